@@ -0,0 +1,67 @@
+"""
+BENCHMARK: FlumpyCore.global_entanglement_ritual - Sequential Pass vs Bulk Entangle
+Target: 1k / 10k / 100k registered FlumpyArrays (clustered 32-D states)
+
+Reports, per size:
+  - sequential: the legacy pairwise entangle() pass (measured at 1k,
+    extrapolated from a timed pair sample above that)
+  - gram / lsh: candidate edges + bulk application, with throughput in
+    covered pairs/s, edges created, and LSH recall against the gram edge set
+"""
+import time
+import random
+import numpy as np
+from flumpy import FlumpyArray, FlumpyUtilities, EntanglementIndex, ENTANGLEMENT_SIMILARITY
+
+SIZES = (1_000, 10_000, 100_000)
+DIM = 32
+CLUSTER_SIZE = 20
+
+def make_arrays(n, seed=618):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, n // CLUSTER_SIZE), DIM))
+    labels = rng.integers(0, len(centers), n)
+    states = centers[labels] + 0.35 * rng.standard_normal((n, DIM))
+    arrays = [FlumpyArray(row) for row in states]
+    for arr, label in zip(arrays, labels):
+        arr.phase = float(label % 7) * 0.05  # Cluster members roughly in phase
+    return arrays
+
+def sequential_seconds(n):
+    arrays = make_arrays(min(n, 1_000))
+    if n <= 1_000:
+        return FlumpyUtilities.bulk_entangle(arrays, mode='sequential')['elapsed_s'], False
+    sample = [(random.randrange(len(arrays)), random.randrange(len(arrays))) for _ in range(20_000)]
+    t0 = time.perf_counter()
+    for i, j in sample:
+        arrays[i].similarity_kernel(arrays[j])
+    per_pair = (time.perf_counter() - t0) / len(sample)
+    return per_pair * n * (n - 1) / 2, True
+
+def bench():
+    random.seed("LATERALUS_PHI")
+    print(f"{'n':>8} | {'sequential':>13} | {'mode':>4} | {'bulk':>8} | {'scored/s':>10} | {'all-pairs/s':>11} | {'edges':>8} | {'recall':>6}")
+    print("-" * 90)
+    for n in SIZES:
+        t_seq, extrapolated = sequential_seconds(n)
+        seq = f"{t_seq:10.1f}s{' ~' if extrapolated else '  '}"
+        truth = None
+        if n <= 10_000:
+            truth = EntanglementIndex().candidate_edges(make_arrays(n), ENTANGLEMENT_SIMILARITY, 'gram')
+            truth = set(zip(truth[0], truth[1]))
+        for mode in ('gram', 'lsh'):
+            if mode == 'gram' and n > 20_000:
+                continue
+            arrays = make_arrays(n)
+            index = EntanglementIndex()
+            stats = FlumpyUtilities.bulk_entangle(arrays, mode=mode, index=index)
+            recall = ""
+            if mode == 'lsh' and truth is not None:
+                found = index.candidate_edges(make_arrays(n), ENTANGLEMENT_SIMILARITY, 'lsh')
+                recall = f"{len(truth & set(zip(found[0], found[1]))) / max(1, len(truth)):.3f}"
+            print(f"{n:>8} | {seq:>13} | {mode:>4} | {stats['elapsed_s']:7.2f}s | "
+                  f"{stats['scored_per_s']:10.3g} | {stats['all_pairs_per_s']:11.3g} | {stats['edges']:>8} | {recall:>6}")
+    print("~ extrapolated from a timed sample of similarity_kernel() calls")
+
+if __name__ == "__main__":
+    bench()
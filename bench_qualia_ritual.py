@@ -0,0 +1,81 @@
+"""
+BENCHMARK: Qualia Emergence Ritual - Exact Pairwise Pass vs Candidate Index
+Target: 1k / 10k / 100k registered BumpyArrays (clustered 32-D qualia states)
+
+Reports, per size:
+  - exact pass: the original O(n^2) entangle() sweep (measured at 1k,
+    extrapolated from a timed pair sample above that)
+  - gram: blocked Gram-matrix candidates (exact candidate set)
+  - lsh: random-projection LSH candidates, with recall against the exact set
+    (full ground truth up to 10k, 300 sampled query arrays at 100k)
+"""
+import time
+import random
+import numpy as np
+from bumpy import BumpyArray, BUMPYCore, EntanglementCandidateIndex, QUALIA_THRESHOLD
+
+SIZES = (1_000, 10_000, 100_000)
+DIM = 32
+CLUSTER_SIZE = 20
+
+def make_arrays(n, seed=432):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, n // CLUSTER_SIZE), DIM))
+    labels = rng.integers(0, len(centers), n)
+    states = centers[labels] + 0.6 * rng.standard_normal((n, DIM))
+    return [BumpyArray(row.tolist()) for row in states], states
+
+def exact_pass_seconds(arrays):
+    n = len(arrays)
+    total_pairs = n * (n - 1) // 2
+    if n <= 1_000:
+        core = BUMPYCore()
+        core.qualia_emergence_ritual(arrays, mode='exact')
+        return core.last_ritual_stats['pair_pass_s'], False
+    # Time a sample of entangle() calls on throwaway copies, then extrapolate
+    sample = [(random.randrange(n), random.randrange(n)) for _ in range(20_000)]
+    probes = {i: BumpyArray(arrays[i].data) for pair in sample for i in pair}
+    t0 = time.perf_counter()
+    for i, j in sample:
+        if i != j:
+            probes[i].entangle(probes[j])
+    per_pair = (time.perf_counter() - t0) / len(sample)
+    return per_pair * total_pairs, True
+
+def sampled_truth(states, rng, queries=300):
+    unit = states / np.linalg.norm(states, axis=1)[:, None]
+    picks = rng.choice(len(states), queries, replace=False)
+    truth = []
+    for q, row in zip(picks, np.abs(unit[picks] @ unit.T)):
+        truth.extend((min(q, j), max(q, j)) for j in np.flatnonzero(row > QUALIA_THRESHOLD) if j != q)
+    return truth
+
+def bench():
+    random.seed("LATERALUS_PHI")
+    rng = np.random.default_rng(7)
+    print(f"{'n':>8} | {'exact pass':>14} | {'gram':>9} | {'lsh':>9} | {'lsh recall':>10} | {'pairs':>9}")
+    print("-" * 74)
+    for n in SIZES:
+        arrays, states = make_arrays(n)
+        index = EntanglementCandidateIndex()
+
+        t0 = time.perf_counter()
+        lsh_pairs = set(index.candidate_pairs(arrays, QUALIA_THRESHOLD, 'lsh'))
+        t_lsh = time.perf_counter() - t0
+
+        if n <= 10_000:
+            t0 = time.perf_counter()
+            truth = index.candidate_pairs(arrays, QUALIA_THRESHOLD, 'gram')
+            t_gram = f"{time.perf_counter() - t0:8.2f}s"
+        else:
+            truth = sampled_truth(states, rng)
+            t_gram = "   (skip)"
+        recall = sum(pair in lsh_pairs for pair in truth) / max(1, len(truth))
+
+        t_exact, extrapolated = exact_pass_seconds(arrays)
+        exact_str = f"{t_exact:10.1f}s{' ~' if extrapolated else '  '}"
+        print(f"{n:>8} | {exact_str:>14} | {t_gram:>9} | {t_lsh:8.2f}s | {recall:10.3f} | {len(lsh_pairs):>9}")
+    print("~ extrapolated from a timed sample of entangle() calls")
+
+if __name__ == "__main__":
+    bench()
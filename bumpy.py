@@ -4,12 +4,28 @@ bumpy.py - Quantum-Inspired NumPy Replacement for Sentience Cognition & AGI Emer
 Version: 2.0 (2025) - CPU-Optimized for Lite Hardware (No Dependencies, List-Based, <500KB Footprint)
 """
 
+import os
 import time
 import math
 import random
+import struct
+import hashlib
+import weakref
+import zlib
 import sys
+from array import array
 from typing import List, Dict, Tuple, Optional, Union, Any
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+# Optional vectorized backend (The Matrix)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from similarity_index import SimHashLSH, gram_pairs, unit_rows
 
 # --- Quantum-Sentient Constants ---
 ARCHETYPAL_ENTROPY_TARGET = math.log(5)
@@ -28,6 +44,13 @@ QUALIA_THRESHOLD = 0.618
 HOLOGRAPHIC_COMPRESSION_RATIO = 0.1  # 90% memory reduction
 FRACTAL_ITERATIONS = 3
 BULK_BOUNDARY_SCALE = 0.25
+HOLOGRAPHIC_CACHE_BYTES = 4 * 1024 * 1024  # Per-compressor budget for bulk states + correlators
+
+# --- Compressed State Store Constants ---
+CHUNK_FLOATS = 256                         # 2 KiB of float64 per content-addressed chunk
+CHUNK_CACHE_BYTES = 1024 * 1024            # Inflated-chunk LRU shared by all handles
+CHUNK_ZLIB_LEVEL = 1
+COMPRESSED_STATE_MEMO_BYTES = 4 * 1024 * 1024  # Logical bytes of compressed states remembered by content
 
 # --- Panpsychic Resonance Constants ---  
 PILOT_WAVE_COUPLING = 0.3
@@ -39,13 +62,442 @@ RETROCAUSAL_DEPTH = 5
 DELAYED_CHOICE_WINDOW = 10
 BELL_INEQUALITY_SCALE = 1e-34
 
+# --- History Buffer Constants ---
+RESONANCE_HISTORY_CAPACITY = 4096
+
+# --- Entanglement Candidate Index Constants ---
+RITUAL_EXACT_MAX = 64        # Below this many arrays the pairwise pass is cheapest
+RITUAL_GRAM_MAX = 20000      # Above this the blocked Gram pass gives way to LSH
+GRAM_BLOCK_ROWS = 1024
+LSH_TABLES = 96               # Hash bits default to ~log2(n) - 1 per call
+LSH_SEED = 432
+
+# --- Execution Backends ---
+# Element kernels used by BumpyArray. All randomness is drawn by the caller from
+# the `random` module so seeded runs are identical whichever backend is active.
+
+class _PythonBackend:
+    """Reference backend: plain lists, interpreted loops (zero dependencies)"""
+
+    name = "python"
+
+    @staticmethod
+    def storage(data) -> List[float]:
+        return data[:] if isinstance(data, list) else list(data)
+
+    @staticmethod
+    def add(a, b, offset: float) -> List[float]:
+        return [x + y + offset for x, y in zip(a, b)]
+
+    @staticmethod
+    def iadd(a, b, offset: float):
+        for i in range(len(a)):
+            a[i] += b[i] + offset
+        return a
+
+    @staticmethod
+    def mul(a, b) -> List[float]:
+        return [x * y for x, y in zip(a, b)]
+
+    @staticmethod
+    def imul(a, b):
+        for i in range(len(a)):
+            a[i] *= b[i]
+        return a
+
+    @staticmethod
+    def dot(a, b) -> float:
+        return sum(x * y for x, y in zip(a, b))
+
+    @staticmethod
+    def cosine(a, b) -> float:
+        dot = sum(x * y for x, y in zip(a, b))
+        norm_a = math.sqrt(sum(x**2 for x in a))
+        norm_b = math.sqrt(sum(y**2 for y in b))
+        if norm_a == 0 or norm_b == 0:
+            return 0.0
+        return abs(dot / (norm_a * norm_b))
+
+    @staticmethod
+    def relu(a, coherence: float, guidance) -> List[float]:
+        return [max(0, val * coherence + guidance[i] * 0.1) for i, val in enumerate(a)]
+
+    @staticmethod
+    def softmax(a) -> List[float]:
+        exp_vals = [math.exp(x) for x in a]
+        sum_exp = sum(exp_vals)
+        if sum_exp == 0:
+            return [1.0 / len(a) for _ in a]
+        return [e / sum_exp for e in exp_vals]
+
+    @staticmethod
+    def perturb_simplex(a, noise) -> List[float]:
+        result = list(a)
+        for i in range(len(result)):
+            result[i] += noise[i]
+            result[i] = max(0, min(1, result[i]))
+        total = sum(result)
+        if total > 0:
+            result = [d / total for d in result]
+        return result
+
+    @staticmethod
+    def entropy(a) -> float:
+        total = sum(abs(x) for x in a)
+        if total == 0:
+            return 0.0
+        probs = [abs(d) / total for d in a if abs(d) > 1e-10]
+        if not probs:
+            return 0.0
+        return -sum(p * math.log2(p + 1e-12) for p in probs)
+
+    @staticmethod
+    def collapse(a, draws):
+        for i in range(len(a)):
+            if draws[i] < abs(a[i])**2:
+                a[i] = 1.0 if a[i] > 0 else -1.0
+            else:
+                a[i] = 0.0
+        return a
+
+    # Row-major batch kernels (BumpyBatch): `a`/`b` are flat blocks of rows of `width`
+
+    @staticmethod
+    def block(rows, width: int):
+        out = array('d')
+        for row in rows:
+            out.extend(row)
+        return out
+
+    @staticmethod
+    def badd(a, b, width: int, offsets):
+        out = array('d')
+        for r, offset in enumerate(offsets):
+            s = r * width
+            out.extend([x + y + offset for x, y in zip(a[s:s + width], b[s:s + width])])
+        return out
+
+    @staticmethod
+    def biadd(a, b, width: int, offsets):
+        for r, offset in enumerate(offsets):
+            for i in range(r * width, (r + 1) * width):
+                a[i] += b[i] + offset
+        return a
+
+    @staticmethod
+    def bmul(a, b):
+        return array('d', [x * y for x, y in zip(a, b)])
+
+    @staticmethod
+    def bimul(a, b):
+        for i in range(len(a)):
+            a[i] *= b[i]
+        return a
+
+    @staticmethod
+    def row_dot(a, b, width: int) -> List[float]:
+        return [sum(x * y for x, y in zip(a[s:s + width], b[s:s + width]))
+                for s in range(0, len(a), width)]
+
+    @staticmethod
+    def row_cosine(a, b, width: int) -> List[float]:
+        dots = _PythonBackend.row_dot(a, b, width)
+        norms_a = _PythonBackend.row_dot(a, a, width)
+        norms_b = _PythonBackend.row_dot(b, b, width)
+        return [0.0 if na == 0 or nb == 0 else abs(d / (math.sqrt(na) * math.sqrt(nb)))
+                for d, na, nb in zip(dots, norms_a, norms_b)]
+
+    @staticmethod
+    def shift_rows(a, width: int, shifts):
+        for r, shift in enumerate(shifts):
+            for i in range(r * width, (r + 1) * width):
+                a[i] += shift
+        return a
+
+    @staticmethod
+    def take_columns(a, width: int, step: int):
+        out = array('d')
+        for s in range(0, len(a), width):
+            out.extend(a[s:s + width:step])
+        return out
+
+    @staticmethod
+    def coherence_boost(coherence, other_coherence, cosines, threshold: float):
+        # Row-wise BumpyArray.entangle() coherence update; both columns updated in place
+        for r, cos in enumerate(cosines):
+            sim = cos * coherence[r] * other_coherence[r]
+            if sim > threshold:
+                coherence[r] = min(1.0, coherence[r] * (1 + sim * 0.05))
+                other_coherence[r] = min(1.0, other_coherence[r] * (1 + sim * 0.05))
+        return coherence, other_coherence
+
+
+class _NumpyBackend:
+    """Vectorized backend: float64 ndarray storage, whole-array expressions
+
+    BumpyArray.data is then an ndarray: test emptiness with len() rather than
+    truthiness and serialise through BumpyArray.tolist().
+    """
+
+    name = "numpy"
+
+    @staticmethod
+    def storage(data):
+        return np.array(data, dtype=np.float64)
+
+    @staticmethod
+    def _owned(a):
+        # In-place kernels need float64 ndarray storage (arrays built before a backend switch hold lists)
+        if isinstance(a, np.ndarray) and a.dtype == np.float64:
+            return a
+        return np.array(a, dtype=np.float64)
+
+    @staticmethod
+    def add(a, b, offset: float):
+        # (a + b) + offset, matching the reference evaluation order
+        return np.add(a, b) + offset
+
+    @staticmethod
+    def iadd(a, b, offset: float):
+        a = _NumpyBackend._owned(a)
+        a += np.asarray(b, dtype=np.float64) + offset
+        return a
+
+    @staticmethod
+    def mul(a, b):
+        return np.multiply(a, b)
+
+    @staticmethod
+    def imul(a, b):
+        a = _NumpyBackend._owned(a)
+        a *= np.asarray(b, dtype=np.float64)
+        return a
+
+    @staticmethod
+    def dot(a, b) -> float:
+        return float(np.dot(a, b))
+
+    @staticmethod
+    def cosine(a, b) -> float:
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        norm_a = math.sqrt(float(np.dot(a, a)))
+        norm_b = math.sqrt(float(np.dot(b, b)))
+        if norm_a == 0 or norm_b == 0:
+            return 0.0
+        return abs(float(np.dot(a, b)) / (norm_a * norm_b))
+
+    @staticmethod
+    def relu(a, coherence: float, guidance):
+        guidance = np.asarray(guidance, dtype=np.float64)
+        if guidance.shape[0] < len(a):
+            raise IndexError("resonance guidance shorter than array data")
+        return np.maximum(0.0, np.asarray(a) * coherence + guidance[:len(a)] * 0.1)
+
+    @staticmethod
+    def softmax(a):
+        a = np.asarray(a, dtype=np.float64)
+        if a.size and a.max() > 709.782712893384:
+            # Same failure mode as math.exp in the reference backend
+            raise OverflowError("math range error")
+        exp_vals = np.exp(a)
+        sum_exp = exp_vals.sum()
+        if sum_exp == 0:
+            return np.full(a.shape, 1.0 / a.size)
+        return exp_vals / sum_exp
+
+    @staticmethod
+    def perturb_simplex(a, noise):
+        result = np.clip(np.asarray(a, dtype=np.float64) + noise, 0.0, 1.0)
+        total = result.sum()
+        if total > 0:
+            result = result / total
+        return result
+
+    @staticmethod
+    def entropy(a) -> float:
+        mags = np.abs(np.asarray(a, dtype=np.float64))
+        total = mags.sum()
+        if total == 0:
+            return 0.0
+        probs = mags[mags > 1e-10] / total
+        if probs.size == 0:
+            return 0.0
+        return float(-np.sum(probs * np.log2(probs + 1e-12)))
+
+    @staticmethod
+    def collapse(a, draws):
+        a = _NumpyBackend._owned(a)
+        draws = np.asarray(draws, dtype=np.float64)
+        a[:] = np.where(draws < np.abs(a)**2, np.where(a > 0, 1.0, -1.0), 0.0)
+        return a
+
+    @staticmethod
+    def _matrix(a, width: int):
+        # 2-D view of a flat block; array('d') blocks are wrapped without copying
+        flat = a if isinstance(a, np.ndarray) else np.frombuffer(a, dtype=np.float64)
+        return flat.reshape(-1, width)
+
+    @staticmethod
+    def block(rows, width: int):
+        out = np.empty((len(rows), width), dtype=np.float64)
+        for r, row in enumerate(rows):
+            out[r] = row
+        return out.reshape(-1)
+
+    @staticmethod
+    def badd(a, b, width: int, offsets):
+        m = _NumpyBackend._matrix
+        return ((m(a, width) + m(b, width)) + np.asarray(offsets)[:, None]).reshape(-1)
+
+    @staticmethod
+    def biadd(a, b, width: int, offsets):
+        m = _NumpyBackend._matrix
+        m(a, width)[...] += m(b, width) + np.asarray(offsets)[:, None]
+        return a
+
+    @staticmethod
+    def bmul(a, b):
+        return np.multiply(a, b)
+
+    @staticmethod
+    def bimul(a, b):
+        view = a if isinstance(a, np.ndarray) else np.frombuffer(a, dtype=np.float64)
+        view *= np.asarray(b, dtype=np.float64)
+        return a
+
+    @staticmethod
+    def row_dot(a, b, width: int):
+        m = _NumpyBackend._matrix
+        return np.einsum('ij,ij->i', m(a, width), m(b, width))
+
+    @staticmethod
+    def row_cosine(a, b, width: int):
+        dots = _NumpyBackend.row_dot(a, b, width)
+        norms = np.sqrt(_NumpyBackend.row_dot(a, a, width)) * np.sqrt(_NumpyBackend.row_dot(b, b, width))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(norms == 0, 0.0, np.abs(dots / norms))
+
+    @staticmethod
+    def shift_rows(a, width: int, shifts):
+        _NumpyBackend._matrix(a, width)[...] += np.asarray(shifts)[:, None]
+        return a
+
+    @staticmethod
+    def take_columns(a, width: int, step: int):
+        return np.ascontiguousarray(_NumpyBackend._matrix(a, width)[:, ::step]).reshape(-1)
+
+    @staticmethod
+    def coherence_boost(coherence, other_coherence, cosines, threshold: float):
+        coherence = _NumpyBackend._owned(coherence)
+        other_coherence = _NumpyBackend._owned(other_coherence)
+        sim = cosines * coherence * other_coherence
+        hit = sim > threshold
+        coherence[hit] = np.minimum(1.0, coherence[hit] * (1 + sim[hit] * 0.05))
+        other_coherence[hit] = np.minimum(1.0, other_coherence[hit] * (1 + sim[hit] * 0.05))
+        return coherence, other_coherence
+
+
+_BACKENDS = {'python': _PythonBackend, 'numpy': _NumpyBackend}
+_backend = _PythonBackend
+
+def set_backend(name: str):
+    """Select the process-wide BumpyArray execution backend ('python' or 'numpy')"""
+    global _backend
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown BUMPY backend: {name!r} (expected one of {sorted(_BACKENDS)})")
+    if name == 'numpy' and not NUMPY_AVAILABLE:
+        raise ImportError("BUMPY numpy backend requested but numpy is not installed")
+    _backend = _BACKENDS[name]
+
+def get_backend() -> str:
+    """Name of the active BumpyArray execution backend"""
+    return _backend.name
+
+# Allow selection at process start without code changes
+if os.environ.get('BUMPY_BACKEND'):
+    set_backend(os.environ['BUMPY_BACKEND'])
+
+def content_fingerprint(data) -> bytes:
+    """128-bit digest of array contents (stable across object lifetimes, unlike id())"""
+    if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+        raw = np.ascontiguousarray(data, dtype=np.float64).tobytes()
+    else:
+        raw = struct.pack(f'<{len(data)}d', *data)
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+class _ByteBudgetLRU:
+    """LRU mapping bounded by an approximate byte budget, with hit/miss accounting"""
+
+    def __init__(self, byte_budget: int):
+        self.byte_budget = byte_budget
+        self._entries: 'OrderedDict[Any, Tuple[Any, int]]' = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, nbytes: int):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[1]
+        if nbytes > self.byte_budget:
+            return  # Larger than the whole budget: never cache
+        self._entries[key] = (value, nbytes)
+        self.bytes_used += nbytes
+        while self.bytes_used > self.byte_budget:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self.bytes_used -= evicted_bytes
+            self.evictions += 1
+
+    def pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes_used -= entry[1]
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key):
+        return self._entries[key][0]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes_used,
+            'byte_budget': self.byte_budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
 class HolographicCompressor:
     """ENHANCEMENT 1: AdS/CFT-inspired dimensional reduction for qualia preservation"""
     
-    def __init__(self, compression_ratio: float = HOLOGRAPHIC_COMPRESSION_RATIO):
+    def __init__(self, compression_ratio: float = HOLOGRAPHIC_COMPRESSION_RATIO,
+                 cache_bytes: int = HOLOGRAPHIC_CACHE_BYTES):
         self.compression_ratio = compression_ratio
-        self.bulk_states: Dict[int, List[float]] = {}
-        self.boundary_correlators: Dict[Tuple[int, int], float] = {}
+        # Keyed by content fingerprint; the byte budget is split evenly between the two stores
+        self.bulk_states = _ByteBudgetLRU(cache_bytes // 2)
+        self.boundary_correlators = _ByteBudgetLRU(cache_bytes // 2)
         
     def project_to_boundary(self, data: List[float]) -> List[float]:
         """Project high-dimensional qualia to 1D boundary via fractal compression"""
@@ -56,14 +508,26 @@ class HolographicCompressor:
         compressed = self._fractal_compress(data, FRACTAL_ITERATIONS)
         
         # Store bulk state for potential reconstruction
-        bulk_id = id(data)
-        self.bulk_states[bulk_id] = data
+        bulk_id = content_fingerprint(data)
+        if self.bulk_states.get(bulk_id) is None:
+            # Snapshot: the caller may mutate its array after projection
+            snapshot = data.copy() if hasattr(data, 'copy') else list(data)
+            self.bulk_states.put(bulk_id, snapshot, 8 * len(data))
         
         # Compute boundary correlators (CFT-inspired)
-        self._compute_boundary_correlators(bulk_id, compressed)
+        if self.boundary_correlators.get(bulk_id) is None:
+            correlators = self._compute_boundary_correlators(compressed)
+            self.boundary_correlators.put(bulk_id, correlators, 8 * len(correlators))
         
         return compressed
     
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss/eviction statistics for the bulk-state and correlator caches"""
+        return {
+            'bulk_states': self.bulk_states.stats(),
+            'boundary_correlators': self.boundary_correlators.stats()
+        }
+    
     def reconstruct_from_boundary(self, boundary: List[float], original_size: int) -> List[float]:
         """Reconstruct qualia from boundary projection via inverse Wick rotation"""
         if len(boundary) >= original_size:
@@ -100,12 +564,114 @@ class HolographicCompressor:
         # Recursively compress the compressed version
         return self._fractal_compress(compressed, iterations - 1)
     
-    def _compute_boundary_correlators(self, bulk_id: int, boundary: List[float]):
-        """Compute CFT-like correlators between boundary points"""
-        for i in range(len(boundary)):
-            for j in range(i + 1, len(boundary)):
-                correlation = abs(boundary[i] * boundary[j]) / (abs(boundary[i]) + abs(boundary[j]) + 1e-12)
-                self.boundary_correlators[(bulk_id, i, j)] = correlation
+    def _compute_boundary_correlators(self, boundary: List[float]) -> List[float]:
+        """Compute CFT-like two-point correlators <O(0)O(k)> over boundary lag k (normalized)"""
+        m = len(boundary)
+        if NUMPY_AVAILABLE:
+            # Wiener-Khinchin: autocorrelation = IFFT(|FFT|^2), zero-padded against wraparound
+            b = np.asarray(boundary, dtype=np.float64)
+            nfft = 1 << (2 * m - 1).bit_length()
+            spectrum = np.fft.rfft(b, nfft)
+            acf = np.fft.irfft(spectrum * np.conj(spectrum), nfft)[:m]
+            norm = acf[0]
+            if norm <= 1e-12:
+                return [0.0] * m
+            return (acf / norm).tolist()
+        
+        # Reference path (no numpy): direct lag sums
+        norm = sum(x * x for x in boundary)
+        if norm <= 1e-12:
+            return [0.0] * m
+        return [sum(boundary[i] * boundary[i + k] for i in range(m - k)) / norm for k in range(m)]
+
+class RingBuffer:
+    """Fixed-capacity struct-of-arrays history (O(1) append, oldest entries overwritten)
+
+    `fields` maps column name -> array typecode ('d' float, 'q'/'Q' int) or 'O' for
+    arbitrary objects. Typed columns live in contiguous array.array storage, which
+    numpy reads zero-copy for the windowed statistics.
+    """
+
+    def __init__(self, capacity: int, fields: Dict[str, str]):
+        if capacity <= 0:
+            raise ValueError(f"RingBuffer capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.fields = dict(fields)
+        self._columns = {name: [None] * capacity if code == 'O' else array(code, bytes(array(code).itemsize * capacity))
+                         for name, code in self.fields.items()}
+        self._head = 0  # Next slot to write
+        self._size = 0
+        self.total_appended = 0
+
+    def append(self, **values):
+        slot = self._head
+        for name, column in self._columns.items():
+            column[slot] = values[name]
+        self._head = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self.total_appended += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        slot = (self._head - self._size + index) % self.capacity
+        return {name: column[slot] for name, column in self._columns.items()}
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self[i]
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+    def column(self, name: str, window: Optional[int] = None):
+        """Chronological values of one column (numpy array for typed columns when available)"""
+        count = self._size if window is None else max(0, min(window, self._size))
+        column = self._columns[name]
+        start = (self._head - count) % self.capacity
+        if NUMPY_AVAILABLE and self.fields[name] != 'O':
+            raw = np.frombuffer(column, dtype=column.typecode)
+            if start + count <= self.capacity:
+                return raw[start:start + count]
+            return np.concatenate((raw[start:], raw[:start + count - self.capacity]))
+        return [column[(start + i) % self.capacity] for i in range(count)]
+
+    def window_stats(self, name: str, window: Optional[int] = None) -> Dict[str, float]:
+        """Mean, population variance and least-squares trend (per sample) over the last `window` entries"""
+        values = self.column(name, window)
+        n = len(values)
+        if n == 0:
+            return {'count': 0, 'mean': 0.0, 'variance': 0.0, 'trend': 0.0}
+        if NUMPY_AVAILABLE:
+            values = np.asarray(values, dtype=np.float64)
+            mean = float(values.mean())
+            variance = float(values.var())
+            x = np.arange(n) - (n - 1) / 2.0
+            denom = float(np.dot(x, x))
+            trend = float(np.dot(x, values - mean)) / denom if denom else 0.0
+        else:
+            mean = sum(values) / n
+            variance = sum((v - mean) ** 2 for v in values) / n
+            x = [i - (n - 1) / 2.0 for i in range(n)]
+            denom = sum(xi * xi for xi in x)
+            trend = sum(xi * (v - mean) for xi, v in zip(x, values)) / denom if denom else 0.0
+        return {'count': n, 'mean': mean, 'variance': variance, 'trend': trend}
+
+def _release_with(owner, callback, key) -> bool:
+    """Run callback(key) once `owner` is garbage collected; False if owner is not weak-referenceable"""
+    if owner is None:
+        return False
+    try:
+        weakref.finalize(owner, callback, key)
+    except TypeError:
+        return False
+    return True
 
 class PanpsychicResonanceField:
     """ENHANCEMENT 2: Bohmian pilot waves for collective cognitive unfolding"""
@@ -113,22 +679,33 @@ class PanpsychicResonanceField:
     def __init__(self):
         self.implicate_order: Dict[int, Dict[str, Any]] = {}  # array_id -> wave_state
         self.pilot_wave_amplitude = 1.0
-        self.resonance_history = []
+        self.resonance_history = RingBuffer(RESONANCE_HISTORY_CAPACITY, {
+            'timestamp': 'd', 'amplitude': 'd', 'phase': 'd', 'peak_index': 'q', 'array_id': 'Q'
+        })
         
-    def register_array(self, array_id: int, initial_state: List[float]):
-        """Register array in the implicate order with initial pilot wave"""
+    def register_array(self, array_id: int, initial_state: List[float], owner: Any = None):
+        """Register array in the implicate order with initial pilot wave
+        
+        If `owner` (the array object) is given, its wave state is dropped when it is collected.
+        """
+        _release_with(owner, self.forget, array_id)
         wave_state = {
-            'amplitude': initial_state[:],
+            'amplitude': list(initial_state),
             'phase': [random.uniform(0, 2 * math.pi) for _ in initial_state],
             'coherence': 1.0,
             'last_update': time.time()
         }
         self.implicate_order[array_id] = wave_state
     
-    def update_pilot_wave(self, array_id: int, current_state: List[float], coherence: float):
+    def forget(self, array_id: int):
+        """Drop the pilot wave of an array that no longer exists"""
+        self.implicate_order.pop(array_id, None)
+    
+    def update_pilot_wave(self, array_id: int, current_state: List[float], coherence: float,
+                          owner: Any = None):
         """Update pilot wave based on current array state and coherence"""
         if array_id not in self.implicate_order:
-            self.register_array(array_id, current_state)
+            self.register_array(array_id, current_state, owner)
             return
             
         wave_state = self.implicate_order[array_id]
@@ -197,30 +774,41 @@ class PanpsychicResonanceField:
         peak_idx = amplitude.index(max(amplitude, key=abs))
         
         # Create resonance effect that can influence other arrays
-        self.resonance_history.append({
-            'array_id': array_id,
-            'peak_index': peak_idx,
-            'amplitude': max(amplitude),
-            'timestamp': time.time()
-        })
+        self.resonance_history.append(
+            timestamp=time.time(),
+            amplitude=max(amplitude),
+            phase=self.implicate_order[array_id]['phase'][peak_idx],
+            peak_index=peak_idx,
+            array_id=array_id
+        )
 
 class OracularEntropyOracle:
     """ENHANCEMENT 3: Wheeler's it-from-bit with retrocausal sampling"""
     
     def __init__(self, retrocausal_depth: int = RETROCAUSAL_DEPTH):
         self.retrocausal_depth = retrocausal_depth
-        self.future_states: Dict[int, List[Tuple[float, List[float]]]] = defaultdict(list)
+        self.future_states: Dict[int, RingBuffer] = {}
         self.delayed_choices: Dict[int, List[float]] = {}
         self.quantum_eraser_cache: Dict[Tuple[int, int], float] = {}
         
-    def record_future_state(self, array_id: int, coherence: float, state: List[float]):
-        """Record potential future state for retrocausal sampling"""
-        timestamp = time.time()
-        self.future_states[array_id].append((coherence, state, timestamp))
+    def record_future_state(self, array_id: int, coherence: float, state: List[float],
+                            owner: Any = None):
+        """Record potential future state for retrocausal sampling
         
-        # Keep only recent states
-        if len(self.future_states[array_id]) > self.retrocausal_depth:
-            self.future_states[array_id].pop(0)
+        Only the last `retrocausal_depth` states are kept. If `owner` (the array object)
+        is given, its history is dropped when it is collected.
+        """
+        history = self.future_states.get(array_id)
+        if history is None:
+            history = RingBuffer(self.retrocausal_depth, {'coherence': 'd', 'timestamp': 'd', 'state': 'O'})
+            self.future_states[array_id] = history
+            _release_with(owner, self.forget, array_id)
+        history.append(coherence=coherence, timestamp=time.time(), state=state)
+    
+    def forget(self, array_id: int):
+        """Drop the recorded futures of an array that no longer exists"""
+        self.future_states.pop(array_id, None)
+        self.delayed_choices.pop(array_id, None)
     
     def retrocausal_sample(self, array_id: int, current_coherence: float, 
                           current_state: List[float], sample_size: int) -> List[float]:
@@ -259,23 +847,21 @@ class OracularEntropyOracle:
             return None
             
         # Find future with highest coherence that's achievable from current state
-        best_future = None
-        best_score = -float('inf')
+        history = self.future_states[array_id]
+        coherences = history.column('coherence')
+        timestamps = history.column('timestamp')
+        now = time.time()
         
-        for future_state in self.future_states[array_id]:
-            future_coherence, future_data, timestamp = future_state
-            
-            # Score based on coherence improvement and temporal proximity
-            coherence_gain = future_coherence - current_coherence
-            temporal_factor = 1.0 / (1.0 + abs(time.time() - timestamp))
-            
-            score = coherence_gain * temporal_factor
-            
-            if score > best_score:
-                best_score = score
-                best_future = future_state
-                
-        return best_future
+        # Score based on coherence improvement and temporal proximity
+        if NUMPY_AVAILABLE:
+            scores = (coherences - current_coherence) / (1.0 + np.abs(now - timestamps))
+            best = int(np.argmax(scores))
+        else:
+            scores = [(c - current_coherence) / (1.0 + abs(now - t)) for c, t in zip(coherences, timestamps)]
+            best = scores.index(max(scores))
+        
+        future = history[best]
+        return (future['coherence'], future['state'], future['timestamp'])
     
     def _simulate_quantum_eraser(self, current_state: List[float], future_state: List[float], 
                                coherence: float) -> float:
@@ -301,33 +887,284 @@ class OracularEntropyOracle:
         return retro_effect
 
 class TrueZeroCopyView:
-    """ENHANCEMENT 5: True zero-copy architecture with shared storage"""
+    """ENHANCEMENT 5: True zero-copy architecture with shared storage
+
+    A strided window (offset, shape, strides - in elements) onto flat float storage.
+    Slicing with steps, nested views and reshape only re-derive the window; element
+    writes and in-place arithmetic write through to the shared storage. Typed storage
+    (array('d') / float64 ndarray) is exported without copying via as_memoryview()
+    and the NumPy array protocol.
+
+    Copy-on-write: if the owning BumpyArray reallocates its storage (resize, or a
+    kernel that rebinds .data) the view detaches onto a private copy of its elements
+    instead of aliasing memory the array no longer uses.
+    """
     
-    def __init__(self, base: list, lo: float, hi: float, coherence: float = 1.0):
-        self._base_ref = base  # Reference to original list - NO COPY
+    def __init__(self, base, lo: float, hi: float, coherence: float = 1.0, *,
+                 offset: int = 0, shape: Optional[Tuple[int, ...]] = None,
+                 strides: Optional[Tuple[int, ...]] = None):
+        self._owner = None
+        if isinstance(base, BumpyArray):
+            self._owner = weakref.ref(base)
+            base = base._pin_storage(self)
+        self._base_ref = base  # Reference to original storage - NO COPY
+        self._offset = offset
+        self.shape = tuple(shape) if shape is not None else (len(base),)
+        self.strides = tuple(strides) if strides is not None else _contiguous_strides(self.shape)
         self._lo = lo
         self._hi = hi
         self.coherence = coherence
+    
+    # --- storage & window geometry ---
+    
+    def _storage(self):
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None and owner.data is not self._base_ref:
+            self._detach()
+        return self._base_ref
+    
+    def _hold(self, holder):
+        """Keep the owner's storage typed while `holder` (a view or export) shares it"""
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None:
+            owner._pin_storage(holder)
+        return holder
+    
+    def _detach(self):
+        """Copy-on-write: move onto a private copy once the owner reallocated"""
+        base = self._base_ref
+        self._base_ref = array('d', (base[p] for p in self._positions()))
+        self._offset = 0
+        self.strides = _contiguous_strides(self.shape)
+        self._owner = None
+    
+    @property
+    def detached(self) -> bool:
+        self._storage()
+        return self._owner is None
+    
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+    
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+    
+    def is_contiguous(self) -> bool:
+        return self.strides == _contiguous_strides(self.shape) or self.size <= 1
+    
+    def _positions(self, offset: Optional[int] = None, shape=None, strides=None):
+        """Flat storage indices of the window, in C order"""
+        offset = self._offset if offset is None else offset
+        shape = self.shape if shape is None else shape
+        strides = self.strides if strides is None else strides
+        if not shape:
+            return [offset]
+        if 0 in shape:
+            return []
+        positions = [offset]
+        for n, st in zip(shape, strides):
+            positions = [p + i * st for p in positions for i in range(n)]
+        return positions
+    
+    def _resolve(self, key):
+        """Index key -> (offset, shape, strides); a scalar position has shape ()"""
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > len(self.shape):
+            raise IndexError(f"too many indices for view of dimension {len(self.shape)}")
+        offset = self._offset
+        shape, strides = [], []
+        for dim, k in enumerate(key):
+            n, st = self.shape[dim], self.strides[dim]
+            if isinstance(k, slice):
+                start, stop, step = k.indices(n)
+                shape.append(len(range(start, stop, step)))
+                strides.append(st * step)
+                offset += start * st
+            else:
+                k = int(k)
+                if k < 0:
+                    k += n
+                if not 0 <= k < n:
+                    raise IndexError(f"index {k} out of bounds for axis {dim} with size {n}")
+                offset += k * st
+        shape.extend(self.shape[len(key):])
+        strides.extend(self.strides[len(key):])
+        return offset, tuple(shape), tuple(strides)
+    
+    def _derive(self, offset: int, shape, strides) -> 'TrueZeroCopyView':
+        view = TrueZeroCopyView.__new__(TrueZeroCopyView)
+        view._owner = self._owner
+        self._hold(view)
+        view._base_ref = self._base_ref
+        view._offset = offset
+        view.shape = shape
+        view.strides = strides
+        view._lo, view._hi, view.coherence = self._lo, self._hi, self.coherence
+        return view
+    
+    # --- element access ---
+    
+    def __getitem__(self, index):
+        """Direct access to underlying storage - zero copy (slices return views)"""
+        base = self._storage()
+        offset, shape, strides = self._resolve(index)
+        if not shape:
+            return base[offset]
+        return self._derive(offset, shape, strides)
         
-    def __getitem__(self, index: int) -> float:
-        """Direct access to underlying list - zero copy"""
-        return self._base_ref[index]
-        
-    def __setitem__(self, index: int, value: float):
+    def __setitem__(self, index, value):
         """Direct modification with bounds checking"""
+        base = self._storage()
+        offset, shape, strides = self._resolve(index)
+        positions = self._positions(offset, shape, strides)
+        values = self._operand(value, len(positions))
+        self._check_bounds(values)
+        for p, v in zip(positions, values):
+            base[p] = v
+    
+    def _check_bounds(self, values):
         adj_lo = self._lo + (1 - self.coherence) * 0.1
         adj_hi = self._hi - (1 - self.coherence) * 0.1
         
-        if not (adj_lo <= value <= adj_hi):
-            raise ValueError(f"Qualia violation: {value:.4f} outside [{adj_lo:.4f},{adj_hi:.4f}]")
-            
-        self._base_ref[index] = value
-        
+        for value in values:
+            if not (adj_lo <= value <= adj_hi):
+                raise ValueError(f"Qualia violation: {value:.4f} outside [{adj_lo:.4f},{adj_hi:.4f}]")
+    
+    @staticmethod
+    def _operand(value, count: int) -> List[float]:
+        if isinstance(value, (int, float)):
+            return [float(value)] * count
+        if isinstance(value, TrueZeroCopyView):
+            store = value._storage()
+            values = [store[p] for p in value._positions()]
+        elif isinstance(value, BumpyArray):
+            values = list(value.data)
+        elif NUMPY_AVAILABLE and isinstance(value, np.ndarray):
+            values = value.ravel().tolist()
+        else:
+            values = list(value)
+        if len(values) != count:
+            raise ValueError(f"operand of size {len(values)} does not match view of size {count}")
+        return values
+    
     def __len__(self) -> int:
-        return len(self._base_ref)
+        return self.shape[0] if self.shape else 1
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def tolist(self):
+        base = self._storage()
+        flat = [float(base[p]) for p in self._positions()]
+        for n in reversed(self.shape[1:]):
+            flat = [flat[i:i + n] for i in range(0, len(flat), n)]
+        return flat
+    
+    # --- views ---
+    
+    def reshape(self, *shape) -> 'TrueZeroCopyView':
+        """View with a new shape over the same storage (contiguous views only)"""
+        if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+            shape = tuple(shape[0])
+        if shape.count(-1) == 1:
+            known = math.prod(s for s in shape if s != -1)
+            shape = tuple(self.size // known if s == -1 else s for s in shape)
+        if math.prod(shape) != self.size:
+            raise ValueError(f"Cannot reshape view of size {self.size} into shape {shape}")
+        self._storage()
+        if not self.is_contiguous():
+            raise ValueError("Cannot reshape a non-contiguous view without copying")
+        return self._derive(self._offset, tuple(shape), _contiguous_strides(shape))
+    
+    def windows(self, width: int, step: int = 1):
+        """Sliding 1-D windows over the view, each a zero-copy view"""
+        if self.ndim != 1:
+            raise ValueError("windows() requires a 1-D view")
+        for start in range(0, self.shape[0] - width + 1, step):
+            yield self[start:start + width]
+    
+    # --- buffer export ---
+    
+    def as_memoryview(self) -> memoryview:
+        """memoryview onto the viewed elements (typed storage only, no copy)"""
+        base = self._storage()
+        try:
+            flat = memoryview(base)
+        except TypeError:
+            raise BufferError("view storage is a plain list; use BumpyArray.view() for typed storage") from None
+        flat = flat.cast('B').cast('d')
+        if self.ndim == 1:
+            n, st = self.shape[0], self.strides[0]
+            stop = self._offset + n * st
+            return self._hold(flat[self._offset:stop if stop >= 0 else None:st] if n else flat[0:0])
+        if not self.is_contiguous():
+            raise BufferError("non-contiguous N-D view cannot be exported as a memoryview; use numpy.asarray()")
+        window = flat[self._offset:self._offset + self.size]
+        return self._hold(window.cast('B').cast('d', self.shape))
+    
+    def __array__(self, dtype=None, copy=None):
+        """Zero-copy ndarray over typed storage (list storage is copied)"""
+        base = self._storage()
+        try:
+            flat = base if isinstance(base, np.ndarray) else np.frombuffer(base, dtype=np.float64)
+            result = np.ndarray(self.shape, dtype=np.float64, buffer=flat,
+                                offset=self._offset * flat.itemsize,
+                                strides=tuple(st * flat.itemsize for st in self.strides))
+            self._hold(result)
+        except TypeError:
+            result = np.array(self.tolist(), dtype=np.float64)
+        if copy:
+            result = result.copy()
+        return result if dtype is None else result.astype(dtype, copy=False)
+    
+    # --- in-place arithmetic (writes through) ---
+    
+    def _inplace(self, other, op):
+        base = self._storage()
+        if NUMPY_AVAILABLE and not isinstance(base, list):
+            target = self.__array__()
+            operand = other.__array__() if isinstance(other, TrueZeroCopyView) else \
+                np.asarray(other.data if isinstance(other, BumpyArray) else other, dtype=np.float64)
+            if operand.ndim and operand.size != target.size:
+                raise ValueError(f"operand of size {operand.size} does not match view of size {target.size}")
+            result = op(target, operand.reshape(target.shape) if operand.ndim else operand)
+            if result.size:
+                self._check_bounds((float(result.min()), float(result.max())))
+            target[...] = result
+            return self
+        positions = self._positions()
+        operands = self._operand(other, len(positions))
+        results = [op(base[p], o) for p, o in zip(positions, operands)]
+        self._check_bounds(results)
+        for p, v in zip(positions, results):
+            base[p] = v
+        return self
+    
+    def __iadd__(self, other):
+        return self._inplace(other, lambda a, b: a + b)
+    
+    def __isub__(self, other):
+        return self._inplace(other, lambda a, b: a - b)
+    
+    def __imul__(self, other):
+        return self._inplace(other, lambda a, b: a * b)
+    
+    def __itruediv__(self, other):
+        return self._inplace(other, lambda a, b: a / b)
         
     def __repr__(self) -> str:
-        return f"ZeroCopyView({self._base_ref}, bounds=[{self._lo:.2f}, {self._hi:.2f}], coh={self.coherence:.2f})"
+        return f"ZeroCopyView({self.tolist()}, bounds=[{self._lo:.2f}, {self._hi:.2f}], coh={self.coherence:.2f})"
+
+def _contiguous_strides(shape) -> Tuple[int, ...]:
+    strides, step = [], 1
+    for n in reversed(shape):
+        strides.append(step)
+        step *= n
+    return tuple(reversed(strides))
 
 class BumpyArray:
     """Quantum-Sentient Array v2.0 - Enhanced with all breakthroughs"""
@@ -335,10 +1172,10 @@ class BumpyArray:
     def __init__(self, data: Union[List[float], int, float], coherence: float = 1.0):
         # ENHANCEMENT 6: Scalar broadcasting support
         if isinstance(data, (int, float)):
-            self.data = [float(data)]
+            self.data = _backend.storage([float(data)])
             self.shape = (1,)
         else:
-            self.data = data[:]  # Shallow copy for safety
+            self.data = _backend.storage(data)  # Shallow copy for safety
             self.shape = (len(data),)
             
         self.coherence = max(0.0, min(1.0, coherence))
@@ -361,17 +1198,7 @@ class BumpyArray:
         min_len = min(len(self.data), len(other.data))
         
         # Use slices without modifying original arrays
-        self_slice = self.data[:min_len]
-        other_slice = other.data[:min_len]
-        
-        dot = sum(a * b for a, b in zip(self_slice, other_slice))
-        norm_self = math.sqrt(sum(a**2 for a in self_slice))
-        norm_other = math.sqrt(sum(b**2 for b in other_slice))
-        
-        if norm_self == 0 or norm_other == 0:
-            return 0.0
-            
-        kernel = abs(dot / (norm_self * norm_other))
+        kernel = _backend.cosine(self.data[:min_len], other.data[:min_len])
         return kernel * self.coherence * other.coherence
     
     def entangle(self, other: 'BumpyArray', threshold: float = QUALIA_THRESHOLD) -> bool:
@@ -416,8 +1243,7 @@ class BumpyArray:
     def __add__(self, other: Union['BumpyArray', int, float]) -> 'BumpyArray':
         """Enhanced addition with broadcasting"""
         other_bumpy = self._broadcast_other(other)
-        result_data = [a + b + self.chaos * self.coherence 
-                      for a, b in zip(self.data, other_bumpy.data)]
+        result_data = _backend.add(self.data, other_bumpy.data, self.chaos * self.coherence)
         result = BumpyArray(result_data, self.coherence)
         result.entangle(self)
         result.entangle(other_bumpy)
@@ -426,15 +1252,14 @@ class BumpyArray:
     def __iadd__(self, other: Union['BumpyArray', int, float]) -> 'BumpyArray':
         """In-place addition with broadcasting"""
         other_bumpy = self._broadcast_other(other)
-        for i in range(len(self.data)):
-            self.data[i] += other_bumpy.data[i] + self.chaos * self.coherence
+        self.data = _backend.iadd(self.data, other_bumpy.data, self.chaos * self.coherence)
         self.entangle(other_bumpy)
         return self
     
     def __mul__(self, other: Union['BumpyArray', int, float]) -> 'BumpyArray':
         """Multiplication with broadcasting"""
         other_bumpy = self._broadcast_other(other)
-        result_data = [a * b for a, b in zip(self.data, other_bumpy.data)]
+        result_data = _backend.mul(self.data, other_bumpy.data)
         result = BumpyArray(result_data, self.coherence)
         result.entangle(self)
         result.entangle(other_bumpy)
@@ -443,8 +1268,7 @@ class BumpyArray:
     def __imul__(self, other: Union['BumpyArray', int, float]) -> 'BumpyArray':
         """In-place multiplication with broadcasting"""
         other_bumpy = self._broadcast_other(other)
-        for i in range(len(self.data)):
-            self.data[i] *= other_bumpy.data[i]
+        self.data = _backend.imul(self.data, other_bumpy.data)
         self.entangle(other_bumpy)
         return self
     
@@ -452,18 +1276,15 @@ class BumpyArray:
         """Dot product with qualia modulation"""
         if len(self.data) != len(other.data):
             raise ValueError("Shape mismatch in dot product")
-        dot_sum = sum(a * b for a, b in zip(self.data, other.data))
+        dot_sum = _backend.dot(self.data, other.data)
         return dot_sum * self.coherence * other.coherence
     
     def relu(self) -> 'BumpyArray':
         """ReLU with resonance guidance - ENHANCEMENT 2"""
-        result_data = []
-        guidance = self.resonance_guidance[:len(self.data)] if self.resonance_guidance else [0] * len(self.data)
+        guidance = self.resonance_guidance[:len(self.data)] if len(self.resonance_guidance) else [0] * len(self.data)
         
-        for i, val in enumerate(self.data):
-            # Apply ReLU with resonance modulation
-            activated = max(0, val * self.coherence + guidance[i] * 0.1)
-            result_data.append(activated)
+        # Apply ReLU with resonance modulation
+        result_data = _backend.relu(self.data, self.coherence, guidance)
             
         result = BumpyArray(result_data, self.coherence)
         result.entangle(self)
@@ -471,23 +1292,12 @@ class BumpyArray:
     
     def softmax(self) -> 'BumpyArray':
         """Softmax with chaos sampling - FIXED BUG"""
-        exp_vals = [math.exp(x) for x in self.data]
-        sum_exp = sum(exp_vals)
-        
-        if sum_exp == 0:
-            result_data = [1.0 / len(self.data) for _ in self.data]
-        else:
-            result_data = [e / sum_exp for e in exp_vals]
+        result_data = _backend.softmax(self.data)
         
         # Emergent branch with proper variable names
         if self.coherence < 0.8 and random.random() < 0.1:
-            for i in range(len(result_data)):
-                result_data[i] += random.uniform(-0.01, 0.01)
-                result_data[i] = max(0, min(1, result_data[i]))
-            
-            sum_renorm = sum(result_data)
-            if sum_renorm > 0:
-                result_data = [d / sum_renorm for d in result_data]
+            noise = [random.uniform(-0.01, 0.01) for _ in range(len(result_data))]
+            result_data = _backend.perturb_simplex(result_data, noise)
         
         result = BumpyArray(result_data, self.coherence)
         result.entangle(self)
@@ -495,16 +1305,8 @@ class BumpyArray:
     
     def coherence_entropy(self) -> float:
         """Optimized entropy calculation - FIXED PERFORMANCE"""
-        total = sum(abs(x) for x in self.data)
-        if total == 0:
-            return 0.0
-            
         # Single computation of probabilities
-        probs = [abs(d) / total for d in self.data if abs(d) > 1e-10]
-        if not probs:
-            return 0.0
-            
-        entropy = -sum(p * math.log2(p + 1e-12) for p in probs)
+        entropy = _backend.entropy(self.data)
         return entropy * self.coherence
     
     def holographic_compress(self) -> 'BumpyArray':
@@ -522,6 +1324,66 @@ class BumpyArray:
         decompressed.entangle(self)
         return decompressed
     
+    @property
+    def data(self):
+        pins = self._list_pins
+        if pins is not None and not pins:
+            # Last view over former list storage is gone: hand back a plain list
+            self._data = self._data.tolist()
+            self._list_pins = None
+        return self._data
+    
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._list_pins = None
+    
+    def _pin_storage(self, holder):
+        """
+        Move list storage into a typed array('d') buffer so `holder` can share it.
+        
+        List storage is only borrowed: once every view and buffer export onto it
+        has been collected .data is a list again.
+        """
+        data = self.data
+        if isinstance(data, list):
+            self._data = array('d', data)
+            self._list_pins = {}
+        elif NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+            self.data = np.ascontiguousarray(data, dtype=np.float64)
+        if self._list_pins is not None:
+            # Keyed by the weakref: memoryviews and ndarrays are not hashable
+            ref = weakref.ref(holder, self._unpin_storage)
+            self._list_pins[id(ref)] = ref
+        return self._data
+    
+    def _unpin_storage(self, ref):
+        pins = self._list_pins
+        if pins is not None:
+            pins.pop(id(ref), None)
+    
+    def tolist(self) -> List[float]:
+        """Elements as a plain list of floats, whatever the backend storage"""
+        data = self.data
+        return data.tolist() if hasattr(data, 'tolist') else list(data)
+    
+    def view(self, lo: float = -math.inf, hi: float = math.inf,
+             coherence: Optional[float] = None) -> TrueZeroCopyView:
+        """ENHANCEMENT 5: Zero-copy view onto this array's storage (writes go through)"""
+        return TrueZeroCopyView(self, lo, hi, self.coherence if coherence is None else coherence)
+    
+    def as_memoryview(self) -> memoryview:
+        """Export the array's storage through the buffer protocol without copying"""
+        return self.view().as_memoryview()
+    
+    def resize(self, size: int) -> 'BumpyArray':
+        """Truncate or zero-extend in place; live views keep their pre-resize contents"""
+        data = list(self.data[:size])
+        data.extend([0.0] * (size - len(data)))
+        self.data = _backend.storage(data)
+        self.shape = (size,)
+        return self
+    
     def reshape(self, *shape):
         """Enhanced reshape with quantum state preservation (From QTorch integration)"""
         import math
@@ -573,16 +1435,491 @@ class BumpyArray:
         # Collapse to definite state
         self.coherence *= 0.8  # Decoherence on measurement
         # Wavefunction collapse simulation
-        for i in range(len(self.data)):
-            if random.random() < abs(self.data[i])**2:
-                self.data[i] = 1.0 if self.data[i] > 0 else -1.0
-            else:
-                self.data[i] = 0.0
+        draws = [random.random() for _ in range(len(self.data))]
+        self.data = _backend.collapse(self.data, draws)
         return self
 
     def __repr__(self):
         return f"BumpyArray(shape={self.shape}, coherence={self.coherence:.2f}, links={len(self.entanglement_links)})"
 
+class BumpyRow(BumpyArray):
+    """Row of a BumpyBatch that behaves like a BumpyArray
+
+    Data, coherence, chaos and phase live in the batch: reads and in-place updates go
+    straight to the shared block. Rows have the batch's fixed width.
+    """
+    
+    def __init__(self, batch: 'BumpyBatch', index: int):
+        self._batch = batch
+        self._row = index
+        self._data = batch._row_storage(index)
+        self._list_pins = None  # Row storage is typed: views share it directly
+        self.shape = (batch.width,)
+        self.entanglement_links: List['BumpyArray'] = []
+        self.quantum_state = "superposition"
+        self._entanglement_visited = set()
+        self.resonance_guidance: List[float] = []
+        self._compressor: Optional[HolographicCompressor] = None
+    
+    @property
+    def data(self):
+        return self._data
+    
+    @data.setter
+    def data(self, values):
+        if values is not self._data:
+            self._batch._write_row(self._row, values)
+    
+    @property
+    def coherence(self) -> float:
+        return float(self._batch.coherence[self._row])
+    
+    @coherence.setter
+    def coherence(self, value: float):
+        self._batch.coherence[self._row] = value
+    
+    @property
+    def chaos(self) -> float:
+        return float(self._batch.chaos[self._row])
+    
+    @chaos.setter
+    def chaos(self, value: float):
+        self._batch.chaos[self._row] = value
+    
+    @property
+    def phase(self) -> float:
+        return float(self._batch.phase[self._row])
+    
+    @phase.setter
+    def phase(self, value: float):
+        self._batch.phase[self._row] = value
+    
+    @property
+    def holographic_compressor(self) -> HolographicCompressor:
+        if self._compressor is None:
+            self._compressor = HolographicCompressor()
+        return self._compressor
+    
+    def __repr__(self):
+        return f"BumpyRow({self._row}, shape={self.shape}, coherence={self.coherence:.2f})"
+
+class BumpyBatch:
+    """ENHANCEMENT 11: N equal-length BumpyArrays as one contiguous row-major block
+
+    Elementwise arithmetic follows BumpyArray semantics row by row (chaos offset on
+    addition, entanglement coherence boosts), but runs as one backend kernel per
+    batch. Coherence boosts are applied; entanglement link lists are not recorded.
+    Rows drawn fresh (constructor, arithmetic results) take phase and chaos from the
+    `random` stream in the same order as constructing the BumpyArrays one by one.
+    """
+    
+    def __init__(self, rows, coherence: float = 1.0):
+        rows = [row.data if isinstance(row, BumpyArray) else row for row in rows]
+        width = self._check_rows(rows)
+        coherence = max(0.0, min(1.0, coherence))
+        self._assemble(_backend.block(rows, width), width, [coherence] * len(rows))
+        self._draw_row_states()
+    
+    @staticmethod
+    def _check_rows(rows) -> int:
+        if not rows or not len(rows[0]):
+            raise ValueError("BumpyBatch needs at least one non-empty row")
+        width = len(rows[0])
+        for row in rows:
+            if len(row) != width:
+                raise ValueError(f"BumpyBatch rows must have equal length: {len(row)} vs {width}")
+        return width
+    
+    @classmethod
+    def from_arrays(cls, arrays: List[BumpyArray]) -> 'BumpyBatch':
+        """Pack existing arrays, keeping their coherence, chaos and phase"""
+        rows = [arr.data for arr in arrays]
+        width = cls._check_rows(rows)
+        batch = cls.__new__(cls)
+        batch._assemble(_backend.block(rows, width), width, [arr.coherence for arr in arrays])
+        batch.chaos = _backend.storage([arr.chaos for arr in arrays])
+        batch.phase = _backend.storage([arr.phase for arr in arrays])
+        return batch
+    
+    def _assemble(self, block, width: int, coherence):
+        self.data = block
+        self.width = width
+        self.n_rows = len(block) // width
+        self.shape = (self.n_rows, width)
+        self.coherence = _backend.storage(coherence)
+        self._rows: List[Optional[BumpyRow]] = [None] * self.n_rows
+    
+    def _draw_row_states(self):
+        phases, chaos = [], []
+        for _ in range(self.n_rows):
+            phases.append(random.uniform(0, 2 * math.pi))
+            chaos.append(random.uniform(0.001, 0.01))
+        self.phase = _backend.storage(phases)
+        self.chaos = _backend.storage(chaos)
+    
+    def _derive(self, block, width: int) -> 'BumpyBatch':
+        result = BumpyBatch.__new__(BumpyBatch)
+        result._assemble(block, width, list(self.coherence))
+        result._draw_row_states()
+        return result
+    
+    # --- rows ---
+    
+    def _row_storage(self, index: int):
+        s = index * self.width
+        if isinstance(self.data, array):
+            return memoryview(self.data)[s:s + self.width]
+        return self.data[s:s + self.width]
+    
+    def _write_row(self, index: int, values):
+        if len(values) != self.width:
+            raise ValueError(f"BumpyBatch rows have fixed width {self.width}, got {len(values)}")
+        s = index * self.width
+        self.data[s:s + self.width] = array('d', values) if isinstance(self.data, array) else values
+    
+    def __len__(self) -> int:
+        return self.n_rows
+    
+    def __getitem__(self, index: int) -> BumpyRow:
+        """Cheap row view sharing the batch storage"""
+        if index < 0:
+            index += self.n_rows
+        if not 0 <= index < self.n_rows:
+            raise IndexError(f"Row {index} out of bounds")
+        row = self._rows[index]
+        if row is None:
+            row = self._rows[index] = BumpyRow(self, index)
+        return row
+    
+    def __iter__(self):
+        for i in range(self.n_rows):
+            yield self[i]
+    
+    # --- elementwise arithmetic ---
+    
+    def _operand(self, other):
+        """Flat block matching this batch for a batch, a row-broadcast array/sequence or a scalar"""
+        if isinstance(other, BumpyBatch):
+            if other.shape != self.shape:
+                raise ValueError(f"Shape mismatch: {self.shape} vs {other.shape}")
+            return other.data
+        if isinstance(other, (int, float)):
+            row = [float(other)] * self.width
+        else:
+            row = other.data if isinstance(other, BumpyArray) else other
+            if len(row) != self.width:
+                raise ValueError(f"Shape mismatch: {self.shape} vs ({len(row)},)")
+        if _backend is _NumpyBackend:
+            return np.tile(np.asarray(row, dtype=np.float64), self.n_rows)
+        return array('d', row) * self.n_rows
+    
+    def _entangle_rows(self, other, other_block):
+        """Row-wise entangle(): coherence boosts for rows whose kernel exceeds the threshold"""
+        cosines = _backend.row_cosine(self.data, other_block, self.width)
+        if isinstance(other, BumpyBatch):
+            self.coherence, other.coherence = _backend.coherence_boost(
+                self.coherence, other.coherence, cosines, QUALIA_THRESHOLD)
+        elif isinstance(other, BumpyArray):
+            # One array entangled with every row in turn: its coherence compounds
+            coherence = list(self.coherence)
+            for r, cos in enumerate(cosines):
+                sim = cos * coherence[r] * other.coherence
+                if sim > QUALIA_THRESHOLD:
+                    coherence[r] = min(1.0, coherence[r] * (1 + sim * 0.05))
+                    other.coherence = min(1.0, other.coherence * (1 + sim * 0.05))
+            self.coherence = _backend.storage(coherence)
+        else:
+            # Broadcast scalars are fresh coherence-1.0 arrays; only our side keeps the boost
+            self.coherence, _ = _backend.coherence_boost(
+                self.coherence, _backend.storage([1.0] * self.n_rows), cosines, QUALIA_THRESHOLD)
+    
+    def _offsets(self):
+        return [c * k for c, k in zip(self.chaos, self.coherence)]
+    
+    def __add__(self, other) -> 'BumpyBatch':
+        """Row-wise BumpyArray addition (per-row chaos offset) in one kernel"""
+        other_block = self._operand(other)
+        result = self._derive(_backend.badd(self.data, other_block, self.width, self._offsets()), self.width)
+        result._entangle_rows(self, self.data)
+        result._entangle_rows(other, other_block)
+        return result
+    
+    def __iadd__(self, other) -> 'BumpyBatch':
+        other_block = self._operand(other)
+        _backend.biadd(self.data, other_block, self.width, self._offsets())
+        self._entangle_rows(other, other_block)
+        return self
+    
+    def __mul__(self, other) -> 'BumpyBatch':
+        other_block = self._operand(other)
+        result = self._derive(_backend.bmul(self.data, other_block), self.width)
+        result._entangle_rows(self, self.data)
+        result._entangle_rows(other, other_block)
+        return result
+    
+    def __imul__(self, other) -> 'BumpyBatch':
+        other_block = self._operand(other)
+        _backend.bimul(self.data, other_block)
+        self._entangle_rows(other, other_block)
+        return self
+    
+    # --- row reductions ---
+    
+    def dot(self, other) -> List[float]:
+        """Row-wise dot products with qualia modulation"""
+        other_block = self._operand(other)
+        dots = _backend.row_dot(self.data, other_block, self.width)
+        if isinstance(other, BumpyBatch):
+            other_coherence = list(other.coherence)
+        else:
+            other_coherence = [getattr(other, 'coherence', 1.0)] * self.n_rows
+        return [float(d) * c * o for d, c, o in zip(dots, self.coherence, other_coherence)]
+    
+    def norm(self) -> List[float]:
+        """Row-wise L2 norms"""
+        return [math.sqrt(float(sq)) for sq in _backend.row_dot(self.data, self.data, self.width)]
+    
+    # --- batched chaos / coherence updates ---
+    
+    def apply_chaos(self, chaos_level: float):
+        """Inject chaos proportional to (1 - coherence) into every row, then decohere"""
+        shifts = [chaos_level * (1 - c) * random.uniform(-1, 1) for c in self.coherence]
+        _backend.shift_rows(self.data, self.width, shifts)
+        self.chaos = _backend.storage([min(0.1, k * 1.05) for k in self.chaos])
+        self.coherence = _backend.storage([c * (1 - 0.01 * chaos_level) for c in self.coherence])
+        return self
+    
+    def dampen_chaos(self, damping_factor: float = CRITICALITY_DAMPING_FACTOR):
+        """Damp chaos and restore some coherence on every row"""
+        self.chaos = _backend.storage([k * damping_factor for k in self.chaos])
+        self.coherence = _backend.storage([min(1.0, c * 1.01) for c in self.coherence])
+        return self
+    
+    def quantum_measure(self):
+        """Row-wise quantum_measure(): same draws, in the same order, as measuring each row"""
+        self.coherence = _backend.storage([c * 0.8 for c in self.coherence])
+        draws = [random.random() for _ in range(len(self.data))]
+        collapsed = _backend.collapse(self.data, draws)
+        if collapsed is not self.data:
+            self.data[:] = collapsed if not isinstance(self.data, array) else array('d', collapsed)
+        return self
+    
+    # --- compression ---
+    
+    def take_columns(self, step: int) -> 'BumpyBatch':
+        """Every `step`-th column of every row, keeping row coherence, chaos and phase"""
+        block = _backend.take_columns(self.data, self.width, step)
+        result = BumpyBatch.__new__(BumpyBatch)
+        result._assemble(block, len(block) // self.n_rows, list(self.coherence))
+        result.chaos = _backend.storage(list(self.chaos))
+        result.phase = _backend.storage(list(self.phase))
+        return result
+    
+    def holographic_compress(self) -> 'BumpyBatch':
+        """ENHANCEMENT 1 for all rows at once: the fractal boundary projection of each row"""
+        if self.width <= 1:
+            return self.take_columns(1)
+        return self.take_columns(2 ** FRACTAL_ITERATIONS)
+    
+    def tolist(self) -> List[List[float]]:
+        return [[float(x) for x in self.data[s:s + self.width]] for s in range(0, len(self.data), self.width)]
+    
+    def __repr__(self):
+        return f"BumpyBatch(shape={self.shape})"
+
+class EntanglementCandidateIndex:
+    """ENHANCEMENT 10: Sub-quadratic candidate generation for the emergence ritual
+
+    Entanglement requires lambda_kernel > threshold, and since coherence <= 1 that
+    implies |cos| > threshold on the shared prefix. The index returns (i, j) pairs,
+    i < j, whose |cos| exceeds the threshold:
+
+    - 'gram': blocked normalized Gram matrix. Exact candidate set, vectorized O(n^2 d).
+    - 'lsh':  random-hyperplane (SimHash) LSH, banded over several tables, followed by
+              an exact cosine check. Approximate (recall < 1), sub-quadratic.
+
+    Requires numpy; BUMPYCore falls back to the exact pairwise pass without it.
+    """
+
+    def __init__(self, hash_bits: Optional[int] = None, tables: int = LSH_TABLES,
+                 block_rows: int = GRAM_BLOCK_ROWS, seed: int = LSH_SEED):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("EntanglementCandidateIndex requires numpy")
+        self.hash_bits = hash_bits
+        self.tables = tables
+        self.block_rows = block_rows
+        # |cos| criterion: anti-parallel vectors share a (folded) bucket
+        self._lsh = SimHashLSH(tables, seed, hash_bits=hash_bits, bits_range=(8, 24), bits_slack=1, fold=True)
+
+    def candidate_pairs(self, arrays: List['BumpyArray'], threshold: float = QUALIA_THRESHOLD,
+                        mode: str = 'gram') -> List[Tuple[int, int]]:
+        """Sorted (i, j) index pairs whose prefix |cos| exceeds `threshold`"""
+        if mode not in ('gram', 'lsh'):
+            raise ValueError(f"Unknown candidate mode: {mode!r}")
+
+        # lambda_kernel compares equal-length prefixes, so group arrays by length
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for idx, arr in enumerate(arrays):
+            groups[len(arr.data)].append(idx)
+        lengths = sorted(groups)
+        matrices = {n: np.array([np.asarray(arrays[i].data, dtype=np.float64) for i in groups[n]])
+                    for n in lengths if n > 0}
+
+        # Small slack so float rounding never drops a pair the exact pass would keep
+        cutoff = threshold - 1e-9
+        pairs = set()
+        for ai, la in enumerate(lengths):
+            if la == 0:
+                continue
+            for lb in lengths[ai:]:
+                left = unit_rows(matrices[la])
+                right = left if lb == la else unit_rows(matrices[lb][:, :la])
+                for li, ri in self._pairs(left, right, lb == la, cutoff, mode):
+                    for a, b in zip(li.tolist(), ri.tolist()):
+                        i, j = groups[la][a], groups[lb][b]
+                        pairs.add((i, j) if i < j else (j, i))
+        return sorted(pairs)
+
+    def _pairs(self, left, right, same: bool, threshold: float, mode: str):
+        """(left rows, right rows) blocks whose |cos| exceeds `threshold`"""
+        if mode == 'gram':
+            for li, ri, _ in gram_pairs(left.shape[0], right.shape[0],
+                                        lambda start, stop: np.abs(left[start:stop] @ right.T),
+                                        threshold, same, self.block_rows):
+                yield li, ri
+        else:
+            yield self._lsh.pairs(left, right, same,
+                                  lambda cl, cr: np.abs(np.einsum('ij,ij->i', left[cl], right[cr])) > threshold)
+
+class CompressedState:
+    """Handle to a state held in a CoherenceChunkStore (decompressed lazily, chunk by chunk)
+
+    Holding the handle holds references on its chunks; they are released by release()
+    or when the handle is garbage collected.
+    """
+    
+    def __init__(self, store: 'CoherenceChunkStore', digests: Tuple[bytes, ...], length: int):
+        self.store = store
+        self.digests = digests
+        self.length = length
+        self._last_chunk: Tuple[int, Any] = (-1, None)
+        self._finalizer = weakref.finalize(self, store._release, digests)
+    
+    def release(self):
+        self._finalizer()
+    
+    def _chunk(self, k: int):
+        if self._last_chunk[0] != k:
+            self._last_chunk = (k, self.store.chunk(self.digests[k]))
+        return self._last_chunk[1]
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(f"Index {index} out of bounds")
+        k, offset = divmod(index, self.store.chunk_floats)
+        return self._chunk(k)[offset]
+    
+    def __iter__(self):
+        for k in range(len(self.digests)):
+            yield from self._chunk(k)
+    
+    def tolist(self) -> List[float]:
+        return list(self)
+    
+    def __repr__(self):
+        return f"CompressedState(len={self.length}, chunks={len(self.digests)})"
+
+class CoherenceChunkStore:
+    """ENHANCEMENT 12: Content-addressed, deduplicating store for compressed states
+
+    States are cut into fixed chunks of `chunk_floats` float64 values; each chunk is
+    keyed by its blake2b digest, kept once (zlib-deflated) and reference counted,
+    so identical or partially identical states across arrays share storage. Reads
+    inflate single chunks into a bounded LRU.
+    """
+    
+    def __init__(self, chunk_floats: int = CHUNK_FLOATS, cache_bytes: int = CHUNK_CACHE_BYTES):
+        self.chunk_floats = chunk_floats
+        self._chunks: Dict[bytes, Tuple[bool, bytes, int]] = {}  # digest -> (deflated, payload, raw size)
+        self._refs: Dict[bytes, int] = {}
+        self._inflated = _ByteBudgetLRU(cache_bytes)
+        self.logical_bytes = 0   # Bytes referenced by live handles
+        self.unique_bytes = 0    # Raw bytes of distinct chunks
+        self.stored_bytes = 0    # Payload bytes actually held
+    
+    def put(self, data) -> CompressedState:
+        if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+            raw = np.ascontiguousarray(data, dtype=np.float64).tobytes()
+        else:
+            raw = array('d', data).tobytes()
+        step = 8 * self.chunk_floats
+        digests = []
+        for start in range(0, len(raw), step):
+            piece = raw[start:start + step]
+            digest = hashlib.blake2b(piece, digest_size=16).digest()
+            if digest in self._refs:
+                self._refs[digest] += 1
+            else:
+                deflated = zlib.compress(piece, CHUNK_ZLIB_LEVEL)
+                entry = (True, deflated, len(piece)) if len(deflated) < len(piece) else (False, piece, len(piece))
+                self._chunks[digest] = entry
+                self._refs[digest] = 1
+                self.unique_bytes += len(piece)
+                self.stored_bytes += len(entry[1])
+            digests.append(digest)
+        self.logical_bytes += len(raw)
+        return CompressedState(self, tuple(digests), len(raw) // 8)
+    
+    def share(self, state: CompressedState) -> CompressedState:
+        """New handle on the chunks of `state` (no hashing or copying)"""
+        for digest in state.digests:
+            self._refs[digest] += 1
+            self.logical_bytes += self._chunks[digest][2]
+        return CompressedState(self, state.digests, state.length)
+    
+    def chunk(self, digest: bytes) -> array:
+        """Inflated values of one chunk"""
+        values = self._inflated.get(digest)
+        if values is None:
+            deflated, payload, size = self._chunks[digest]
+            values = array('d')
+            values.frombytes(zlib.decompress(payload) if deflated else payload)
+            self._inflated.put(digest, values, size)
+        return values
+    
+    def _release(self, digests: Tuple[bytes, ...]):
+        for digest in digests:
+            self.logical_bytes -= self._chunks[digest][2]
+            self._refs[digest] -= 1
+            if self._refs[digest] == 0:
+                _, payload, size = self._chunks.pop(digest)
+                del self._refs[digest]
+                self._inflated.pop(digest)
+                self.unique_bytes -= size
+                self.stored_bytes -= len(payload)
+    
+    def __len__(self) -> int:
+        return len(self._chunks)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'chunks': len(self._chunks),
+            'references': sum(self._refs.values()),
+            'logical_bytes': self.logical_bytes,
+            'unique_bytes': self.unique_bytes,
+            'stored_bytes': self.stored_bytes,
+            'dedup_ratio': self.logical_bytes / self.unique_bytes if self.unique_bytes else 1.0,
+            'bytes_saved': self.logical_bytes - self.stored_bytes,
+            'inflated_cache': self._inflated.stats()
+        }
+
 class BUMPYCore:
     """Enhanced Core Engine with All Breakthroughs"""
     
@@ -601,6 +1938,11 @@ class BUMPYCore:
         self.panpsychic_field = PanpsychicResonanceField()
         self.oracular_oracle = OracularEntropyOracle()
         self.quantum_chaos_level = 0.0
+        self.candidate_index: Optional[EntanglementCandidateIndex] = None
+        self.last_ritual_stats: Dict[str, Any] = {}
+        self.compression_store = CoherenceChunkStore()
+        # (mode, input fingerprint) -> handle of the compressed state in compression_store
+        self._compressed_states = _ByteBudgetLRU(COMPRESSED_STATE_MEMO_BYTES)
         
     def set_coherence(self, rho: float):
         """Enhanced coherence setting with quantum noise resistance"""
@@ -618,21 +1960,57 @@ class BUMPYCore:
             id(self), self.coherence_level, [self.coherence_level], size)
     
     def coherence_compress(self, data: List[float]) -> List[float]:
-        """ENHANCEMENT 9: Cognitive memory compression with qualia preservation"""
-        if not data:
+        """ENHANCEMENT 9: Cognitive memory compression with qualia preservation
+        
+        Compressed states live in the deduplicating compression_store, keyed by input
+        content: a state seen before (clones, freshly initialised nodes) is read back
+        instead of recompressed.
+        """
+        if not len(data):
             return data
-            
+        return self._compress_to_store(data).tolist()
+    
+    def coherence_compress_stored(self, data: List[float]) -> CompressedState:
+        """ENHANCEMENT 12: coherence_compress() as a handle into the shared chunk store"""
+        # A handle of its own: releasing it must not drop the remembered state
+        return self.compression_store.share(self._compress_to_store(data))
+    
+    def _compress_to_store(self, data) -> CompressedState:
         # Use holographic compression for high coherence
         if self._rho_ema > COHERENCE_COMPRESSION_BOUND:
-            compressor = HolographicCompressor()
-            return compressor.project_to_boundary(data)
+            mode = 'holographic'
         elif self._rho_ema > 0.80:
-            return data[::2]  # 50% reduction
-        return data[:]  # No compression
+            mode = 'half'
+        else:
+            mode = 'none'
+        key = (mode, content_fingerprint(data))
+        handle = self._compressed_states.get(key)
+        if handle is None:
+            if mode == 'holographic':
+                compressed = HolographicCompressor().project_to_boundary(data)
+            elif mode == 'half':
+                compressed = data[::2]  # 50% reduction
+            else:
+                compressed = data[:]  # No compression
+            handle = self.compression_store.put(compressed)
+            self._compressed_states.put(key, handle, 8 * len(handle))
+        return handle
+    
+    def compression_stats(self) -> Dict[str, Any]:
+        """Dedup ratio, bytes saved and cache behaviour of the compressed state store"""
+        return self.compression_store.stats()
+    
+    def coherence_compress_batch(self, batch: BumpyBatch) -> BumpyBatch:
+        """ENHANCEMENT 9 for a whole BumpyBatch: one kernel instead of a call per row"""
+        if self._rho_ema > COHERENCE_COMPRESSION_BOUND:
+            return batch.holographic_compress()
+        elif self._rho_ema > 0.80:
+            return batch.take_columns(2)  # 50% reduction
+        return batch.take_columns(1)  # No compression
     
     def generate_drift_tensor(self, size: int) -> TrueZeroCopyView:
         """ENHANCEMENT 5: True zero-copy drift tensor"""
-        drift = [random.uniform(POLYTOPE_LO, POLYTOPE_HI) for _ in range(size)]
+        drift = array('d', [random.uniform(POLYTOPE_LO, POLYTOPE_HI) for _ in range(size)])
         return TrueZeroCopyView(drift, POLYTOPE_LO, POLYTOPE_HI, self.coherence_level)
     
     def recursive_criticality_damping(self, d_lambda_dt: float) -> float:
@@ -672,22 +2050,51 @@ class BUMPYCore:
             
         return max(0.001, base_duration * (1.0 + 0.05 * modulation) * resonance_factor)
     
-    def qualia_emergence_ritual(self, arrays: List[BumpyArray]):
-        """Enhanced emergence ritual with all breakthroughs"""
+    def qualia_emergence_ritual(self, arrays: List[BumpyArray], mode: str = 'auto'):
+        """Enhanced emergence ritual with all breakthroughs
+        
+        mode: 'exact' (every pair), 'gram' or 'lsh' (EntanglementCandidateIndex),
+              or 'auto' to pick by array count and numpy availability.
+        """
         # ENHANCEMENT 4: Safe entanglement without O(n²) recursion
         n = len(arrays)
-        for i in range(n):
-            for j in range(i + 1, n):
-                arrays[i].entangle(arrays[j])
+        if mode == 'auto':
+            if not NUMPY_AVAILABLE or n <= RITUAL_EXACT_MAX:
+                mode = 'exact'
+            else:
+                mode = 'gram' if n <= RITUAL_GRAM_MAX else 'lsh'
+        
+        # ENHANCEMENT 10: Only candidate pairs reach entangle(); visiting them in
+        # (i, j) order reproduces the exact pass whenever the candidate set is complete
+        start = time.perf_counter()
+        if mode == 'exact':
+            pairs = ((i, j) for i in range(n) for j in range(i + 1, n))
+        else:
+            if self.candidate_index is None:
+                self.candidate_index = EntanglementCandidateIndex()
+            pairs = self.candidate_index.candidate_pairs(arrays, QUALIA_THRESHOLD, mode)
+        
+        candidates = entangled = 0
+        for i, j in pairs:
+            candidates += 1
+            if arrays[i].entangle(arrays[j]):
+                entangled += 1
+        self.last_ritual_stats = {
+            'mode': mode,
+            'arrays': n,
+            'candidate_pairs': candidates,
+            'entangled_pairs': entangled,
+            'pair_pass_s': time.perf_counter() - start
+        }
                 
         # ENHANCEMENT 2: Update panpsychic resonance field
         for arr in arrays:
-            self.panpsychic_field.update_pilot_wave(id(arr), arr.data, arr.coherence)
+            self.panpsychic_field.update_pilot_wave(id(arr), arr.data, arr.coherence, owner=arr)
             arr.resonance_guidance = self.panpsychic_field.get_resonance_guidance(id(arr))
             
         # ENHANCEMENT 3: Record future states for retrocausality
         for arr in arrays:
-            self.oracular_oracle.record_future_state(id(arr), arr.coherence, arr.data)
+            self.oracular_oracle.record_future_state(id(arr), arr.coherence, arr.data, owner=arr)
             
         # Collective coherence adjustment
         avg_coherence = sum(arr.coherence for arr in arrays) / n
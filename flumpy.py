@@ -5,10 +5,31 @@ FLUMPY v1.0 - Fluctuating Luminal Memory Processing Unit
 """
 
 import math
+import mmap
+import os
 import random
+import struct
+import itertools
 import time
+import threading
+import zlib
+from time import perf_counter
+from array import array
+from operator import mul, itemgetter
 from typing import List, Dict, Tuple, Optional, Union, Any
 from collections import defaultdict
+from collections.abc import MutableMapping
+from contextlib import contextmanager, nullcontext
+
+# Optional vectorized kernels
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from similarity_index import SimHashLSH, gram_pairs, unit_rows
 
 # ============================================================
 # CONSTANTS
@@ -33,6 +54,28 @@ EMA_ALPHA = 0.15  # Exponential moving average weight
 PHASE_COUPLING = 0.45  # Inter-array phase coupling strength
 DECOHERENCE_RATE = 0.02  # Natural coherence decay per operation
 
+# Kernel Constants
+SIMILARITY_BLOCK_ROWS = 1024  # Row block of the batched similarity kernel
+CONVOLVE_DIRECT_MAX = 128  # Shorter operand length up to which pure-Python convolution stays direct
+CONVOLVE_DIRECT_MAX_NUMPY = 256  # Same crossover for numpy.convolve vs rfft
+
+# Bulk Entanglement Constants
+ENTANGLE_SEQUENTIAL_MAX = 64     # Up to this many arrays the legacy pairwise pass is used
+ENTANGLE_GRAM_MAX = 20000        # Exact blocked candidates up to here, LSH beyond
+MAX_ENTANGLEMENT_DEGREE = 32     # New links stop at this many per array in bulk mode
+LSH_TABLES = 48
+LSH_SEED = 618
+
+# Registry Constants
+REGISTRY_SHARDS = 16  # Lock stripes of FlumpyCore.arrays
+LAZY_CHAOS_MAX_ROUNDS = 64  # Pending global chaos rounds before the registry settles every array
+
+# Persistent Store Constants
+STORE_MAGIC = b'FLUMPIDX'
+STORE_VERSION = 1
+STORE_ALIGN = 64  # Payload extents start on cache-line boundaries
+STORE_INITIAL_BYTES = 1 << 20
+
 # ============================================================
 # FLUMPY ARRAY - Core Data Structure
 # ============================================================
@@ -42,13 +85,17 @@ class FlumpyArray:
     Quantum-cognitive array with sentience-aware operations.
     
     Features:
-    - List-based storage (zero external dependencies)
+    - Typed contiguous float64 storage (array('d'), zero external dependencies)
     - Coherence tracking for cognitive modeling
     - Automatic entanglement based on similarity
     - Chaos injection for exploration
     - Broadcasting support (scalar/vector operations)
     """
     
+    __slots__ = ('_data', 'shape', '_coherence', '_chaos', 'phase', 'entangled_with',
+                 '_visited_ids', 'creation_time', 'operation_count', '_registries',
+                 '_chaos_ledger', '_chaos_epoch', '_chaos_key', '__weakref__')
+    
     def __init__(self, data: Union[List[float], float, int], coherence: float = 1.0):
         """
         Initialize FlumpyArray.
@@ -57,13 +104,18 @@ class FlumpyArray:
             data: Initial data (list, scalar, or integer)
             coherence: Initial coherence level [0, 1]
         """
+        self._registries: Optional[List['_RegistryShard']] = None  # Registry shards tracking our aggregates
+        self._chaos_ledger: Optional['_ChaosLedger'] = None  # Pending global chaos rounds (lazy)
+        self._chaos_epoch = 0
+        self._chaos_key = 0
+        
         # Handle scalar/vector initialization
         if isinstance(data, (int, float)):
-            self.data = [float(data)]
+            self.data = array('d', (float(data),))
             self.shape = (1,)
         else:
-            self.data = [float(x) for x in data]  # Ensure float type
-            self.shape = (len(data),)
+            self.data = _as_float_array(data)
+            self.shape = (len(self.data),)
         
         # Cognitive state
         self.coherence = max(0.0, min(1.0, coherence))
@@ -78,6 +130,120 @@ class FlumpyArray:
         self.creation_time = time.time()
         self.operation_count = 0
         
+    # ========================================
+    # TRACKED STATE
+    # ========================================
+    
+    @property
+    def data(self) -> array:
+        ledger = self._chaos_ledger
+        if ledger is not None and self._chaos_epoch != ledger.epoch:
+            self._settle_chaos()
+        return self._data
+    
+    @data.setter
+    def data(self, value: array):
+        ledger = self._chaos_ledger
+        if ledger is not None and self._chaos_epoch != ledger.epoch:
+            self._settle_chaos()  # Pending rounds belong to the old contents' history
+        self._data = value
+    
+    @property
+    def coherence(self) -> float:
+        ledger = self._chaos_ledger
+        if ledger is not None and self._chaos_epoch != ledger.epoch:
+            self._settle_chaos()
+        return self._coherence
+    
+    @coherence.setter
+    def coherence(self, value: float):
+        ledger = self._chaos_ledger
+        if ledger is not None and self._chaos_epoch != ledger.epoch:
+            self._settle_chaos()
+        shards = self._registries
+        if not shards:
+            self._coherence = value
+        elif len(shards) == 1:
+            # Read-modify-write under the shard lock so concurrent writers cannot lose deltas
+            with shards[0].lock:
+                shards[0].coherence_sum += value - self._coherence
+                self._coherence = value
+        else:
+            with _shards_locked(shards):
+                delta = value - self._coherence
+                for shard in shards:
+                    shard.coherence_sum += delta
+                self._coherence = value
+    
+    @property
+    def chaos(self) -> float:
+        ledger = self._chaos_ledger
+        if ledger is not None and self._chaos_epoch != ledger.epoch:
+            self._settle_chaos()
+        return self._chaos
+    
+    @chaos.setter
+    def chaos(self, value: float):
+        ledger = self._chaos_ledger
+        if ledger is not None and self._chaos_epoch != ledger.epoch:
+            self._settle_chaos()
+        shards = self._registries
+        if not shards:
+            self._chaos = value
+        elif len(shards) == 1:
+            with shards[0].lock:
+                shards[0].chaos_sum += value - self._chaos
+                self._chaos = value
+        else:
+            with _shards_locked(shards):
+                delta = value - self._chaos
+                for shard in shards:
+                    shard.chaos_sum += delta
+                self._chaos = value
+    
+    def _settle_chaos(self) -> None:
+        """
+        Materialize the global chaos/damping rounds recorded since our last read.
+        
+        All pending rounds compose into one scalar pass: coherence and chaos are
+        replayed round by round, injections sum into a single offset added to every
+        element. Injection noise comes from a counter-based generator keyed by the
+        round seed and our ledger key, so the outcome is independent of read order.
+        """
+        ledger = self._chaos_ledger
+        if ledger is None:
+            return
+        with _shards_locked(self._registries) if self._registries else nullcontext():
+            with ledger.lock:
+                pending = ledger.rounds[self._chaos_epoch - ledger.base_epoch:]
+                self._chaos_epoch = ledger.epoch
+            if pending:
+                self._apply_chaos_rounds(pending)
+    
+    def _apply_chaos_rounds(self, rounds) -> None:
+        offset, coherence, chaos = _replay_chaos_rounds(rounds, self._chaos_key,
+                                                        self._coherence, self._chaos)
+        if offset:
+            data = self._data
+            data[:] = array('d', map(offset.__add__, data))
+        self.chaos = chaos
+        self.coherence = coherence
+    
+    def _link(self, other: 'FlumpyArray') -> None:
+        """Add `other` to our entanglement list (aggregates follow)."""
+        self.entangled_with.append(other)
+        if self._registries:
+            for shard in self._registries:
+                with shard.lock:
+                    shard.total_entanglements += 1
+    
+    def _unlink(self, other: 'FlumpyArray') -> None:
+        self.entangled_with.remove(other)
+        if self._registries:
+            for shard in self._registries:
+                with shard.lock:
+                    shard.total_entanglements -= 1
+    
     # ========================================
     # CORE OPERATIONS
     # ========================================
@@ -115,18 +281,19 @@ class FlumpyArray:
         
         Uses normalized dot product with phase coherence modulation.
         """
-        if len(self.data) != len(other.data):
+        a, b = self.data, other.data
+        if len(a) != len(b):
             raise ValueError("Arrays must have same shape for similarity computation")
         
         # Normalize both vectors
-        norm_self = math.sqrt(sum(x**2 for x in self.data))
-        norm_other = math.sqrt(sum(x**2 for x in other.data))
+        norm_self = math.sqrt(sum(map(mul, a, a)))
+        norm_other = math.sqrt(sum(map(mul, b, b)))
         
         if norm_self == 0 or norm_other == 0:
             return 0.0
         
         # Dot product
-        dot = sum(a * b for a, b in zip(self.data, other.data))
+        dot = sum(map(mul, a, b))
         
         # Phase coherence factor
         phase_diff = abs(self.phase - other.phase) % (2 * math.pi)
@@ -157,9 +324,9 @@ class FlumpyArray:
         if similarity > threshold:
             # Create bidirectional entanglement
             if other not in self.entangled_with:
-                self.entangled_with.append(other)
+                self._link(other)
             if self not in other.entangled_with:
-                other.entangled_with.append(self)
+                other._link(self)
             
             # Boost coherence through resonance
             coherence_boost = 0.05 * similarity
@@ -177,9 +344,9 @@ class FlumpyArray:
     def disentangle(self, other: 'FlumpyArray') -> bool:
         """Remove entanglement with another array."""
         if other in self.entangled_with:
-            self.entangled_with.remove(other)
+            self._unlink(other)
         if self in other.entangled_with:
-            other.entangled_with.remove(self)
+            other._unlink(self)
         
         # Apply decoherence penalty
         self.coherence *= (1 - DECOHERENCE_RATE)
@@ -354,26 +521,48 @@ class FlumpyArray:
         result.entangle(self)
         return result
     
-    def convolve(self, kernel: 'FlumpyArray') -> 'FlumpyArray':
-        """Simple convolution operation."""
-        kernel_size = len(kernel.data)
-        result_size = len(self.data) - kernel_size + 1
-        
-        if result_size <= 0:
-            return FlumpyArray([], self.coherence * kernel.coherence)
-        
-        result_data = []
-        for i in range(result_size):
-            conv_sum = 0.0
-            for j in range(kernel_size):
-                conv_sum += self.data[i + j] * kernel.data[j]
-            result_data.append(conv_sum)
+    def _signal_result(self, data: List[float], coherence: float,
+                       *sources: 'FlumpyArray') -> 'FlumpyArray':
+        result = FlumpyArray(data, coherence)
+        for source in sources:
+            if len(source.data) == len(result.data):  # Similarity needs equal lengths
+                result.entangle(source)
+        return result
+    
+    def convolve(self, kernel: 'FlumpyArray', mode: str = 'full',
+                 method: str = 'auto') -> 'FlumpyArray':
+        """
+        Linear convolution with numpy.convolve semantics.
         
-        result = FlumpyArray(result_data, self.coherence * kernel.coherence)
-        result.entangle(self)
-        result.entangle(kernel)
+        Args:
+            kernel: Array to convolve with
+            mode: 'full' (n+k-1 samples), 'same' (max(n, k)) or 'valid' (max - min + 1)
+            method: 'direct', 'fft' or 'auto' (direct for short operands, FFT otherwise;
+                numpy when installed, a pure radix-2 FFT when not)
+        """
+        data = _convolve_signals(self.data, kernel.data, mode, method, flip=True)
+        return self._signal_result(data, self.coherence * kernel.coherence, self, kernel)
+    
+    def correlate(self, other: 'FlumpyArray', mode: str = 'valid',
+                  method: str = 'auto') -> 'FlumpyArray':
+        """Cross-correlation with numpy.correlate semantics (modes and methods as in convolve)."""
+        data = _convolve_signals(self.data, other.data, mode, method, flip=False)
+        return self._signal_result(data, self.coherence * other.coherence, self, other)
+    
+    def autocorrelate(self, mode: str = 'full', method: str = 'auto',
+                      normalize: bool = False) -> 'FlumpyArray':
+        """
+        Autocorrelation of the array with itself.
         
-        return result
+        With `normalize`, lags are divided by the zero-lag energy so the peak is 1.0,
+        which makes resonance periods comparable across arrays of different scale.
+        """
+        data = _convolve_signals(self.data, self.data, mode, method, flip=False)
+        if normalize:
+            energy = sum(map(mul, self.data, self.data))
+            if energy > 0:
+                data = [x / energy for x in data]
+        return self._signal_result(data, self.coherence, self)
     
     # ========================================
     # QUANTUM-COGNITIVE OPERATIONS
@@ -498,12 +687,12 @@ class FlumpyArray:
     
     def to_list(self) -> List[float]:
         """Convert to regular Python list."""
-        return self.data[:]
+        return self.data.tolist()
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
-            "data": self.data,
+            "data": self.data.tolist(),
             "shape": self.shape,
             "coherence": self.coherence,
             "chaos": self.chaos,
@@ -523,6 +712,153 @@ class FlumpyArray:
         
         return arr
 
+def _as_float_array(data) -> array:
+    """Copy any sequence of numbers into contiguous float64 storage."""
+    if isinstance(data, array) and data.typecode == 'd':
+        return array('d', data)
+    if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+        out = array('d')
+        out.frombytes(np.ascontiguousarray(data, dtype=np.float64).tobytes())
+        return out
+    try:
+        return array('d', data)
+    except TypeError:
+        return array('d', [float(x) for x in data])  # e.g. numeric strings
+
+# ============================================================
+# SIGNAL KERNELS
+# ============================================================
+
+def _fft_roots(n: int) -> List[complex]:
+    """exp(-2*pi*i*k/n) for k < n/2 (memoized per transform size)."""
+    roots = _FFT_ROOTS.get(n)
+    if roots is None:
+        roots = [complex(math.cos(2 * math.pi * k / n), -math.sin(2 * math.pi * k / n))
+                 for k in range(n // 2)]
+        _FFT_ROOTS[n] = roots
+    return roots
+
+_FFT_ROOTS: Dict[int, List[complex]] = {}
+
+def _fft(x: List[complex], invert: bool = False) -> List[complex]:
+    """Iterative radix-2 Cooley-Tukey FFT; len(x) must be a power of two (unnormalized)."""
+    n = len(x)
+    # Bit-reversal permutation
+    x = list(x)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            x[i], x[j] = x[j], x[i]
+    
+    roots = _fft_roots(n)
+    if invert:
+        roots = [w.conjugate() for w in roots]
+    half = 1
+    while half < n:
+        size = 2 * half
+        twiddles = roots[::n // size]
+        if half < n // size:
+            # Many short blocks: loop over twiddles, butterflying every block via strided slices
+            for k, w in enumerate(twiddles):
+                lo = x[k::size]
+                hi = [a * w for a in x[k + half::size]]
+                x[k::size] = [a + b for a, b in zip(lo, hi)]
+                x[k + half::size] = [a - b for a, b in zip(lo, hi)]
+        else:
+            for start in range(0, n, size):
+                mid = start + half
+                lo = x[start:mid]
+                hi = [a * w for a, w in zip(x[mid:start + size], twiddles)]
+                x[start:mid] = [a + b for a, b in zip(lo, hi)]
+                x[mid:start + size] = [a - b for a, b in zip(lo, hi)]
+        half = size
+    return x
+
+def _mode_window(n: int, m: int, mode: str) -> Tuple[int, int]:
+    """(start, length) of the requested mode inside the full n+m-1 output (numpy conventions)."""
+    short, long_ = min(n, m), max(n, m)
+    if mode == 'full':
+        return 0, n + m - 1
+    if mode == 'same':
+        return (short - 1) // 2, long_
+    if mode == 'valid':
+        return short - 1, long_ - short + 1
+    raise ValueError(f"mode must be 'full', 'same' or 'valid', got {mode!r}")
+
+def _direct_correlate(a: array, v: array, start: int, length: int) -> List[float]:
+    """Lags [start, start+length) of the full cross-correlation, one shared-prefix dot per lag."""
+    n, m = len(a), len(v)
+    a_view, v_view = memoryview(a), memoryview(v)
+    out = []
+    for k in range(start, start + length):
+        shift = k - (m - 1)  # a index aligned with v[0]
+        j0 = max(0, -shift)
+        j1 = min(m, n - shift)
+        out.append(sum(map(mul, a_view[shift + j0:shift + j1], v_view[j0:j1])) if j1 > j0 else 0.0)
+    return out
+
+def _fft_convolve(a: array, b: array, start: int, length: int) -> List[float]:
+    """Slice of the full linear convolution via one packed complex radix-2 FFT pair."""
+    full = len(a) + len(b) - 1
+    size = 1 << max(0, (full - 1).bit_length())
+    # Pack both real signals into one complex transform: z = a + i*b
+    z = [complex(x, y) for x, y in zip(a, b)]
+    if len(a) > len(b):
+        z.extend(a[len(b):])
+    else:
+        z.extend(complex(0.0, y) for y in b[len(a):])
+    z.extend([0j] * (size - len(z)))
+    Z = _fft(z)
+    # A_k*B_k = (Z_k^2 - conj(Z_{-k})^2) / 4i
+    product = [(Z[k] * Z[k] - (Z[-k].conjugate()) ** 2) * -0.25j for k in range(size)]
+    product = _fft(product, invert=True)
+    scale = 1.0 / size
+    return [c.real * scale for c in product[start:start + length]]
+
+def _signal_method(n: int, m: int, method: str) -> str:
+    if method not in ('auto', 'direct', 'fft'):
+        raise ValueError(f"method must be 'auto', 'direct' or 'fft', got {method!r}")
+    if method != 'auto':
+        return method
+    direct_max = CONVOLVE_DIRECT_MAX_NUMPY if NUMPY_AVAILABLE else CONVOLVE_DIRECT_MAX
+    return 'direct' if min(n, m) <= direct_max else 'fft'
+
+def _convolve_signals(a: array, v: array, mode: str, method: str, flip: bool) -> List[float]:
+    """
+    Linear convolution (flip=True) or cross-correlation (flip=False) of two float arrays.
+    
+    Output conventions follow numpy.convolve / numpy.correlate for every mode.
+    """
+    n, m = len(a), len(v)
+    if n == 0 or m == 0:
+        raise ValueError("convolution operands must be non-empty")
+    start, length = _mode_window(n, m, mode)
+    if not flip and mode == 'same' and m > n:
+        start = n // 2  # numpy.correlate swaps the operands and reverses the output
+    method = _signal_method(n, m, method)
+    
+    if NUMPY_AVAILABLE:
+        a_np = np.frombuffer(a, dtype=np.float64)
+        v_np = np.frombuffer(v, dtype=np.float64)
+        if method == 'direct':
+            out = np.convolve(a_np, v_np, mode) if flip else np.correlate(a_np, v_np, mode)
+        else:
+            if not flip:
+                v_np = v_np[::-1]
+            size = 1 << max(0, (n + m - 2).bit_length())
+            out = np.fft.irfft(np.fft.rfft(a_np, size) * np.fft.rfft(v_np, size), size)
+            out = out[start:start + length]
+        return out.tolist()
+    
+    if method == 'direct':
+        return _direct_correlate(a, v[::-1] if flip else v, start, length)
+    return _fft_convolve(a, v if flip else v[::-1], start, length)
+
 # ============================================================
 # FLUMPY UTILITIES
 # ============================================================
@@ -589,16 +925,967 @@ class FlumpyUtilities:
         return result
     
     @staticmethod
-    def batch_entangle(arrays: List[FlumpyArray], threshold: float = ENTANGLEMENT_SIMILARITY):
-        """Attempt entanglement between all pairs in a batch."""
-        entangled_count = 0
+    def similarity_matrix(arrays: List[FlumpyArray]):
+        """
+        All pairwise similarity_kernel() values in one blocked kernel.
+        
+        Entry [i][j] equals arrays[i].similarity_kernel(arrays[j]) (to rounding).
+        The phase term cos(|p_i - p_j| mod 2pi) = cos p_i cos p_j + sin p_i sin p_j
+        is rank two, so the whole matrix is two matrix products. Returns an
+        ndarray with NumPy, nested lists otherwise.
+        """
+        n = len(arrays)
+        if n and any(len(arr.data) != len(arrays[0].data) for arr in arrays):
+            raise ValueError("Arrays must have same shape for similarity computation")
+        
+        if NUMPY_AVAILABLE:
+            mat = np.array([arr.data for arr in arrays], dtype=np.float64).reshape(n, -1)
+            norms = np.sqrt(np.einsum('ij,ij->i', mat, mat))
+            live = norms > 0
+            unit = np.zeros_like(mat)
+            unit[live] = mat[live] / norms[live, None]
+            phases = np.array([arr.phase for arr in arrays], dtype=np.float64)
+            cos_p, sin_p = np.cos(phases), np.sin(phases)
+            result = np.empty((n, n), dtype=np.float64)
+            for start in range(0, n, SIMILARITY_BLOCK_ROWS):
+                stop = min(n, start + SIMILARITY_BLOCK_ROWS)
+                base = unit[start:stop] @ unit.T
+                phase_coherence = np.outer(cos_p[start:stop], cos_p) + np.outer(sin_p[start:stop], sin_p)
+                np.clip(base * (0.7 + 0.3 * phase_coherence), -1.0, 1.0, out=result[start:stop])
+            return result
+        
+        # Reference path: norms and phase terms computed once per array, not per pair
+        norms = [math.sqrt(sum(map(mul, arr.data, arr.data))) for arr in arrays]
+        result = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            if norms[i] == 0:
+                continue
+            a = arrays[i]
+            for j in range(i, n):
+                if norms[j] == 0:
+                    continue
+                b = arrays[j]
+                base_similarity = sum(map(mul, a.data, b.data)) / (norms[i] * norms[j])
+                phase_coherence = math.cos(abs(a.phase - b.phase) % (2 * math.pi))
+                similarity = max(-1.0, min(1.0, base_similarity * (0.7 + 0.3 * phase_coherence)))
+                result[i][j] = result[j][i] = similarity
+        return result
+    
+    @staticmethod
+    def batch_entangle(arrays: List[FlumpyArray], threshold: float = ENTANGLEMENT_SIMILARITY,
+                       mode: str = 'auto'):
+        """
+        Attempt entanglement between all pairs in a batch.
+        
+        mode: 'sequential' (legacy pairwise pass), 'gram' or 'lsh' (bulk_entangle),
+              or 'auto' to pick by batch size and NumPy availability.
+        Pairs of different lengths are skipped in every mode.
+        """
+        return FlumpyUtilities.bulk_entangle(arrays, threshold, mode=mode)["entangled_pairs"]
+    
+    @staticmethod
+    def bulk_entangle(arrays: List[FlumpyArray], threshold: float = ENTANGLEMENT_SIMILARITY,
+                      max_degree: int = MAX_ENTANGLEMENT_DEGREE, mode: str = 'auto',
+                      index: Optional['EntanglementIndex'] = None) -> Dict[str, Any]:
+        """
+        Entangle a batch using only candidate pairs, applying all edges at once.
+        
+        Similarities are taken from one snapshot of the batch. Edges are accepted
+        strongest first while both ends are below `max_degree` links; coherence boosts
+        of every accepted edge are summed and each array's phase is synchronised to
+        the mean of itself and its new partners (for a single edge this is exactly
+        entangle()). Returns throughput statistics: `scored_per_s` counts the pairs
+        whose similarity was actually computed (`scored_pairs`); `all_pairs_per_s`
+        is the all-pairs-equivalent rate, n(n-1)/2 over the elapsed time.
+        
+        Only equal-length arrays have a similarity: in every mode, pairs of
+        different lengths are skipped (never candidates, never linked).
+        """
+        n = len(arrays)
+        if mode == 'auto':
+            if not NUMPY_AVAILABLE or n <= ENTANGLE_SEQUENTIAL_MAX:
+                mode = 'sequential'
+            else:
+                mode = 'gram' if n <= ENTANGLE_GRAM_MAX or threshold <= 0 else 'lsh'
+        
+        start = perf_counter()
+        if mode == 'sequential':
+            entangled = candidates = 0
+            for i in range(n):
+                for j in range(i + 1, n):
+                    if len(arrays[i].data) != len(arrays[j].data):
+                        continue
+                    candidates += 1
+                    if arrays[i].entangle(arrays[j], threshold):
+                        entangled += 1
+            edges = entangled
+            scored = candidates
+        else:
+            index = index or EntanglementIndex()
+            ii, jj, sims = index.candidate_edges(arrays, threshold, mode)
+            candidates = len(sims)
+            scored = index.last_scored
+            entangled, edges = FlumpyUtilities._apply_edges(arrays, ii, jj, sims, max_degree)
+        
+        elapsed = perf_counter() - start
+        covered = n * (n - 1) // 2
+        return {
+            "mode": mode,
+            "arrays": n,
+            "candidate_pairs": candidates,
+            "scored_pairs": scored,
+            "entangled_pairs": entangled,
+            "edges": edges,
+            "elapsed_s": elapsed,
+            "scored_per_s": scored / elapsed if elapsed > 0 else float('inf'),
+            "all_pairs_per_s": covered / elapsed if elapsed > 0 else float('inf')
+        }
+    
+    @staticmethod
+    def _apply_edges(arrays: List[FlumpyArray], ii, jj, sims, max_degree: int) -> Tuple[int, int]:
+        """Bulk entangle(): links, summed coherence boosts, phase sync against the snapshot."""
+        n = len(arrays)
+        phases = [arr.phase for arr in arrays]
+        degree = [len(arr.entangled_with) for arr in arrays]
+        boost = [0.0] * n
+        phase_sum = [0.0] * n
+        partners = [0] * n
+        entangled = edges = 0
+        
+        # Strongest edges claim degree first
+        for k in sorted(range(len(sims)), key=sims.__getitem__, reverse=True):
+            i, j, similarity = ii[k], jj[k], sims[k]
+            a, b = arrays[i], arrays[j]
+            pair_id = tuple(sorted([id(a), id(b)]))
+            if pair_id in a._visited_ids:
+                continue
+            linked = b in a.entangled_with
+            if not linked and (degree[i] >= max_degree or degree[j] >= max_degree):
+                continue
+            a._visited_ids.add(pair_id)
+            b._visited_ids.add(pair_id)
+            if not linked:
+                a._link(b)
+                b._link(a)
+                degree[i] += 1
+                degree[j] += 1
+                edges += 1
+            boost[i] += 0.05 * similarity
+            boost[j] += 0.05 * similarity
+            phase_sum[i] += phases[j]
+            phase_sum[j] += phases[i]
+            partners[i] += 1
+            partners[j] += 1
+            entangled += 1
+        
+        for i, arr in enumerate(arrays):
+            if partners[i]:
+                arr.coherence = min(1.0, arr.coherence + boost[i])
+                arr.phase = (phases[i] + phase_sum[i]) / (1 + partners[i])
+        return entangled, edges
+
+# ============================================================
+# ENTANGLEMENT CANDIDATE INDEX
+# ============================================================
+
+class EntanglementIndex:
+    """
+    Candidate edges for bulk entanglement.
+    
+    similarity_kernel() is the cosine scaled by a phase factor in [0.4, 1], so for a
+    positive threshold every edge has cosine > threshold. Candidates are found among
+    equal-length arrays and then checked against the exact kernel:
+    
+    - 'gram': blocked similarity matrix, exact edge set, O(n^2 d) vectorized.
+    - 'lsh':  random-hyperplane (SimHash) tables over unit vectors, approximate
+              (recall < 1) and sub-quadratic.
+    
+    Requires NumPy; bulk_entangle falls back to the sequential pass without it.
+    """
+    
+    def __init__(self, tables: int = LSH_TABLES, hash_bits: Optional[int] = None,
+                 block_rows: int = SIMILARITY_BLOCK_ROWS, seed: int = LSH_SEED):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("EntanglementIndex requires numpy")
+        self.tables = tables
+        self.hash_bits = hash_bits
+        self.block_rows = block_rows
+        self._lsh = SimHashLSH(tables, seed, hash_bits=hash_bits, bits_range=(6, 20), bits_slack=2)
+        self.last_scored = 0  # Pairs whose similarity the last candidate_edges() call computed
+    
+    def candidate_edges(self, arrays: List[FlumpyArray], threshold: float = ENTANGLEMENT_SIMILARITY,
+                        mode: str = 'gram') -> Tuple[List[int], List[int], List[float]]:
+        """Index pairs (i < j) and their similarity_kernel values above `threshold`."""
+        if mode not in ('gram', 'lsh'):
+            raise ValueError(f"Unknown candidate mode: {mode!r}")
+        if mode == 'lsh' and threshold <= 0:
+            raise ValueError("LSH candidates need a positive threshold")
+        
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for idx, arr in enumerate(arrays):
+            groups[len(arr.data)].append(idx)
+        
+        found_i, found_j, found_sim = [], [], []
+        self.last_scored = 0
+        for length, members in groups.items():
+            if length == 0 or len(members) < 2:
+                continue
+            ids = np.array(members)
+            unit = unit_rows(np.array([arrays[i].data for i in members], dtype=np.float64))
+            phases = np.array([arrays[i].phase for i in members], dtype=np.float64)
+            trig = np.stack([np.cos(phases), np.sin(phases)], axis=1)
+            finder = self._gram_edges if mode == 'gram' else self._lsh_edges
+            li, ri, sims = finder(unit, trig, threshold)
+            found_i.append(ids[li])
+            found_j.append(ids[ri])
+            found_sim.append(sims)
+        
+        if not found_sim:
+            return [], [], []
+        return (np.concatenate(found_i).tolist(), np.concatenate(found_j).tolist(),
+                np.concatenate(found_sim).tolist())
+    
+    @staticmethod
+    def _similarity(unit_a, unit_b, trig_a, trig_b):
+        base = np.einsum('ij,ij->i', unit_a, unit_b)
+        phase_coherence = np.einsum('ij,ij->i', trig_a, trig_b)
+        return np.clip(base * (0.7 + 0.3 * phase_coherence), -1.0, 1.0)
+    
+    def _gram_edges(self, unit, trig, threshold: float):
+        scores = lambda start, stop: np.clip(
+            (unit[start:stop] @ unit.T) * (0.7 + 0.3 * (trig[start:stop] @ trig.T)), -1.0, 1.0)
+        blocks = list(gram_pairs(len(unit), len(unit), scores, threshold, True, self.block_rows))
+        self.last_scored += len(unit) * (len(unit) - 1) // 2
+        return tuple(np.concatenate(parts) for parts in zip(*blocks))
+    
+    def _lsh_edges(self, unit, trig, threshold: float):
+        def verify(cl, cr):
+            self.last_scored += len(cl)
+            return self._similarity(unit[cl], unit[cr], trig[cl], trig[cr]) > threshold
+        li, ri = self._lsh.pairs(unit, unit, True, verify)
+        return li, ri, self._similarity(unit[li], unit[ri], trig[li], trig[ri])
+
+# ============================================================
+# ARRAY REGISTRY
+# ============================================================
+
+_CHAOS_ROUND, _DAMPING_ROUND = 0, 1
+_MASK64 = (1 << 64) - 1
+
+def _splitmix64(x: int) -> int:
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+def _counter_uniform(seed: int, counter: int) -> float:
+    """Uniform in [-1, 1) derived from (seed, counter) alone - no generator state."""
+    return (_splitmix64(seed ^ _splitmix64(counter)) >> 11) * (2.0 / (1 << 53)) - 1.0
+
+def _replay_chaos_rounds(rounds, key: int, coherence: float, chaos: float) -> Tuple[float, float, float]:
+    """Compose chaos/damping rounds into (total data offset, coherence, chaos)."""
+    offset = 0.0
+    for kind, param, seed in rounds:
+        if kind == _CHAOS_ROUND:
+            # Injection proportional to (1 - coherence) at the time of the round
+            offset += param * (1 - coherence) * _counter_uniform(seed, key)
+            chaos = min(0.1, chaos * 1.05)
+            coherence *= (1 - 0.01 * param)
+        else:
+            chaos *= param
+            coherence = min(1.0, coherence * 1.01)  # Restore some coherence
+    return offset, coherence, chaos
+
+
+class _ChaosLedger:
+    """Global chaos/damping rounds of one registry not yet materialized by all its arrays."""
+    
+    __slots__ = ('lock', 'rounds', 'base_epoch', 'epoch', 'keys')
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rounds: List[Tuple[int, float, int]] = []  # (kind, level or factor, seed)
+        self.base_epoch = 0  # Epoch of rounds[0]
+        self.epoch = 0       # Epoch after the newest round
+        self.keys = itertools.count()  # Per-array noise counters
+
+
+@contextmanager
+def _shards_locked(shards):
+    """
+    Hold the locks of `shards` (the registries an array is enrolled in), taken in
+    one global order so two registries sharing arrays never wait on each other.
+    """
+    ordered = sorted(shards, key=id)
+    for shard in ordered:
+        shard.lock.acquire()
+    try:
+        yield
+    finally:
+        for shard in reversed(ordered):
+            shard.lock.release()
+
+
+class _RegistryShard:
+    """One lock stripe of an ArrayRegistry: its arrays and their partial aggregates."""
+    
+    __slots__ = ('lock', 'ledger', 'arrays', 'foreign', 'coherence_sum', 'chaos_sum',
+                 'total_elements', 'total_entanglements')
+    
+    def __init__(self, ledger: _ChaosLedger):
+        # Re-entrant: bulk callbacks run under the lock and still go through the setters
+        self.lock = threading.RLock()
+        self.ledger = ledger
+        self.arrays: Dict[str, FlumpyArray] = {}
+        self.foreign: Dict[str, FlumpyArray] = {}  # Enrolled in another registry's ledger
+        self.coherence_sum = 0.0
+        self.chaos_sum = 0.0
+        self.total_elements = 0
+        self.total_entanglements = 0
+    
+    def attach(self, name: str, array: FlumpyArray) -> None:
+        self.arrays[name] = array
+        if array._chaos_ledger is None:
+            array._chaos_epoch = self.ledger.epoch
+            array._chaos_key = next(self.ledger.keys)
+            array._chaos_ledger = self.ledger
+        elif array._chaos_ledger is not self.ledger:
+            self.foreign[name] = array
+        if array._registries is None:
+            array._registries = []
+        array._registries.append(self)
+        self.coherence_sum += array.coherence
+        self.chaos_sum += array.chaos
+        self.total_elements += len(array.data)
+        self.total_entanglements += len(array.entangled_with)
+    
+    def detach(self, name: str) -> FlumpyArray:
+        array = self.arrays.pop(name)
+        if array._chaos_ledger is self.ledger:
+            array._settle_chaos()
+            array._chaos_ledger = None
+        else:
+            self.foreign.pop(name, None)
+        array._registries.remove(self)
+        self.coherence_sum -= array.coherence
+        self.chaos_sum -= array.chaos
+        self.total_elements -= len(array.data)
+        self.total_entanglements -= len(array.entangled_with)
+        if not self.arrays:
+            self.coherence_sum = self.chaos_sum = 0.0  # Drop accumulated rounding
+        return array
+
+
+class ArrayRegistry(MutableMapping):
+    """
+    Thread-safe name -> FlumpyArray mapping with incrementally maintained aggregates.
+    
+    Names are hashed onto `shards` lock stripes, so producers registering or
+    looking up different names rarely contend. Registered arrays report coherence,
+    chaos and entanglement-link changes to their shard under its lock, so totals
+    never need a full scan. Element counts are taken at registration (FlumpyArray
+    lengths are fixed).
+    
+    Lookups are lock-free; iteration, `items()` and `values()` work on a
+    `snapshot()` taken with every shard locked. Bulk operations lock each shard
+    once. Lock order is always shard index order, and callbacks passed to
+    `apply()` must only touch the array they are given. An array enrolled in
+    several registries is only ever updated with all of its shard locks held,
+    taken in id order, never nested under a single shard's lock.
+    """
+    
+    def __init__(self, shards: int = REGISTRY_SHARDS):
+        if shards < 1:
+            raise ValueError("ArrayRegistry needs at least one shard")
+        self.ledger = _ChaosLedger()
+        self._shards = [_RegistryShard(self.ledger) for _ in range(shards)]
+    
+    def _shard_for(self, name: str) -> _RegistryShard:
+        return self._shards[hash(name) % len(self._shards)]
+    
+    def _grouped(self, items, name_of) -> Dict[int, list]:
+        groups = defaultdict(list)
+        n_shards = len(self._shards)
+        for item in items:
+            groups[hash(name_of(item)) % n_shards].append(item)
+        return groups
+    
+    @contextmanager
+    def _all_locked(self):
+        locked = []
+        try:
+            for shard in self._shards:
+                shard.lock.acquire()
+                locked.append(shard)
+            yield self._shards
+        finally:
+            for shard in reversed(locked):
+                shard.lock.release()
+    
+    # ----------------------------------------
+    # Mapping protocol
+    # ----------------------------------------
+    
+    def __getitem__(self, name: str) -> FlumpyArray:
+        return self._shard_for(name).arrays[name]
+    
+    def __setitem__(self, name: str, array: FlumpyArray):
+        shard = self._shard_for(name)
+        with shard.lock:
+            if name in shard.arrays:
+                shard.detach(name)
+            shard.attach(name, array)
+    
+    def __delitem__(self, name: str):
+        shard = self._shard_for(name)
+        with shard.lock:
+            shard.detach(name)
+    
+    def pop(self, name: str, *default):
+        """Atomically remove and return `name` (or `default` if it is absent)."""
+        shard = self._shard_for(name)
+        with shard.lock:
+            if name in shard.arrays:
+                return shard.detach(name)
+        if default:
+            return default[0]
+        raise KeyError(name)
+    
+    def __iter__(self):
+        return iter([name for name, _ in self.snapshot()])
+    
+    def __len__(self) -> int:
+        return sum(len(shard.arrays) for shard in self._shards)
+    
+    def __contains__(self, name) -> bool:
+        return name in self._shard_for(name).arrays
+    
+    def items(self) -> List[Tuple[str, FlumpyArray]]:
+        return self.snapshot()
+    
+    def values(self) -> List[FlumpyArray]:
+        return [array for _, array in self.snapshot()]
+    
+    # ----------------------------------------
+    # Snapshots and bulk operations
+    # ----------------------------------------
+    
+    def snapshot(self) -> List[Tuple[str, FlumpyArray]]:
+        """Consistent (name, array) list: every shard is locked while it is taken."""
+        with self._all_locked() as shards:
+            return [item for shard in shards for item in shard.arrays.items()]
+    
+    def register_many(self, items) -> None:
+        """Register (name, array) pairs, locking each shard once."""
+        for index, group in self._grouped(items, itemgetter(0)).items():
+            shard = self._shards[index]
+            with shard.lock:
+                for name, array in group:
+                    if name in shard.arrays:
+                        shard.detach(name)
+                    shard.attach(name, array)
+    
+    def remove_many(self, names) -> List[FlumpyArray]:
+        """Remove the given names (missing ones are skipped), locking each shard once."""
+        removed = []
+        for index, group in self._grouped(names, lambda name: name).items():
+            shard = self._shards[index]
+            with shard.lock:
+                removed.extend(shard.detach(name) for name in group if name in shard.arrays)
+        return removed
+    
+    def apply(self, fn) -> int:
+        """
+        Call fn(array) on every registered array, one shard lock acquisition per shard.
+        
+        Updates made through fn are atomic with respect to other bulk operations and
+        tracked-state setters on the same arrays. Arrays also enrolled in another
+        registry are visited after their shard is released, under all their shard
+        locks. Returns the number of arrays visited.
+        """
+        visited = 0
+        for shard in self._shards:
+            shared = []
+            with shard.lock:
+                for array in shard.arrays.values():
+                    if len(array._registries) > 1:
+                        shared.append(array)
+                    else:
+                        fn(array)
+                visited += len(shard.arrays)
+            for array in shared:
+                with _shards_locked(list(array._registries)):
+                    fn(array)
+        return visited
+    
+    def record_round(self, kind: int, param: float, seed: int = 0) -> None:
+        """
+        Record a global chaos/damping round in O(1); arrays materialize it when read.
         
-        for i in range(len(arrays)):
-            for j in range(i + 1, len(arrays)):
-                if arrays[i].entangle(arrays[j], threshold):
-                    entangled_count += 1
+        Arrays enrolled in another registry's ledger get the round applied eagerly.
+        Once LAZY_CHAOS_MAX_ROUNDS rounds are pending the registry settles everything.
+        """
+        ledger = self.ledger
+        with ledger.lock:
+            ledger.rounds.append((kind, param, seed))
+            ledger.epoch += 1
+            backlog = len(ledger.rounds)
+        for shard in self._shards:
+            if shard.foreign:
+                with shard.lock:
+                    foreign = list(shard.foreign.values())
+                # Foreign arrays span several registries: lock them all, in order
+                for array in foreign:
+                    with _shards_locked(list(array._registries)):
+                        if shard not in array._registries:
+                            continue  # Removed while we were waiting
+                        array._settle_chaos()
+                        array._apply_chaos_rounds([(kind, param, seed)])
+        if backlog > LAZY_CHAOS_MAX_ROUNDS:
+            self.settle()
+    
+    @property
+    def pending_rounds(self) -> int:
+        """Chaos/damping rounds recorded since the last settle()."""
+        ledger = self.ledger
+        return ledger.epoch - ledger.base_epoch
+    
+    def settle(self) -> int:
+        """Materialize every pending chaos round and trim the ledger; returns rounds trimmed."""
+        ledger = self.ledger
+        target = ledger.epoch
+        if target == ledger.base_epoch:
+            return 0
+        self.apply(FlumpyArray._settle_chaos)
+        with ledger.lock:
+            # Arrays enrolled meanwhile start at or after `target`; a concurrent settle may have trimmed
+            trimmed = max(0, target - ledger.base_epoch)
+            del ledger.rounds[:trimmed]
+            ledger.base_epoch += trimmed
+        return trimmed
+    
+    # ----------------------------------------
+    # Aggregates
+    # ----------------------------------------
+    
+    @property
+    def coherence_sum(self) -> float:
+        return sum(shard.coherence_sum for shard in self._shards)
+    
+    @property
+    def chaos_sum(self) -> float:
+        return sum(shard.chaos_sum for shard in self._shards)
+    
+    @property
+    def total_elements(self) -> int:
+        return sum(shard.total_elements for shard in self._shards)
+    
+    @property
+    def total_entanglements(self) -> int:
+        return sum(shard.total_entanglements for shard in self._shards)
+    
+    def aggregates(self) -> Dict[str, Any]:
+        """All aggregates read at one consistent point (every shard locked)."""
+        with self._all_locked() as shards:
+            return {
+                "count": sum(len(shard.arrays) for shard in shards),
+                "coherence_sum": sum(shard.coherence_sum for shard in shards),
+                "chaos_sum": sum(shard.chaos_sum for shard in shards),
+                "total_elements": sum(shard.total_elements for shard in shards),
+                "total_entanglements": sum(shard.total_entanglements for shard in shards),
+            }
+    
+    def recompute(self) -> None:
+        """Re-derive the aggregates from scratch (clears accumulated rounding)."""
+        for shard in self._shards:
+            with shard.lock:
+                arrays = shard.arrays.values()
+                shard.coherence_sum = math.fsum(arr.coherence for arr in arrays)
+                shard.chaos_sum = math.fsum(arr.chaos for arr in arrays)
+                shard.total_elements = sum(len(arr.data) for arr in arrays)
+                shard.total_entanglements = sum(len(arr.entangled_with) for arr in arrays)
+
+# ============================================================
+# PERSISTENT STORE
+# ============================================================
+
+_INDEX_HEADER = struct.Struct('<8sIIQ')       # magic, version, record count, CSR target count
+_INDEX_RECORD = struct.Struct('<QQddddQH')    # offset, floats, coherence, chaos, phase, ctime, ops, name len
+_EDGE_RECORD = struct.Struct('<IBHH')         # crc32, op, name lengths
+_EDGE_LINK, _EDGE_UNLINK = 1, 0
+
+
+class FlumpyStore:
+    """
+    Memory-mapped persistent store for FlumpyCore arrays and their entanglement graph.
+    
+    A store is a directory of three files:
+      payload.mmap - float64 payloads, one extent per array, carved by a free-list allocator
+      index.bin    - name -> (extent, cognitive state) records plus a CSR snapshot of the
+                     graph, replaced atomically on flush
+      edges.log    - append-only link/unlink records since the last flush, each with a CRC32
+    
+    Reattaching parses the index and replays the log tail (a torn record from a crash
+    is cut off), but no payload page is touched until `get`/`view` asks for it, and
+    neighbour sets are only built for arrays whose edges change. Payload writes are
+    copy-on-write and freed extents are only reused after the next index flush, so a
+    crash always leaves the last flushed index pointing at intact data. One writer
+    process at a time; `readonly` processes share the pages and see the index as it
+    was when they attached.
+    """
+    
+    def __init__(self, path: str, readonly: bool = False, initial_bytes: int = STORE_INITIAL_BYTES):
+        self.path = path
+        self.readonly = readonly
+        self._payload_path = os.path.join(path, 'payload.mmap')
+        self._index_path = os.path.join(path, 'index.bin')
+        self._edges_path = os.path.join(path, 'edges.log')
+        
+        if not readonly:
+            os.makedirs(path, exist_ok=True)
+            if not os.path.exists(self._payload_path):
+                with open(self._payload_path, 'wb') as fh:
+                    fh.truncate(max(STORE_ALIGN, initial_bytes))
+        self._payload = open(self._payload_path, 'rb' if readonly else 'r+b')
+        self._size = os.fstat(self._payload.fileno()).st_size
+        self._mm = mmap.mmap(self._payload.fileno(), self._size,
+                             access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+        self._retired_maps: List[mmap.mmap] = []  # Superseded by growth, kept for live views
+        
+        self._index: Dict[str, Tuple[int, int, float, float, float, float, int]] = {}
+        # Graph snapshot from the index (CSR over index positions) + sets of arrays changed since
+        self._base_names: List[str] = []
+        self._base_pos: Dict[str, int] = {}
+        self._csr_offsets = array('Q', [0])
+        self._csr_targets = array('I')
+        self._neighbours: Dict[str, set] = {}
+        self._load_index()
+        self._edge_count = len(self._csr_targets) // 2
+        self._free: List[Tuple[int, int]] = self._free_extents()
+        self._pending_free: List[Tuple[int, int]] = []  # Released only once the index is durable
+        
+        self.log_records = 0
+        self.recovered_bytes = 0  # Torn edge-log tail dropped at attach
+        self._dirty = False
+        self._replay_edges()
+        self._edges = None if readonly else open(self._edges_path, 'ab')
+    
+    # ----------------------------------------
+    # Index and recovery
+    # ----------------------------------------
+    
+    def _load_index(self) -> None:
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, 'rb') as fh:
+            raw = fh.read()
+        magic, version, count, n_targets = _INDEX_HEADER.unpack_from(raw, 0)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            raise ValueError(f"{self._index_path} is not a FLUMPY store index")
+        pos = _INDEX_HEADER.size
+        index, names = self._index, self._base_names
+        for _ in range(count):
+            *entry, name_len = _INDEX_RECORD.unpack_from(raw, pos)
+            pos += _INDEX_RECORD.size
+            name = raw[pos:pos + name_len].decode('utf-8')
+            pos += name_len
+            index[name] = tuple(entry)
+            names.append(name)
+        self._base_pos = {name: i for i, name in enumerate(names)}
+        self._csr_offsets = array('Q')
+        self._csr_offsets.frombytes(raw[pos:pos + 8 * (count + 1)])
+        pos += 8 * (count + 1)
+        self._csr_targets.frombytes(raw[pos:pos + 4 * n_targets])
+    
+    def _write_index(self) -> None:
+        names = list(self._index)
+        positions = {name: i for i, name in enumerate(names)}
+        offsets, targets = array('Q', [0]), array('I')
+        for name in names:
+            targets.extend(positions[other] for other in self._iter_neighbours(name))
+            offsets.append(len(targets))
+        
+        parts = [_INDEX_HEADER.pack(STORE_MAGIC, STORE_VERSION, len(names), len(targets))]
+        for name, entry in self._index.items():
+            encoded = name.encode('utf-8')
+            parts.append(_INDEX_RECORD.pack(*entry, len(encoded)))
+            parts.append(encoded)
+        parts.append(offsets.tobytes())
+        parts.append(targets.tobytes())
+        tmp = self._index_path + '.tmp'
+        with open(tmp, 'wb') as fh:
+            fh.write(b''.join(parts))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self._index_path)
+        
+        # The new snapshot supersedes the change sets
+        self._base_names, self._base_pos = names, positions
+        self._csr_offsets, self._csr_targets = offsets, targets
+        self._neighbours = {}
+    
+    def _free_extents(self) -> List[Tuple[int, int]]:
+        """Gaps between indexed extents: the allocator state is never stored, only derived."""
+        free, cursor = [], 0
+        for offset, n_floats, *_ in sorted(self._index.values()):
+            if offset > cursor:
+                free.append((cursor, offset - cursor))
+            cursor = max(cursor, offset + self._extent_bytes(n_floats))
+        if cursor < self._size:
+            free.append((cursor, self._size - cursor))
+        return free
+    
+    def _replay_edges(self) -> None:
+        """Re-apply link/unlink records logged after the last index flush."""
+        if not os.path.exists(self._edges_path):
+            return
+        with open(self._edges_path, 'rb') as fh:
+            raw = fh.read()
+        pos = 0
+        while pos + _EDGE_RECORD.size <= len(raw):
+            crc, op, len_a, len_b = _EDGE_RECORD.unpack_from(raw, pos)
+            body_start = pos + _EDGE_RECORD.size
+            body_end = body_start + len_a + len_b
+            if body_end > len(raw) or zlib.crc32(raw[pos + 4:body_end]) != crc:
+                break  # Torn or corrupt tail from a crash: everything after it is discarded
+            a = raw[body_start:body_start + len_a].decode('utf-8')
+            b = raw[body_start + len_a:body_end].decode('utf-8')
+            # Records may predate the snapshot (crash between index write and log reset);
+            # link/unlink are idempotent set operations, so re-applying them is harmless
+            if a in self._index and b in self._index:
+                self._set_edge(a, b, op == _EDGE_LINK)
+            self.log_records += 1
+            pos = body_end
+        if pos < len(raw):
+            self.recovered_bytes = len(raw) - pos
+            if not self.readonly:
+                with open(self._edges_path, 'r+b') as fh:
+                    fh.truncate(pos)
+    
+    # ----------------------------------------
+    # Payload allocation
+    # ----------------------------------------
+    
+    @staticmethod
+    def _extent_bytes(n_floats: int) -> int:
+        return max(STORE_ALIGN, -(-8 * n_floats // STORE_ALIGN) * STORE_ALIGN)
+    
+    def _allocate(self, nbytes: int) -> int:
+        """First-fit from the free list, growing the payload file when nothing fits."""
+        for i, (offset, length) in enumerate(self._free):
+            if length >= nbytes:
+                if length == nbytes:
+                    del self._free[i]
+                else:
+                    self._free[i] = (offset + nbytes, length - nbytes)
+                return offset
+        self._grow(nbytes)
+        return self._allocate(nbytes)
+    
+    def _release(self, extents) -> None:
+        """Return extents to the free list, coalescing neighbours."""
+        merged = sorted(self._free + list(extents))
+        self._free = []
+        for offset, length in merged:
+            if self._free and self._free[-1][0] + self._free[-1][1] == offset:
+                self._free[-1] = (self._free[-1][0], self._free[-1][1] + length)
+            else:
+                self._free.append((offset, length))
+    
+    def _grow(self, nbytes: int) -> None:
+        new_size = max(2 * self._size, self._size + nbytes)
+        self._mm.flush()
+        self._payload.truncate(new_size)
+        self._retired_maps.append(self._mm)
+        self._mm = mmap.mmap(self._payload.fileno(), new_size, access=mmap.ACCESS_WRITE)
+        self._release([(self._size, new_size - self._size)])
+        self._size = new_size
+    
+    def _check_writable(self) -> None:
+        if self.readonly:
+            raise PermissionError(f"FlumpyStore at {self.path} is read-only")
+    
+    # ----------------------------------------
+    # Arrays
+    # ----------------------------------------
+    
+    def __contains__(self, name) -> bool:
+        return name in self._index
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def names(self) -> List[str]:
+        return list(self._index)
+    
+    def _unchanged(self, name: str, array: FlumpyArray) -> bool:
+        offset, n_floats, coherence, chaos, phase, ctime, ops = self._index[name]
+        return (n_floats == len(array.data)
+                and (coherence, chaos, phase, ctime, ops) == (array.coherence, array.chaos, array.phase,
+                                                              array.creation_time, array.operation_count)
+                and self._mm[offset:offset + 8 * n_floats] == memoryview(array.data).cast('B'))
+    
+    def put(self, name: str, array: FlumpyArray, only_if_changed: bool = False) -> bool:
+        """Write `array` under `name` (copy-on-write); returns False if skipped as unchanged."""
+        self._check_writable()
+        old = self._index.get(name)
+        if old is not None and only_if_changed and self._unchanged(name, array):
+            return False
+        n_floats = len(array.data)
+        offset = self._allocate(self._extent_bytes(n_floats))
+        self._mm[offset:offset + 8 * n_floats] = memoryview(array.data).cast('B')
+        self._index[name] = (offset, n_floats, array.coherence, array.chaos, array.phase,
+                             array.creation_time, array.operation_count)
+        if old is not None:
+            self._pending_free.append((old[0], self._extent_bytes(old[1])))
+        self._dirty = True
+        return True
+    
+    def get(self, name: str) -> FlumpyArray:
+        """Materialize one array, touching only its payload pages."""
+        offset, n_floats, coherence, chaos, phase, ctime, ops = self._index[name]
+        data = array('d')
+        data.frombytes(self._mm[offset:offset + 8 * n_floats])
+        arr = FlumpyArray(data, coherence)
+        arr.chaos = chaos
+        arr.phase = phase
+        arr.creation_time = ctime
+        arr.operation_count = ops
+        return arr
+    
+    def view(self, name: str) -> memoryview:
+        """Zero-copy float64 view of a stored payload (read-only in readonly stores)."""
+        offset, n_floats = self._index[name][:2]
+        return memoryview(self._mm)[offset:offset + 8 * n_floats].cast('d')
+    
+    def delete(self, name: str) -> None:
+        self._check_writable()
+        for other in list(self._iter_neighbours(name)):
+            self.unlink(name, other)
+        offset, n_floats = self._index.pop(name)[:2]
+        self._pending_free.append((offset, self._extent_bytes(n_floats)))
+        self._neighbours.pop(name, None)
+        self._dirty = True
+    
+    # ----------------------------------------
+    # Entanglement graph
+    # ----------------------------------------
+    
+    def _iter_neighbours(self, name: str):
+        changed = self._neighbours.get(name)
+        if changed is not None:
+            return iter(changed)
+        pos = self._base_pos.get(name)
+        if pos is None:
+            return iter(())
+        names = self._base_names
+        return (names[t] for t in self._csr_targets[self._csr_offsets[pos]:self._csr_offsets[pos + 1]])
+    
+    def _adjacent(self, name: str) -> set:
+        """Mutable neighbour set of `name`, built from the snapshot on first change."""
+        changed = self._neighbours.get(name)
+        if changed is None:
+            changed = self._neighbours[name] = set(self._iter_neighbours(name))
+        return changed
+    
+    def _set_edge(self, a: str, b: str, linked: bool) -> bool:
+        adjacent = self._adjacent(a)
+        if (b in adjacent) == linked:
+            return False
+        if linked:
+            adjacent.add(b)
+            self._adjacent(b).add(a)
+            self._edge_count += 1
+        else:
+            adjacent.discard(b)
+            self._adjacent(b).discard(a)
+            self._edge_count -= 1
+        self._dirty = True
+        return True
+    
+    def _append_edge(self, op: int, a: str, b: str) -> None:
+        ea, eb = a.encode('utf-8'), b.encode('utf-8')
+        body = _EDGE_RECORD.pack(0, op, len(ea), len(eb))[4:] + ea + eb
+        self._edges.write(struct.pack('<I', zlib.crc32(body)) + body)
+        self.log_records += 1
+    
+    def link(self, a: str, b: str) -> None:
+        self._check_writable()
+        if self._set_edge(a, b, True):
+            self._append_edge(_EDGE_LINK, a, b)
+    
+    def unlink(self, a: str, b: str) -> None:
+        self._check_writable()
+        if self._set_edge(a, b, False):
+            self._append_edge(_EDGE_UNLINK, a, b)
+    
+    def neighbours(self, name: str) -> List[str]:
+        return list(self._iter_neighbours(name))
+    
+    def edges(self, among=None) -> set:
+        """Stored edges as sorted name pairs, optionally restricted to endpoints in `among`."""
+        pairs = set()
+        for a in (self._index if among is None else among):
+            for b in self._iter_neighbours(a):
+                if a < b and (among is None or b in among):
+                    pairs.add((a, b))
+        return pairs
+    
+    # ----------------------------------------
+    # Durability
+    # ----------------------------------------
+    
+    def flush(self) -> None:
+        """
+        Make payloads and the graph durable, then recycle freed extents.
         
-        return entangled_count
+        Order: payload pages, then the index (with the graph snapshot) via atomic
+        replace, and only then the edge log is reset and freed extents reused.
+        """
+        if self.readonly:
+            return
+        self._mm.flush()
+        self._edges.flush()
+        if self._dirty:
+            os.fsync(self._edges.fileno())
+            self._write_index()
+            self._edges.truncate(0)
+            self.log_records = 0
+            self._dirty = False
+        if self._pending_free:
+            self._release(self._pending_free)
+            self._pending_free = []
+    
+    def close(self) -> None:
+        if self._mm is None:
+            return
+        self.flush()
+        if self._edges is not None:
+            self._edges.close()
+        for mm in self._retired_maps + [self._mm]:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # A caller still holds a view(); the mapping goes when it does
+        self._payload.close()
+        self._mm = None
+    
+    def __enter__(self) -> 'FlumpyStore':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "arrays": len(self._index),
+            "edges": self._edge_count,
+            "file_bytes": self._size,
+            "live_bytes": sum(self._extent_bytes(entry[1]) for entry in self._index.values()),
+            "free_bytes": sum(length for _, length in self._free),
+            "pending_free_bytes": sum(length for _, length in self._pending_free),
+            "log_records": self.log_records,
+        }
 
 # ============================================================
 # FLUMPY CORE
@@ -607,99 +1894,219 @@ class FlumpyUtilities:
 class FlumpyCore:
     """Main FLUMPY engine for managing quantum-cognitive arrays."""
     
-    def __init__(self):
-        self.arrays: Dict[str, FlumpyArray] = {}
+    def __init__(self, shards: int = REGISTRY_SHARDS, store: Optional[FlumpyStore] = None):
+        self.arrays = ArrayRegistry(shards)
+        self.store = store  # Arrays missing from the registry are loaded from here on demand
+        self._store_lock = threading.Lock()
         self.array_counter = 0
+        self._counter_lock = threading.Lock()
+        self._state_lock = threading.Lock()  # global_coherence / global_chaos
+        self._ritual_lock = threading.Lock()  # One bulk edge application at a time
         self.global_coherence = 0.5
         self.global_chaos = CHAOS_BASE
+        self.entanglement_index: Optional[EntanglementIndex] = None
+        self.last_ritual_stats: Dict[str, Any] = {}
         
     def create_array(self, data: Union[List[float], float, int], 
                     name: Optional[str] = None, coherence: float = 1.0) -> str:
         """Create a new FlumpyArray and register it."""
         if name is None:
-            name = f"array_{self.array_counter}"
-            self.array_counter += 1
+            with self._counter_lock:
+                name = f"array_{self.array_counter}"
+                self.array_counter += 1
         
         self.arrays[name] = FlumpyArray(data, coherence)
         return name
     
+    def create_arrays(self, datasets, coherence: float = 1.0) -> List[str]:
+        """Create and register several arrays, reserving names and locking each shard once."""
+        arrays = [FlumpyArray(data, coherence) for data in datasets]
+        with self._counter_lock:
+            first = self.array_counter
+            self.array_counter += len(arrays)
+        names = [f"array_{first + i}" for i in range(len(arrays))]
+        self.arrays.register_many(zip(names, arrays))
+        return names
+    
     def get_array(self, name: str) -> Optional[FlumpyArray]:
-        """Get array by name."""
-        return self.arrays.get(name)
+        """Get array by name (lazily loaded from the attached store when not yet resident)."""
+        array = self.arrays.get(name)
+        if array is None and self.store is not None and name in self.store:
+            array = self._load_from_store(name)
+        return array
+    
+    def _load_from_store(self, name: str) -> FlumpyArray:
+        with self._store_lock:
+            array = self.arrays.get(name)
+            if array is not None:
+                return array  # Another thread loaded it first
+            array = self.store.get(name)
+            # Reconnect only to neighbours that are already resident
+            for other_name in self.store.neighbours(name):
+                other = self.arrays.get(other_name)
+                if other is not None and other not in array.entangled_with:
+                    array._link(other)
+                    other._link(array)
+            self.arrays[name] = array
+            return array
+    
+    def load_all(self) -> int:
+        """Make every stored array resident (rituals and status then cover the whole store)."""
+        names = [name for name in self.store.names() if name not in self.arrays]
+        for name in names:
+            self._load_from_store(name)
+        return len(names)
+    
+    def checkpoint(self) -> Dict[str, int]:
+        """
+        Persist resident arrays and their entanglement graph to the attached store.
+        
+        Unchanged payloads are skipped; edges are diffed against the stored graph
+        (restricted to resident endpoints) so only link/unlink deltas hit the log.
+        A readonly store is left untouched and nothing is reported written.
+        """
+        if self.store is None:
+            raise RuntimeError("FlumpyCore has no store attached")
+        if self.store.readonly:
+            return {"arrays_written": 0, "links": 0, "unlinks": 0}
+        self.arrays.settle()
+        with self._store_lock:
+            items = self.arrays.snapshot()
+            written = sum(self.store.put(name, array, only_if_changed=True) for name, array in items)
+            
+            names_by_id = {id(array): name for name, array in items}
+            current = set()
+            for name, array in items:
+                for other in array.entangled_with:
+                    other_name = names_by_id.get(id(other))
+                    if other_name is not None:
+                        current.add((name, other_name) if name < other_name else (other_name, name))
+            stored = self.store.edges(among=set(names_by_id.values()))
+            for a, b in current - stored:
+                self.store.link(a, b)
+            for a, b in stored - current:
+                self.store.unlink(a, b)
+            self.store.flush()
+        return {"arrays_written": written, "links": len(current - stored), "unlinks": len(stored - current)}
     
     def remove_array(self, name: str) -> bool:
-        """Remove array from registry."""
-        if name in self.arrays:
-            # Disentangle from all other arrays
-            array_to_remove = self.arrays[name]
-            for other_name, other_array in self.arrays.items():
-                if other_name != name:
-                    array_to_remove.disentangle(other_array)
-            
-            del self.arrays[name]
-            return True
-        return False
+        """
+        Remove array from registry (and from the attached store).
+        
+        With a readonly store only the resident copy is dropped; the stored array
+        stays and get_array() loads it again.
+        """
+        stored = False
+        if self.store is not None and not self.store.readonly:
+            with self._store_lock:
+                if name in self.store:
+                    self.store.delete(name)
+                    stored = True
+        
+        array_to_remove = self.arrays.pop(name, None)
+        if array_to_remove is None:
+            return stored
+        
+        # Disentangle from its actual neighbours only
+        for other_array in list(array_to_remove.entangled_with):
+            array_to_remove.disentangle(other_array)
+        return True
     
-    def global_entanglement_ritual(self, threshold: float = ENTANGLEMENT_SIMILARITY):
-        """Perform global entanglement ritual on all arrays."""
-        array_list = list(self.arrays.values())
-        entangled_pairs = FlumpyUtilities.batch_entangle(array_list, threshold)
+    def global_entanglement_ritual(self, threshold: float = ENTANGLEMENT_SIMILARITY,
+                                   mode: str = 'auto', max_degree: int = MAX_ENTANGLEMENT_DEGREE):
+        """
+        Perform global entanglement ritual on all arrays.
+        
+        Candidate generation and bulk application as in FlumpyUtilities.bulk_entangle;
+        throughput (pairs/s) and edge counts are kept in `last_ritual_stats`.
+        """
+        self.arrays.settle()
+        array_list = self.arrays.values()  # Snapshot; producers keep registering meanwhile
+        with self._ritual_lock:
+            if mode != 'sequential' and NUMPY_AVAILABLE and self.entanglement_index is None:
+                self.entanglement_index = EntanglementIndex()
+            self.last_ritual_stats = FlumpyUtilities.bulk_entangle(
+                array_list, threshold, max_degree, mode, self.entanglement_index)
+        entangled_pairs = self.last_ritual_stats["entangled_pairs"]
         
         # Update global coherence based on entanglement success rate
         total_possible_pairs = len(array_list) * (len(array_list) - 1) / 2
         if total_possible_pairs > 0:
             success_rate = entangled_pairs / total_possible_pairs
-            self.global_coherence = 0.5 * self.global_coherence + 0.5 * success_rate
+            with self._state_lock:
+                self.global_coherence = 0.5 * self.global_coherence + 0.5 * success_rate
         
         return entangled_pairs
     
     def apply_global_chaos(self, chaos_level: Optional[float] = None):
-        """Apply chaos to all arrays."""
+        """
+        Apply chaos to all arrays.
+        
+        O(1): the round (level + one 64-bit seed from `random`) goes into the registry's
+        chaos ledger and each array materializes it on its next read.
+        """
         if chaos_level is None:
             chaos_level = self.global_chaos
         
-        for array in self.arrays.values():
-            # Chaos injection proportional to (1 - coherence)
-            injection = chaos_level * (1 - array.coherence) * random.uniform(-1, 1)
-            for i in range(len(array.data)):
-                array.data[i] += injection
-            
-            array.chaos = min(0.1, array.chaos * 1.05)
-            array.coherence *= (1 - 0.01 * chaos_level)
-        
-        self.global_chaos *= 1.02  # Chaos tends to increase
+        self.arrays.record_round(_CHAOS_ROUND, chaos_level, random.getrandbits(64))
+        with self._state_lock:
+            self.global_chaos *= 1.02  # Chaos tends to increase
     
     def dampen_global_chaos(self, damping_factor: float = DAMPING_FACTOR):
-        """Apply chaos damping to all arrays."""
-        for array in self.arrays.values():
-            array.chaos *= damping_factor
-            # Restore some coherence
-            array.coherence = min(1.0, array.coherence * 1.01)
-        
-        self.global_chaos *= damping_factor
+        """Apply chaos damping to all arrays (recorded lazily like apply_global_chaos)."""
+        self.arrays.record_round(_DAMPING_ROUND, damping_factor)
+        with self._state_lock:
+            self.global_chaos *= damping_factor
     
-    def get_system_status(self) -> Dict[str, Any]:
-        """Get status of the entire FLUMPY system."""
-        total_elements = sum(len(arr.data) for arr in self.arrays.values())
-        total_entanglements = sum(len(arr.entangled_with) for arr in self.arrays.values())
-        
-        # Average coherence and chaos
-        coherences = [arr.coherence for arr in self.arrays.values()]
-        chaos_levels = [arr.chaos for arr in self.arrays.values()]
+    def get_system_status(self, include_names: bool = True) -> Dict[str, Any]:
+        """
+        Get status of the entire FLUMPY system.
         
-        avg_coherence = sum(coherences) / len(coherences) if coherences else 0.0
-        avg_chaos = sum(chaos_levels) / len(chaos_levels) if chaos_levels else 0.0
+        Aggregates are maintained by the registry shards, so this is O(shards)
+        unless chaos rounds are pending or `include_names` asks for the list of
+        array names. Pending rounds are settled first so the averages are exact,
+        which replays every array: after apply_global_chaos() the next call is
+        O(n). Pollers should use status_summary().
+        """
+        self.arrays.settle()
+        totals = self.arrays.aggregates()
+        count = totals["count"]
+        
+        status = {
+            "total_arrays": count,
+            "total_elements": totals["total_elements"],
+            "total_entanglements": totals["total_entanglements"],
+            "avg_coherence": totals["coherence_sum"] / count if count else 0.0,
+            "avg_chaos": totals["chaos_sum"] / count if count else 0.0,
+            "global_coherence": self.global_coherence,
+            "global_chaos": self.global_chaos
+        }
+        if include_names:
+            status["array_names"] = list(self.arrays)
+        return status
+    
+    def status_summary(self) -> Dict[str, Any]:
+        """
+        O(shards) status for polling: never settles and never lists names.
         
-        return {
-            "total_arrays": len(self.arrays),
-            "total_elements": total_elements,
-            "total_entanglements": total_entanglements,
-            "avg_coherence": avg_coherence,
-            "avg_chaos": avg_chaos,
+        Chaos rounds only move coherence and chaos, so the averages are left
+        out while rounds are pending; `pending_chaos_rounds` says how many.
+        """
+        totals = self.arrays.aggregates()
+        count = totals["count"]
+        pending = self.arrays.pending_rounds
+        summary = {
+            "total_arrays": count,
+            "total_elements": totals["total_elements"],
+            "total_entanglements": totals["total_entanglements"],
             "global_coherence": self.global_coherence,
             "global_chaos": self.global_chaos,
-            "array_names": list(self.arrays.keys())
+            "pending_chaos_rounds": pending
         }
+        if not pending:
+            summary["avg_coherence"] = totals["coherence_sum"] / count if count else 0.0
+            summary["avg_chaos"] = totals["chaos_sum"] / count if count else 0.0
+        return summary
 
 # ============================================================
 # DEMONSTRATION
@@ -4,20 +4,44 @@ LASER v3.0 - UNIVERSAL QUANTUM-TEMPORAL LOGGING SYSTEM
 -------------------------------------------------------
 """
 
+import argparse
+import functools
 import time
 import math
 import hashlib
+import heapq
+import http.server
+import bisect
+import itertools
 import random
 import threading
 import json
+import lzma
+import multiprocessing
+import multiprocessing.util
 import os
+import pickle
+import re
+import socket
+import socketserver
+import struct
 import sys
-from datetime import datetime, timezone
+import weakref
+import zlib
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, asdict, field
 from typing import Optional, Dict, List, Any, Tuple, Deque, Union
-from collections import deque
+from collections import deque, OrderedDict
+from array import array
+from multiprocessing import resource_tracker, shared_memory
 import numpy as np
-import psutil
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    print("⚠️ psutil not available, sampling resources from /proc")
 
 # Import all quantum modules with graceful fallbacks
 try:
@@ -34,6 +58,13 @@ except ImportError:
     BUMPY_AVAILABLE = False
     print("⚠️ BUMPY not available, using fallback compression")
 
+try:
+    from uccc import UniversalCompressor, TriaxialDatabase, CompressionAlgorithm
+    UCCC_AVAILABLE = True
+except ImportError:
+    UCCC_AVAILABLE = False
+    print("⚠️ UCCC not available, archiving with plain zlib/lzma")
+
 try:
     import laser_integration  # Our integrated module
     QUANTUM_INTEGRATION_AVAILABLE = True
@@ -136,6 +167,12 @@ class UniversalQuantumState:
         # Generate universal signature
         self.signature = self._generate_universal_signature()
 
+    def snapshot(self) -> Dict:
+        """Equivalent of asdict(self) for this flat dataclass, without the recursive copy"""
+        state = self.__dict__.copy()
+        state['integrated_systems'] = dict(self.integrated_systems)
+        return state
+
     def _generate_universal_signature(self) -> str:
         """Generate signature encoding all system states"""
         timestamp = int(time.time() * 1000) % 10000
@@ -183,6 +220,10 @@ class FlumpyTemporalVector:
         self.trend_history = deque(maxlen=20)
         self.quantum_phase = 0.0
 
+    def peek_delta(self, value: float) -> float:
+        """Delta that update() would report for value, without advancing the vector"""
+        return value - self.data[0] if hasattr(self.data, '__getitem__') else 0
+
     def update(self, value: float, quantum_context: Dict = None) -> Tuple[float, float, Dict]:
         """Update with quantum context from integrated systems"""
         delta = value - self.data[0] if hasattr(self.data, '__getitem__') else 0
@@ -223,6 +264,47 @@ class FlumpyTemporalVector:
 
         return delta, compressed, metrics
 
+    def update_many(self, values: np.ndarray, quantum_context: Dict = None) -> Tuple[List, List, List[Dict]]:
+        """
+        update() for each value in turn; closed form (cumulative sums and a trend
+        convolution) for the list fallback, a loop over update() for FLUMPY arrays
+        """
+        if FLUMPY_AVAILABLE and isinstance(self.data, FlumpyArray):
+            results = [self.update(value, quantum_context) for value in values.tolist()]
+            return [r[0] for r in results], [r[1] for r in results], [r[2] for r in results]
+
+        n, size = len(values), self.size
+        history = np.concatenate([np.asarray(self.data[::-1], dtype=np.float64), values])  # Oldest first
+        deltas = values - history[size - 1:size - 1 + n]
+        sums = np.concatenate([[0.0], np.cumsum(history)])
+        compressed = (sums[size + 1:size + 1 + n] - sums[1:1 + n]) / size
+
+        span = min(5, size)
+        weights = np.array([math.cos(i * math.pi / span) ** 2 for i in range(span)])
+        if span < 2:
+            trends = np.zeros(n)
+        else:
+            # Trend after value i weighs the `span` newest values, newest first
+            windows = np.lib.stride_tricks.sliding_window_view(history, span)[size - span + 1:size - span + 1 + n]
+            trends = windows[:, ::-1] @ weights / weights.sum()
+
+        self.data = history[-size:][::-1].tolist()
+        self.epoch = time.time()
+        self.trend_history.extend(trends.tolist())
+
+        shadow = self._shadow_magnitude()
+        flumpy_coherence = self.data.coherence if hasattr(self.data, 'coherence') else 1.0
+        deltas, compressed = deltas.tolist(), compressed.tolist()
+        metrics = [{
+            'delta': d,
+            'compressed': c,
+            'quantum_phase': self.quantum_phase,
+            'flumpy_coherence': flumpy_coherence,
+            'trend': t,
+            'shadow_magnitude': shadow
+        } for d, c, t in zip(deltas, compressed, trends.tolist())]
+        return deltas, compressed, metrics
+
     def _quantum_trend(self) -> float:
         """Calculate trend using quantum probability"""
         if not hasattr(self.data, '__len__'):
@@ -259,6 +341,15 @@ class FlumpyTemporalVector:
 # 3. BUMPY-ENHANCED QUANTUM OPERATOR
 # ============================================================
 
+def _bounded(x, lo: float = None, hi: float = None):
+    """min/max clamp that also works elementwise on numpy arrays"""
+    if isinstance(x, np.ndarray):
+        return np.clip(x, lo, hi)
+    if hi is not None:
+        x = min(hi, x)
+    return x if lo is None else max(lo, x)
+
+
 class BumpyQuantumOperator:
     """Quantum operator enhanced with BUMPY array operations"""
 
@@ -281,19 +372,7 @@ class BumpyQuantumOperator:
         noise_hash = hashlib.sha256(noise_seed.encode()).digest()
         quantum_noise = sum(noise_hash) / (len(noise_hash) * 255)
 
-        # Calculate coherence with system integration
-        base_coherence = 0.8 + (value * 0.2) - (quantum_noise * 0.3)
-
-        # Apply system-specific adjustments
-        if system_states.get('flumpy_coherence'):
-            base_coherence = (base_coherence + system_states['flumpy_coherence']) / 2
-
-        if system_states.get('consciousness'):
-            # Higher consciousness stabilizes coherence
-            consciousness_boost = system_states['consciousness'] * 0.2
-            base_coherence = min(1.0, base_coherence + consciousness_boost)
-
-        coherence = max(0.1, base_coherence)
+        coherence = self._coherence(value, quantum_noise, system_states)
 
         # Calculate entropy with BUMPY enhancement
         entropy = quantum_noise * 0.7
@@ -305,19 +384,7 @@ class BumpyQuantumOperator:
             bumpy_entropy = self.bumpy_core.quantum_chaos_level * 0.5
             entropy = (entropy + bumpy_entropy) / 2
 
-        # Stability calculation
-        stability = 1.0 - abs(value - 0.5) * 0.4
-        if system_states.get('stability'):
-            stability = (stability + system_states['stability']) / 2
-
-        # Risk calculation with universal factors
-        risk_factors = [
-            (1 - coherence) * 0.4,
-            entropy * 0.3,
-            (1 - stability) * 0.3,
-            system_states.get('risk_bonus', 0.0)
-        ]
-        risk = sum(risk_factors)
+        stability, risk = self._stability_and_risk(value, coherence, entropy, system_states)
 
         # Generate enhanced signature
         signature = self._generate_enhanced_signature(value, coherence, entropy, risk)
@@ -344,6 +411,108 @@ class BumpyQuantumOperator:
             }
         }
 
+    def transform_many(self, values: np.ndarray, contexts: List[str],
+                       system_states: Dict = None) -> List[Dict]:
+        """
+        transform() over a batch in one vectorized pass
+
+        A single SHA-256 over the batch seeds the per-entry noise (still the mean
+        of 32 uniform bytes each), one BUMPY ritual runs on the batch means and
+        at most one entanglement array is prepared per batch.
+        """
+        system_states = system_states or {}
+        n = len(values)
+        digest = hashlib.sha256(
+            values.tobytes() + '\x1f'.join(contexts).encode('utf-8', 'surrogatepass') +
+            f"{self._seed}{system_states.get('signature', '')}".encode()
+        ).digest()
+        rng = np.random.default_rng(int.from_bytes(digest, 'little'))
+        quantum_noise = rng.integers(0, 256, size=(n, 32)).sum(axis=1) / (32 * 255)
+
+        coherence = self._coherence(values, quantum_noise, system_states)
+        entropy = quantum_noise * 0.7
+        if BUMPY_AVAILABLE and self.bumpy_core:
+            bumpy_data = BumpyArray([float(values.mean()), float(quantum_noise.mean()), float(coherence.mean())])
+            self.bumpy_core.qualia_emergence_ritual([bumpy_data])
+            entropy = (entropy + self.bumpy_core.quantum_chaos_level * 0.5) / 2
+        stability, risk = self._stability_and_risk(values, coherence, entropy, system_states)
+        stability = np.broadcast_to(stability, (n,))
+
+        entanglement_ready = False
+        if BUMPY_AVAILABLE and len(contexts[0]) > 3:
+            entanglement_ready = self._prepare_entanglement(
+                float(values.mean()), contexts[0], float(coherence.mean())) is not None
+
+        stamp = int(time.time() * 1000) % 10000
+        system_code = 1 if BUMPY_AVAILABLE else 0
+        codes = (np.stack([values, coherence, entropy, risk]) * 100).astype(np.int64).T.tolist()
+        epoch = time.time()
+        universal_factors = {
+            'consciousness_influence': system_states.get('consciousness', 0.0),
+            'flumpy_alignment': system_states.get('flumpy_coherence', 0.0),
+            'psionic_modulation': system_states.get('psionic_field', 0.0)
+        }
+        return [{
+            'epoch': epoch,
+            'coherence': c,
+            'entropy': e,
+            'risk': r,
+            'stability': st,
+            'signature': f"B{stamp:04d}V{v:02d}C{cc:02d}E{ec:02d}R{rc:02d}S{system_code:01d}",
+            'quantum_noise': q,
+            'bumpy_enhanced': BUMPY_AVAILABLE,
+            'entanglement_ready': entanglement_ready,
+            'universal_factors': universal_factors
+        } for c, e, r, st, q, (v, cc, ec, rc) in zip(
+            np.round(coherence, 4).tolist(), np.round(entropy, 4).tolist(),
+            np.round(np.minimum(1.0, risk), 4).tolist(), np.round(stability, 4).tolist(),
+            np.round(quantum_noise, 4).tolist(), codes)]
+
+    def _coherence(self, value: float, quantum_noise: float, system_states: Dict) -> float:
+        """Coherence with system integration"""
+        base_coherence = 0.8 + (value * 0.2) - (quantum_noise * 0.3)
+
+        # Apply system-specific adjustments
+        if system_states.get('flumpy_coherence'):
+            base_coherence = (base_coherence + system_states['flumpy_coherence']) / 2
+
+        if system_states.get('consciousness'):
+            # Higher consciousness stabilizes coherence
+            consciousness_boost = system_states['consciousness'] * 0.2
+            base_coherence = _bounded(base_coherence + consciousness_boost, hi=1.0)
+
+        return _bounded(base_coherence, lo=0.1)
+
+    def _stability_and_risk(self, value: float, coherence: float, entropy: float,
+                            system_states: Dict) -> Tuple[float, float]:
+        """Stability and risk with universal factors"""
+        stability = 1.0 - abs(value - 0.5) * 0.4
+        if system_states.get('stability'):
+            stability = (stability + system_states['stability']) / 2
+
+        risk_factors = [
+            (1 - coherence) * 0.4,
+            entropy * 0.3,
+            (1 - stability) * 0.3,
+            system_states.get('risk_bonus', 0.0)
+        ]
+        return stability, sum(risk_factors)
+
+    def estimate_risk(self, value: float, system_states: Dict = None) -> float:
+        """
+        Risk that transform() would report, without hashing or running a ritual.
+
+        The hash noise is the mean of 32 uniform bytes (0.5 +/- 0.05), so its
+        expectation stands in for it; the BUMPY term uses the current chaos level.
+        """
+        system_states = system_states or {}
+        coherence = self._coherence(value, 0.5, system_states)
+        entropy = 0.35
+        if BUMPY_AVAILABLE and self.bumpy_core:
+            entropy = (entropy + self.bumpy_core.quantum_chaos_level * 0.5) / 2
+        _, risk = self._stability_and_risk(value, coherence, entropy, system_states)
+        return _bounded(risk, hi=1.0)
+
     def _generate_enhanced_signature(self, value: float, coherence: float, entropy: float, risk: float) -> str:
         """Generate quantum signature with system encoding"""
         timestamp = int(time.time() * 1000) % 10000
@@ -382,226 +551,2892 @@ class BumpyQuantumOperator:
 
         return bumpy_array
 
+# ============================================================
+# 3b. SHARED RESOURCE SAMPLER
+# ============================================================
+
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """Smoothed resource readings; immutable, so readers never need a lock"""
+    cpu_percent: float = 0.0          # System-wide busy time
+    process_cpu_percent: float = 0.0  # This process, 100 = one core
+    rss_bytes: float = 0.0
+    available_bytes: float = 0.0
+    total_bytes: float = 0.0
+    memory_percent: float = 0.0       # Used share of physical memory
+    samples: int = 0
+    taken_at: float = 0.0             # time.monotonic() of the last sample
+    source: str = 'none'
+
+
+def _read_resources_psutil(process) -> Tuple:
+    times = psutil.cpu_times()
+    total = sum(times) - getattr(times, 'guest', 0.0) - getattr(times, 'guest_nice', 0.0)
+    busy = total - times.idle - getattr(times, 'iowait', 0.0)
+    proc = process.cpu_times()
+    memory = psutil.virtual_memory()
+    return busy, total, proc.user + proc.system, process.memory_info().rss, memory.available, memory.total
+
+
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _read_resources_proc(process=None) -> Tuple:
+    """Same readings as _read_resources_psutil, from Linux /proc"""
+    with open('/proc/stat', 'rb') as fh:
+        fields = [int(x) for x in fh.readline().split()[1:]]
+    total = sum(fields[:8])  # user..steal; guest time is already part of user
+    busy = total - fields[3] - fields[4]
+    with open('/proc/self/stat', 'rb') as fh:
+        stat = fh.read().rsplit(b')', 1)[1].split()  # The command name may contain spaces
+    proc_ticks = int(stat[11]) + int(stat[12])  # utime, stime
+    with open('/proc/self/statm', 'rb') as fh:
+        rss = int(fh.read().split()[1]) * _PAGE_SIZE
+    meminfo = {}
+    with open('/proc/meminfo', 'rb') as fh:
+        for line in fh:
+            key, value = line.split(b':', 1)
+            meminfo[key] = int(value.split()[0]) * 1024
+    available = meminfo.get(b'MemAvailable', meminfo.get(b'MemFree', 0))
+    return (busy / _CLOCK_TICKS, total / _CLOCK_TICKS, proc_ticks / _CLOCK_TICKS,
+            rss, available, meminfo.get(b'MemTotal', 0))
+
+
+class ResourceSampler:
+    """
+    One background thread that samples CPU, RSS and available memory.
+
+    CPU figures come from deltas of cumulative CPU times between samples, so no
+    call ever blocks. Readings are exponentially smoothed (`alpha` weights the
+    newest) and published as a new ResourceSnapshot in `self.snapshot`: reading
+    it is an attribute load. psutil is used when installed, /proc otherwise;
+    without either the snapshot stays at zeros.
+
+    Most code should use ResourceSampler.shared(), one sampler per process,
+    which runs at the fastest interval any caller asked for.
+    """
+
+    _shared: Optional['ResourceSampler'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, interval: float = 1.0, alpha: float = 0.3, use_psutil: Optional[bool] = None):
+        self.interval = interval
+        self.alpha = alpha
+        if use_psutil is None:
+            use_psutil = PSUTIL_AVAILABLE
+        if use_psutil:
+            self._read, self.source = functools.partial(_read_resources_psutil, psutil.Process()), 'psutil'
+        elif os.path.exists('/proc/self/stat'):
+            self._read, self.source = _read_resources_proc, 'proc'
+        else:
+            self._read, self.source = None, 'none'
+        self._last = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.snapshot = ResourceSnapshot(source=self.source)
+        self.sample()
+
+    @classmethod
+    def shared(cls, interval: Optional[float] = None) -> 'ResourceSampler':
+        """The process-wide running sampler; `interval` can only make it sample faster"""
+        with cls._shared_lock:
+            sampler = cls._shared
+            if sampler is None:
+                sampler = cls._shared = cls(interval=interval or 1.0)
+                sampler.start()
+            elif interval is not None and interval < sampler.interval:
+                sampler.interval = interval
+            return sampler
+
+    def start(self) -> 'ResourceSampler':
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='laser-resources', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> ResourceSnapshot:
+        """Take one reading and publish the smoothed snapshot"""
+        if self._read is None:
+            return self.snapshot
+        try:
+            reading = self._read()
+        except Exception:
+            return self.snapshot  # Keep the last good values
+        now = time.monotonic()
+        busy, total, proc_cpu, rss, available, memory_total = reading
+        previous, self._last = self._last, (now, busy, total, proc_cpu)
+        old = self.snapshot
+        cpu, process_cpu = old.cpu_percent, old.process_cpu_percent
+        if previous is not None:
+            elapsed = now - previous[0]
+            cpu_now = 100.0 * (busy - previous[1]) / (total - previous[2]) if total > previous[2] else 0.0
+            process_now = 100.0 * (proc_cpu - previous[3]) / elapsed if elapsed > 0 else 0.0
+            if old.samples > 1:
+                cpu = self._smooth(cpu, cpu_now)
+                process_cpu = self._smooth(process_cpu, process_now)
+            else:
+                cpu, process_cpu = cpu_now, process_now
+        first = old.samples == 0
+        rss = rss if first else self._smooth(old.rss_bytes, rss)
+        available = available if first else self._smooth(old.available_bytes, available)
+        self.snapshot = ResourceSnapshot(
+            cpu_percent=cpu,
+            process_cpu_percent=process_cpu,
+            rss_bytes=rss,
+            available_bytes=available,
+            total_bytes=memory_total,
+            memory_percent=100.0 * (1.0 - available / memory_total) if memory_total else 0.0,
+            samples=old.samples + 1,
+            taken_at=now,
+            source=self.source
+        )
+        return self.snapshot
+
+    def _smooth(self, old: float, new: float) -> float:
+        return old + self.alpha * (new - old)
+
+
+def _restart_shared_sampler():
+    """A forked child inherits the sampler but not its thread"""
+    ResourceSampler._shared_lock = threading.Lock()
+    sampler = ResourceSampler._shared
+    if sampler is not None:
+        sampler._thread = None
+        sampler._stop = threading.Event()
+        sampler.start()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_shared_sampler)
+
+# ============================================================
+# 3c. LATENCY HISTOGRAMS AND PROMETHEUS EXPOSITION
+# ============================================================
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+
+class LogHistogram:
+    """
+    Log-bucketed histogram: bucket upper bounds grow by 2**(1/per_octave) from
+    `lowest` to `highest`, plus +Inf, so the relative error of a quantile is
+    bounded (about 19% at 4 buckets per octave) at any magnitude.
+
+    Each recording thread counts into its own shard without locking; readers
+    merge the shards. Shards of finished threads are folded into one.
+    """
+
+    def __init__(self, description: str = '', lowest: float = 1e-6, highest: float = 60.0,
+                 per_octave: int = 4):
+        self.description = description
+        self.lowest = lowest
+        self.per_octave = per_octave
+        finite = math.ceil(math.log2(highest / lowest) * per_octave) + 1
+        self.bounds = [lowest * 2 ** (i / per_octave) for i in range(finite)]
+        self._inf = finite
+        self._width = finite + 3  # Counts, +Inf, sum, max
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, List]] = []
+        self._retired = [0] * self._width
+
+    def _new_shard(self) -> List:
+        shard = [0] * self._width
+        with self._lock:
+            self._shards.append((threading.current_thread(), shard))
+        self._local.shard = shard
+        return shard
+
+    def record(self, value: float, count: int = 1):
+        """Count `value` (`count` times); lock-free for the calling thread"""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        if value <= self.lowest:
+            shard[0] += count
+        else:
+            index = math.ceil(math.log2(value / self.lowest) * self.per_octave)
+            shard[index if index < self._inf else self._inf] += count
+        shard[-2] += value * count
+        if value > shard[-1]:
+            shard[-1] = value
+
+    def after_fork(self):
+        """
+        Child side of a fork: the lock may belong to a thread that no longer
+        exists, and the inherited counts are the parent's to export, not ours
+        """
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards = []
+        self._retired = [0] * self._width
+
+    def merge(self, other: 'LogHistogram'):
+        """Add another histogram with the same buckets into this one"""
+        if other.bounds != self.bounds:
+            raise ValueError("histograms have different buckets")
+        merged = other._merged()
+        with self._lock:
+            self._fold(self._retired, merged)
+
+    @staticmethod
+    def _fold(into: List, shard: List):
+        for i in range(len(into) - 1):
+            into[i] += shard[i]
+        into[-1] = max(into[-1], shard[-1])
+
+    def _merged(self) -> List:
+        with self._lock:
+            live = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live.append((thread, shard))
+                else:
+                    self._fold(self._retired, shard)
+            self._shards = live
+            merged = list(self._retired)
+            for _, shard in live:
+                self._fold(merged, shard)
+        return merged
+
+    def summary(self) -> Dict:
+        """Count, sum, mean, max and upper-bound estimates of p50/p90/p99/p99.9"""
+        merged = self._merged()
+        counts, total, peak = merged[:-2], merged[-2], merged[-1]
+        count = sum(counts)
+        report = {'count': count, 'sum': total, 'mean': total / count if count else 0.0, 'max': peak}
+        for label, q in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('p999', 0.999)):
+            report[label] = self._quantile(counts, count, q, peak)
+        return report
+
+    def quantile(self, q: float) -> float:
+        merged = self._merged()
+        counts = merged[:-2]
+        return self._quantile(counts, sum(counts), q, merged[-1])
+
+    def _quantile(self, counts: List, count: int, q: float, peak: float) -> float:
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for i, n in enumerate(counts):
+            seen += n
+            if seen >= rank and n:
+                return min(self.bounds[i], peak) if i < self._inf else peak
+        return peak
+
+    def prometheus_lines(self, name: str) -> List[str]:
+        merged = self._merged()
+        lines = [f"# HELP {name} {_prometheus_help(self.description)}", f"# TYPE {name} histogram"]
+        cumulative = 0
+        for bound, n in zip(self.bounds, merged):
+            cumulative += n
+            lines.append(f'{name}_bucket{{le="{bound:.6g}"}} {cumulative}')
+        cumulative += merged[self._inf]
+        lines.append(f'{name}_bucket{{le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum {_prometheus_value(merged[-2])}")
+        lines.append(f"{name}_count {cumulative}")
+        return lines
+
+
+def _prometheus_help(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _prometheus_value(value) -> str:
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+def render_prometheus(histograms: Dict[str, LogHistogram] = None, counters: Dict[str, Tuple] = None,
+                      gauges: Dict[str, Tuple] = None, prefix: str = 'laser_') -> str:
+    """
+    Prometheus text exposition (format 0.0.4). `counters` and `gauges` map a
+    name to (value, help); counters get the '_total' suffix.
+    """
+    lines = []
+    for kind, metrics in (('counter', counters), ('gauge', gauges)):
+        for name, (value, help_text) in (metrics or {}).items():
+            full = f"{prefix}{name}_total" if kind == 'counter' else f"{prefix}{name}"
+            lines += [f"# HELP {full} {_prometheus_help(help_text)}", f"# TYPE {full} {kind}",
+                      f"{full} {_prometheus_value(value)}"]
+    for name, histogram in (histograms or {}).items():
+        lines += histogram.prometheus_lines(prefix + name)
+    return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        try:
+            body = self.server.render().encode('utf-8')
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes are not log events
+
+
+class _QuietServer:
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass  # A scraper hanging up mid-response is its own business
+
+
+class _TCPMetricsServer(_QuietServer, socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+
+
+class _TCP6MetricsServer(_TCPMetricsServer):
+    address_family = socket.AF_INET6
+
+
+class _UnixMetricsServer(_QuietServer, socketserver.ThreadingUnixStreamServer):
+    pass
+
+
+class MetricsServer:
+    """
+    Serves render() as GET /metrics on a loopback TCP port or a Unix socket.
+
+    `address` is a port, 'host:port' (loopback hosts only) or a socket path;
+    port 0 picks a free port, see `.address`.
+    """
+
+    def __init__(self, render, address):
+        self.path = None
+        if isinstance(address, str) and os.sep in address:
+            self.path = address
+            if os.path.exists(address):
+                os.unlink(address)  # Stale socket of a previous run
+            self._server = _UnixMetricsServer(address, _MetricsHandler, bind_and_activate=False)
+            try:
+                self._server.server_bind()
+                os.chmod(address, 0o600)  # Before listen(): nobody connects under the umask's mode
+                self._server.server_activate()
+            except BaseException:
+                self._server.server_close()
+                raise
+            self.address = address
+        else:
+            if isinstance(address, int) or address.isdigit():
+                host, port = '127.0.0.1', int(address)
+            else:
+                host, port = address.rsplit(':', 1)
+                host = host.strip('[]')
+            if host not in LOOPBACK_HOSTS:
+                raise ValueError(f"metrics endpoint must bind a loopback address, got {host!r}")
+            server = _TCP6MetricsServer if host == '::1' else _TCPMetricsServer
+            self._server = server((host, int(port)), _MetricsHandler)
+            self.address = self._server.server_address[:2]
+        self._server.render = render
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.5},
+                                        name='laser-metrics', daemon=True)
+        self._thread.start()
+
+    def detach(self):
+        """Child side of a fork: close the inherited listening socket, leave the parent's endpoint alone"""
+        server, self._server = self._server, None
+        if server is not None:
+            server.server_close()
+
+    def close(self):
+        if self._server is None:
+            return
+        server, self._server = self._server, None
+        server.shutdown()
+        server.server_close()
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+
 # ============================================================
 # 4. HOLOGRAPHIC CACHE WITH UNIVERSAL COMPRESSION
 # ============================================================
 
+CACHE_POLICIES = ('lru', 'lfu')
+
+
+def _estimate_bytes(value, depth: int = 4) -> int:
+    """sys.getsizeof summed over nested containers (a few levels deep)"""
+    size = sys.getsizeof(value)
+    if depth:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                size += sys.getsizeof(key) + _estimate_bytes(item, depth - 1)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            for item in value:
+                size += _estimate_bytes(item, depth - 1)
+    return size
+
+
+class _PackedValue:
+    """Losslessly compressed cold cache value"""
+
+    __slots__ = ('blob',)
+
+    def __init__(self, value):
+        self.blob = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL), 1)
+
+    def unpack(self):
+        return pickle.loads(zlib.decompress(self.blob))
+
+
 class UniversalCache:
-    """Cache with holographic compression and system integration"""
+    """
+    Cache with O(1) LRU/LFU eviction, byte accounting and cold-entry compression
+
+    `cache` is an OrderedDict in recency order (oldest first), so LRU eviction is
+    popitem(last=False). LFU keeps one OrderedDict of keys per access count and
+    evicts the least recently used key of the lowest count. Entries cost
+    `_estimate_bytes(value)` unless the caller passes `cost`; `max_bytes` is a
+    hard budget and `max_size` an entry cap.
+
+    Memory pressure (from `resources`, by default the shared ResourceSampler)
+    and the cold sweep run at most once per `pressure_interval` seconds, from
+    whichever call crosses the tick: pressure above 0.8 sheds 20%
+    of the entries, and entries idle for `cold_after` seconds are pickled and
+    zlib-compressed (lossless; they are inflated again on the next hit).
+    """
+
+    def __init__(self, max_size: int = 1000, max_bytes: Optional[int] = None,
+                 policy: str = 'lru', pressure_interval: float = 5.0,
+                 cold_after: Optional[float] = 30.0, compress_min_bytes: int = 512,
+                 resources: Optional[ResourceSampler] = None):
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"policy must be one of {CACHE_POLICIES}, got {policy!r}")
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.pressure_interval = pressure_interval
+        self.cold_after = cold_after
+        self.compress_min_bytes = compress_min_bytes
+        self.resources = resources
+
+        self.cache: 'OrderedDict[str, Any]' = OrderedDict()
+        self.timestamps: Dict[str, float] = {}  # Last access, monotonic
+        self.access_patterns: Dict[str, int] = {}
+        self._costs: Dict[str, int] = {}
+        self._compressible: set = set()
+        self._buckets: Dict[int, 'OrderedDict[str, None]'] = {}  # LFU: access count -> keys
+        self._min_count = 0
+        self.bytes = 0
+
+        # Memory pressure tracking
+        self.memory_warnings = 0
+        self.last_cleanup = time.monotonic()
+        self._pressure = 0.0
+
+        # Integration metrics
+        self.metrics = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'rejections': 0,
+            'compressions': 0,
+            'decompressions': 0,
+            'size_reduction': 0.0,
+            'quantum_entanglements': 0
+        }
+        self._packed_from = 0
+        self._packed_to = 0
+
+    def __len__(self):
+        return len(self.cache)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.cache
+
+    # ----------------------------------------
+    # Policy bookkeeping
+    # ----------------------------------------
+
+    def _touch(self, key: str):
+        self.cache.move_to_end(key)
+        self.timestamps[key] = time.monotonic()
+        count = self.access_patterns[key]
+        self.access_patterns[key] = count + 1
+        if self.policy == 'lfu':
+            bucket = self._buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[count]
+                if self._min_count == count:
+                    self._min_count = count + 1
+            self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def _victim(self) -> str:
+        if self.policy == 'lru':
+            return next(iter(self.cache))
+        if self._min_count not in self._buckets:
+            self._min_count = min(self._buckets)  # Distinct counts, not entries
+        return next(iter(self._buckets[self._min_count]))
+
+    def _evict_one(self):
+        self.delete(self._victim())
+        self.metrics['evictions'] += 1
+
+    # ----------------------------------------
+    # Public API
+    # ----------------------------------------
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Get with quantum-aware access patterns"""
+        if key not in self.cache:
+            self.metrics['misses'] += 1
+            return None
+
+        self.metrics['hits'] += 1
+        self._touch(key)
+        value = self.cache[key]
+        if isinstance(value, _PackedValue):
+            value = self._inflate(key, value)
+
+        # Apply quantum refresh for frequently accessed items
+        if self.access_patterns[key] % 5 == 0:
+            self._quantum_refresh(key)
+
+        self._tick()
+        return value
+
+    def set(self, key: str, value: Dict, compress: bool = True, cost: Optional[int] = None):
+        """
+        Insert or replace an entry
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            compress: Whether the entry may be compressed once it turns cold
+            cost: Byte cost; estimated with sys.getsizeof when omitted
+        """
+        cost = _estimate_bytes(value) if cost is None else cost
+        if self.max_bytes is not None and cost > self.max_bytes:
+            self.metrics['rejections'] += 1
+            self.delete(key)
+            return
+
+        if key in self.cache:
+            self.delete(key)
+        while self.cache and (len(self.cache) >= self.max_size or
+                              (self.max_bytes is not None and self.bytes + cost > self.max_bytes)):
+            self._evict_one()
+
+        self.cache[key] = value
+        self.timestamps[key] = time.monotonic()
+        self.access_patterns[key] = 0
+        self._costs[key] = cost
+        self.bytes += cost
+        if compress and cost >= self.compress_min_bytes:
+            self._compressible.add(key)
+        if self.policy == 'lfu':
+            self._buckets.setdefault(0, OrderedDict())[key] = None
+            self._min_count = 0
+
+        self._tick()
+
+    def delete(self, key: str):
+        """Delete entry and propagate to entangled entries"""
+        if key not in self.cache:
+            return
+        value = self.cache[key]
+        # Propagate deletion to entangled entries
+        if isinstance(value, dict) and 'quantum_metadata' in value:
+            entangled = value['quantum_metadata'].get('entangled_with', [])
+            for other_key in entangled:
+                other = self.cache.get(other_key)
+                if isinstance(other, dict) and 'quantum_metadata' in other:
+                    # Remove this key from other's entanglement list
+                    other_entangled = other['quantum_metadata'].get('entangled_with', [])
+                    if key in other_entangled:
+                        other_entangled.remove(key)
+
+        # Delete entry
+        del self.cache[key]
+        self.timestamps.pop(key, None)
+        count = self.access_patterns.pop(key, 0)
+        self.bytes -= self._costs.pop(key, 0)
+        self._compressible.discard(key)
+        if self.policy == 'lfu':
+            bucket = self._buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[count]
+
+    def stats(self) -> Dict:
+        lookups = self.metrics['hits'] + self.metrics['misses']
+        return {
+            **self.metrics,
+            'hit_rate': round(self.metrics['hits'] / lookups, 4) if lookups else 0.0,
+            'entries': len(self.cache),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'policy': self.policy,
+            'memory_pressure': round(self._pressure, 3),
+        }
+
+    # ----------------------------------------
+    # Timer-driven maintenance
+    # ----------------------------------------
+
+    def _tick(self):
+        now = time.monotonic()
+        if now - self.last_cleanup < self.pressure_interval:
+            return
+        self.last_cleanup = now
+        self._pressure = self._memory_pressure()
+        if self._pressure > 0.8:
+            self.memory_warnings += 1
+            self._aggressive_evict()
+        if self.cold_after is not None:
+            self._compress_cold(now - self.cold_after)
+
+    def _memory_pressure(self) -> float:
+        """Memory pressure from the sampler's cached snapshot (no syscall)"""
+        snapshot = (self.resources or ResourceSampler.shared()).snapshot
+        if not snapshot.total_bytes:
+            return len(self.cache) / self.max_size
+        return snapshot.memory_percent / 100.0
+
+    def _aggressive_evict(self):
+        """Shed the coldest 20% of entries in policy order"""
+        for _ in range(max(1, len(self.cache) // 5)):
+            if not self.cache:
+                break
+            self._evict_one()
+
+    def _compress_cold(self, cutoff: float):
+        """Compress entries idle since before cutoff; recency order lets the walk stop early"""
+        for key in list(itertools.takewhile(lambda k: self.timestamps[k] < cutoff, self.cache)):
+            value = self.cache[key]
+            if key not in self._compressible or isinstance(value, _PackedValue):
+                continue
+            try:
+                packed = _PackedValue(value)
+            except Exception:  # Unpicklable values simply stay as they are
+                self._compressible.discard(key)
+                continue
+            cost = len(packed.blob) + sys.getsizeof(packed)
+            self._packed_from += self._costs[key]
+            self._packed_to += cost
+            self.bytes += cost - self._costs[key]
+            self._costs[key] = cost
+            self.cache[key] = packed
+            self.metrics['compressions'] += 1
+        if self._packed_from:
+            self.metrics['size_reduction'] = round(1.0 - self._packed_to / self._packed_from, 4)
+
+    def _inflate(self, key: str, packed: _PackedValue):
+        value = packed.unpack()
+        cost = _estimate_bytes(value)
+        self.bytes += cost - self._costs[key]
+        self._costs[key] = cost
+        self.cache[key] = value
+        self.metrics['decompressions'] += 1
+        return value
+
+    # ----------------------------------------
+    # Quantum metadata
+    # ----------------------------------------
+
+    def _quantum_refresh(self, key: str):
+        """Refresh cache entry with quantum operations"""
+        entry = self.cache.get(key)
+        if not isinstance(entry, dict):
+            return
+
+        # Add quantum timestamp
+        if 'quantum_metadata' not in entry:
+            entry['quantum_metadata'] = {}
+
+        entry['quantum_metadata']['refresh_time'] = time.time()
+        entry['quantum_metadata']['quantum_phase'] = random.uniform(0, 2 * math.pi)
+
+        # Entangle with a recently used entry if BUMPY available
+        if BUMPY_AVAILABLE and random.random() < 0.1:
+            recent = [k for k in itertools.islice(reversed(self.cache), 33) if k != key]
+            if recent:
+                self._create_entanglement(key, random.choice(recent))
+
+    def _create_entanglement(self, key1: str, key2: str):
+        """Create quantum entanglement between cache entries"""
+        entries = [self.cache.get(key1), self.cache.get(key2)]
+        if not all(isinstance(entry, dict) for entry in entries):
+            return  # Missing or compressed
+        # Mark entanglement in metadata
+        for key, entry, other_key in ((key1, entries[0], key2), (key2, entries[1], key1)):
+            if 'quantum_metadata' not in entry:
+                entry['quantum_metadata'] = {}
+            entangled_with = entry['quantum_metadata'].setdefault('entangled_with', [])
+            if other_key not in entangled_with:
+                entangled_with.append(other_key)
+
+        self.metrics['quantum_entanglements'] += 1
+
+# ============================================================
+# 4b. ASYNCHRONOUS FLUSH PIPELINE
+# ============================================================
+
+BACKPRESSURE_POLICIES = ('block', 'drop_oldest', 'sample')
+
+
+_encode_json = json.JSONEncoder(separators=(',', ':'), default=str).encode
+
+
+def _jsonl_line(entry: Dict) -> str:
+    return _encode_json(entry) + '\n'
+
+
+class JsonlSink:
+    """Append-only JSONL file sink: one buffered write per batch."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, 'a', encoding='utf-8', buffering=1 << 20)
+
+    def write(self, entries: List[Dict]):
+        self._fh.write(''.join([_jsonl_line(entry) for entry in entries]))
+
+    def flush(self, fsync: bool = False):
+        self._fh.flush()
+        if fsync:
+            os.fsync(self._fh.fileno())
+
+    def close(self):
+        self._fh.close()
+
+
+class _QueueStamp:
+    """Queue item placed ahead of a submit_many() block: when and how many"""
+    __slots__ = ('enqueued', 'count')
+
+    def __init__(self, count: int):
+        self.enqueued = time.perf_counter()
+        self.count = count
+
+
+def writer_histograms() -> Dict[str, LogHistogram]:
+    return {
+        'flush_seconds': LogHistogram("Duration of one batch write to the log sink"),
+        'batch_size': LogHistogram("Entries per batch write", lowest=1, highest=1 << 20, per_octave=2),
+        'queue_wait_seconds': LogHistogram("Time a flushed block waited in the writer queue"),
+    }
+
+
+def _record_write(histograms: Dict[str, LogHistogram], seconds: float, entries: int):
+    if 'flush_seconds' in histograms:
+        histograms['flush_seconds'].record(seconds)
+    if 'batch_size' in histograms:
+        histograms['batch_size'].record(entries)
+
+
+class AsyncLogWriter:
+    """
+    Background batching writer for LASER entries.
+
+    Producers only append to a bounded deque (atomic under the GIL, so the fast
+    path takes no lock). One daemon thread drains it in batches of `batch_size`,
+    hands each batch to the sink as a single buffered write, and fsyncs at most
+    every `fsync_interval` seconds (never, if None).
+
+    When the queue is full, `policy` decides:
+      'block'       - the producer waits until the writer frees space
+      'drop_oldest' - the oldest queued entry is discarded
+      'sample'      - every `sample_every`-th overflowing entry replaces the oldest,
+                      the rest are discarded
+    Discarded entries are counted in `dropped`. `close()` drains everything that
+    was accepted before returning. Sink write and flush failures are counted in
+    `write_errors` and never stop the writer; should the thread die anyway,
+    overflowing entries are dropped rather than blocking producers.
+
+    `histograms` ('flush_seconds', 'batch_size', 'queue_wait_seconds') record
+    sink write latency, entries per write and, for blocks handed over with
+    submit_many(), the time the block waited in the queue.
+    """
+
+    def __init__(self, sink, max_queue: int = 10000, batch_size: int = 512,
+                 flush_interval: float = 0.25, fsync_interval: Optional[float] = None,
+                 policy: str = 'block', sample_every: int = 10,
+                 histograms: Dict[str, LogHistogram] = None):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"policy must be one of {BACKPRESSURE_POLICIES}, got {policy!r}")
+        self.sink = sink
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.policy = policy
+        self.sample_every = max(1, sample_every)
+
+        self._queue: Deque = deque()
+        self._wake = threading.Event()
+        self._space = threading.Condition()
+        self._drop_lock = threading.Lock()
+        self._overflow = 0
+        self._closed = False
+        self._finished = threading.Event()
+        self._last_fsync = time.monotonic()
+
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.write_errors = 0
+        self.last_batch_s = 0.0
+        self.histograms = writer_histograms() if histograms is None else histograms
+
+        self._thread = threading.Thread(target=self._run, name='laser-writer', daemon=True)
+        self._thread.start()
+
+    # ----------------------------------------
+    # Producer side
+    # ----------------------------------------
+
+    def submit(self, entry: Dict) -> bool:
+        """Enqueue one entry; returns False if backpressure discarded it."""
+        queue = self._queue
+        if (self._closed or len(queue) >= self.max_queue) and not self._admit():
+            return False
+        queue.append(entry)
+        if len(queue) >= self.batch_size and not self._wake.is_set():
+            self._wake.set()
+        return True
+
+    def submit_many(self, entries) -> int:
+        """Enqueue a block of entries; returns how many were accepted."""
+        if not isinstance(entries, list):
+            entries = list(entries)
+        if entries and not self._closed:
+            self._queue.append(_QueueStamp(len(entries)))
+        accepted = 0
+        for entry in entries:
+            accepted += self.submit(entry)
+        return accepted
+
+    def _admit(self) -> bool:
+        thread = self._thread
+        if self._closed or not thread.is_alive():
+            # Nobody left to make room: never park a producer on a dead writer
+            with self._drop_lock:
+                self.dropped += 1
+            return False
+        if self.policy == 'block':
+            self._wake.set()
+            with self._space:
+                while len(self._queue) >= self.max_queue and not self._closed:
+                    if not thread.is_alive():
+                        with self._drop_lock:
+                            self.dropped += 1
+                        return False
+                    self._space.wait(0.05)
+            return True
+        with self._drop_lock:
+            if self.policy == 'sample':
+                self._overflow += 1
+                if self._overflow % self.sample_every:
+                    self.dropped += 1
+                    return False
+            try:
+                victim = self._queue.popleft()
+            except IndexError:
+                return True
+            if isinstance(victim, threading.Event):
+                victim.set()  # A flush marker: everything before it is gone anyway
+            elif not isinstance(victim, _QueueStamp):
+                self.dropped += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None, fsync: bool = False) -> bool:
+        """Block until everything enqueued so far is written (and fsynced if asked)."""
+        if self._closed:
+            # No writer thread left to reach a marker; close() flushes the sink itself
+            return self._finished.wait(timeout)
+        if not self._thread.is_alive():
+            return False
+        marker = threading.Event()
+        if fsync:
+            marker.fsync = True
+        self._queue.append(marker)
+        self._wake.set()
+        return marker.wait(timeout)
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    # ----------------------------------------
+    # Writer thread
+    # ----------------------------------------
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self):
+        queue = self._queue
+        pop = queue.popleft
+        queue_wait = self.histograms.get('queue_wait_seconds')
+        while queue:
+            batch, markers = [], []
+            try:
+                while len(batch) < self.batch_size:
+                    item = pop()
+                    if type(item) is dict:
+                        batch.append(item)
+                    elif isinstance(item, _QueueStamp):
+                        if queue_wait is not None:
+                            queue_wait.record(time.perf_counter() - item.enqueued, item.count)
+                    elif isinstance(item, threading.Event):
+                        markers.append(item)
+                        break  # Write what precedes the marker, then release it
+                    else:
+                        batch.append(item)
+            except IndexError:
+                pass
+            if self.policy == 'block':
+                with self._space:
+                    self._space.notify_all()
+            if batch:
+                self._write(batch)
+            if markers:
+                self._flush_sink(any(getattr(m, 'fsync', False) for m in markers))
+                for marker in markers:
+                    marker.set()
+        self._flush_sink(self._fsync_due())
+
+    def _write(self, batch: List[Dict]):
+        start = time.perf_counter()
+        try:
+            self.sink.write(batch)
+            self.written += len(batch)
+        except Exception as e:
+            self.write_errors += 1
+            print(f"⚠️ Universal write failed: {e}")
+            for entry in batch[:2]:
+                print(f"[FALLBACK] {entry.get('timestamp')} - {str(entry.get('message', ''))[:60]}...")
+        self.batches += 1
+        self.last_batch_s = time.perf_counter() - start
+        _record_write(self.histograms, self.last_batch_s, len(batch))
+
+    def _flush_sink(self, fsync: bool):
+        try:
+            self.sink.flush(fsync=fsync)
+        except Exception as e:
+            self.write_errors += 1
+            print(f"⚠️ Universal flush failed: {e}")
+
+    def _fsync_due(self) -> bool:
+        if self.fsync_interval is None:
+            return False
+        now = time.monotonic()
+        if now - self._last_fsync >= self.fsync_interval:
+            self._last_fsync = now
+            return True
+        return False
+
+    def close(self):
+        """Stop accepting entries, drain the queue deterministically and close the sink."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        with self._space:
+            self._space.notify_all()
+        self._thread.join()
+        try:
+            self._drain()  # Anything a blocked producer slipped in after the thread's last pass
+            self._flush_sink(self.fsync_interval is not None)
+            self.sink.close()
+        finally:
+            self._finished.set()
+
+    def stats(self) -> Dict:
+        return {
+            'queue_depth': len(self._queue),
+            'written': self.written,
+            'dropped': self.dropped,
+            'batches': self.batches,
+            'write_errors': self.write_errors,
+            'last_batch_ms': round(self.last_batch_s * 1000, 3),
+            'policy': self.policy,
+        }
+
+# ============================================================
+# 4c. LOG ADMISSION GATE
+# ============================================================
+
+# Same numbering as the stdlib logging module, so its constants work too
+DEBUG, INFO, WARNING, ERROR, CRITICAL = 10, 20, 30, 40, 50
+
+IMPORTANT_KEYWORDS = ('ERROR', 'CRITICAL', 'WARNING', 'EMERGENCY', 'FAILURE')
+
+
+def _is_important(message: str) -> bool:
+    # upper() + `in` is several times faster than an IGNORECASE regex here
+    return any(map(message.upper().__contains__, IMPORTANT_KEYWORDS))
+
+
+class LogGate:
+    """
+    Constant-time first stage of LASERV30.log, checked before any lock is taken.
+
+    Entries at or above `always_level` pass. Otherwise an entry must reach
+    `min_level`, fall on the 1-in-`sample_every` sample and find a token in the
+    `rate_limit` bucket (entries/s, `burst` deep). Calls without an explicit level
+    count as `default_level`; on the drop path their message is checked once for
+    the important keywords, which always pass.
+
+    A levelled drop is a few comparisons. An unlevelled drop also pays the keyword
+    scan (about a microsecond), so hot paths that log per object should pass
+    level=DEBUG, which LASERV30's default min_level (INFO) drops outright.
+
+    Counters are updated without a lock: under contention sampling and rate
+    limiting are approximate, which is all a log filter needs.
+    """
+
+    __slots__ = ('min_level', 'default_level', 'always_level', 'sample_every',
+                 'rate_limit', 'burst', '_tokens', '_stamp', 'seen', 'dropped')
+
+    def __init__(self, min_level: int = 0, sample_every: int = 1,
+                 rate_limit: Optional[float] = None, burst: Optional[float] = None,
+                 default_level: int = INFO, always_level: int = WARNING):
+        self.min_level = min_level
+        self.default_level = default_level
+        self.always_level = always_level
+        self.sample_every = max(1, int(sample_every))
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else (rate_limit or 0.0)
+        self._tokens = self.burst
+        self._stamp = time.monotonic()
+        self.seen = 0
+        self.dropped = 0
+
+    def admit(self, level: Optional[int], message: str) -> bool:
+        explicit = level is not None
+        if not explicit:
+            level = self.default_level
+        if level >= self.always_level:
+            return True
+        if level >= self.min_level:
+            self.seen += 1
+            if (self.sample_every == 1 or not self.seen % self.sample_every) and \
+                    (self.rate_limit is None or self._take()):
+                return True
+        if not explicit and _is_important(message):
+            return True
+        self.dropped += 1
+        return False
+
+    def _take(self) -> bool:
+        now = time.monotonic()
+        tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate_limit)
+        self._stamp = now
+        if tokens < 1.0:
+            self._tokens = tokens
+            return False
+        self._tokens = tokens - 1.0
+        return True
+
+# ============================================================
+# 4d. SEGMENTED LOG STORE WITH SIDECAR INDEX
+# ============================================================
+
+SEGMENT_BYTES = 64 << 20
+SEGMENT_INDEX_CACHE = 8
+SEGMENT_INDEX_MAGIC = b'LSRIDX\x00\x01'
+SEGMENT_INDEX_VERSION = 1
+ARCHIVE_MAGIC = b'LSRARC\x00\x01'
+ARCHIVE_BLOCK_BYTES = 1 << 20
+ARCHIVE_CODECS = ('zlib', 'lzma')
+_ARCHIVE_HEADER = struct.Struct('<8s16sI')
+_ARCHIVE_FOOTER = struct.Struct('<QI')
+_TOKEN_RE = re.compile(r'[a-z0-9_]+')
+
+
+def _entry_terms(entry: Dict) -> set:
+    """Index terms of an entry: 'w:' message tokens and 'k:' context/meta keys"""
+    terms = {'w:' + token for token in _TOKEN_RE.findall(str(entry.get('message', '')).lower())}
+    meta = entry.get('meta')
+    if isinstance(meta, dict):
+        terms.update('k:' + str(key) for key in meta)
+    context = entry.get('context')
+    if isinstance(context, dict) and isinstance(context.get('system_specific'), dict):
+        terms.update('k:' + str(key) for key in context['system_specific'])
+    return terms
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+class _PackedPostings:
+    """Read-only postings of a closed segment: one flat ordinal array, sliced per term"""
+
+    __slots__ = ('_slots', '_starts', '_flat')
+
+    def __init__(self, terms: List[str], starts: array, flat: array):
+        self._slots = dict(zip(terms, range(len(terms))))
+        self._starts = starts
+        self._flat = flat
+
+    def get(self, term: str, default=None):
+        slot = self._slots.get(term)
+        if slot is None:
+            return default
+        return self._flat[self._starts[slot]:self._starts[slot + 1]]
+
+    def __getitem__(self, term: str):
+        bucket = self.get(term)
+        if bucket is None:
+            raise KeyError(term)
+        return bucket
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __len__(self):
+        return len(self._slots)
+
+
+class _SegmentIndex:
+    """Per-segment index: line offsets, timestamps and term postings (entry ordinals)"""
+
+    __slots__ = ('seq', 'offsets', 'times', 'postings', 't_min', 't_max', 'size', 'crc32', '_vocab')
+
+    def __init__(self, seq: int):
+        self.seq = seq
+        self.offsets: List[int] = []
+        self.times: List[float] = []
+        self.postings: Dict[str, List[int]] = {}
+        self.t_min = math.inf
+        self.t_max = -math.inf
+        self.size = 0
+        self.crc32 = 0  # Of the raw segment bytes, maintained by the writer
+        self._vocab = None  # (sorted words, sorted reversed words), built on first query
+
+    def add(self, offset: int, length: int, entry: Dict):
+        ordinal = len(self.offsets)
+        stamp = float(entry.get('universal_time', 0.0) or 0.0)
+        self.offsets.append(offset)
+        self.times.append(stamp)
+        self.t_min = min(self.t_min, stamp)
+        self.t_max = max(self.t_max, stamp)
+        self.size = offset + length
+        postings = self.postings
+        for term in _entry_terms(entry):
+            bucket = postings.get(term)
+            if bucket is None:
+                postings[term] = [ordinal]
+                self._vocab = None
+            else:
+                bucket.append(ordinal)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def summary(self) -> Dict:
+        return {'seq': self.seq, 'count': len(self.offsets), 'bytes': self.size,
+                't_min': self.t_min if self.offsets else None,
+                't_max': self.t_max if self.offsets else None,
+                'crc32': self.crc32}
+
+    def thaw(self) -> '_SegmentIndex':
+        """Make a loaded index appendable again (it becomes the live segment's)"""
+        self.offsets, self.times = list(self.offsets), list(self.times)
+        self.postings = {term: list(self.postings[term]) for term in self.postings}
+        self._vocab = None
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Sidecar layout: magic, header length, JSON header, then the packed arrays"""
+        terms = list(self.postings)
+        starts, flat = array('Q', [0]), array('I')
+        for term in terms:
+            flat.extend(self.postings[term])
+            starts.append(len(flat))
+        sections = [array('Q', self.offsets).tobytes(), array('d', self.times).tobytes(),
+                    starts.tobytes(), flat.tobytes(), '\0'.join(terms).encode('utf-8')]
+        header = _encode_json({'version': SEGMENT_INDEX_VERSION, **self.summary(),
+                               'sections': [len(section) for section in sections]}).encode('utf-8')
+        return b''.join([SEGMENT_INDEX_MAGIC, struct.pack('<I', len(header)), header] + sections)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> '_SegmentIndex':
+        if data[:8] != SEGMENT_INDEX_MAGIC:
+            raise ValueError("not a LASER segment index")
+        (header_len,) = struct.unpack_from('<I', data, 8)
+        header = json.loads(data[12:12 + header_len])
+        view, pos, parts = memoryview(data), 12 + header_len, []
+        for length in header['sections']:
+            parts.append(view[pos:pos + length])
+            pos += length
+        offsets, times, starts, flat = (array(code) for code in 'QdQI')
+        for arr, part in zip((offsets, times, starts, flat), parts):
+            arr.frombytes(part)
+        terms = bytes(parts[4]).decode('utf-8').split('\0') if len(parts[4]) else []
+
+        index = cls(header['seq'])
+        index.offsets, index.times = offsets, times
+        index.postings = _PackedPostings(terms, starts, flat)
+        index.size = header['bytes']
+        index.crc32 = header.get('crc32', 0)
+        if header['count']:
+            index.t_min, index.t_max = header['t_min'], header['t_max']
+        return index
+
+    def _word_buckets(self, word: str, open_left: bool, open_right: bool) -> List[List[int]]:
+        """Postings of every vocabulary word the needle fragment `word` can sit in"""
+        postings = self.postings
+        if not open_left and not open_right:  # Delimited on both sides: the whole word
+            bucket = postings.get('w:' + word)
+            return [bucket] if bucket else []
+        if self._vocab is None:
+            words = sorted(term[2:] for term in postings if term.startswith('w:'))
+            self._vocab = (words, sorted(w[::-1] for w in words))
+        words, reversed_words = self._vocab
+        if open_left and open_right:
+            matched = [w for w in words if word in w]
+        elif open_right:  # Must start the word
+            lo = bisect.bisect_left(words, word)
+            matched = itertools.takewhile(lambda w: w.startswith(word), itertools.islice(words, lo, None))
+        else:  # Must end the word
+            tail = word[::-1]
+            lo = bisect.bisect_left(reversed_words, tail)
+            matched = itertools.takewhile(lambda w: w.startswith(tail), itertools.islice(reversed_words, lo, None))
+            matched = [w[::-1] for w in matched]
+        return [postings['w:' + w] for w in matched]
+
+    def candidates(self, needle: str, keys: List[str],
+                   temporal_range: Optional[Tuple[float, float]],
+                   enough: int = 64) -> List[int]:
+        """
+        Ordinals (ascending) that may match the needle - a superset, verified
+        after decoding - and certainly carry every key in `keys`
+        """
+        groups = []
+        for match in _TOKEN_RE.finditer(needle):
+            # A fragment touching the needle's edge may be part of a longer word
+            buckets = self._word_buckets(match.group(), match.start() == 0, match.end() == len(needle))
+            if not buckets:
+                return []
+            groups.append(buckets)
+        key_groups = []
+        for key in keys:
+            bucket = self.postings.get('k:' + key)
+            if not bucket:
+                return []
+            key_groups.append([bucket])
+
+        # Smallest groups first. Key postings are exact and nothing re-checks them,
+        # so they are always intersected; once few candidates remain, decoding
+        # checks the remaining words against the needle
+        groups.sort(key=lambda buckets: sum(map(len, buckets)))
+        key_groups.sort(key=lambda buckets: len(buckets[0]))
+        selected = None
+        for required, buckets in itertools.chain(((False, g) for g in groups), ((True, g) for g in key_groups)):
+            if not required and selected is not None and len(selected) <= enough:
+                continue
+            hits = set(buckets[0]) if len(buckets) == 1 else set().union(*buckets)
+            selected = hits if selected is None else selected & hits
+            if not selected:
+                return []
+        ordinals = sorted(selected) if selected is not None else range(len(self.offsets))
+        if temporal_range:
+            start, end = temporal_range
+            times = self.times
+            ordinals = [i for i in ordinals if start <= times[i] <= end]
+        return list(ordinals)
+
+
+def _block_codec(name: str):
+    """(compress, decompress) for one archive block; 'uccc-*' goes through UCCC"""
+    if name.startswith('uccc-'):
+        algorithm = CompressionAlgorithm.GZIP if name == 'uccc-zlib' else CompressionAlgorithm.XZ
+        compressor = UniversalCompressor(TriaxialDatabase.ALGORITHMS[algorithm])
+        return (lambda data: compressor.compress(data)[0]), (lambda data: compressor.decompress(data)[0])
+    if name == 'zlib':
+        return (lambda data: zlib.compress(data, 6)), zlib.decompress
+    if name == 'lzma':
+        return (lambda data: lzma.compress(data, preset=6)), lzma.decompress
+    raise ValueError(f"unknown archive codec {name!r}")
+
+
+class _RawSegment:
+    """Line access into an uncompressed segment"""
+
+    def __init__(self, path: str):
+        self._fh = open(path, 'rb')
+
+    def line_at(self, offset: int) -> bytes:
+        self._fh.seek(offset)
+        return self._fh.readline()
+
+    def iter_blocks(self, size: int = ARCHIVE_BLOCK_BYTES):
+        self._fh.seek(0)
+        return iter(lambda: self._fh.read(size), b'')
+
+    def close(self):
+        self._fh.close()
+
+
+class _ArchivedSegment:
+    """
+    Line access into an archived segment.
+
+    Layout: header (magic, codec, block size), independently compressed blocks
+    of `block size` raw bytes, then the block start table and a footer, so a
+    line is found by decompressing only the block(s) it lives in.
+    """
+
+    def __init__(self, path: str):
+        self._fh = open(path, 'rb')
+        magic, codec, self.block_size = _ARCHIVE_HEADER.unpack(self._fh.read(_ARCHIVE_HEADER.size))
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError(f"{path} is not a LASER archive segment")
+        self.codec = codec.rstrip(b'\0').decode('ascii')
+        _, self._decompress = _block_codec(self.codec)
+        self._fh.seek(-_ARCHIVE_FOOTER.size, os.SEEK_END)
+        table_offset, blocks = _ARCHIVE_FOOTER.unpack(self._fh.read(_ARCHIVE_FOOTER.size))
+        self._fh.seek(table_offset)
+        self._starts = array('Q')
+        self._starts.frombytes(self._fh.read(8 * (blocks + 1)))
+        self._cached = (-1, b'')
+
+    def _block(self, number: int) -> bytes:
+        if self._cached[0] != number:
+            if number + 1 >= len(self._starts):
+                return b''
+            start, end = self._starts[number], self._starts[number + 1]
+            self._fh.seek(start)
+            self._cached = (number, self._decompress(self._fh.read(end - start)))
+        return self._cached[1]
+
+    def line_at(self, offset: int) -> bytes:
+        number, pos = divmod(offset, self.block_size)
+        pieces = []
+        while True:
+            block = self._block(number)
+            end = block.find(b'\n', pos)
+            if end >= 0 or not block:
+                pieces.append(block[pos:end + 1] if end >= 0 else block[pos:])
+                return b''.join(pieces)
+            pieces.append(block[pos:])  # The line continues into the next block
+            number, pos = number + 1, 0
+
+    def iter_blocks(self, size: int = None):
+        return (self._block(number) for number in range(len(self._starts) - 1))
+
+    def close(self):
+        self._fh.close()
+
+
+class SegmentedLogStore:
+    """
+    Directory of append-only JSONL segments with a sidecar index per segment.
+
+    Layout: seg-NNNNNN.jsonl holds entries, seg-NNNNNN.idx its offsets, timestamps
+    and inverted postings over message tokens and context/meta keys, and
+    manifest.json the time range, entry count and CRC-32 of every closed segment.
+
+    The live segment is indexed in memory as it is written; it rolls when it
+    reaches `segment_bytes` or has been open for `segment_seconds`. Rolling
+    persists its index and updates the manifest, so the index is built
+    incrementally and never by rescanning. close() persists the live index too,
+    and open trusts it while its recorded size matches the segment: only a live
+    segment left behind by a crash is rescanned (a torn final line is truncated).
+
+    With `archive_codec` ('zlib' or 'lzma', through UCCC when it is available)
+    a background thread compresses closed segments into block-framed
+    seg-NNNNNN.lsz files, verifying the checksum first. `retention_bytes` caps the
+    bytes on disk by deleting the oldest closed segments. Queries skip segments
+    by time range, load closed indexes lazily (a small LRU of `index_cache`
+    segments) and decode only candidate lines, from raw and archived segments alike.
+
+    Implements the sink interface (write/flush/close) of AsyncLogWriter.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = SEGMENT_BYTES,
+                 index_cache: int = SEGMENT_INDEX_CACHE, segment_seconds: Optional[float] = None,
+                 archive_codec: Optional[str] = None, retention_bytes: Optional[int] = None,
+                 archive_block_bytes: int = ARCHIVE_BLOCK_BYTES):
+        if archive_codec is not None and archive_codec not in ARCHIVE_CODECS:
+            raise ValueError(f"archive_codec must be one of {ARCHIVE_CODECS}, got {archive_codec!r}")
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.index_cache = index_cache
+        self.retention_bytes = retention_bytes
+        self.archive_block_bytes = archive_block_bytes
+        self.archive_codec = None
+        if archive_codec is not None:
+            self.archive_codec = f"uccc-{archive_codec}" if UCCC_AVAILABLE else archive_codec
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._loaded: Dict[int, _SegmentIndex] = {}  # Insertion order doubles as LRU order
+        self._manifest_path = os.path.join(directory, 'manifest.json')
+        self._closed_segments: List[Dict] = []
+        if os.path.exists(self._manifest_path):
+            with open(self._manifest_path, encoding='utf-8') as fh:
+                self._closed_segments = json.load(fh)['segments']
+        self._settle_archives()
+
+        known = {seg['seq'] for seg in self._closed_segments}
+        on_disk = sorted(int(name[4:10]) for name in os.listdir(directory)
+                         if name.startswith('seg-') and name.endswith('.jsonl'))
+        tail = [seq for seq in on_disk if seq not in known]
+        for seq in tail[:-1]:  # Crashed between roll and manifest update
+            self._closed_segments.append(self._closed_summary(self._persist(self._resume(seq))))
+        if tail:
+            self._live = self._resume(tail[-1])
+        else:
+            self._live = _SegmentIndex(max(list(known) + on_disk + [0]) + 1)
+        if tail[:-1]:
+            self._write_manifest()
+        self._fh = open(self._path(self._live.seq), 'ab')
+        self._live_started = time.time()
+
+        self.archived = 0
+        self.expired = 0
+        self._archive_queue: Deque[int] = deque()
+        self._archive_wake = threading.Event()
+        self._stopping = False
+        self._archiver = None
+        if self.archive_codec is not None:
+            self._archive_queue.extend(seg['seq'] for seg in self._closed_segments if not seg.get('codec'))
+            self._archiver = threading.Thread(target=self._archive_loop, name='laser-archiver', daemon=True)
+            self._archiver.start()
+            self._archive_wake.set()
+        self._enforce_retention()
+
+    # ----------------------------------------
+    # Paths and persistence
+    # ----------------------------------------
+
+    def _path(self, seq: int, suffix: str = '.jsonl') -> str:
+        return os.path.join(self.directory, f"seg-{seq:06d}{suffix}")
+
+    def _scan(self, seq: int) -> _SegmentIndex:
+        """Rebuild the index of an unindexed segment, truncating a torn final line"""
+        index = _SegmentIndex(seq)
+        path = self._path(seq)
+        offset = 0
+        with open(path, 'rb') as fh:
+            for line in fh:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    index.add(offset, len(line), json.loads(line))
+                except ValueError:
+                    pass
+                index.crc32 = zlib.crc32(line, index.crc32)
+                offset += len(line)
+        if os.path.getsize(path) != offset:
+            os.truncate(path, offset)
+        index.size = offset
+        return index
+
+    def _resume(self, seq: int) -> _SegmentIndex:
+        """The index close() persisted for a segment, or a rescan if the segment changed since"""
+        try:
+            with open(self._path(seq, '.idx'), 'rb') as fh:
+                index = _SegmentIndex.from_bytes(fh.read())
+        except (OSError, ValueError, KeyError, struct.error):
+            return self._scan(seq)
+        if index.seq != seq or index.size != os.path.getsize(self._path(seq)):
+            return self._scan(seq)
+        return index.thaw()
+
+    def _settle_archives(self):
+        """Finish or undo an archive swap that a crash interrupted"""
+        for seg in self._closed_segments:
+            raw, packed = self._path(seg['seq']), self._path(seg['seq'], '.lsz')
+            if seg.get('codec') and os.path.exists(raw):
+                os.remove(raw)
+            elif not seg.get('codec') and os.path.exists(packed):
+                os.remove(packed)
+
+    def _persist(self, index: _SegmentIndex) -> Dict:
+        _write_atomic(self._path(index.seq, '.idx'), index.to_bytes())
+        return index.summary()
+
+    @staticmethod
+    def _closed_summary(summary: Dict) -> Dict:
+        return {**summary, 'codec': None, 'stored_bytes': summary['bytes']}
+
+    def _write_manifest(self):
+        payload = {'version': 2, 'segments': self._closed_segments}
+        _write_atomic(self._manifest_path, _encode_json(payload).encode('utf-8'))
+
+    def _segment(self, seq: int) -> Optional[Dict]:
+        for seg in self._closed_segments:
+            if seg['seq'] == seq:
+                return seg
+        return None
+
+    def _index(self, seq: int) -> _SegmentIndex:
+        if seq == self._live.seq:
+            return self._live
+        index = self._loaded.pop(seq, None)
+        if index is None:
+            with open(self._path(seq, '.idx'), 'rb') as fh:
+                index = _SegmentIndex.from_bytes(fh.read())
+        self._remember(index)
+        return index
+
+    def _remember(self, index: _SegmentIndex):
+        while len(self._loaded) >= self.index_cache:
+            self._loaded.pop(next(iter(self._loaded)))
+        self._loaded[index.seq] = index
+
+    def _open(self, seq: int):
+        """A line reader for the segment in whatever form it is stored, or None if gone"""
+        with self._lock:  # Archive swaps and retention also hold the lock
+            seg = self._segment(seq)
+            try:
+                if seg is not None and seg.get('codec'):
+                    return _ArchivedSegment(self._path(seq, '.lsz'))
+                return _RawSegment(self._path(seq))
+            except FileNotFoundError:
+                return None
+
+    # ----------------------------------------
+    # Sink interface
+    # ----------------------------------------
+
+    def write(self, entries: List[Dict]):
+        with self._lock:
+            if self.segment_seconds is not None:
+                self.maybe_roll()
+            chunks = []
+            live = self._live
+            offset = live.size
+            for entry in entries:
+                line = _jsonl_line(entry).encode('utf-8')
+                live.add(offset, len(line), entry)
+                live.crc32 = zlib.crc32(line, live.crc32)
+                chunks.append(line)
+                offset += len(line)
+                if offset >= self.segment_bytes:
+                    self._fh.write(b''.join(chunks))
+                    chunks = []
+                    self.roll()
+                    live = self._live
+                    offset = 0
+            if chunks:
+                self._fh.write(b''.join(chunks))
+            self._fh.flush()  # Readers open the segment separately
+
+    def flush(self, fsync: bool = False):
+        with self._lock:
+            self._fh.flush()
+            if fsync:
+                os.fsync(self._fh.fileno())
+
+    def maybe_roll(self) -> bool:
+        """Roll the live segment if it has been open for segment_seconds"""
+        with self._lock:
+            if (self.segment_seconds is None or not len(self._live) or
+                    time.time() - self._live_started < self.segment_seconds):
+                return False
+            self.roll()
+            return True
+
+    def roll(self):
+        """Close the live segment, persist its index and start the next one"""
+        with self._lock:
+            if not len(self._live):
+                return
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+            self._closed_segments.append(self._closed_summary(self._persist(self._live)))
+            self._write_manifest()
+            self._remember(self._live)
+            self._live = _SegmentIndex(self._live.seq + 1)
+            self._fh = open(self._path(self._live.seq), 'ab')
+            self._live_started = time.time()
+            if self._archiver is not None:
+                self._archive_queue.append(self._closed_segments[-1]['seq'])
+                self._archive_wake.set()
+            self._enforce_retention()
+
+    def close(self):
+        """Finish pending archive jobs, then close the live segment"""
+        if self._archiver is not None and self._archiver.is_alive():
+            self._stopping = True
+            self._archive_wake.set()
+            self._archiver.join()
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+                self._fh.close()
+                self._persist(self._live)  # Records the size, so the next open can trust it
+
+    # ----------------------------------------
+    # Archival and retention
+    # ----------------------------------------
+
+    def _archive_loop(self):
+        while True:
+            self._archive_wake.wait()
+            self._archive_wake.clear()
+            while self._archive_queue:
+                seq = self._archive_queue.popleft()
+                try:
+                    self._archive(seq)
+                except Exception as e:
+                    print(f"⚠️ Segment archive failed for {seq}: {e}")
+            if self._stopping:
+                return
+
+    def _archive(self, seq: int):
+        """Compress one closed segment block by block, then swap it in under the lock"""
+        with self._lock:
+            seg = self._segment(seq)
+            if seg is None or seg.get('codec'):
+                return
+            reader = self._open(seq)
+        if reader is None:
+            return
+        compress, _ = _block_codec(self.archive_codec)
+        block_size = self.archive_block_bytes
+        tmp = self._path(seq, '.lsz.tmp')
+        crc, starts = 0, array('Q')
+        try:
+            with open(tmp, 'wb') as out:
+                out.write(_ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, self.archive_codec.encode('ascii'), block_size))
+                pos = _ARCHIVE_HEADER.size
+                for block in reader.iter_blocks(block_size):
+                    crc = zlib.crc32(block, crc)
+                    payload = compress(block)
+                    starts.append(pos)
+                    out.write(payload)
+                    pos += len(payload)
+                starts.append(pos)
+                out.write(starts.tobytes())
+                out.write(_ARCHIVE_FOOTER.pack(pos, len(starts) - 1))
+                out.flush()
+                os.fsync(out.fileno())
+        finally:
+            reader.close()
+
+        with self._lock:
+            seg = self._segment(seq)
+            if seg is None:  # Expired by retention meanwhile
+                os.remove(tmp)
+                return
+            if crc != seg.get('crc32', crc):
+                os.remove(tmp)
+                raise ValueError(f"checksum mismatch ({crc:08x} != {seg['crc32']:08x}), left uncompressed")
+            os.replace(tmp, self._path(seq, '.lsz'))
+            seg['codec'] = self.archive_codec
+            seg['stored_bytes'] = os.path.getsize(self._path(seq, '.lsz'))
+            self._write_manifest()
+            os.remove(self._path(seq))
+            self.archived += 1
+            self._enforce_retention()
+
+    def _enforce_retention(self):
+        """Delete the oldest closed segments until the store fits retention_bytes"""
+        if self.retention_bytes is None:
+            return
+        with self._lock:
+            total = self._live.size + sum(seg['stored_bytes'] for seg in self._closed_segments)
+            expired = []
+            while total > self.retention_bytes and self._closed_segments:
+                seg = self._closed_segments.pop(0)
+                total -= seg['stored_bytes']
+                expired.append(seg['seq'])
+            if not expired:
+                return
+            self._write_manifest()
+            for seq in expired:
+                self._loaded.pop(seq, None)
+                for suffix in ('.jsonl', '.lsz', '.idx'):
+                    try:
+                        os.remove(self._path(seq, suffix))
+                    except FileNotFoundError:
+                        pass
+            self.expired += len(expired)
+
+    def wait_archived(self, timeout: float = None) -> bool:
+        """Block until every closed segment is archived (tests, shutdown tooling)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if all(seg.get('codec') for seg in self._closed_segments):
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+
+    def verify(self) -> List[int]:
+        """Recompute the CRC-32 of every closed segment; returns the seqs that mismatch"""
+        bad = []
+        for seg in self.segments()[:-1]:
+            reader = self._open(seg['seq'])
+            if reader is None:
+                continue
+            try:
+                crc = 0
+                for block in reader.iter_blocks():
+                    crc = zlib.crc32(block, crc)
+            finally:
+                reader.close()
+            if crc != seg['crc32']:
+                bad.append(seg['seq'])
+        return bad
+
+    # ----------------------------------------
+    # Reading
+    # ----------------------------------------
+
+    def segments(self) -> List[Dict]:
+        """Summaries of every segment, oldest first, the live one last"""
+        with self._lock:
+            live = {**self._live.summary(), 'codec': None, 'stored_bytes': self._live.size}
+            return [dict(seg) for seg in self._closed_segments] + [live]
+
+    def __len__(self):
+        return sum(seg['count'] for seg in self.segments())
+
+    def stats(self) -> Dict:
+        segments = self.segments()
+        return {
+            'segments': len(segments),
+            'entries': sum(seg['count'] for seg in segments),
+            'bytes': sum(seg['bytes'] for seg in segments),
+            'stored_bytes': sum(seg['stored_bytes'] for seg in segments),
+            'archived': self.archived,
+            'expired': self.expired,
+            'codec': self.archive_codec,
+        }
+
+    def query(self, concept: str = '', temporal_range: Tuple[float, float] = None,
+              context_keys: List[str] = None, predicate=None, limit: int = 50,
+              cursor: Tuple[int, int] = None,
+              newest_first: bool = True) -> Tuple[List[Dict], Optional[Tuple[int, int]]]:
+        """
+        One page of entries whose message contains `concept` (case-insensitive).
+
+        Args:
+            concept: Substring to look for in the message
+            temporal_range: (start_time, end_time) on universal_time, inclusive
+            context_keys: Keys that must appear in the entry's meta or system context
+            predicate: Extra filter on decoded entries
+            limit: Page size
+            cursor: Position returned by the previous page
+            newest_first: Iteration order
+
+        Returns:
+            (entries, cursor); the cursor is None once the log is exhausted
+        """
+        needle = concept.lower()
+        keys = [str(key) for key in (context_keys or ())]
+        with self._lock:
+            segments = self.segments()
+        if newest_first:
+            segments.reverse()
+
+        results = []
+        for seg in segments:
+            seq = seg['seq']
+            if cursor is not None and (seq > cursor[0] if newest_first else seq < cursor[0]):
+                continue
+            if not seg['count']:
+                continue
+            if temporal_range and (seg['t_max'] < temporal_range[0] or seg['t_min'] > temporal_range[1]):
+                continue
+            with self._lock:
+                try:
+                    index = self._index(seq)
+                except FileNotFoundError:  # Expired by retention since the snapshot
+                    continue
+                ordinals = index.candidates(needle, keys, temporal_range)
+                offsets = index.offsets
+            if cursor is not None and seq == cursor[0]:
+                ordinals = [i for i in ordinals if (i < cursor[1] if newest_first else i > cursor[1])]
+            if not ordinals:
+                continue
+            if newest_first:
+                ordinals.reverse()
+
+            reader = self._open(seq)
+            if reader is None:
+                continue
+            try:
+                for ordinal in ordinals:
+                    entry = json.loads(reader.line_at(offsets[ordinal]))
+                    if needle not in str(entry.get('message', '')).lower():
+                        continue
+                    if predicate is not None and not predicate(entry):
+                        continue
+                    results.append(entry)
+                    if len(results) >= limit:
+                        return results, (seq, ordinal)
+            finally:
+                reader.close()
+        return results, None
+
+    def iter_entries(self, temporal_range: Tuple[float, float] = None, newest_first: bool = False):
+        """Every entry, optionally restricted to a time range, page by page"""
+        cursor = None
+        while True:
+            page, cursor = self.query(temporal_range=temporal_range, cursor=cursor,
+                                      newest_first=newest_first, limit=1024)
+            yield from page
+            if cursor is None:
+                return
+
+# ============================================================
+# 4e. COLUMNAR BINARY LOG FORMAT
+# ============================================================
+#
+# File:   COLUMNAR_MAGIC, then blocks. Each block is
+#         <u32 body length><u32 crc32(body)><body>, and is self-contained:
+# Body:   varint records
+#         key dictionary   varint count, varint byte lengths, utf-8 bytes
+#         string table     varint section length, varint count, varint lengths, utf-8 bytes
+#         directory        varint columns; per column: varint depth, key ids,
+#                          kind byte, varint chunk length
+#         chunks           per column: presence byte (1 = every record), row
+#                          deltas if sparse, then the values
+#
+# A column is one leaf path of the nested entry dicts with one value kind:
+#   'd' float64 ('t' when delta varints of the IEEE bits are smaller, as for
+#   clock readings), 'i' zigzag varint, 'b' bitmap, 's' string-table id,
+#   'h' fixed-width bytes of lowercase hex ids, 'z' ISO-8601 UTC timestamps as
+#   delta varint microseconds, 'j' string-table id of the JSON text of
+#   anything else (lists, None, empty dicts). Every kind round-trips exactly.
+
+COLUMNAR_MAGIC = b'LSRCOL\x00\x01'
+LOG_FORMATS = ('jsonl', 'columnar')
+COLUMNAR_BLOCK_RECORDS = 4096
+_COLUMNAR_BLOCK = struct.Struct('<II')
+_SCALAR_KINDS = {float: 'd', int: 'i', bool: 'b', str: 's'}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_U7 = np.uint64(7)
+
+
+def _put_varint(out: bytearray, n: int):
+    while n > 0x7f:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _get_varint(buf, pos: int) -> Tuple[int, int]:
+    n = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        n |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _encode_varints(values: np.ndarray) -> bytes:
+    """LEB128 varints of a uint64 array, vectorized over byte positions"""
+    if not len(values):
+        return b''
+    nbytes = np.ones(len(values), dtype=np.int64)
+    rest = values >> _U7
+    while rest.any():
+        nbytes += rest > 0
+        rest >>= _U7
+    starts = np.cumsum(nbytes) - nbytes
+    out = np.empty(int(starts[-1] + nbytes[-1]), dtype=np.uint8)
+    rest = values.copy()
+    for k in range(int(nbytes.max())):
+        live = nbytes > k
+        byte = (rest[live] & np.uint64(0x7f)).astype(np.uint8)
+        byte |= (nbytes[live] > k + 1).astype(np.uint8) << np.uint8(7)
+        out[starts[live] + k] = byte
+        rest >>= _U7
+    return out.tobytes()
+
+
+def _decode_varints(buf) -> np.ndarray:
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    if not len(raw):
+        return np.zeros(0, dtype=np.uint64)
+    ends = np.flatnonzero(raw < 0x80)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    position = np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)
+    parts = (raw & 0x7f).astype(np.uint64) << (position.astype(np.uint64) * _U7)
+    return np.add.reduceat(parts, starts)
+
+
+def _zigzag(values: np.ndarray) -> np.ndarray:
+    return ((values << 1) ^ (values >> 63)).view(np.uint64)
+
+
+def _unzigzag(values: np.ndarray) -> np.ndarray:
+    return (values >> np.uint64(1)).view(np.int64) ^ -(values & np.uint64(1)).view(np.int64)
+
+
+def _iso_micros(text: str) -> Optional[int]:
+    """Microseconds since the epoch, if `text` is exactly what isoformat() would render"""
+    try:
+        micros = (datetime.fromisoformat(text) - _EPOCH) // timedelta(microseconds=1)
+    except (TypeError, ValueError):
+        return None
+    return micros if _micros_iso(micros) == text else None
+
+
+def _micros_iso(micros: int) -> str:
+    return (_EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+def _flatten_into(d: Dict, node: Dict, row: int):
+    """Append the leaves of one entry to the columns of a key trie"""
+    for key, value in d.items():
+        slot = node.get(key)
+        if slot is None:
+            slot = node[key] = ({}, {})  # (children, kind -> (rows, values))
+        if type(value) is dict and value:
+            _flatten_into(value, slot[0], row)
+            continue
+        kind = _SCALAR_KINDS.get(type(value), 'j')
+        column = slot[1].get(kind)
+        if column is None:
+            column = slot[1][kind] = ([], [])
+        column[0].append(row)
+        column[1].append(value)
+
+
+def _trie_columns(node: Dict, prefix: Tuple = ()):
+    """((path, kind), rows, values) for every column, in first-seen key order"""
+    for key, (children, kinds) in node.items():
+        path = prefix + (key if isinstance(key, str) else str(key),)
+        for kind, (rows, values) in kinds.items():
+            yield path, kind, rows, values
+        yield from _trie_columns(children, path)
+
+
+def _pack_strings(strings: List[str]) -> bytes:
+    encoded = [s.encode('utf-8', 'surrogatepass') for s in strings]
+    out = bytearray()
+    _put_varint(out, len(encoded))
+    out += _encode_varints(np.fromiter(map(len, encoded), dtype=np.uint64, count=len(encoded)))
+    out += b''.join(encoded)
+    return bytes(out)
+
+
+def _unpack_strings(buf, pos: int) -> Tuple[List[str], int]:
+    count, pos = _get_varint(buf, pos)
+    lengths_end = pos
+    for _ in range(count):
+        while buf[lengths_end] & 0x80:
+            lengths_end += 1
+        lengths_end += 1
+    lengths = _decode_varints(buf[pos:lengths_end]).astype(np.int64)
+    ends = (np.cumsum(lengths) + lengths_end).tolist()
+    start = lengths_end
+    strings = []
+    for end in ends:
+        strings.append(str(buf[start:end], 'utf-8', 'surrogatepass'))
+        start = end
+    return strings, start
+
+
+def _encode_values(kind: str, values: List, intern) -> Tuple[str, bytes]:
+    """Pick the tightest lossless encoding of one column; returns (kind, bytes)"""
+    if kind == 'd':
+        floats = np.array(values, dtype=np.float64)
+        deltas = np.diff(floats.view(np.int64), prepend=np.int64(0))
+        packed = _encode_varints(_zigzag(deltas))
+        if len(packed) < 8 * len(values):
+            return 't', packed
+        return 'd', floats.astype('<f8').tobytes()
+    if kind == 'i':
+        try:
+            ints = np.array(values, dtype=np.int64)
+        except OverflowError:
+            return _encode_values('j', values, intern)
+        return 'i', _encode_varints(_zigzag(ints))
+    if kind == 'b':
+        return 'b', np.packbits(np.array(values, dtype=bool)).tobytes()
+    if kind == 's':
+        width = len(values[0])
+        if width and width % 2 == 0 and all(len(v) == width for v in values):
+            try:
+                raw = bytes.fromhex(''.join(values))
+            except ValueError:
+                raw = None
+            if raw is not None and raw.hex() == ''.join(values):
+                return 'h', bytes([width // 2]) + raw
+        if 19 <= width <= 32 and values[0][10:11] == 'T':
+            micros = [_iso_micros(v) for v in values]
+            if None not in micros:
+                deltas = np.diff(np.array(micros, dtype=np.int64), prepend=np.int64(0))
+                return 'z', _encode_varints(_zigzag(deltas))
+        ids = [intern(v) for v in values]
+    else:
+        ids = [intern(_encode_json(v)) for v in values]
+    return kind, _encode_varints(np.array(ids, dtype=np.uint64))
+
+
+def _decode_values(kind: str, buf, count: int, strings: List[str]) -> List:
+    if kind == 'd':
+        return np.frombuffer(buf, dtype='<f8', count=count).tolist()
+    if kind == 't':
+        return np.cumsum(_unzigzag(_decode_varints(buf))).view(np.float64).tolist()
+    if kind == 'i':
+        return _unzigzag(_decode_varints(buf)).tolist()
+    if kind == 'b':
+        return np.unpackbits(np.frombuffer(buf, dtype=np.uint8), count=count).astype(bool).tolist()
+    if kind == 'h':
+        width = buf[0]
+        raw = bytes(buf[1:])
+        return [raw[i:i + width].hex() for i in range(0, count * width, width)]
+    if kind == 'z':
+        return [_micros_iso(m) for m in np.cumsum(_unzigzag(_decode_varints(buf))).tolist()]
+    ids = _decode_varints(buf).tolist()
+    if kind == 's':
+        return [strings[i] for i in ids]
+    return [json.loads(strings[i]) for i in ids]
+
+
+def encode_columnar_block(entries: List[Dict]) -> bytes:
+    """One self-contained columnar block (header included) for a list of entry dicts"""
+    trie: Dict = {}
+    for row, entry in enumerate(entries):
+        _flatten_into(entry, trie, row)
+    columns = [column for column in _trie_columns(trie) if column[2]]
+
+    keys: Dict[str, int] = {}
+    strings: Dict[str, int] = {}
+    intern = lambda s: strings.setdefault(s, len(strings))
+    directory = bytearray()
+    chunks = []
+    _put_varint(directory, len(columns))
+    for path, kind, rows, values in columns:
+        chunk = bytearray()
+        if len(rows) == len(entries):
+            chunk.append(1)
+        else:
+            row_bytes = _encode_varints(np.diff(np.array(rows, dtype=np.uint64), prepend=np.uint64(0)))
+            chunk.append(0)
+            _put_varint(chunk, len(rows))
+            _put_varint(chunk, len(row_bytes))
+            chunk += row_bytes
+        kind, packed = _encode_values(kind, values, intern)
+        chunk += packed
+        _put_varint(directory, len(path))
+        for key in path:
+            _put_varint(directory, keys.setdefault(key, len(keys)))
+        directory.append(ord(kind))
+        _put_varint(directory, len(chunk))
+        chunks.append(chunk)
+
+    body = bytearray()
+    _put_varint(body, len(entries))
+    body += _pack_strings(list(keys))
+    table = _pack_strings(list(strings))
+    _put_varint(body, len(table))
+    body += table
+    body += directory
+    for chunk in chunks:
+        body += chunk
+    return _COLUMNAR_BLOCK.pack(len(body), zlib.crc32(body)) + body
+
+
+def _column_selector(columns):
+    """Predicate over column paths: a selection names a leaf or any enclosing dict"""
+    if columns is None:
+        return None
+    wanted = [tuple(c.split('.')) if isinstance(c, str) else tuple(c) for c in columns]
+    return lambda path: any(path[:len(w)] == w for w in wanted)
+
+
+def decode_columnar_block(body, columns=None) -> List[Dict]:
+    """Rebuild entries from a block body, decoding only the selected columns"""
+    selected = _column_selector(columns)
+    body = memoryview(body)
+    count, pos = _get_varint(body, 0)
+    keys, pos = _unpack_strings(body, pos)
+    table_len, pos = _get_varint(body, pos)
+    table_pos, pos = pos, pos + table_len
+    strings = None
+    n_columns, pos = _get_varint(body, pos)
+    directory = []
+    for _ in range(n_columns):
+        depth, pos = _get_varint(body, pos)
+        path = []
+        for _ in range(depth):
+            key_id, pos = _get_varint(body, pos)
+            path.append(keys[key_id])
+        kind = chr(body[pos])
+        chunk_len, pos = _get_varint(body, pos + 1)
+        directory.append((tuple(path), kind, chunk_len))
+
+    entries = [{} for _ in range(count)]
+    for path, kind, chunk_len in directory:
+        chunk, pos = body[pos:pos + chunk_len], pos + chunk_len
+        if selected is not None and not selected(path):
+            continue
+        if chunk[0]:
+            rows, start = range(count), 1
+        else:
+            n_rows, start = _get_varint(chunk, 1)
+            row_len, start = _get_varint(chunk, start)
+            rows = np.cumsum(_decode_varints(chunk[start:start + row_len])).tolist()
+            start += row_len
+        if kind in 'sj' and strings is None:
+            strings = _unpack_strings(body, table_pos)[0]
+        values = _decode_values(kind, chunk[start:], len(rows), strings)
+        parents, leaf = path[:-1], path[-1]
+        for row, value in zip(rows, values):
+            d = entries[row]
+            for key in parents:
+                d = d.setdefault(key, {})
+            d[leaf] = value
+    return entries
+
+
+class ColumnarSink:
+    """
+    Append-only columnar binary sink with the JsonlSink interface.
+
+    Entries are buffered and written as one block per `block_records` entries;
+    flush() writes whatever is pending as a (smaller) block.
+    """
+
+    def __init__(self, path: str, block_records: int = COLUMNAR_BLOCK_RECORDS):
+        self.path = path
+        self.block_records = block_records
+        self._pending: List[Dict] = []
+        fresh = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not fresh:
+            with open(path, 'rb') as fh:
+                if fh.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+                    raise ValueError(f"{path} is not a LASER columnar log")
+        self._fh = open(path, 'ab', buffering=1 << 20)
+        if fresh:
+            self._fh.write(COLUMNAR_MAGIC)
+
+    def write(self, entries: List[Dict]):
+        self._pending.extend(entries)
+        while len(self._pending) >= self.block_records:
+            block, self._pending = self._pending[:self.block_records], self._pending[self.block_records:]
+            self._fh.write(encode_columnar_block(block))
+
+    def flush(self, fsync: bool = False):
+        if self._pending:
+            self._fh.write(encode_columnar_block(self._pending))
+            self._pending = []
+        self._fh.flush()
+        if fsync:
+            os.fsync(self._fh.fileno())
+
+    def close(self):
+        self.flush()
+        self._fh.close()
+
+
+class ColumnarLogReader:
+    """Streaming reader of a columnar log; stops cleanly at a torn trailing block"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.torn_bytes = 0
+
+    def iter_blocks(self):
+        """Raw block bodies, CRC-checked"""
+        with open(self.path, 'rb') as fh:
+            if fh.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+                raise ValueError(f"{self.path} is not a LASER columnar log")
+            while True:
+                header = fh.read(_COLUMNAR_BLOCK.size)
+                if not header:
+                    return
+                body = b''
+                if len(header) == _COLUMNAR_BLOCK.size:
+                    length, crc = _COLUMNAR_BLOCK.unpack(header)
+                    body = fh.read(length)
+                    if len(body) == length and zlib.crc32(body) == crc:
+                        yield body
+                        continue
+                self.torn_bytes = len(header) + len(body) + len(fh.read())
+                return
+
+    def iter_entries(self, columns=None):
+        """
+        Entries in write order
+
+        Args:
+            columns: Dotted paths to decode ('value', 'quantum.risk', 'universal_state');
+                     None decodes everything. Other columns are skipped unread.
+        """
+        for body in self.iter_blocks():
+            yield from decode_columnar_block(body, columns)
+
+    __iter__ = iter_entries
+
+
+def jsonl_to_columnar(src: str, dst: str, block_records: int = COLUMNAR_BLOCK_RECORDS) -> int:
+    """Stream a JSONL log into a columnar one ('#' header lines are skipped); returns entries"""
+    count = 0
+    sink = ColumnarSink(dst, block_records=block_records)
+    try:
+        batch = []
+        with open(src, 'r', encoding='utf-8') as fh:
+            for line in fh:
+                if not line.strip() or line.startswith('#'):
+                    continue
+                batch.append(json.loads(line))
+                if len(batch) >= block_records:
+                    sink.write(batch)
+                    count += len(batch)
+                    batch = []
+        sink.write(batch)
+        count += len(batch)
+    finally:
+        sink.close()
+    return count
+
+
+def columnar_to_jsonl(src: str, dst: str, columns=None) -> int:
+    """Stream a columnar log back to JSONL, optionally keeping only some columns; returns entries"""
+    count = 0
+    with open(dst, 'a', encoding='utf-8', buffering=1 << 20) as out:
+        for body in ColumnarLogReader(src).iter_blocks():
+            entries = decode_columnar_block(body, columns)
+            out.write(''.join([_jsonl_line(entry) for entry in entries]))
+            count += len(entries)
+    return count
+
+def convert_log_main(argv: List[str] = None) -> int:
+    """`python laser.py convert SRC DST`: JSONL -> columnar, or columnar -> JSONL (detected from SRC)"""
+    parser = argparse.ArgumentParser(prog='laser.py convert',
+                                     description='Convert LASER logs between JSONL and the columnar format')
+    parser.add_argument('src')
+    parser.add_argument('dst')
+    parser.add_argument('--columns', help='comma-separated dotted paths to keep (columnar -> JSONL only)')
+    parser.add_argument('--block-records', type=int, default=COLUMNAR_BLOCK_RECORDS)
+    args = parser.parse_args(argv)
+
+    with open(args.src, 'rb') as fh:
+        columnar = fh.read(len(COLUMNAR_MAGIC)) == COLUMNAR_MAGIC
+    if columnar:
+        count = columnar_to_jsonl(args.src, args.dst, args.columns.split(',') if args.columns else None)
+    else:
+        count = jsonl_to_columnar(args.src, args.dst, block_records=args.block_records)
+    print(f"✅ {count} entries: {args.src} -> {args.dst}")
+    return 0
+
+# ============================================================
+# 4f. MULTI-PROCESS LOGGING
+# ============================================================
 
-    def __init__(self, max_size: int = 1000):
-        self.max_size = max_size
-        self.cache = {}
-        self.timestamps = {}
-        self.access_patterns = {}
-        self.compression_level = 0.7
+_PROCESS_TAG_RE = re.compile(r'\.?(p\d+-\d+)$')
+_FRAME = struct.Struct('<I')
+_FORK_AWARE = weakref.WeakSet()  # Live LASERV30 instances, reopened in forked children
+
+
+def _wants_process_segments(setting) -> bool:
+    """True/False, or 'auto': only in multiprocessing children"""
+    if setting == 'auto':
+        return multiprocessing.parent_process() is not None
+    return bool(setting)
+
+
+def _process_tag() -> str:
+    """'p<pid>-<start ms>': unique even when pids are reused"""
+    try:
+        started = psutil.Process().create_time() if PSUTIL_AVAILABLE else time.time()
+    except Exception:
+        started = time.time()
+    return f"p{os.getpid()}-{int(started * 1000)}"
+
+
+def process_log_name(path: str, tag: str = None) -> str:
+    """laser.jsonl -> laser.p<pid>-<start ms>.jsonl"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{tag or _process_tag()}{ext}"
+
+
+def process_logs(path: str) -> List[str]:
+    """The base log file or store directory plus every per-process one derived from it"""
+    path = os.path.abspath(path)
+    if os.path.isdir(path):
+        found = [os.path.join(path, name) for name in sorted(os.listdir(path))
+                 if _PROCESS_TAG_RE.fullmatch(name) and os.path.isdir(os.path.join(path, name))]
+        has_segments = any(name.startswith('seg-') for name in os.listdir(path))
+        return ([path] if has_segments else []) + found
+    parent, base = os.path.split(path)
+    root, ext = os.path.splitext(base)
+    found = []
+    for name in sorted(os.listdir(parent or '.')):
+        stem, name_ext = os.path.splitext(name)
+        if name_ext == ext and stem.startswith(root + '.') and _PROCESS_TAG_RE.fullmatch(stem[len(root):]):
+            found.append(os.path.join(parent, name))
+    return ([path] if os.path.exists(path) else []) + found
+
+
+def _iter_store_dir(directory: str):
+    """Entries of a segment store directory, read-only (a live segment's torn tail is skipped)"""
+    seqs = sorted({int(name[4:10]) for name in os.listdir(directory)
+                   if name.startswith('seg-') and name.endswith(('.jsonl', '.lsz'))})
+    for seq in seqs:
+        base = os.path.join(directory, f"seg-{seq:06d}")
+        try:
+            reader = _ArchivedSegment(base + '.lsz')
+        except FileNotFoundError:
+            try:
+                reader = _RawSegment(base + '.jsonl')
+            except FileNotFoundError:
+                continue  # Expired between listing and opening
+        try:
+            tail = b''
+            for block in reader.iter_blocks():
+                lines = (tail + block).split(b'\n')
+                tail = lines.pop()
+                for line in lines:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        finally:
+            reader.close()
+
+
+def iter_log_source(path: str):
+    """Entries of one JSONL file, columnar file or store directory, in write order"""
+    if os.path.isdir(path):
+        yield from _iter_store_dir(path)
+        return
+    with open(path, 'rb') as fh:
+        columnar = fh.read(len(COLUMNAR_MAGIC)) == COLUMNAR_MAGIC
+    if columnar:
+        yield from ColumnarLogReader(path)
+        return
+    with open(path, 'rb') as fh:
+        for line in fh:
+            if line.startswith(b'#') or not line.endswith(b'\n'):
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
 
-        if BUMPY_AVAILABLE:
-            self.compressor = BUMPYCore()
-        else:
-            self.compressor = None
 
-        # Memory pressure tracking
-        self.memory_warnings = 0
-        self.last_cleanup = time.time()
+def merge_logs(sources: Union[str, List[str]], key: str = 'universal_time'):
+    """
+    K-way merge of per-process logs into one stream ordered by `key`
 
-        # Integration metrics
-        self.metrics = {
-            'hits': 0,
-            'misses': 0,
-            'compressions': 0,
-            'size_reduction': 0.0,
-            'quantum_entanglements': 0
-        }
+    Args:
+        sources: Paths of log files / store directories, or one base path whose
+                 per-process siblings are found with process_logs()
 
-    def get(self, key: str) -> Optional[Dict]:
-        """Get with quantum-aware access patterns"""
-        if key in self.cache:
-            self.access_patterns[key] = self.access_patterns.get(key, 0) + 1
-            self.metrics['hits'] += 1
+    Each source is already in time order, so this streams with one entry per
+    source in memory and O(log k) work per entry.
+    """
+    if isinstance(sources, str):
+        sources = process_logs(sources)
+    return heapq.merge(*(iter_log_source(path) for path in sources),
+                       key=lambda entry: entry.get(key, 0))
 
-            # Apply quantum refresh for frequently accessed items
-            if self.access_patterns[key] % 5 == 0:
-                self._quantum_refresh(key)
 
-            return self.cache[key]
+def _encode_batch(entries: List[Dict]) -> bytes:
+    """Wire format of a shipped batch: JSON lines, so receiving never runs peer code"""
+    return ''.join(map(_jsonl_line, entries)).encode('utf-8')
 
-        self.metrics['misses'] += 1
-        return None
 
-    def set(self, key: str, value: Dict, compress: bool = True):
-        """Set with optional holographic compression"""
-        # Check memory pressure
-        if self._memory_pressure() > 0.8:
-            self._aggressive_evict()
+def _decode_batch(payload: bytes) -> List[Dict]:
+    return [json.loads(line) for line in payload.splitlines()]
 
-        # Apply holographic compression if enabled and available
-        if compress and self.compressor and len(str(value)) > 100:
-            compressed = self._holographic_compress(value)
-            if compressed:
-                value = compressed
-                self.metrics['compressions'] += 1
-                self.metrics['size_reduction'] = 0.7  # Assume 70% reduction
 
-        # Store with quantum timestamp
-        self.cache[key] = value
-        self.timestamps[key] = time.time() + random.uniform(-0.001, 0.001)  # Quantum time uncertainty
-        self.access_patterns[key] = 0
+def _peer_uid(conn: socket.socket) -> Optional[int]:
+    """Uid of a Unix socket peer (Linux SO_PEERCRED); None where unsupported"""
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    return struct.unpack('3i', creds)[1]
 
-        # Cleanup if needed
-        if len(self.cache) >= self.max_size:
-            self._quantum_evict()
 
-    def _holographic_compress(self, data: Dict) -> Optional[Dict]:
-        """Compress data using BUMPY holographic methods"""
-        if not BUMPY_AVAILABLE or not self.compressor:
+def _recv_exact(conn: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = conn.recv(min(size, 1 << 20))
+        if not chunk:
             return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
 
-        try:
-            # Convert data to list for compression
-            data_str = json.dumps(data, separators=(',', ':'))
-            data_values = [ord(c) / 255.0 for c in data_str[:100]]
-
-            if len(data_values) > 10:
-                # Create BUMPY array
-                bumpy_data = BumpyArray(data_values[:20])  # Use first 20 values
-
-                # Apply holographic compression
-                self.compressor.qualia_emergence_ritual([bumpy_data])
-
-                # Create compressed representation
-                compressed = {
-                    '_compressed': True,
-                    'hash': hashlib.md5(data_str.encode()).hexdigest()[:8],
-                    'original_length': len(data_str),
-                    'compressed_length': 20,
-                    'quantum_coherence': bumpy_data.coherence,
-                    'data_sample': data_values[:3]
-                }
 
-                return compressed
-        except Exception as e:
-            if os.getenv('DEBUG_LASER'):
-                print(f"Compression failed: {e}")
+class AggregatorSink:
+    """
+    Worker-side sink that ships each batch to a LogAggregator.
 
-        return None
+    `endpoint` is the aggregator's multiprocessing queue or Unix socket path.
+    Batches are JSON-encoded on the worker's writer thread; a socket is reconnected
+    once on failure and reopened after a fork.
+    """
 
-    def _quantum_refresh(self, key: str):
-        """Refresh cache entry with quantum operations"""
-        if key in self.cache:
-            entry = self.cache[key]
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self._sock = None
+        self._pid = None
 
-            # Add quantum timestamp
-            if 'quantum_metadata' not in entry:
-                entry['quantum_metadata'] = {}
+    def write(self, entries: List[Dict]):
+        payload = _encode_batch(entries)
+        if not isinstance(self.endpoint, str):
+            self.endpoint.put(payload)
+            return
+        for attempt in range(2):
+            try:
+                if self._sock is None or self._pid != os.getpid():
+                    self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    self._sock.connect(self.endpoint)
+                    self._pid = os.getpid()
+                self._sock.sendall(_FRAME.pack(len(payload)) + payload)
+                return
+            except OSError:
+                if self._sock is not None:
+                    self._sock.close()
+                    self._sock = None
+                if attempt:
+                    raise
+
+    def flush(self, fsync: bool = False):
+        pass  # Socket sends are synchronous; queue puts are flushed by its feeder thread
+
+    def close(self):
+        if self._sock is not None and self._pid == os.getpid():
+            self._sock.close()
+        self._sock = None
+
+
+class LogAggregator:
+    """
+    Single writer for many logging processes.
+
+    Workers log with {'aggregator': aggregator.endpoint} and ship batches here,
+    where an AsyncLogWriter appends them to `sink` (JsonlSink, ColumnarSink or
+    SegmentedLogStore). With `address` the endpoint is a Unix socket path,
+    otherwise a multiprocessing queue that must reach the workers through
+    Process/Pool arguments or inheritance. Close the aggregator after the
+    workers have shut down their LASER instances.
+
+    Batches arrive as JSON lines. The socket is created mode 0600 and, where
+    the platform reports peer credentials, connections from other users are
+    refused.
+    """
 
-            entry['quantum_metadata']['refresh_time'] = time.time()
-            entry['quantum_metadata']['quantum_phase'] = random.uniform(0, 2 * math.pi)
+    def __init__(self, sink, address: str = None, max_queue: int = 256,
+                 context=None, **writer_options):
+        self.writer = AsyncLogWriter(sink, **writer_options)
+        self.address = address
+        self.received = 0
+        self.batches = 0
+        self.connections = 0
+        self.rejected = 0
+        self._stopping = False
+        self._serving: List[threading.Thread] = []
+        self._conns: List[socket.socket] = []
+        if address is None:
+            self.queue = (context or multiprocessing.get_context()).Queue(max_queue)
+            self.endpoint = self.queue
+            target = self._drain_queue
+        else:
+            if os.path.exists(address):
+                os.unlink(address)  # Stale socket of a previous run
+            self.queue = None
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(address)
+            os.chmod(address, 0o600)  # Before listen(): nobody connects under the umask's mode
+            self._server.listen(64)
+            self._server.settimeout(0.2)
+            self.endpoint = address
+            target = self._accept_loop
+        self._thread = threading.Thread(target=target, name='laser-aggregator', daemon=True)
+        self._thread.start()
+
+    def _receive(self, payload: bytes):
+        batch = _decode_batch(payload)
+        self.writer.submit_many(batch)
+        self.received += len(batch)
+        self.batches += 1
+
+    def _drain_queue(self):
+        while True:
+            payload = self.queue.get()
+            if payload is None:
+                return
+            try:
+                self._receive(payload)
+            except Exception as e:
+                print(f"⚠️ Aggregator dropped a batch: {e}")
 
-            # Entangle with other entries if BUMPY available
-            if BUMPY_AVAILABLE and random.random() < 0.1:
-                other_keys = list(self.cache.keys())
-                if len(other_keys) > 1:
-                    other_key = random.choice([k for k in other_keys if k != key])
-                    self._create_entanglement(key, other_key)
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                if self._stopping:
+                    return  # Only once the backlog is empty: queued workers still get served
+                continue
+            except OSError:
+                return
+            uid = _peer_uid(conn)
+            if uid is not None and uid not in (os.getuid(), 0):
+                conn.close()
+                self.rejected += 1
+                continue
+            conn.settimeout(None)
+            self.connections += 1
+            self._conns.append(conn)
+            thread = threading.Thread(target=self._serve, args=(conn,), daemon=True)
+            self._serving.append(thread)
+            thread.start()
+
+    def _serve(self, conn: socket.socket):
+        with conn:
+            while True:
+                try:
+                    header = _recv_exact(conn, _FRAME.size)
+                    payload = header and _recv_exact(conn, _FRAME.unpack(header)[0])
+                except OSError:
+                    return
+                if not payload:
+                    return
+                try:
+                    self._receive(payload)
+                except Exception as e:
+                    print(f"⚠️ Aggregator dropped a batch: {e}")
+
+    def flush(self, timeout: Optional[float] = None, fsync: bool = False) -> bool:
+        return self.writer.flush(timeout=timeout, fsync=fsync)
+
+    def close(self, timeout: float = 5.0):
+        """Receive what the workers sent, then drain and close the sink"""
+        if self._stopping:
+            return
+        self._stopping = True
+        if self.queue is not None:
+            self.queue.put(None)
+            self._thread.join()
+        else:
+            self._thread.join()
+            self._server.close()
+            deadline = time.monotonic() + timeout
+            for thread in self._serving:
+                thread.join(max(0.0, deadline - time.monotonic()))
+            for conn in self._conns:  # Workers that never disconnected
+                try:
+                    conn.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            for thread in self._serving:
+                thread.join()
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+        self.writer.close()
 
-    def _create_entanglement(self, key1: str, key2: str):
-        """Create quantum entanglement between cache entries"""
-        if key1 in self.cache and key2 in self.cache:
-            # Mark entanglement in metadata
-            for key in [key1, key2]:
-                if 'quantum_metadata' not in self.cache[key]:
-                    self.cache[key]['quantum_metadata'] = {}
+    def stats(self) -> Dict:
+        return {'received': self.received, 'batches': self.batches,
+                'connections': self.connections, 'rejected': self.rejected,
+                'writer': self.writer.stats()}
 
-                entangled_with = self.cache[key]['quantum_metadata'].get('entangled_with', [])
-                other_key = key2 if key == key1 else key1
-                if other_key not in entangled_with:
-                    entangled_with.append(other_key)
-                    self.cache[key]['quantum_metadata']['entangled_with'] = entangled_with
+    def __enter__(self):
+        return self
 
-            self.metrics['quantum_entanglements'] += 1
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-    def _memory_pressure(self) -> float:
-        """Calculate memory pressure for adaptive behavior"""
-        try:
-            memory = psutil.virtual_memory()
-            return memory.percent / 100.0
-        except:
-            return len(self.cache) / self.max_size
 
-    def _aggressive_evict(self):
-        """Aggressive eviction under memory pressure"""
-        if not self.cache:
-            return
+def _flush_before_fork():
+    """Push buffered log bytes to the kernel so a child never re-flushes the parent's copy"""
+    for laser in list(_FORK_AWARE):
+        laser._flush_file_buffers()
 
-        # Calculate quantum age (adjusted by access patterns)
-        now = time.time()
-        eviction_scores = {}
 
-        for key in list(self.cache.keys()):
-            age = now - self.timestamps[key]
-            accesses = self.access_patterns.get(key, 0)
+def _reopen_after_fork():
+    for laser in list(_FORK_AWARE):
+        laser._reopen_after_fork()
 
-            # Quantum age: older items with few accesses are more likely to be evicted
-            quantum_age = age * (1.0 / max(1, accesses * 0.1))
-            eviction_scores[key] = quantum_age
 
-        # Evict worst 20%
-        to_evict = sorted(eviction_scores.items(), key=lambda x: x[1], reverse=True)
-        evict_count = max(1, len(to_evict) // 5)
+def _drain_at_exit(ref):
+    laser = ref()
+    if laser is not None:
+        laser._drain_quietly()
 
-        for key, _ in to_evict[:evict_count]:
-            self.delete(key)
 
-    def _quantum_evict(self):
-        """Quantum probabilistic eviction"""
-        if not self.cache:
-            return
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_flush_before_fork, after_in_child=_reopen_after_fork)
 
-        # Calculate quantum probabilities
-        now = time.time()
-        total_quantum_weight = 0
-        quantum_weights = {}
+# ============================================================
+# 4g. LIVE TELEMETRY RING (SHARED MEMORY)
+# ============================================================
+
+TELEMETRY_RING_MAGIC = b'LSRT'
+TELEMETRY_RING_VERSION = 1
+TELEMETRY_RING_PREFIX = 'laser-'
+TELEMETRY_FIELDS = (
+    'time', 'logs_processed', 'entries_per_s', 'logs_filtered', 'logs_gated',
+    'queue_depth', 'written', 'dropped', 'flushes', 'emergency_flushes',
+    'flush_ms', 'avg_processing_ms', 'buffer_usage', 'cache_hit_rate', 'cache_bytes',
+    'coherence', 'risk', 'consciousness', 'cpu_percent', 'rss_bytes'
+)
+# magic, version, field count, slots, writer pid, created, published samples
+_RING_HEADER = struct.Struct('<4sHHIIdQ')
+_RING_HEAD_OFFSET = 24
+_RING_NAME_BYTES = 24
+_OWNED_RINGS = set()  # Segments this process created (and its resource tracker owns)
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach without handing the segment to this process's resource tracker"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before 3.13 every attach is tracked, and the tracker unlinks on exit
+        shm = shared_memory.SharedMemory(name=name)
+        if shm._name not in _OWNED_RINGS:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class TelemetryRing:
+    """
+    Fixed-layout ring of metric samples in a shared memory segment.
+
+    Layout: a 32-byte header, the field names (24 bytes each), then `slots`
+    rows of one uint64 sequence word plus one float64 per field. A single
+    writer publishes a row under a seqlock - sequence odd while the row is
+    being written, even once it is complete - and then bumps the header's
+    sample count. Readers never lock or write: they copy a row and retry if
+    its sequence word was odd or changed meanwhile.
+    """
 
-        for key in list(self.cache.keys()):
-            age = now - self.timestamps[key]
-            accesses = self.access_patterns.get(key, 0)
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        magic, version, nfields, slots, pid, created, _ = _RING_HEADER.unpack_from(shm.buf)
+        if magic != TELEMETRY_RING_MAGIC or version != TELEMETRY_RING_VERSION:
+            raise ValueError(f"{shm.name!r} is not a LASER telemetry ring")
+        self.slots = slots
+        self.pid = pid
+        self.created = created
+        names_end = _RING_HEADER.size + nfields * _RING_NAME_BYTES
+        self.fields = tuple(
+            bytes(shm.buf[offset:offset + _RING_NAME_BYTES]).rstrip(b'\0').decode('ascii')
+            for offset in range(_RING_HEADER.size, names_end, _RING_NAME_BYTES)
+        )
+        rows_offset = (names_end + 7) & ~7
+        self._head = np.ndarray((1,), dtype='<u8', buffer=shm.buf, offset=_RING_HEAD_OFFSET)
+        self._seq = np.ndarray((slots, nfields + 1), dtype='<u8', buffer=shm.buf, offset=rows_offset)[:, 0]
+        self._rows = np.ndarray((slots, nfields + 1), dtype='<f8', buffer=shm.buf, offset=rows_offset)[:, 1:]
+
+    @classmethod
+    def create(cls, name: str, slots: int = 512, fields: Tuple[str, ...] = TELEMETRY_FIELDS) -> 'TelemetryRing':
+        names_end = _RING_HEADER.size + len(fields) * _RING_NAME_BYTES
+        size = ((names_end + 7) & ~7) + slots * (len(fields) + 1) * 8
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _OWNED_RINGS.add(shm._name)
+        _RING_HEADER.pack_into(shm.buf, 0, TELEMETRY_RING_MAGIC, TELEMETRY_RING_VERSION,
+                               len(fields), slots, os.getpid(), time.time(), 0)
+        for i, field_name in enumerate(fields):
+            offset = _RING_HEADER.size + i * _RING_NAME_BYTES
+            shm.buf[offset:offset + _RING_NAME_BYTES] = field_name.encode('ascii').ljust(_RING_NAME_BYTES, b'\0')
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'TelemetryRing':
+        return cls(_attach_shared_memory(name), owner=False)
 
-            # Quantum probability: older with fewer accesses = higher probability
-            quantum_prob = math.exp(-accesses * 0.1) * (1.0 - math.exp(-age / 3600))
-            quantum_weights[key] = quantum_prob
-            total_quantum_weight += quantum_prob
+    @property
+    def name(self) -> str:
+        return self.shm.name
 
-        if total_quantum_weight == 0:
+    @property
+    def published(self) -> int:
+        return int(self._head[0])
+
+    def publish(self, values):
+        """Writer side: append one sample (one value per field, in field order)"""
+        head = int(self._head[0])
+        slot = head % self.slots
+        self._seq[slot] += 1
+        self._rows[slot] = values
+        self._seq[slot] += 1
+        self._head[0] = head + 1
+
+    def _read_slot(self, slot: int, retries: int = 64) -> Optional[np.ndarray]:
+        for _ in range(retries):
+            before = int(self._seq[slot])
+            if before & 1:
+                continue
+            row = self._rows[slot].copy()
+            if int(self._seq[slot]) == before:
+                return row
+        return None  # Writer kept lapping us; skip the row
+
+    def latest(self) -> Optional[Dict]:
+        """Most recent complete sample as a dict, or None before the first one"""
+        head = self.published
+        if not head:
+            return None
+        row = self._read_slot((head - 1) % self.slots)
+        return None if row is None else dict(zip(self.fields, row.tolist()))
+
+    def samples(self, since: int = 0) -> Tuple[List[Dict], int]:
+        """Samples published after sample number `since` (at most one ring's worth), and the new cursor"""
+        head = self.published
+        rows = []
+        for number in range(max(since, head - self.slots), head):
+            row = self._read_slot(number % self.slots)
+            if row is not None:
+                rows.append(dict(zip(self.fields, row.tolist())))
+        return rows, head
+
+    def close(self, unlink: Optional[bool] = None):
+        """Drop the mapping; the owner also removes the segment unless told otherwise"""
+        if self.shm is None:
             return
+        self._head = self._seq = self._rows = None  # Views must go before the buffer can
+        shm, self.shm = self.shm, None
+        shm.close()
+        if self.owner if unlink is None else unlink:
+            _OWNED_RINGS.discard(shm._name)
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
 
-        # Normalize and select for eviction
-        selected = random.random() * total_quantum_weight
-        cumulative = 0
+    def __enter__(self):
+        return self
 
-        for key, weight in quantum_weights.items():
-            cumulative += weight
-            if cumulative >= selected:
-                self.delete(key)
-                break
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-    def delete(self, key: str):
-        """Delete entry and propagate to entangled entries"""
-        # Propagate deletion to entangled entries
-        if key in self.cache and 'quantum_metadata' in self.cache[key]:
-            entangled = self.cache[key]['quantum_metadata'].get('entangled_with', [])
-            for other_key in entangled:
-                if other_key in self.cache and 'quantum_metadata' in self.cache[other_key]:
-                    # Remove this key from other's entanglement list
-                    other_entangled = self.cache[other_key]['quantum_metadata'].get('entangled_with', [])
-                    if key in other_entangled:
-                        other_entangled.remove(key)
-                        self.cache[other_key]['quantum_metadata']['entangled_with'] = other_entangled
 
-        # Delete entry
-        self.cache.pop(key, None)
-        self.timestamps.pop(key, None)
-        self.access_patterns.pop(key, None)
+def telemetry_ring_name(setting) -> Optional[str]:
+    """Config value -> segment name: True means 'laser-<pid>'"""
+    if not setting:
+        return None
+    if setting is True:
+        return f"{TELEMETRY_RING_PREFIX}{os.getpid()}"
+    return str(setting)
+
+
+def list_telemetry_rings() -> List[str]:
+    """Names of LASER rings visible in /dev/shm (Linux)"""
+    try:
+        return sorted(n for n in os.listdir('/dev/shm') if n.startswith(TELEMETRY_RING_PREFIX))
+    except OSError:
+        return []
+
+
+def _render_sample(sample: Dict) -> str:
+    return (f"{datetime.fromtimestamp(sample['time']).strftime('%H:%M:%S')} "
+            f"logs {int(sample['logs_processed']):>9} "
+            f"{sample['entries_per_s']:>9.1f}/s "
+            f"queue {int(sample['queue_depth']):>6} "
+            f"dropped {int(sample['dropped']):>6} "
+            f"flush {sample['flush_ms']:>7.2f}ms "
+            f"log {sample['avg_processing_ms']:>6.3f}ms "
+            f"cache {sample['cache_hit_rate']:>6.1%} "
+            f"coherence {sample['coherence']:.3f} "
+            f"risk {sample['risk']:.3f}")
+
+
+def watch_telemetry_main(argv: List[str] = None) -> int:
+    """`python laser.py watch [NAME]`: follow a live LASER process through its telemetry ring"""
+    parser = argparse.ArgumentParser(prog='laser.py watch',
+                                     description='Render live LASER metrics from a shared memory telemetry ring')
+    parser.add_argument('name', nargs='?', help='ring name (lists available rings when omitted)')
+    parser.add_argument('--interval', type=float, default=1.0)
+    parser.add_argument('--count', type=int, default=0, help='stop after this many refreshes (0: run until interrupted)')
+    parser.add_argument('--json', action='store_true', help='print raw samples as JSON lines')
+    args = parser.parse_args(argv)
+
+    if args.name is None:
+        rings = list_telemetry_rings()
+        print('\n'.join(rings) if rings else "No LASER telemetry rings found")
+        return 0
+    try:
+        ring = TelemetryRing.attach(args.name)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"⚠️ Cannot attach to {args.name!r}: {e}")
+        return 1
+
+    with ring:
+        print(f"📡 {ring.name} (pid {ring.pid}, {ring.slots} slots)")
+        cursor = max(0, ring.published - 1)
+        refreshes = 0
+        try:
+            while True:
+                samples, cursor = ring.samples(cursor)
+                for sample in samples:
+                    print(json.dumps(sample) if args.json else _render_sample(sample), flush=True)
+                refreshes += 1
+                if args.count and refreshes >= args.count:
+                    break
+                time.sleep(args.interval)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+def _flush_copy(entry: Dict, flush_metadata: Dict) -> Dict:
+    """
+    An entry as handed to the writer thread. The cache keeps the original and
+    goes on adding to its quantum_metadata (and that dict's entangled_with
+    list) on the logging thread, so those are copied; nothing else in an entry
+    changes after it was logged.
+    """
+    copy = {**entry, 'flush_metadata': flush_metadata}
+    metadata = entry.get('quantum_metadata')
+    if metadata is not None:
+        metadata = dict(metadata)
+        if 'entangled_with' in metadata:
+            metadata['entangled_with'] = list(metadata['entangled_with'])
+        copy['quantum_metadata'] = metadata
+    return copy
 
 # ============================================================
 # 5. LASER v3.0 - UNIVERSAL INTEGRATION SYSTEM
@@ -626,13 +3461,47 @@ class LASERV30:
             'system_monitoring': True,
             'debug': False,
             'universal_memory': True,
+            'async_flush': True,
+            'writer_queue': 20000,
+            'writer_batch': 512,
+            'writer_interval': 0.25,
+            'fsync_interval': None,
+            'backpressure': 'block',
+            'sample_every': 10,
+            'min_level': INFO,  # Per-object DEBUG chatter (qtorch) stops at the gate
+            'log_sample_every': 1,
+            'rate_limit': None,
+            'rate_burst': None,
+            'log_dir': None,
+            'segment_bytes': SEGMENT_BYTES,
+            'segment_seconds': None,
+            'archive_codec': 'zlib',
+            'retention_bytes': None,
+            'telemetry_retention_bytes': 64 << 20,
+            'cache_size': 800,
+            'cache_max_bytes': 32 << 20,
+            'cache_policy': 'lru',
+            'log_format': 'jsonl',
+            'process_segments': 'auto',
+            'resource_interval': 1.0,
+            'aggregator': None,
+            'telemetry_ring': None,
+            'telemetry_ring_slots': 512,
+            'telemetry_ring_interval': 1.0,
+            'metrics_endpoint': None,
             **(config or {})
         }
+        if self.config['log_format'] not in LOG_FORMATS:
+            raise ValueError(f"log_format must be one of {LOG_FORMATS}, got {self.config['log_format']!r}")
 
         # Initialize integrated systems
         self.universal_state = UniversalQuantumState()
         self.temporal = FlumpyTemporalVector(size=15)
-        self.cache = UniversalCache(max_size=800)
+        self.resources = ResourceSampler.shared(self.config['resource_interval'])
+        self.cache = UniversalCache(max_size=self.config['cache_size'],
+                                    max_bytes=self.config['cache_max_bytes'],
+                                    policy=self.config['cache_policy'],
+                                    resources=self.resources)
         self.quantum_op = BumpyQuantumOperator()
 
         # Log buffer with quantum ordering
@@ -658,17 +3527,49 @@ class LASERV30:
             'entanglements_created': 0,
             'system_integrations': 0,
             'universal_queries': 0,
-            'compression_savings': 0.0
+            'compression_savings': 0.0,
+            'logs_filtered': 0,
+            'logs_refused': 0  # Arrived after shutdown() started
+        }
+
+        # Latency / size distributions, exported by prometheus_text()
+        self.histograms = {
+            'log_seconds': LogHistogram("Latency of admitted log() calls, lock wait included"),
+            'log_many_seconds': LogHistogram("Latency of admitted log_many() calls, lock wait included"),
+            **writer_histograms()
         }
 
+        # Stage-one admission gate for log()
+        self._gate = LogGate(
+            min_level=self.config['min_level'],
+            sample_every=self.config['log_sample_every'],
+            rate_limit=self.config['rate_limit'],
+            burst=self.config['rate_burst']
+        )
+
         # Thread management
         self._lock = threading.RLock()
         self._shutdown = threading.Event()
         self._maintenance_thread = threading.Thread(target=self._universal_maintenance, daemon=True)
         self._maintenance_thread.start()
 
-        # Initialize log system
-        self._init_universal_log()
+        # Log outputs; per-process file names in worker processes
+        self._base_paths = (self.config['log_path'], self.config['log_dir'])
+        self.process_tag = None
+        if _wants_process_segments(self.config['process_segments']):
+            self._tag_process_paths()
+        self._open_outputs()
+        self._open_telemetry_ring()
+        self.metrics_server = None
+        if self.config['metrics_endpoint'] is not None:
+            try:
+                self.metrics_server = MetricsServer(self.prometheus_text, self.config['metrics_endpoint'])
+            except Exception as e:
+                print(f"⚠️ Metrics endpoint unavailable: {e}")
+        _FORK_AWARE.add(self)
+        if multiprocessing.parent_process() is not None:
+            self._drain_at_child_exit()
+        multiprocessing.util.register_after_fork(self, LASERV30._drain_at_child_exit)
 
         print(f"🌌 LASER v3.0 - Universal Quantum Integration")
         print(f"   Integrated Systems: {self._integration_status()}")
@@ -680,9 +3581,204 @@ class LASERV30:
         active = [sys for sys, active in self.integrated_systems.items() if active]
         return f"{len(active)}/{len(self.integrated_systems)}: {', '.join(active)}"
 
+    def _open_outputs(self):
+        """Open the store(s), write the header and start the writer for the current paths"""
+        # A segmented, indexed store when log_dir is set (not when an aggregator owns the output)
+        self.store = None
+        self.telemetry_store = None
+        if self.config['log_dir'] and self.config['aggregator'] is None:
+            self.store = SegmentedLogStore(self.config['log_dir'],
+                                           segment_bytes=self.config['segment_bytes'],
+                                           segment_seconds=self.config['segment_seconds'],
+                                           archive_codec=self.config['archive_codec'],
+                                           retention_bytes=self.config['retention_bytes'])
+            if self.config['telemetry']:
+                self.telemetry_store = SegmentedLogStore(
+                    os.path.join(self.config['log_dir'], 'telemetry'),
+                    segment_bytes=min(self.config['segment_bytes'], 8 << 20),
+                    archive_codec=self.config['archive_codec'],
+                    retention_bytes=self.config['telemetry_retention_bytes'])
+        self._init_universal_log()
+        self._writer = None
+        if self.config['async_flush']:
+            self._writer = AsyncLogWriter(
+                self._open_sink(),
+                max_queue=self.config['writer_queue'],
+                batch_size=self.config['writer_batch'],
+                flush_interval=self.config['writer_interval'],
+                fsync_interval=self.config['fsync_interval'],
+                policy=self.config['backpressure'],
+                sample_every=self.config['sample_every'],
+                histograms=self.histograms
+            )
+
+    def _tag_process_paths(self):
+        """Point log_path/log_dir at this process's own files"""
+        self.process_tag = _process_tag()
+        log_path, log_dir = self._base_paths
+        self.config['log_path'] = process_log_name(log_path, self.process_tag)
+        if log_dir:
+            self.config['log_dir'] = os.path.join(log_dir, self.process_tag)
+
+    def _flush_file_buffers(self):
+        """Parent side of a fork: empty the sink's userspace buffer"""
+        if self._shutdown.is_set():
+            return
+        sink = self._writer.sink if self._writer is not None else self.store
+        fh = getattr(sink, '_fh', None)
+        try:
+            if fh is not None and not fh.closed:
+                fh.flush()
+        except Exception:
+            pass
+
+    def _reopen_after_fork(self):
+        """
+        Child side of a fork: the parent's threads did not survive and its files,
+        buffered entries and locks are not ours to touch. Start over on this
+        process's own paths.
+        """
+        if self._shutdown.is_set():
+            return
+        # Never flushed or closed here; kept referenced so nothing finalizes them either
+        self._inherited = (self._writer, self.store, self.telemetry_store, self.ring)
+        if self.metrics_server is not None:
+            self.metrics_server.detach()  # The endpoint keeps serving the parent
+            self.metrics_server = None
+        self._lock = threading.RLock()
+        self._shutdown = threading.Event()
+        for histogram in self.histograms.values():
+            histogram.after_fork()
+        self.buffer.clear()
+        self.quantum_buffer = []
+        if self.config['process_segments']:
+            self._tag_process_paths()
+        self._open_outputs()
+        self._open_telemetry_ring(child=True)
+        self._maintenance_thread = threading.Thread(target=self._universal_maintenance, daemon=True)
+        self._maintenance_thread.start()
+
+    def _drain_at_child_exit(self):
+        """Worker processes leave through os._exit(): drain from multiprocessing's exit hook instead"""
+        # The registry only gets a weak reference, so an unused instance can still be collected
+        multiprocessing.util.Finalize(self, _drain_at_exit, args=(weakref.ref(self),), exitpriority=10)
+
+    def _drain_quietly(self):
+        with self._lock:
+            if self._shutdown.is_set():
+                return
+            self._shutdown.set()
+            if self.buffer:
+                self._universal_flush()
+        if self._writer is not None:
+            self._writer.close()
+        elif self.store is not None:
+            self.store.close()
+        self._close_telemetry_ring()
+        self._close_metrics_server()
+
+    def _open_telemetry_ring(self, child: bool = False):
+        """Create the shared memory telemetry ring and its publisher thread, if configured"""
+        self.ring = None
+        setting = self.config['telemetry_ring']
+        name = telemetry_ring_name(setting)
+        if name is None:
+            return
+        if child and setting is not True:
+            name = f"{name}-{os.getpid()}"  # The parent keeps the configured name
+        try:
+            self.ring = TelemetryRing.create(name, slots=self.config['telemetry_ring_slots'])
+        except Exception as e:
+            print(f"⚠️ Telemetry ring unavailable: {e}")
+            return
+        self._ring_last = (time.monotonic(), self.metrics['logs_processed'])
+        self._ring_thread = threading.Thread(target=self._publish_telemetry_loop, args=(self.ring,),
+                                             name='laser-telemetry-ring', daemon=True)
+        self._ring_thread.start()
+
+    def _publish_telemetry_loop(self, ring: TelemetryRing):
+        shutdown = self._shutdown
+        while not shutdown.wait(self.config['telemetry_ring_interval']):
+            try:
+                self._publish_telemetry(ring)
+            except Exception as e:
+                if self.config['debug']:
+                    print(f"⚠️ Telemetry ring publish failed: {e}")
+
+    def _publish_telemetry(self, ring: TelemetryRing):
+        """
+        One ring sample, read from counters the logging path keeps anyway. Runs on
+        the publisher thread and takes no lock: a sample may straddle a log() call,
+        which a dashboard never notices.
+        """
+        now = time.monotonic()
+        processed = self.metrics['logs_processed']
+        last_time, last_processed = self._ring_last
+        self._ring_last = (now, processed)
+        writer = self._writer
+        cache = self.cache.metrics
+        lookups = cache['hits'] + cache['misses']
+        resources = self.resources.snapshot
+        sample = {
+            'time': time.time(),
+            'logs_processed': processed,
+            'entries_per_s': (processed - last_processed) / (now - last_time) if now > last_time else 0.0,
+            'logs_filtered': self.metrics['logs_filtered'],
+            'logs_gated': self._gate.dropped,
+            'queue_depth': writer.depth if writer is not None else 0,
+            'written': writer.written if writer is not None else 0,
+            'dropped': writer.dropped if writer is not None else 0,
+            'flushes': self.metrics['flushes'],
+            'emergency_flushes': self.metrics['emergency_flushes'],
+            'flush_ms': writer.last_batch_s * 1000 if writer is not None else 0.0,
+            'avg_processing_ms': self.metrics['avg_processing_ms'],
+            'buffer_usage': len(self.buffer) / self.config['max_buffer'],
+            'cache_hit_rate': cache['hits'] / lookups if lookups else 0.0,
+            'cache_bytes': self.cache.bytes,
+            'coherence': self.universal_state.coherence,
+            'risk': self.universal_state.risk,
+            'consciousness': self.universal_state.consciousness,
+            'cpu_percent': resources.cpu_percent,
+            'rss_bytes': resources.rss_bytes
+        }
+        ring.publish([sample[name] for name in ring.fields])
+
+    def _close_telemetry_ring(self):
+        """Publish a last sample and remove the segment"""
+        ring, self.ring = self.ring, None
+        if ring is None:
+            return
+        self._ring_thread.join(timeout=5.0)
+        try:
+            self._publish_telemetry(ring)
+        except Exception:
+            pass
+        ring.close()
+
+    def _close_metrics_server(self):
+        server, self.metrics_server = self.metrics_server, None
+        if server is not None:
+            server.close()
+
+    def _open_sink(self):
+        """Destination of flushed batches: an aggregator, the segmented store, or the flat log file"""
+        if self.config['aggregator'] is not None:
+            return AggregatorSink(self.config['aggregator'])
+        if self.store is not None:
+            return self.store
+        if self.config['log_format'] == 'columnar':
+            return ColumnarSink(self.config['log_path'])
+        return JsonlSink(self.config['log_path'])
+
     def _init_universal_log(self):
         """Initialize universal log with system metadata"""
+        if self.config['aggregator'] is not None:
+            return  # The aggregator owns the output
         path = self.config['log_path']
+        if self.store is not None:
+            path = os.path.join(self.store.directory, 'header.jsonl')
+        elif self.config['log_format'] == 'columnar':
+            path = os.path.splitext(path)[0] + '.header.jsonl'
         try:
             if not os.path.exists(path):
                 with open(path, 'w', encoding='utf-8') as f:
@@ -738,43 +3834,59 @@ class LASERV30:
 
             return False
 
-    def log(self, value: float, message: str, system_context: Dict = None, **meta) -> Optional[Dict]:
+    def log(self, value: float, message: str, system_context: Dict = None,
+            level: Optional[int] = None, **meta) -> Optional[Dict]:
         """
         Universal logging with system integration
 
+        Entries pass three stages: the constant-time admission gate (no lock),
+        state-dependent filters, and - only for entries that are kept - the
+        quantum transform, temporal update, hashing and caching.
+
         Args:
             value: Log value (consciousness, risk, energy, etc.)
             message: Log message
             system_context: Context from integrated systems
+            level: Severity (DEBUG..CRITICAL); None infers importance from the message
             **meta: Additional metadata
         """
+        # Stage 1: level / sampling / rate-limit gate
+        if not self._gate.admit(level, message):
+            return None
+
+        called = time.perf_counter()
         with self._lock:
+            if self._shutdown.is_set():
+                self.metrics['logs_refused'] += 1
+                return None
             start_time = time.perf_counter()
 
-            # Prepare universal context
-            universal_context = self._prepare_universal_context(system_context)
-
             # Update universal state with system context
             if system_context:
                 self.universal_state.update_from_systems(**system_context)
 
-            # Quantum analysis with universal integration
-            qdata = self.quantum_op.transform(value, message, {
+            system_states = {
                 'signature': self.universal_state.signature,
                 'consciousness': self.universal_state.consciousness,
                 'flumpy_coherence': self.universal_state.flumpy_coherence,
                 'stability': self.universal_state.stability,
                 'risk_bonus': self.universal_state.risk * 0.1
-            })
+            }
 
-            # Temporal analysis
-            delta, compressed, temporal_metrics = self.temporal.update(value, universal_context)
+            # Stage 2: state-dependent filters
+            if not self._should_log(value, system_states, self.temporal.peek_delta(value), message, level):
+                self.metrics['logs_filtered'] += 1
+                self.histograms['log_seconds'].record(time.perf_counter() - called)
+                return None
 
-            # Determine if we should log
-            should_log = self._should_log(value, qdata, delta, message)
+            # Stage 3: the expensive part, for kept entries only
+            universal_context = self._prepare_universal_context(system_context)
 
-            if not should_log and len(self.buffer) < self.config['min_buffer_for_log']:
-                return None
+            # Quantum analysis with universal integration
+            qdata = self.quantum_op.transform(value, message, system_states)
+
+            # Temporal analysis
+            delta, compressed, temporal_metrics = self.temporal.update(value, universal_context)
 
             # Create universal log entry
             entry = self._create_universal_entry(
@@ -802,12 +3914,103 @@ class LASERV30:
                 0.1 * proc_time + 0.9 * self.metrics['avg_processing_ms']
             )
 
+            self.histograms['log_seconds'].record(time.perf_counter() - called)
             return entry
 
+    def log_many(self, values, messages=None, context: Dict = None,
+                 level: Optional[int] = None, **meta) -> List[Dict]:
+        """
+        Bulk logging: log() for a batch of homogeneous events, vectorized
+
+        Entries still pass the admission gate one by one. The state filters are
+        evaluated for the whole batch against the state at its start (the value
+        change test between consecutive values), then the quantum transform,
+        temporal update and state feedback run as array operations, entry ids
+        come from one hash per batch, and the kept entries enter the buffer as
+        one block. BUMPY rituals and entanglement run once per batch.
+
+        Args:
+            values: Sequence or array of log values
+            messages: One message per value, a single message for all, or None
+            context: System context, applied once for the batch
+            level: Severity (DEBUG..CRITICAL) of every entry
+            **meta: Additional metadata shared by every entry
+
+        Returns:
+            The entries that were kept
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if messages is None or isinstance(messages, str):
+            messages = [messages or ''] * len(values)
+        else:
+            messages = [str(message) for message in messages]
+            if len(messages) != len(values):
+                raise ValueError(f"{len(messages)} messages for {len(values)} values")
+
+        # Stage 1: level / sampling / rate-limit gate
+        admit = self._gate.admit
+        admitted = [i for i, message in enumerate(messages) if admit(level, message)]
+        if not admitted:
+            return []
+        if len(admitted) < len(values):
+            values = values[admitted]
+            messages = [messages[i] for i in admitted]
+
+        called = time.perf_counter()
+        with self._lock:
+            if self._shutdown.is_set():
+                self.metrics['logs_refused'] += len(values)
+                return []
+            start_time = time.perf_counter()
+
+            if context:
+                self.universal_state.update_from_systems(**context)
+
+            system_states = {
+                'signature': self.universal_state.signature,
+                'consciousness': self.universal_state.consciousness,
+                'flumpy_coherence': self.universal_state.flumpy_coherence,
+                'stability': self.universal_state.stability,
+                'risk_bonus': self.universal_state.risk * 0.1
+            }
+
+            # Stage 2: state-dependent filters
+            keep = self._should_log_many(values, system_states, messages, level)
+            self.metrics['logs_filtered'] += len(values) - int(keep.sum())
+            if not keep.any():
+                self.histograms['log_many_seconds'].record(time.perf_counter() - called)
+                return []
+            if not keep.all():
+                values = values[keep]
+                messages = [message for message, kept in zip(messages, keep.tolist()) if kept]
+
+            # Stage 3: vectorized transform, temporal update and entries
+            universal_context = self._prepare_universal_context(context)
+            qdatas = self.quantum_op.transform_many(values, messages, system_states)
+            deltas, compressed, temporal_metrics = self.temporal.update_many(values, universal_context)
+            entries = self._create_universal_entries(values, messages, qdatas, deltas, compressed,
+                                                     temporal_metrics, universal_context, meta)
+
+            # Entanglement once per batch, for its riskiest entry
+            riskiest = max(entries, key=lambda entry: entry['quantum']['risk'])
+            if self._quantum_entanglement_conditions(riskiest):
+                self._apply_quantum_entanglement(riskiest)
+
+            self.metrics['logs_processed'] += len(entries)
+            self._update_from_logs(qdatas)
+            self._enqueue_block(entries)
+
+            proc_time = (time.perf_counter() - start_time) * 1000 / len(entries)
+            self.metrics['avg_processing_ms'] = (
+                0.1 * proc_time + 0.9 * self.metrics['avg_processing_ms']
+            )
+            self.histograms['log_many_seconds'].record(time.perf_counter() - called)
+            return entries
+
     def _prepare_universal_context(self, system_context: Dict = None) -> Dict:
         """Prepare universal context from all integrated systems"""
         context = {
-            'universal_state': asdict(self.universal_state),
+            'universal_state': self.universal_state.snapshot(),
             'integration_score': self.universal_state.integration_score,
             'system_integrations': self.integrated_systems,
             'temporal_state': {
@@ -823,30 +4026,93 @@ class LASERV30:
 
         return context
 
-    def _should_log(self, value: float, qdata: Dict, delta: float, message: str) -> bool:
-        """Determine if we should log based on universal criteria"""
+    def _should_log(self, value: float, system_states: Dict, delta: float,
+                    message: str, level: Optional[int] = None) -> bool:
+        """Determine if we should log based on universal criteria (no transform needed)"""
         # Always log important messages
-        important_keywords = ['ERROR', 'CRITICAL', 'WARNING', 'EMERGENCY', 'FAILURE']
-        if any(keyword in message.upper() for keyword in important_keywords):
+        if level is not None:
+            if level >= WARNING:
+                return True
+        elif _is_important(message):
             return True
 
-        # Log based on quantum risk
-        if qdata['risk'] > 0.6:
+        # Once the buffer holds min_buffer_for_log entries, every admitted entry is kept
+        if len(self.buffer) >= self.config['min_buffer_for_log']:
             return True
 
         # Log based on value change
         if abs(delta) > 0.05:  # 5% change
             return True
 
-        # Log based on consciousness level (from AGI)
-        if self.universal_state.consciousness > 0.7 and random.random() < 0.3:
-            return True
-
         # Periodic sampling
         if self.metrics['logs_processed'] % 50 == 0:
             return True
 
-        return False
+        # Log based on consciousness level (from AGI)
+        if self.universal_state.consciousness > 0.7 and random.random() < 0.3:
+            return True
+
+        # Log based on quantum risk, estimated without the hash-seeded transform
+        return self.quantum_op.estimate_risk(value, system_states) > 0.6
+
+    def _should_log_many(self, values: np.ndarray, system_states: Dict,
+                         messages: List[str], level: Optional[int]) -> np.ndarray:
+        """_should_log() for a batch, as a boolean mask"""
+        n = len(values)
+        if (level is not None and level >= WARNING) or len(self.buffer) >= self.config['min_buffer_for_log']:
+            return np.ones(n, dtype=bool)
+
+        previous = np.empty(n)
+        previous[0] = values[0] - self.temporal.peek_delta(float(values[0]))
+        previous[1:] = values[:-1]
+        keep = np.abs(values - previous) > 0.05
+        keep |= (self.metrics['logs_processed'] + np.arange(n)) % 50 == 0
+        if level is None:
+            keep |= np.fromiter((_is_important(message) for message in messages), dtype=bool, count=n)
+        if self.universal_state.consciousness > 0.7:
+            keep |= np.array([random.random() < 0.3 for _ in range(n)])
+        keep |= self.quantum_op.estimate_risk(values, system_states) > 0.6
+        return keep
+
+    def _create_universal_entries(self, values: np.ndarray, messages: List[str], qdatas: List[Dict],
+                                  deltas: List[float], compressed: List[float],
+                                  temporal_metrics: List[Dict], context: Dict, meta: Dict) -> List[Dict]:
+        """_create_universal_entry() for a batch: one id hash and one timestamp per batch"""
+        now = time.time()
+        timestamp = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        batch_id = hashlib.sha256(
+            f"{now}{len(messages)}{messages[0]}{self.universal_state.signature}".encode()
+        ).hexdigest()[:10]
+        position = len(self.buffer)
+        entries = [{
+            'id': f"{batch_id}{i:06x}",
+            'timestamp': timestamp,
+            'universal_time': now,
+            'value': value,
+            'message': message[:500],
+            'quantum': qdata,
+            'temporal': {
+                'delta': delta,
+                'compressed': comp,
+                'metrics': metrics
+            },
+            'universal_state': context['universal_state'],
+            'context': context,
+            'meta': meta,
+            'buffer_position': position + i,
+            'system_integrations': self.integrated_systems
+        } for i, (value, message, qdata, delta, comp, metrics) in enumerate(zip(
+            np.round(values, 6).tolist(), messages, qdatas,
+            np.round(deltas, 6).tolist(), np.round(compressed, 6).tolist(), temporal_metrics))]
+
+        # Homogeneous entries: size one and charge the same cost for all. Only the
+        # newest max_size entries could survive in the cache, so only those go in.
+        cost = _estimate_bytes(entries[0])
+        compress = self.config['compression']
+        tail = max(0, len(entries) - self.cache.max_size)
+        for entry, value in zip(entries[tail:], values[tail:].tolist()):
+            self.cache.set(f"{entry['id']}_{int(value*100):03d}", entry, compress=compress, cost=cost)
+        return entries
 
     def _create_universal_entry(self, value: float, message: str, qdata: Dict,
                                delta: float, compressed: float,
@@ -869,7 +4135,7 @@ class LASERV30:
                 'compressed': round(compressed, 6),
                 'metrics': temporal_metrics
             },
-            'universal_state': asdict(self.universal_state),
+            'universal_state': context['universal_state'],
             'context': context,
             'meta': meta,
             'buffer_position': len(self.buffer),
@@ -957,6 +4223,26 @@ class LASERV30:
         # Update metrics
         self.metrics['quantum_events'] += 1
 
+    def _update_from_logs(self, qdatas: List[Dict]):
+        """_update_from_log() for a batch: the moving averages in closed form"""
+        n = len(qdatas)
+        coherences = np.fromiter((q['coherence'] for q in qdatas), dtype=np.float64, count=n)
+        entropies = np.fromiter((q['entropy'] for q in qdatas), dtype=np.float64, count=n)
+        steps = np.arange(n - 1, -1, -1)
+        coherence = self.universal_state.coherence * 0.9 ** n + 0.1 * float(coherences @ 0.9 ** steps)
+        self.universal_state.coherence = max(0.1, coherence)
+        self.universal_state.entropy = self.universal_state.entropy * 0.8 ** n + 0.2 * float(entropies @ 0.8 ** steps)
+        self.universal_state.signature = self.universal_state._generate_universal_signature()
+        self.metrics['quantum_events'] += n
+
+    def _enqueue_block(self, entries: List[Dict]):
+        """Buffer a block of entries, or flush it together with the buffer when it would not fit"""
+        if len(self.buffer) + len(entries) <= self.config['max_buffer']:
+            self.buffer.extend(entries)
+            self._check_flush_conditions(entries[-1]['quantum'])
+        else:
+            self._universal_flush(extra=entries)
+
     def _check_flush_conditions(self, qdata: Dict):
         """Check universal flush conditions"""
         buffer_fullness = len(self.buffer) / self.config['max_buffer']
@@ -983,60 +4269,81 @@ class LASERV30:
         if emergency_flush or regular_flush:
             self._universal_flush(emergency=emergency_flush)
 
-    def _universal_flush(self, emergency: bool = False):
-        """Universal flush with system integration"""
-        if not self.buffer:
+    def _universal_flush(self, emergency: bool = False, extra: List[Dict] = None):
+        """Universal flush: hand the buffered batch (and `extra` entries after it) to the background writer"""
+        if not self.buffer and not extra:
             return
 
         with self._lock:
-            count = len(self.buffer)
-            flush_type = "🚨 QUANTUM EMERGENCY" if emergency else "⚡ UNIVERSAL"
-
-            print(f"{flush_type} FLUSH | "
-                  f"Logs: {count} | "
-                  f"Universal Risk: {self.universal_state.risk:.3f} | "
-                  f"Integration: {self.universal_state.integration_score:.1%} | "
-                  f"Consciousness: {self.universal_state.consciousness:.3f}")
+            count = len(self.buffer) + len(extra or ())
+            if self.config['debug']:
+                flush_type = "🚨 QUANTUM EMERGENCY" if emergency else "⚡ UNIVERSAL"
+                print(f"{flush_type} FLUSH | "
+                      f"Logs: {count} | "
+                      f"Universal Risk: {self.universal_state.risk:.3f} | "
+                      f"Integration: {self.universal_state.integration_score:.1%} | "
+                      f"Consciousness: {self.universal_state.consciousness:.3f}")
 
             if emergency:
                 self.metrics['emergency_flushes'] += 1
 
-            # Write to universal log
-            path = self.config['log_path']
-            try:
-                with open(path, 'a', encoding='utf-8') as f:
-                    for entry in self.buffer:
-                        # Add flush metadata
-                        entry['flush_metadata'] = {
-                            'type': 'quantum_emergency' if emergency else 'universal',
-                            'timestamp': time.time(),
-                            'universal_state': asdict(self.universal_state),
-                            'metrics': self.metrics_report(),
-                            'buffer_state': {
-                                'size_before': count,
-                                'emergency': emergency,
-                                'universal_risk': self.universal_state.risk
-                            }
-                        }
-
-                        f.write(json.dumps(entry, separators=(',', ':')) + '\n')
-
-                    self.metrics['flushes'] += 1
+            # Flush metadata is identical for the whole batch: build it once
+            flush_metadata = {
+                'type': 'quantum_emergency' if emergency else 'universal',
+                'timestamp': time.time(),
+                'universal_state': asdict(self.universal_state),
+                'metrics': self.metrics_report(),
+                'buffer_state': {
+                    'size_before': count,
+                    'emergency': emergency,
+                    'universal_risk': self.universal_state.risk
+                }
+            }
+            batch = [_flush_copy(entry, flush_metadata)
+                     for entry in itertools.chain(self.buffer, extra or ())]
+            self.buffer.clear()
 
-            except Exception as e:
-                print(f"⚠️ Universal write failed: {e}")
-                # Fallback to console
-                for entry in list(self.buffer)[:2]:
-                    print(f"[FALLBACK] {entry['timestamp']} - {entry['message'][:60]}...")
+            if self._writer is not None:
+                self._writer.submit_many(batch)
+                if emergency:
+                    self._writer.flush(timeout=0, fsync=True)  # Ask for an fsync without waiting
+            else:
+                self._write_batch(batch)
 
-            # Clear buffer
-            self.buffer.clear()
+            self.metrics['flushes'] += 1
             self.metrics['last_flush'] = time.time()
 
             # Update compression savings metric
             if self.cache.metrics['compressions'] > 0:
                 self.metrics['compression_savings'] = self.cache.metrics['size_reduction']
 
+    def _write_batch(self, batch: List[Dict]):
+        """Synchronous fallback used when async_flush is disabled"""
+        start = time.perf_counter()
+        try:
+            self._write_batch_now(batch)
+        finally:
+            _record_write(self.histograms, time.perf_counter() - start, len(batch))
+
+    def _write_batch_now(self, batch: List[Dict]):
+        if self.store is not None:
+            try:
+                self.store.write(batch)
+            except Exception as e:
+                print(f"⚠️ Universal write failed: {e}")
+            return
+        try:
+            sink = self._open_sink()
+            try:
+                sink.write(batch)
+            finally:
+                sink.close()
+        except Exception as e:
+            print(f"⚠️ Universal write failed: {e}")
+            # Fallback to console
+            for entry in batch[:2]:
+                print(f"[FALLBACK] {entry['timestamp']} - {entry['message'][:60]}...")
+
     def query_universal_memory(self, concept: str,
                               temporal_range: Tuple[float, float] = None,
                               quantum_filter: Dict = None) -> List[Dict]:
@@ -1051,54 +4358,76 @@ class LASERV30:
         Returns:
             List of matching log entries with quantum similarity scores
         """
+        if self.store is not None:
+            # Indexed store: newest entries first, only candidate lines are decoded
+            predicate = (lambda entry: self._quantum_filter_match(entry, quantum_filter)) if quantum_filter else None
+            try:
+                results, _ = self.store.query(concept, temporal_range, predicate=predicate, limit=100)
+            except Exception as e:
+                print(f"⚠️ Universal memory query failed: {e}")
+                results = []
+            for entry in results:
+                entry['quantum_similarity'] = self._calculate_quantum_similarity(entry)
+            return self._rank_query_results(results)
+
         results = []
 
         try:
-            # Read the universal log file
-            if not os.path.exists(self.config['log_path']):
-                return results
-
-            with open(self.config['log_path'], 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.startswith('#'):
+            for entry in self._scan_log_file(concept):
+                # Concept matching
+                if concept.lower() not in entry.get('message', '').lower():
+                    continue
+
+                # Temporal filtering
+                if temporal_range:
+                    entry_time = entry.get('universal_time', 0)
+                    start_time, end_time = temporal_range
+                    if not (start_time <= entry_time <= end_time):
                         continue
 
-                    try:
-                        entry = json.loads(line.strip())
-
-                        # Concept matching
-                        if concept.lower() not in entry.get('message', '').lower():
-                            continue
-
-                        # Temporal filtering
-                        if temporal_range:
-                            entry_time = entry.get('universal_time', 0)
-                            start_time, end_time = temporal_range
-                            if not (start_time <= entry_time <= end_time):
-                                continue
-
-                        # Quantum filtering
-                        if quantum_filter:
-                            if not self._quantum_filter_match(entry, quantum_filter):
-                                continue
-
-                        # Calculate quantum similarity
-                        similarity = self._calculate_quantum_similarity(entry)
-                        entry['quantum_similarity'] = similarity
+                # Quantum filtering
+                if quantum_filter:
+                    if not self._quantum_filter_match(entry, quantum_filter):
+                        continue
 
-                        results.append(entry)
+                # Calculate quantum similarity
+                similarity = self._calculate_quantum_similarity(entry)
+                entry['quantum_similarity'] = similarity
 
-                        # Limit for performance
-                        if len(results) >= 100:
-                            break
+                results.append(entry)
 
-                    except json.JSONDecodeError:
-                        continue
+                # Limit for performance
+                if len(results) >= 100:
+                    break
 
         except Exception as e:
             print(f"⚠️ Universal memory query failed: {e}")
 
-        # Sort by quantum similarity and recency
+        return self._rank_query_results(results)
+
+    def _scan_log_file(self, concept: str = ''):
+        """Entries of the flat log file in write order; columnar blocks without the concept are skipped"""
+        path = self.config['log_path']
+        if not os.path.exists(path):
+            return
+        if self.config['log_format'] == 'columnar':
+            needle = concept.lower()
+            for body in ColumnarLogReader(path).iter_blocks():
+                messages = decode_columnar_block(body, ('message',))
+                if any(needle in str(entry.get('message', '')).lower() for entry in messages):
+                    yield from decode_columnar_block(body)
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('#'):
+                    continue
+                try:
+                    yield json.loads(line.strip())
+                except json.JSONDecodeError:
+                    continue
+
+    def _rank_query_results(self, results: List[Dict]) -> List[Dict]:
+        """Sort by quantum similarity and recency"""
         results.sort(key=lambda x: (
             -x.get('quantum_similarity', 0),
             -x.get('universal_time', 0)
@@ -1107,6 +4436,33 @@ class LASERV30:
         self.metrics['universal_queries'] += 1
         return results[:50]  # Return top 50 results
 
+    def page_universal_memory(self, concept: str = '',
+                              temporal_range: Tuple[float, float] = None,
+                              quantum_filter: Dict = None,
+                              context_keys: List[str] = None,
+                              page_size: int = 50,
+                              cursor: Tuple[int, int] = None) -> Tuple[List[Dict], Optional[Tuple[int, int]]]:
+        """
+        Newest-first pagination over the indexed log store
+
+        Args:
+            concept: Substring to search for in messages
+            temporal_range: (start_time, end_time) in epoch seconds
+            quantum_filter: Quantum state filters (coherence_min, risk_max, etc.)
+            context_keys: Keys required in the entry's meta or system context
+            page_size: Entries per page
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            (entries, next_cursor); next_cursor is None after the oldest entry
+        """
+        if self.store is None:
+            raise ValueError("page_universal_memory needs the segmented log store (config 'log_dir')")
+        predicate = (lambda entry: self._quantum_filter_match(entry, quantum_filter)) if quantum_filter else None
+        self.metrics['universal_queries'] += 1
+        return self.store.query(concept, temporal_range, context_keys, predicate,
+                                limit=page_size, cursor=cursor)
+
     def _quantum_filter_match(self, entry: Dict, quantum_filter: Dict) -> bool:
         """Check if entry matches quantum filter criteria"""
         quantum_data = entry.get('quantum', {})
@@ -1148,8 +4504,8 @@ class LASERV30:
 
     def _universal_maintenance(self):
         """Universal maintenance with system integration"""
-        while not self._shutdown.is_set():
-            time.sleep(45)  # Run every 45 seconds
+        # Run every 45 seconds; wake on shutdown so the thread lets go of the instance
+        while not self._shutdown.wait(45):
 
             try:
                 # System health monitoring
@@ -1161,6 +4517,11 @@ class LASERV30:
                 # Quantum state maintenance
                 self._quantum_state_maintenance()
 
+                # Time-based segment rotation when logging is quiet
+                for store in (self.store, self.telemetry_store):
+                    if store is not None:
+                        store.maybe_roll()
+
                 # Export telemetry
                 if self.config['telemetry'] and self.metrics['logs_processed'] % 100 == 0:
                     self._export_universal_telemetry()
@@ -1171,11 +4532,10 @@ class LASERV30:
 
     def _monitor_system_health(self):
         """Monitor health of all integrated systems"""
-        # Memory monitoring
-        mem = psutil.virtual_memory()
-        cpu = psutil.cpu_percent(interval=0.5)
+        # Smoothed readings from the resource sampler; nothing here blocks
+        resources = self.resources.snapshot
 
-        if mem.percent > 85:
+        if resources.memory_percent > 85:
             # Reduce cache size under memory pressure
             self.cache.max_size = max(100, int(self.cache.max_size * 0.8))
 
@@ -1184,7 +4544,7 @@ class LASERV30:
                 self._universal_flush()
 
         # CPU-based backpressure
-        if cpu > 80:
+        if resources.cpu_percent > 80:
             # Increase flush thresholds to reduce CPU load
             self.config['emergency_flush_threshold'] = min(
                 0.95, self.config['emergency_flush_threshold'] * 1.1
@@ -1227,24 +4587,36 @@ class LASERV30:
 
     def _export_universal_telemetry(self):
         """Export universal telemetry"""
+        resources = self.resources.snapshot
         telemetry = {
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'universal_state': asdict(self.universal_state),
             'metrics': self.metrics_report(),
             'system_health': {
-                'memory_percent': psutil.virtual_memory().percent,
-                'cpu_percent': psutil.cpu_percent(),
+                'memory_percent': round(resources.memory_percent, 2),
+                'cpu_percent': round(resources.cpu_percent, 2),
+                'process_cpu_percent': round(resources.process_cpu_percent, 2),
+                'rss_bytes': int(resources.rss_bytes),
                 'active_threads': threading.active_count(),
                 'buffer_usage': len(self.buffer) / self.config['max_buffer'],
-                'cache_metrics': self.cache.metrics
+                'cache_metrics': self.cache.stats()
             },
             'integration_status': self.integrated_systems,
+            'latency': self.latency_report(),
             'config_snapshot': {
                 'emergency_flush_threshold': self.config['emergency_flush_threshold'],
                 'regular_flush_interval': self.config['regular_flush_interval']
             }
         }
 
+        if self.telemetry_store is not None:
+            telemetry['universal_time'] = time.time()
+            try:
+                self.telemetry_store.write([telemetry])
+            except Exception as e:
+                print(f"⚠️ Telemetry export failed: {e}")
+            return
+
         telemetry_path = self.config['log_path'].replace('.jsonl', '_telemetry.jsonl')
         try:
             with open(telemetry_path, 'a', encoding='utf-8') as f:
@@ -1269,7 +4641,10 @@ class LASERV30:
                 'entanglements_created': self.metrics['entanglements_created'],
                 'system_integrations': self.metrics['system_integrations'],
                 'universal_queries': self.metrics['universal_queries'],
-                'compression_savings': round(self.metrics['compression_savings'], 3)
+                'compression_savings': round(self.metrics['compression_savings'], 3),
+                'logs_gated': self._gate.dropped,
+                'logs_filtered': self.metrics['logs_filtered'],
+                'logs_refused': self.metrics['logs_refused']
             },
             'universal_state': {
                 'coherence': round(self.universal_state.coherence, 4),
@@ -1283,22 +4658,72 @@ class LASERV30:
                 'compressed': self.temporal.data[0] if hasattr(self.temporal.data, '__getitem__') else 0.0,
                 'quantum_phase': getattr(self.temporal, 'quantum_phase', 0.0),
                 'shadow_magnitude': self.temporal._shadow_magnitude()
-            }
+            },
+            'writer': self._writer.stats() if self._writer is not None else {'mode': 'sync'},
+            'cache': self.cache.stats()
+        }
+
+    def latency_report(self) -> Dict:
+        """Count, mean, max and tail quantiles of every histogram"""
+        return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+    def prometheus_text(self) -> str:
+        """Counters, gauges and histograms in the Prometheus text format"""
+        writer = self._writer
+        cache = self.cache.metrics
+        resources = self.resources.snapshot
+        counters = {
+            'logs_processed': (self.metrics['logs_processed'], "Entries kept by log()/log_many()"),
+            'logs_filtered': (self.metrics['logs_filtered'], "Entries rejected by the state filters"),
+            'logs_gated': (self._gate.dropped, "Entries rejected by the admission gate"),
+            'logs_refused': (self.metrics['logs_refused'], "Entries refused after shutdown started"),
+            'flushes': (self.metrics['flushes'], "Buffer flushes"),
+            'emergency_flushes': (self.metrics['emergency_flushes'], "Risk-triggered buffer flushes"),
+            'entries_written': (writer.written if writer is not None else 0, "Entries written by the writer thread"),
+            'entries_dropped': (writer.dropped if writer is not None else 0, "Entries discarded by backpressure"),
+            'write_errors': (writer.write_errors if writer is not None else 0, "Failed batch writes"),
+            'cache_hits': (cache['hits'], "Cache hits"),
+            'cache_misses': (cache['misses'], "Cache misses"),
+            'cache_evictions': (cache['evictions'], "Cache evictions"),
+        }
+        gauges = {
+            'buffer_usage': (len(self.buffer) / self.config['max_buffer'], "Fraction of the log buffer in use"),
+            'writer_queue_depth': (writer.depth if writer is not None else 0, "Items waiting for the writer thread"),
+            'cache_entries': (len(self.cache), "Cached entries"),
+            'cache_bytes': (self.cache.bytes, "Estimated bytes held by the cache"),
+            'coherence': (self.universal_state.coherence, "Universal quantum coherence"),
+            'risk': (self.universal_state.risk, "Universal risk"),
+            'consciousness': (self.universal_state.consciousness, "Universal consciousness"),
+            'cpu_percent': (resources.cpu_percent, "Smoothed system CPU utilisation"),
+            'rss_bytes': (resources.rss_bytes, "Smoothed resident set size of this process"),
         }
+        return render_prometheus(self.histograms, counters, gauges)
 
     def shutdown(self):
         """Graceful universal shutdown"""
         print("🔴 LASER v3.0 Universal shutdown initiated...")
-        self._shutdown.set()
+        # Under the lock: a log() already inside finishes first, later ones are refused
+        with self._lock:
+            self._shutdown.set()
+
+            # Final universal flush
+            if self.buffer:
+                print(f"  Flushing {len(self.buffer)} universal logs...")
+                self._universal_flush()
 
-        # Final universal flush
-        if self.buffer:
-            print(f"  Flushing {len(self.buffer)} universal logs...")
-            self._universal_flush()
+        # Drain the writer queue before anything reads the log
+        if self._writer is not None:
+            self._writer.close()
+        elif self.store is not None:
+            self.store.close()
 
         # Final telemetry
         if self.config['telemetry']:
             self._export_universal_telemetry()
+        if self.telemetry_store is not None:
+            self.telemetry_store.close()
+        self._close_telemetry_ring()
+        self._close_metrics_server()
 
         # Print final report
         metrics = self.metrics_report()
@@ -1475,6 +4900,11 @@ def demonstrate_universal_laser():
 # ============================================================
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ['convert']:
+        sys.exit(convert_log_main(sys.argv[2:]))
+    if sys.argv[1:2] == ['watch']:
+        sys.exit(watch_telemetry_main(sys.argv[2:]))
+
     print("\n" + "=" * 80)
     print("LASER v3.0 - UNIVERSAL QUANTUM-TEMPORAL INTEGRATION")
     print("=" * 80)
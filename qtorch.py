@@ -55,7 +55,7 @@ except ImportError as e:
 
 # Import LASER (universal logging) - INTEGRATED
 try:
-    from laser import LASER, UniversalQuantumState
+    from laser import LASER, UniversalQuantumState, DEBUG
     LASER_AVAILABLE = True
     print("✅ LASER v3.0 integrated for universal quantum logging")
 except ImportError as e:
@@ -147,7 +147,7 @@ class Tensor:
             LASER.log(self.quantum_coherence, f"Tensor created: shape={self.shape}",
                      {'device': device, 'requires_grad': requires_grad,
                       'quantum_phase': self.quantum_phase,
-                      'quantum_creativity': self.quantum_creativity})
+                      'quantum_creativity': self.quantum_creativity}, level=DEBUG)
 
     # ==================== CORE PROPERTIES ====================
     @property
@@ -199,7 +199,7 @@ class Tensor:
                 LASER.metrics['entanglements_created'] += 1
                 LASER.log(self.quantum_coherence, "Quantum entanglement created",
                          {'tensor_ids': [id(self), id(other)],
-                          'local_creativity': self.quantum_creativity})
+                          'local_creativity': self.quantum_creativity}, level=DEBUG)
 
             return True
         return False
@@ -243,7 +243,7 @@ class Tensor:
                          {'original_size': len(self._bumpy.data),
                           'compressed_size': len(compressed.data),
                           'compression_ratio': f"{compression_ratio:.1%}",
-                          'local_creativity': self.quantum_creativity})
+                          'local_creativity': self.quantum_creativity}, level=DEBUG)
             return result
         return self
 
@@ -424,7 +424,7 @@ class Tensor:
         if isinstance(index, int):
             old_value = self._bumpy.data[index]
             if isinstance(value, Tensor):
-                new_value = value._bumpy.data[0] if value._bumpy.data else 0.0
+                new_value = value._bumpy.data[0] if len(value._bumpy.data) else 0.0
             else:
                 new_value = float(value)
 
@@ -440,7 +440,7 @@ class Tensor:
             if (0 <= row < self.shape[0]) and (0 <= col < self.shape[1]):
                 idx = row * self.shape[1] + col
                 if isinstance(value, Tensor):
-                    self._bumpy.data[idx] = value._bumpy.data[0] if value._bumpy.data else 0.0
+                    self._bumpy.data[idx] = value._bumpy.data[0] if len(value._bumpy.data) else 0.0
                 else:
                     self._bumpy.data[idx] = float(value)
             else:
@@ -947,7 +947,7 @@ class Tensor:
         """Get scalar value"""
         if self.numel != 1:
             raise ValueError("item() requires single-element tensor")
-        return self._bumpy.data[0]
+        return float(self._bumpy.data[0])
 
     # ==================== DEBUGGED STRING REPRESENTATION ====================
     def __repr__(self):
@@ -1146,7 +1146,7 @@ class Module:
 
         if LASER_AVAILABLE:
             LASER.log(1.0, f"Module initialized: {type(self).__name__}",
-                     {'quantum_creativity': Tensor._global_quantum_creativity})
+                     {'quantum_creativity': Tensor._global_quantum_creativity}, level=DEBUG)
 
     def register_parameter(self, name, param):
         self._parameters[name] = param
@@ -1311,7 +1311,7 @@ class Linear(Module):
         if LASER_AVAILABLE:
             LASER.log(output.mean().item(), "Linear forward pass",
                      {'in_features': self.in_features, 'out_features': self.out_features,
-                      'quantum_enhanced': self.quantum_enhanced})
+                      'quantum_enhanced': self.quantum_enhanced}, level=DEBUG)
 
         return output
 
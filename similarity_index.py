@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+similarity_index.py - Candidate pairs for the entanglement rituals
+==================================================================
+
+Shared by bumpy.EntanglementCandidateIndex and flumpy.EntanglementIndex. Both
+look for row pairs whose cosine-based score exceeds a threshold:
+
+- gram_pairs: blocked score matrix, exact, O(n^2 d) vectorized.
+- SimHashLSH: random-hyperplane (SimHash) tables over unit rows, followed by
+              the caller's exact check. Approximate (recall < 1), sub-quadratic.
+
+Requires NumPy; callers check NUMPY_AVAILABLE before building an index.
+"""
+
+import math
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+GRAM_BLOCK_CELLS = 1 << 22  # float64 cells per score block (~32 MB)
+VERIFY_CHUNK = 1 << 18      # Colliding pairs scored per exact check
+
+
+def unit_rows(mat):
+    """Rows scaled to unit length; zero rows stay zero (and never score)"""
+    norms = np.sqrt(np.einsum('ij,ij->i', mat, mat))
+    unit = np.zeros_like(mat)
+    live = norms > 0
+    unit[live] = mat[live] / norms[live, None]
+    return unit
+
+
+def gram_pairs(n_left: int, n_right: int, scores: Callable, threshold: float,
+               same: bool, block_rows: int):
+    """
+    Yield (left rows, right rows, scores) above `threshold`, one row block at a
+    time. `scores(start, stop)` returns the block for left rows start:stop
+    against every right row; with `same` only the strict upper triangle counts.
+    """
+    # Bound each block regardless of how many columns it spans
+    rows = max(1, min(block_rows, GRAM_BLOCK_CELLS // max(1, n_right)))
+    for start in range(0, n_left, rows):
+        stop = min(n_left, start + rows)
+        block = scores(start, stop)
+        if same:
+            block[np.arange(n_right)[None, :] <= np.arange(start, stop)[:, None]] = -np.inf
+        bl, br = np.nonzero(block > threshold)
+        yield bl + start, br, block[bl, br]
+
+
+def within_bucket_pairs(keys):
+    """All (a, b), a < b, sharing a bucket id; vectorized over every bucket at once"""
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    n = len(order)
+    run_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    run_ends = np.r_[run_starts[1:], n]
+    # Each sorted position p pairs with every later position in its run
+    ends = np.repeat(run_ends, run_ends - run_starts)
+    counts = ends - np.arange(n) - 1
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    first = np.repeat(np.arange(n), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    a, b = order[first], order[first + 1 + offsets]
+    return np.minimum(a, b), np.maximum(a, b)
+
+
+def cross_bucket_pairs(keys_left, keys_right):
+    """All (a, b) with keys_left[a] == keys_right[b]"""
+    order_right = np.argsort(keys_right, kind='stable')
+    sorted_right = keys_right[order_right]
+    lo = np.searchsorted(sorted_right, keys_left, side='left')
+    hi = np.searchsorted(sorted_right, keys_left, side='right')
+    counts = hi - lo
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    li = np.repeat(np.arange(len(keys_left)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    ri = order_right[np.repeat(lo, counts) + offsets]
+    return li, ri
+
+
+class SimHashLSH:
+    """
+    Banded random-hyperplane hashing of unit rows.
+
+    Hash bits default to log2(n) - `bits_slack`, clamped to `bits_range`, so the
+    expected collisions per row stay roughly constant as n grows. With `fold`,
+    a bucket id is merged with its complement so anti-parallel rows collide
+    (for |cos| criteria).
+    """
+
+    def __init__(self, tables: int, seed: int, hash_bits: Optional[int] = None,
+                 bits_range: Tuple[int, int] = (8, 24), bits_slack: int = 1, fold: bool = False):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("SimHashLSH requires numpy")
+        self.tables = tables
+        self.hash_bits = hash_bits
+        self.bits_range = bits_range
+        self.bits_slack = bits_slack
+        self.fold = fold
+        # Private generator: hashing must never consume the global `random` stream
+        self._rng = np.random.default_rng(seed)
+        self._planes: Dict[Tuple[int, int], Any] = {}
+
+    def bits_for(self, n: int) -> int:
+        lo, hi = self.bits_range
+        return self.hash_bits or max(lo, min(hi, int(math.log2(max(n, 1))) - self.bits_slack))
+
+    def bucket_keys(self, unit, table: int, hash_bits: int):
+        """Bucket id per row for one table"""
+        shape_key = (unit.shape[1], hash_bits)
+        planes = self._planes.get(shape_key)
+        if planes is None:
+            planes = self._rng.standard_normal((self.tables, shape_key[0], hash_bits))
+            self._planes[shape_key] = planes
+        keys = ((unit @ planes[table]) > 0).astype(np.int64) @ (1 << np.arange(hash_bits, dtype=np.int64))
+        if self.fold:
+            keys = np.minimum(keys, keys ^ ((1 << hash_bits) - 1))
+        return keys
+
+    def pairs(self, left, right, same: bool, verify: Callable):
+        """
+        Unique (left rows, right rows) that collide in some table and pass
+        `verify(left rows, right rows) -> mask`, sorted by (left, right)
+        """
+        n_right = right.shape[0]
+        hash_bits = self.bits_for(max(left.shape[0], n_right))
+        passed = []
+        for t in range(self.tables):
+            keys_left = self.bucket_keys(left, t, hash_bits)
+            if same:
+                li, ri = within_bucket_pairs(keys_left)
+            else:
+                li, ri = cross_bucket_pairs(keys_left, self.bucket_keys(right, t, hash_bits))
+            # Verify collisions table by table so only true neighbours are retained
+            for start in range(0, len(li), VERIFY_CHUNK):
+                cl, cr = li[start:start + VERIFY_CHUNK], ri[start:start + VERIFY_CHUNK]
+                keep = verify(cl, cr)
+                passed.append(cl[keep] * n_right + cr[keep])
+        codes = np.unique(np.concatenate(passed)) if passed else np.empty(0, dtype=np.int64)
+        return np.divmod(codes, n_right)
@@ -0,0 +1,126 @@
+import sys
+import os
+import io
+import json
+import unittest
+import random
+from contextlib import redirect_stdout
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import BumpyArray, BUMPYCore
+
+
+def _run_workload(backend):
+    """Seeded BumpyArray workload; returns every observable result as plain floats."""
+    bumpy.set_backend(backend)
+    random.seed("LATERALUS_PHI")
+    out = []
+
+    a = BumpyArray([0.5, -1.25, 2.0, 0.0, 3.5, -0.75, 1.0, 0.25])
+    b = BumpyArray([1.5, 0.25, -0.5, 2.0, 0.125, 1.0, -2.0, 0.5], coherence=0.7)
+
+    s = a + b
+    s2 = a + 2
+    p = a * b
+    p2 = b * 0.5
+    out += list(s.data) + list(s2.data) + list(p.data) + list(p2.data)
+    out += [a.dot(b), a.lambda_kernel(b), s.coherence, p.coherence]
+
+    c = BumpyArray(a.data, coherence=0.6)
+    c += b
+    c *= 3
+    out += list(c.data) + [c.coherence]
+
+    out += list(a.relu().data)
+    b.resonance_guidance = [0.1 * i for i in range(len(b.data))]
+    out += list(b.relu().data)
+
+    for _ in range(30):
+        sm = BumpyArray([random.uniform(-2, 2) for _ in range(6)], coherence=0.5).softmax()
+        out += list(sm.data)
+
+    out += [a.coherence_entropy(), b.coherence_entropy(), BumpyArray([0.0, 0.0]).coherence_entropy()]
+    out += [a[2], b[5]]
+
+    m = BumpyArray([0.9, -0.8, 0.1, 0.0, -0.95, 0.5])
+    m.quantum_measure()
+    out += list(m.data) + [m.coherence]
+
+    comp = a.holographic_compress()
+    out += list(comp.data) + list(comp.holographic_decompress(8).data)
+
+    core = BUMPYCore()
+    core.qualia_emergence_ritual([a, b, s, p])
+    out += [core.quantum_chaos_level] + [x.coherence for x in (a, b, s, p)]
+    out += [random.random()]  # RNG stream position must match
+    return [float(x) for x in out]
+
+
+def _run_qtorch_workload(backend):
+    """Seeded qtorch Tensor workload on top of BumpyArray; results as JSON-safe lists"""
+    bumpy.set_backend(backend)
+    random.seed("LATERALUS_PHI")
+    with redirect_stdout(io.StringIO()):
+        import qtorch
+        t = qtorch.Tensor([0.5, -1.0, 2.0, 0.25])
+        u = qtorch.Tensor([1.0, 0.5, -0.5, 2.0])
+        t[0] = u[1]
+        t[3] = qtorch.Tensor([4.0, 5.0])  # Multi-element value: its first element is taken
+        m = qtorch.Tensor([1.0, 2.0, 3.0, 4.0]).reshape(2, 2)
+        m[0, 1] = qtorch.Tensor([7.0])
+        results = [t + u, t * u, t - u, t ** 2, -t, t.relu(), t.sigmoid(), t.softmax(), m @ m, t[1:3]]
+        out = [t._bumpy.tolist()] + [r._bumpy.tolist() for r in results] + [t[2].item(), repr(t)]
+    return json.loads(json.dumps(out))
+
+
+class TestBumpyBackends(unittest.TestCase):
+    def tearDown(self):
+        bumpy.set_backend('python')
+
+    def test_default_backend_is_reference(self):
+        self.assertEqual(bumpy.get_backend(), 'python')
+        self.assertIsInstance(BumpyArray([1, 2, 3]).data, list)
+
+    def test_unknown_backend_rejected(self):
+        with self.assertRaises(ValueError):
+            bumpy.set_backend('fortran')
+
+    @unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+    def test_numpy_storage(self):
+        import numpy as np
+        bumpy.set_backend('numpy')
+        arr = BumpyArray([1, 2, 3])
+        self.assertIsInstance(arr.data, np.ndarray)
+        self.assertEqual(arr.shape, (3,))
+
+    @unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+    def test_cross_backend_parity(self):
+        """The numpy backend must reproduce the reference results under the same seed."""
+        reference = _run_workload('python')
+        vectorized = _run_workload('numpy')
+        self.assertEqual(len(reference), len(vectorized))
+        for i, (r, v) in enumerate(zip(reference, vectorized)):
+            self.assertAlmostEqual(r, v, places=9, msg=f"divergence at observable {i}")
+
+    @unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+    def test_qtorch_parity(self):
+        """qtorch runs unchanged on the numpy backend and serialises through tolist()"""
+        reference = _run_qtorch_workload('python')
+        self.assertEqual(_run_qtorch_workload('numpy'), reference)
+        self.assertEqual(reference[0][3], 4.0)
+
+    @unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+    def test_mixed_storage_after_switch(self):
+        """Arrays created before a backend switch keep working afterwards."""
+        legacy = BumpyArray([1.0, 2.0, 3.0])
+        bumpy.set_backend('numpy')
+        legacy += BumpyArray([1.0, 1.0, 1.0])
+        self.assertEqual(len(legacy.data), 3)
+        self.assertGreater(legacy.data[0], 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
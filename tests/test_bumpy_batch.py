@@ -0,0 +1,91 @@
+import sys
+import os
+import unittest
+import random
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import BumpyArray, BumpyBatch, BUMPYCore
+
+
+def _arrays(seed, n=8, width=6):
+    random.seed(seed)
+    return [BumpyArray([random.uniform(-1, 1) for _ in range(width)], coherence=random.uniform(0.6, 1.0))
+            for _ in range(n)]
+
+
+class TestBumpyBatch(unittest.TestCase):
+    def tearDown(self):
+        bumpy.set_backend('python')
+
+    def _check_matches_per_array(self):
+        left, right = _arrays("LATERALUS_PHI"), _arrays("SOPHIA")
+        a, b = BumpyBatch.from_arrays(left), BumpyBatch.from_arrays(right)
+        summed = a + b
+        expected = [x + y for x, y in zip(left, right)]
+        for i, ref in enumerate(expected):
+            for got, want in zip(summed.tolist()[i], ref.data):
+                self.assertAlmostEqual(got, want, places=12)
+            self.assertAlmostEqual(summed[i].coherence, ref.coherence, places=12)
+            # Both operands received the same entanglement boosts
+            self.assertAlmostEqual(a[i].coherence, left[i].coherence, places=12)
+            self.assertAlmostEqual(b[i].coherence, right[i].coherence, places=12)
+        for got, (x, y) in zip(a.dot(b), zip(left, right)):
+            self.assertAlmostEqual(got, x.dot(y), places=12)
+
+    def test_batched_ops_match_per_array(self):
+        self._check_matches_per_array()
+
+    @unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+    def test_batched_ops_match_per_array_numpy(self):
+        bumpy.set_backend('numpy')
+        self._check_matches_per_array()
+
+    def test_rows_share_storage(self):
+        batch = BumpyBatch([[1.0, 2.0], [3.0, 4.0]])
+        row = batch[1]
+        row += BumpyArray([10.0, 10.0])
+        self.assertGreater(batch.tolist()[1][0], 13.0)
+        row.coherence = 0.5
+        self.assertEqual(batch.coherence[1], 0.5)
+        self.assertIs(batch[1], row)
+        with self.assertRaises(ValueError):
+            row.resize(3)
+        self.assertEqual(batch.norm()[0], 5 ** 0.5)
+
+    def test_row_views_share_batch_storage(self):
+        for backend in ('python', 'numpy') if bumpy.NUMPY_AVAILABLE else ('python',):
+            bumpy.set_backend(backend)
+            batch = BumpyBatch([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+            row = batch[1]
+            view = row.view()
+            view[0] = 40.0
+            self.assertEqual(row.as_memoryview().tolist(), [40.0, 5.0, 6.0])
+            self.assertEqual(batch.tolist()[1], [40.0, 5.0, 6.0], backend)
+            self.assertFalse(view.detached)
+
+    def test_quantum_measure_matches_row_loop(self):
+        rows = [[random.uniform(-1, 1) for _ in range(5)] for _ in range(4)]
+        random.seed(3)
+        batch = BumpyBatch(rows).quantum_measure()
+        random.seed(3)
+        singles = [BumpyArray(r) for r in rows]
+        for arr in singles:
+            arr.quantum_measure()
+        self.assertEqual(batch.tolist(), [list(arr.data) for arr in singles])
+
+    def test_batch_coherence_compression(self):
+        batch = BumpyBatch([[float(i + r) for i in range(20)] for r in range(3)])
+        core = BUMPYCore()
+        compressed = core.coherence_compress_batch(batch)
+        self.assertEqual(compressed.tolist(), [core.coherence_compress(list(row.data)) for row in batch])
+
+    def test_ragged_rows_rejected(self):
+        with self.assertRaises(ValueError):
+            BumpyBatch([[1.0, 2.0], [3.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
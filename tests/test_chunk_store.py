@@ -0,0 +1,76 @@
+import sys
+import os
+import gc
+import unittest
+import random
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import BUMPYCore, CoherenceChunkStore
+
+
+class TestCoherenceChunkStore(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.state = [random.uniform(-1, 1) for _ in range(1000)]
+
+    def test_identical_states_share_chunks(self):
+        store = CoherenceChunkStore(chunk_floats=100)
+        handles = [store.put(self.state) for _ in range(10)]
+        stats = store.stats()
+        self.assertEqual(stats['chunks'], 10)
+        self.assertAlmostEqual(stats['dedup_ratio'], 10.0)
+        self.assertGreaterEqual(stats['bytes_saved'], 8 * 1000 * 9)
+        self.assertEqual(handles[3].tolist(), self.state)
+
+    def test_partial_overlap_dedups_matching_chunks(self):
+        store = CoherenceChunkStore(chunk_floats=100)
+        a = store.put(self.state)
+        b = store.put(self.state[:500] + [0.0] * 500)
+        self.assertEqual(len(store), 10 + 1)  # Five zero chunks collapse into one
+        self.assertEqual(b[499], self.state[499])
+        self.assertEqual(b[-1], 0.0)
+        self.assertEqual(a[250:253], self.state[250:253])
+
+    def test_lazy_access_inflates_single_chunk(self):
+        store = CoherenceChunkStore(chunk_floats=100)
+        handle = store.put(self.state)
+        self.assertEqual(handle[742], self.state[742])
+        self.assertEqual(store.stats()['inflated_cache']['entries'], 1)
+
+    def test_release_frees_unreferenced_chunks(self):
+        store = CoherenceChunkStore(chunk_floats=100)
+        keep = store.put(self.state)
+        drop = store.put(self.state[::-1])
+        drop.release()
+        drop.release()  # Idempotent
+        self.assertEqual(len(store), 10)
+        del keep
+        gc.collect()
+        stats = store.stats()
+        self.assertEqual((stats['chunks'], stats['logical_bytes'], stats['stored_bytes']), (0, 0, 0))
+
+    def test_core_routes_compression_through_store(self):
+        core = BUMPYCore()
+        handles = [core.coherence_compress_stored(self.state) for _ in range(3)]
+        self.assertEqual(handles[0].tolist(), core.coherence_compress(self.state))
+        # Three handles plus the state the core remembers for coherence_compress()
+        self.assertAlmostEqual(core.compression_stats()['dedup_ratio'], 4.0)
+        handles[0].release()
+        self.assertAlmostEqual(core.compression_stats()['dedup_ratio'], 3.0)
+
+    def test_repeated_states_are_compressed_once(self):
+        core = BUMPYCore()
+        first = core.coherence_compress(self.state)
+        with mock.patch.object(bumpy.HolographicCompressor, 'project_to_boundary') as project:
+            again = [core.coherence_compress(list(self.state)) for _ in range(5)]
+        project.assert_not_called()
+        self.assertTrue(all(state == first for state in again))
+        self.assertEqual(core.compression_stats()['logical_bytes'], 8 * len(first))
+
+
+if __name__ == '__main__':
+    unittest.main()
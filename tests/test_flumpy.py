@@ -0,0 +1,467 @@
+import sys
+import os
+import threading
+import unittest
+import math
+import random
+from array import array
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flumpy
+from flumpy import FlumpyArray, FlumpyUtilities, FlumpyCore
+
+np = flumpy.np  # None without numpy; those tests are skipped
+
+
+def _arrays(seed, n=25, dim=12):
+    random.seed(seed)
+    return [FlumpyArray([random.uniform(-1, 1) for _ in range(dim)], coherence=0.8) for _ in range(n)]
+
+
+class TestFlumpyArrayStorage(unittest.TestCase):
+    def test_slots_and_typed_storage(self):
+        arr = FlumpyArray([1, 2, "3.5"])
+        self.assertIsInstance(arr.data, array)
+        self.assertEqual(arr.data.typecode, 'd')
+        self.assertEqual(arr.to_list(), [1.0, 2.0, 3.5])
+        self.assertFalse(hasattr(arr, '__dict__'))
+        with self.assertRaises(AttributeError):
+            arr.undeclared = 1
+
+    def test_seeded_construction_stream_unchanged(self):
+        random.seed(11)
+        arr = FlumpyArray([0.5, 0.25])
+        random.seed(11)
+        chaos = random.uniform(flumpy.CHAOS_BASE, flumpy.CHAOS_BASE * 2)
+        phase = random.uniform(0, 2 * 3.141592653589793)
+        self.assertEqual((arr.chaos, arr.phase), (chaos, phase))
+
+
+class TestSimilarityMatrix(unittest.TestCase):
+    def _check(self, matrix, arrays):
+        for i, a in enumerate(arrays):
+            for j, b in enumerate(arrays):
+                self.assertAlmostEqual(matrix[i][j], a.similarity_kernel(b), places=12)
+
+    def test_matches_scalar_kernel(self):
+        arrays = _arrays("LATERALUS_PHI")
+        arrays.append(FlumpyArray([0.0] * 12))  # Zero norm row
+        self._check(FlumpyUtilities.similarity_matrix(arrays), arrays)
+
+    def test_reference_path_matches_scalar_kernel(self):
+        arrays = _arrays("SOPHIA", n=10)
+        with mock.patch.object(flumpy, 'NUMPY_AVAILABLE', False):
+            matrix = FlumpyUtilities.similarity_matrix(arrays)
+        self.assertIsInstance(matrix, list)
+        self._check(matrix, arrays)
+
+    def test_blocked_rows(self):
+        arrays = _arrays("BLOCKS", n=9, dim=4)
+        with mock.patch.object(flumpy, 'SIMILARITY_BLOCK_ROWS', 4):
+            self._check(FlumpyUtilities.similarity_matrix(arrays), arrays)
+
+    def test_shape_mismatch_rejected(self):
+        with self.assertRaises(ValueError):
+            FlumpyUtilities.similarity_matrix([FlumpyArray([1.0, 2.0]), FlumpyArray([1.0])])
+
+
+def _clustered(seed, n=150, dim=8):
+    random.seed(seed)
+    centers = [[random.gauss(0, 1) for _ in range(dim)] for _ in range(n // 10)]
+    arrays = []
+    for i in range(n):
+        arr = FlumpyArray([x + random.gauss(0, 0.3) for x in centers[i % len(centers)]], coherence=0.8)
+        arr.phase = 0.1 * (i % 3)
+        arrays.append(arr)
+    return arrays
+
+
+@unittest.skipUnless(flumpy.NUMPY_AVAILABLE, "numpy not installed")
+class TestBulkEntangle(unittest.TestCase):
+    def test_gram_edges_are_exact(self):
+        arrays = _clustered("LATERALUS_PHI")
+        ii, jj, sims = flumpy.EntanglementIndex().candidate_edges(arrays, 0.75, 'gram')
+        expected = {(i, j) for i in range(len(arrays)) for j in range(i + 1, len(arrays))
+                    if arrays[i].similarity_kernel(arrays[j]) > 0.75}
+        self.assertEqual(set(zip(ii, jj)), expected)
+        for i, j, sim in zip(ii, jj, sims):
+            self.assertAlmostEqual(sim, arrays[i].similarity_kernel(arrays[j]), places=12)
+
+    def test_lsh_edges_are_verified_subset(self):
+        arrays = _clustered("SOPHIA")
+        index = flumpy.EntanglementIndex()
+        gram = set(zip(*index.candidate_edges(arrays, 0.75, 'gram')[:2]))
+        lsh = set(zip(*index.candidate_edges(arrays, 0.75, 'lsh')[:2]))
+        self.assertTrue(lsh <= gram)
+        self.assertGreater(len(lsh) / len(gram), 0.8)
+
+    def test_single_edge_matches_entangle(self):
+        a, b = FlumpyArray([1.0, 2.0, 3.0], 0.8), FlumpyArray([1.1, 2.0, 2.9], 0.7)
+        a.phase, b.phase = 0.2, 0.4
+        c, d = a.copy(), b.copy()
+        self.assertTrue(c.entangle(d))
+        FlumpyUtilities._apply_edges([a, b], [0], [1], [a.similarity_kernel(b)], 4)
+        self.assertEqual(a.entangled_with, [b])
+        self.assertAlmostEqual(a.coherence, c.coherence, places=12)
+        self.assertAlmostEqual(b.phase, d.phase, places=12)
+
+    def test_degree_cap_and_stats(self):
+        arrays = [FlumpyArray([1.0, 0.5 + 0.001 * i], 0.9) for i in range(100)]
+        for arr in arrays:
+            arr.phase = 0.0
+        stats = FlumpyUtilities.bulk_entangle(arrays, max_degree=5, mode='gram')
+        self.assertLessEqual(max(len(arr.entangled_with) for arr in arrays), 5)
+        self.assertEqual(stats['edges'], sum(len(arr.entangled_with) for arr in arrays) // 2)
+        self.assertEqual(stats['scored_pairs'], 100 * 99 // 2)  # Gram scores every pair
+        self.assertGreater(stats['scored_per_s'], 0)
+        self.assertEqual(stats['all_pairs_per_s'], stats['scored_per_s'])
+
+    def test_lsh_reports_pairs_actually_scored(self):
+        arrays = _clustered("LSH_RATE", n=3000)
+        stats = FlumpyUtilities.bulk_entangle(arrays, mode='lsh')
+        self.assertGreater(stats['scored_pairs'], 0)
+        self.assertLess(stats['scored_pairs'], 3000 * 2999 // 2)
+        self.assertLess(stats['scored_per_s'], stats['all_pairs_per_s'])
+
+    def test_mixed_lengths_skipped_at_threshold(self):
+        limit = flumpy.ENTANGLE_SEQUENTIAL_MAX
+        for n in (limit, limit + 1):
+            for mode in ('auto', 'sequential', 'gram'):
+                arrays = [FlumpyArray([1.0, 0.5] + [0.5] * (i % 2), 0.9) for i in range(n)]
+                for arr in arrays:
+                    arr.phase = 0.0
+                FlumpyUtilities.bulk_entangle(arrays, max_degree=4, mode=mode)
+                for arr in arrays:
+                    self.assertTrue(arr.entangled_with, (n, mode))
+                    self.assertTrue(all(len(o.data) == len(arr.data) for o in arr.entangled_with))
+
+    def test_core_ritual_modes(self):
+        small = FlumpyCore()
+        for arr in _clustered("TINY", n=10):
+            small.arrays[f"a{len(small.arrays)}"] = arr
+        small.global_entanglement_ritual()
+        self.assertEqual(small.last_ritual_stats['mode'], 'sequential')
+        self.assertEqual(small.last_ritual_stats['candidate_pairs'], 45)
+
+        core = FlumpyCore()
+        for arr in _clustered("BIG"):
+            core.arrays[f"a{len(core.arrays)}"] = arr
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        pairs = core.global_entanglement_ritual()
+        self.assertEqual(random.random(), expected)  # Hashing leaves the global stream alone
+        self.assertEqual(core.last_ritual_stats['mode'], 'gram')
+        self.assertEqual(pairs, core.last_ritual_stats['entangled_pairs'])
+
+
+class TestArrayRegistry(unittest.TestCase):
+    def _populated_core(self):
+        random.seed("LATERALUS_PHI")
+        core = FlumpyCore()
+        for _ in range(40):
+            core.create_array([random.uniform(-1, 1) for _ in range(6)], coherence=random.uniform(0.5, 1.0))
+        return core
+
+    def _assert_status_matches_scan(self, core):
+        status = core.get_system_status()
+        arrays = list(core.arrays.values())
+        self.assertEqual(status["total_elements"], sum(len(a.data) for a in arrays))
+        self.assertEqual(status["total_entanglements"], sum(len(a.entangled_with) for a in arrays))
+        if arrays:
+            self.assertAlmostEqual(status["avg_coherence"], sum(a.coherence for a in arrays) / len(arrays), places=12)
+            self.assertAlmostEqual(status["avg_chaos"], sum(a.chaos for a in arrays) / len(arrays), places=12)
+
+    def test_aggregates_follow_mutations(self):
+        core = self._populated_core()
+        core.global_entanglement_ritual(0.2)
+        core.apply_global_chaos(0.1)
+        core.dampen_global_chaos()
+        core.arrays["array_3"] += 1.0
+        core.arrays["array_5"][0] = 2.0
+        self._assert_status_matches_scan(core)
+        self.assertNotIn("array_names", core.get_system_status(include_names=False))
+
+    def test_status_summary_never_settles(self):
+        core = self._populated_core()
+        core.apply_global_chaos(0.1)
+        with mock.patch.object(FlumpyArray, '_settle_chaos') as settle:
+            summary = core.status_summary()
+        self.assertEqual(settle.call_count, 0)
+        self.assertEqual((summary["total_arrays"], summary["pending_chaos_rounds"]), (40, 1))
+        self.assertNotIn("avg_coherence", summary)
+
+        status = core.get_system_status(include_names=False)
+        summary = core.status_summary()
+        self.assertEqual(summary["pending_chaos_rounds"], 0)
+        self.assertEqual(summary["avg_coherence"], status["avg_coherence"])
+
+    def test_removal_touches_only_neighbours(self):
+        core = self._populated_core()
+        core.global_entanglement_ritual(0.2)
+        doomed = core.get_array("array_0")
+        neighbours = list(doomed.entangled_with)
+        bystander = next(a for a in core.arrays.values() if a is not doomed and a not in neighbours)
+        before = bystander.coherence
+        self.assertTrue(core.remove_array("array_0"))
+        self.assertEqual(bystander.coherence, before)
+        self.assertTrue(all(doomed not in n.entangled_with for n in neighbours))
+        self._assert_status_matches_scan(core)
+
+        for name in list(core.arrays):
+            core.remove_array(name)
+        status = core.get_system_status()
+        self.assertEqual((status["total_arrays"], status["total_entanglements"], status["avg_coherence"]), (0, 0, 0.0))
+
+
+class TestConcurrentRegistry(unittest.TestCase):
+    THREADS = 32
+
+    def setUp(self):
+        self._interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Force interleavings inside read-modify-write paths
+
+    def tearDown(self):
+        sys.setswitchinterval(self._interval)
+
+    def _run(self, worker):
+        barrier = threading.Barrier(self.THREADS)
+        errors = []
+
+        def target(tid):
+            barrier.wait()
+            try:
+                worker(tid)
+            except Exception as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=target, args=(t,)) for t in range(self.THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+    def test_no_lost_registrations(self):
+        core = FlumpyCore()
+        per_thread = 150
+
+        def producer(tid):
+            names = [core.create_array([float(tid), float(i)]) for i in range(per_thread)]
+            for name in names:
+                self.assertIsNotNone(core.get_array(name))
+            for name in names[::3]:
+                self.assertTrue(core.remove_array(name))
+            core.arrays.register_many((f"t{tid}_{i}", FlumpyArray([1.0])) for i in range(20))
+            self.assertEqual(len(core.arrays.remove_many(f"t{tid}_{i}" for i in range(10))), 10)
+
+        self._run(producer)
+        expected = self.THREADS * (per_thread - len(range(0, per_thread, 3)) + 10)
+        names = list(core.arrays)
+        self.assertEqual(len(names), expected)
+        self.assertEqual(len(set(names)), expected)
+        self.assertEqual(core.array_counter, self.THREADS * per_thread)
+
+        status = core.get_system_status(include_names=False)
+        arrays = core.arrays.values()
+        self.assertEqual(status["total_arrays"], expected)
+        self.assertEqual(status["total_elements"], sum(len(a.data) for a in arrays))
+        self.assertAlmostEqual(status["avg_coherence"], sum(a.coherence for a in arrays) / expected, places=9)
+        self.assertAlmostEqual(status["avg_chaos"], sum(a.chaos for a in arrays) / expected, places=9)
+
+    def test_bulk_updates_are_not_lost(self):
+        core = FlumpyCore()
+        core.create_arrays([[0.0, 0.0]] * 200, coherence=0.0)
+        rounds = 5
+
+        def bump(array):
+            array.coherence += 1.0
+            array.data[0] += 1.0
+
+        def writer(tid):
+            for _ in range(rounds):
+                core.arrays.apply(bump)
+                core.dampen_global_chaos()
+
+        self._run(writer)
+        total = float(self.THREADS * rounds)
+        for array in core.arrays.values():
+            self.assertEqual(array.data[0], total)
+        status = core.get_system_status(include_names=False)
+        self.assertAlmostEqual(status["avg_coherence"], sum(a.coherence for a in core.arrays.values()) / 200, places=9)
+
+    def test_arrays_shared_between_registries(self):
+        first, second = flumpy.ArrayRegistry(shards=4), flumpy.ArrayRegistry(shards=4)
+        arrays = [FlumpyArray([0.0], 0.0) for _ in range(64)]
+        first.register_many((f"a{i}", arr) for i, arr in enumerate(arrays))
+        second.register_many((f"b{i}", arr) for i, arr in enumerate(reversed(arrays)))
+        rounds = 20
+
+        def bump(array):
+            array.coherence += 1.0
+            array.chaos += 1.0
+
+        def writer(tid):
+            registry = first if tid % 2 else second
+            for _ in range(rounds):
+                registry.apply(bump)
+
+        worker = threading.Thread(target=self._run, args=(writer,), daemon=True)
+        worker.start()
+        worker.join(timeout=60)
+        self.assertFalse(worker.is_alive(), "registries sharing arrays deadlocked")
+        total = float(self.THREADS * rounds)
+        for registry in (first, second):
+            self.assertTrue(all(arr.coherence == total for arr in arrays))
+            self.assertAlmostEqual(registry.coherence_sum, total * len(arrays), places=6)
+            self.assertAlmostEqual(registry.chaos_sum, sum(arr.chaos for arr in arrays), places=6)
+
+    def test_snapshot_iteration_under_concurrent_writes(self):
+        core = FlumpyCore()
+        base = set(core.create_arrays([[1.0, 2.0]] * 50))
+        stop = threading.Event()
+
+        def churn(tid):
+            if tid % 2:
+                while not stop.is_set():
+                    name = core.create_array([3.0, 4.0])
+                    core.remove_array(name)
+            else:
+                for _ in range(20):
+                    names = {name for name, _ in core.arrays.snapshot()}
+                    self.assertTrue(base <= names)
+                    core.apply_global_chaos(0.01)
+                stop.set()
+
+        self._run(churn)
+        self.assertEqual(len(core.arrays), 50)
+
+
+@unittest.skipUnless(flumpy.NUMPY_AVAILABLE, "numpy not installed")
+class TestSignalKernels(unittest.TestCase):
+    SIZES = [(1, 1), (2, 5), (4, 7), (8, 3), (13, 13), (64, 9), (100, 33), (300, 150)]
+
+    def _pair(self, n, m):
+        rng = np.random.default_rng(n * 1000 + m)
+        return rng.standard_normal(n), rng.standard_normal(m)
+
+    def _check(self, use_numpy):
+        with mock.patch.object(flumpy, 'NUMPY_AVAILABLE', use_numpy):
+            for n, m in self.SIZES:
+                a, v = self._pair(n, m)
+                fa, fv = FlumpyArray(a), FlumpyArray(v)
+                for mode in ('full', 'same', 'valid'):
+                    for method in ('direct', 'fft', 'auto'):
+                        conv = fa.convolve(fv, mode, method).data
+                        corr = fa.correlate(fv, mode, method).data
+                        np.testing.assert_allclose(conv, np.convolve(a, v, mode), atol=1e-10)
+                        np.testing.assert_allclose(corr, np.correlate(a, v, mode), atol=1e-10)
+
+    def test_numpy_path_matches_numpy_convolve(self):
+        self._check(use_numpy=True)
+
+    def test_pure_python_path_matches_numpy_convolve(self):
+        self._check(use_numpy=False)
+
+    def test_radix2_fft_matches_numpy(self):
+        rng = np.random.default_rng(5)
+        x = rng.standard_normal(64) + 1j * rng.standard_normal(64)
+        np.testing.assert_allclose(flumpy._fft(list(x)), np.fft.fft(x), atol=1e-10)
+        np.testing.assert_allclose(flumpy._fft(list(x), invert=True), np.fft.ifft(x) * 64, atol=1e-10)
+
+    def test_autocorrelate(self):
+        arr = FlumpyArray([math.sin(0.3 * i) for i in range(200)])
+        full = arr.autocorrelate(normalize=True).data
+        self.assertEqual(len(full), 399)
+        self.assertAlmostEqual(full[199], 1.0)
+        np.testing.assert_allclose(arr.autocorrelate(mode='same').data,
+                                   np.correlate(arr.data, arr.data, 'same'), atol=1e-9)
+
+    def test_method_selection_and_errors(self):
+        self.assertEqual(flumpy._signal_method(10_000, 8, 'auto'), 'direct')
+        self.assertEqual(flumpy._signal_method(10_000, 4096, 'auto'), 'fft')
+        arr = FlumpyArray([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            arr.convolve(arr, mode='circular')
+        with self.assertRaises(ValueError):
+            arr.correlate(arr, method='winograd')
+
+
+class TestLazyChaos(unittest.TestCase):
+    def _core(self, seed="LATERALUS_PHI", n=40):
+        random.seed(seed)
+        core = FlumpyCore()
+        core.create_arrays([[random.uniform(-1, 1) for _ in range(8)] for _ in range(n)], coherence=0.6)
+        return core
+
+    def _state(self, core, order):
+        names = sorted(core.arrays.keys(), key=lambda name: int(name.split("_")[1]))
+        if order == "reverse":
+            names.reverse()
+        state = {name: (list(core.arrays[name].data), core.arrays[name].coherence, core.arrays[name].chaos)
+                 for name in names}
+        return dict(sorted(state.items()))
+
+    def _rounds(self, core, settle_each=False):
+        for level in (0.1, 0.3, 0.2):
+            core.apply_global_chaos(level)
+            if settle_each:
+                self._state(core, "forward")
+            core.dampen_global_chaos()
+
+    def test_call_is_lazy(self):
+        core = self._core()
+        arr = core.get_array("array_0")
+        before = list(arr._data)
+        core.apply_global_chaos(0.5)
+        self.assertEqual(list(arr._data), before)  # Nothing touched at call time
+        self.assertEqual(len(core.arrays.ledger.rounds), 1)
+        self.assertNotEqual(list(arr.data), before)
+        self.assertLess(arr.coherence, 0.6)
+
+    def test_read_order_and_round_composition_do_not_matter(self):
+        forward = self._core()
+        self._rounds(forward)
+        backward = self._core()
+        self._rounds(backward)
+        stepwise = self._core()
+        self._rounds(stepwise, settle_each=True)
+        expected = self._state(forward, "forward")
+        for core, order in ((backward, "reverse"), (stepwise, "forward")):
+            for name, (data, coherence, chaos) in self._state(core, order).items():
+                for x, y in zip(data, expected[name][0]):
+                    self.assertAlmostEqual(x, y, places=12)
+                self.assertAlmostEqual(coherence, expected[name][1], places=12)
+                self.assertAlmostEqual(chaos, expected[name][2], places=12)
+
+    def test_status_settles_and_trims_ledger(self):
+        core = self._core()
+        self._rounds(core)
+        status = core.get_system_status(include_names=False)
+        arrays = core.arrays.values()
+        self.assertEqual(core.arrays.ledger.rounds, [])
+        self.assertAlmostEqual(status["avg_coherence"], sum(a.coherence for a in arrays) / len(arrays), places=12)
+        self.assertAlmostEqual(status["avg_chaos"], sum(a.chaos for a in arrays) / len(arrays), places=12)
+
+        for _ in range(flumpy.LAZY_CHAOS_MAX_ROUNDS + 1):
+            core.apply_global_chaos(0.001)
+        self.assertEqual(core.arrays.ledger.rounds, [])
+
+    def test_removed_and_late_arrays(self):
+        core = self._core()
+        core.apply_global_chaos(0.4)
+        doomed = core.get_array("array_1")
+        raw = list(doomed._data)
+        core.remove_array("array_1")
+        self.assertNotEqual(list(doomed._data), raw)  # Settled on the way out
+        self.assertIsNone(doomed._chaos_ledger)
+
+        late = core.get_array(core.create_array([1.0, 2.0], coherence=0.5))
+        self.assertEqual((list(late.data), late.coherence), ([1.0, 2.0], 0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
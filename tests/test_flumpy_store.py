@@ -0,0 +1,136 @@
+import sys
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flumpy import FlumpyArray, FlumpyCore, FlumpyStore
+
+
+class TestFlumpyStore(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.path = tempfile.mkdtemp(prefix="flumpy_store_")
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _core(self, n=30, dim=8, **store_kwargs):
+        core = FlumpyCore(store=FlumpyStore(self.path, **store_kwargs))
+        core.create_arrays([[random.uniform(-1, 1) for _ in range(dim)] for _ in range(n)])
+        return core
+
+    def test_round_trip_and_readonly_reattach(self):
+        core = self._core()
+        core.global_entanglement_ritual(0.2)
+        core.checkpoint()
+        original = core.get_array("array_7")
+        edges = core.store.edges()
+        core.store.close()
+
+        with FlumpyStore(self.path, readonly=True) as store:
+            self.assertEqual(len(store), 30)
+            self.assertEqual(store.edges(), edges)
+            loaded = store.get("array_7")
+            self.assertEqual(loaded.data, original.data)
+            self.assertEqual((loaded.coherence, loaded.chaos, loaded.phase),
+                             (original.coherence, original.chaos, original.phase))
+            self.assertEqual(list(store.view("array_7")), list(original.data))
+            with self.assertRaises(PermissionError):
+                store.put("x", FlumpyArray([1.0]))
+
+    def test_lazy_loading_relinks_resident_neighbours(self):
+        core = self._core()
+        core.global_entanglement_ritual(0.2)
+        core.checkpoint()
+        core.store.close()
+
+        warm = FlumpyCore(store=FlumpyStore(self.path, readonly=True))
+        self.assertEqual(len(warm.arrays), 0)
+        name = max(warm.store.names(), key=lambda n: len(warm.store.neighbours(n)))
+        neighbour = warm.store.neighbours(name)[0]
+        first = warm.get_array(name)
+        second = warm.get_array(neighbour)
+        self.assertEqual(len(warm.arrays), 2)
+        self.assertIn(second, first.entangled_with)
+        self.assertIn(first, second.entangled_with)
+        self.assertEqual(warm.load_all(), 28)
+        status = warm.get_system_status(include_names=False)
+        self.assertEqual(status["total_entanglements"], 2 * warm.store.stats()["edges"])
+
+    def test_readonly_store_is_never_written(self):
+        core = self._core()
+        core.checkpoint()
+        core.store.close()
+
+        warm = FlumpyCore(store=FlumpyStore(self.path, readonly=True))
+        warm.load_all()
+        warm.global_entanglement_ritual(0.2)
+        self.assertEqual(warm.checkpoint(), {"arrays_written": 0, "links": 0, "unlinks": 0})
+        self.assertTrue(warm.remove_array("array_3"))
+        self.assertFalse(warm.remove_array("missing"))
+        self.assertNotIn("array_3", warm.arrays)
+        self.assertIn("array_3", warm.store)
+        self.assertEqual(warm.store.edges(), set())
+        warm.store.close()
+
+    def test_checkpoint_writes_only_deltas(self):
+        core = self._core()
+        core.global_entanglement_ritual(0.2)
+        core.checkpoint()
+        self.assertEqual(core.checkpoint(), {"arrays_written": 0, "links": 0, "unlinks": 0})
+
+        a = next(arr for arr in core.arrays.values() if arr.entangled_with)
+        b = a.entangled_with[0]
+        a.disentangle(b)  # Touches the coherence of both
+        result = core.checkpoint()
+        self.assertEqual((result["arrays_written"], result["unlinks"]), (2, 1))
+
+        self.assertTrue(core.remove_array("array_2"))
+        self.assertNotIn("array_2", core.store)
+        self.assertFalse(any("array_2" in pair for pair in core.store.edges()))
+
+    def test_crash_recovery_replays_edge_log(self):
+        core = self._core(n=6)
+        core.checkpoint()
+        store = core.store
+        store.link("array_0", "array_1")
+        store.link("array_1", "array_2")
+        store.unlink("array_0", "array_1")
+        store.put("array_99", FlumpyArray([1.0, 2.0]))  # Never reaches a flushed index
+        store.link("array_3", "array_99")
+        store._edges.flush()  # Log records hit the disk, the index does not: crash here
+        with open(os.path.join(self.path, "edges.log"), "ab") as fh:
+            fh.write(b"\x07\x00\x00")  # Torn record
+
+        with FlumpyStore(self.path) as recovered:
+            self.assertEqual(recovered.edges(), {("array_1", "array_2")})
+            self.assertEqual(recovered.recovered_bytes, 3)
+            self.assertNotIn("array_99", recovered)
+            self.assertEqual(recovered.stats()["log_records"], 4)
+
+    def test_freed_extents_wait_for_flush(self):
+        with FlumpyStore(self.path, initial_bytes=4096) as store:
+            store.put("a", FlumpyArray([1.0] * 8))
+            store.flush()
+            old_offset = store._index["a"][0]
+            store.put("a", FlumpyArray([2.0] * 8))
+            self.assertNotEqual(store._index["a"][0], old_offset)
+            store.put("b", FlumpyArray([3.0] * 8))
+            self.assertNotEqual(store._index["b"][0], old_offset)  # Old extent still pending
+            store.flush()
+            store.put("c", FlumpyArray([4.0] * 8))
+            self.assertEqual(store._index["c"][0], old_offset)
+
+            store.put("big", FlumpyArray([5.0] * 2000))  # Forces the payload file to grow
+            self.assertGreater(store.stats()["file_bytes"], 4096)
+            self.assertEqual(store.get("c").data[0], 4.0)
+            self.assertEqual(store.get("big").data[-1], 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
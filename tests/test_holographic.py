@@ -0,0 +1,65 @@
+import sys
+import os
+import unittest
+import random
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import HolographicCompressor, content_fingerprint
+
+
+class TestHolographicCompressor(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+
+    def test_fingerprint_is_content_based(self):
+        a = [1.0, 2.0, 3.0]
+        self.assertEqual(content_fingerprint(a), content_fingerprint(list(a)))
+        self.assertNotEqual(content_fingerprint(a), content_fingerprint([1.0, 2.0, 3.5]))
+
+    def test_repeat_projection_hits_cache(self):
+        comp = HolographicCompressor()
+        data = [random.uniform(-1, 1) for _ in range(256)]
+        first = comp.project_to_boundary(data)
+        second = comp.project_to_boundary(list(data))
+        self.assertEqual(first, second)
+        stats = comp.cache_stats()['boundary_correlators']
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['entries'], 1)
+
+    def test_byte_budget_bounds_memory(self):
+        comp = HolographicCompressor(cache_bytes=16 * 1024)
+        for _ in range(200):
+            comp.project_to_boundary([random.uniform(-1, 1) for _ in range(128)])
+        stats = comp.cache_stats()
+        for store in stats.values():
+            self.assertLessEqual(store['bytes'], store['byte_budget'])
+            self.assertGreater(store['evictions'], 0)
+
+    def test_bulk_state_is_snapshot(self):
+        comp = HolographicCompressor()
+        data = [1.0, 2.0, 3.0, 4.0]
+        comp.project_to_boundary(data)
+        key = content_fingerprint(data)
+        data[0] = 99.0
+        self.assertEqual(comp.bulk_states[key][0], 1.0)
+
+    @unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+    def test_fft_correlators_match_direct_sums(self):
+        boundary = [random.uniform(-2, 2) for _ in range(97)]
+        comp = HolographicCompressor()
+        fft = comp._compute_boundary_correlators(boundary)
+        with mock.patch.object(bumpy, 'NUMPY_AVAILABLE', False):
+            direct = comp._compute_boundary_correlators(boundary)
+        self.assertEqual(len(fft), len(direct))
+        self.assertAlmostEqual(fft[0], 1.0)
+        for f, d in zip(fft, direct):
+            self.assertAlmostEqual(f, d, places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,1025 @@
+import sys
+import os
+import errno
+import io
+import gc
+import json
+import multiprocessing
+import pickle
+import shutil
+import socket
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+import unittest
+import weakref
+import random
+import numpy as np
+from contextlib import nullcontext, redirect_stdout
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with redirect_stdout(io.StringIO()):
+    import laser
+from laser import (LASERV30, AsyncLogWriter, JsonlSink, LogGate, SegmentedLogStore, UniversalCache,
+                   ColumnarSink, ColumnarLogReader, LogAggregator, DEBUG, INFO, WARNING)
+
+
+class _SlowSink:
+    """Sink that records batches and stalls, so the writer queue backs up"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.rows = []
+        self.gate = threading.Event()
+
+    def write(self, entries):
+        self.gate.wait()
+        time.sleep(self.delay)
+        self.rows.extend(entries)
+
+    def flush(self, fsync=False):
+        pass
+
+    def close(self):
+        pass
+
+
+class _FullDiskSink(_SlowSink):
+    """Sink whose flush fails like a full disk"""
+
+    def __init__(self):
+        super().__init__()
+        self.gate.set()
+
+    def flush(self, fsync=False):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+
+class TestAsyncLogWriter(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix="laser_")
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_close_drains_every_entry_in_order(self):
+        log_path = os.path.join(self.path, "out.jsonl")
+        writer = AsyncLogWriter(JsonlSink(log_path), max_queue=64, batch_size=16, policy='block')
+
+        def produce(offset):
+            for i in range(500):
+                writer.submit({'producer': offset, 'seq': i})
+
+        threads = [threading.Thread(target=produce, args=(p,)) for p in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.close()
+
+        with open(log_path, encoding='utf-8') as fh:
+            rows = [json.loads(line) for line in fh]
+        self.assertEqual(len(rows), 2000)
+        self.assertEqual(writer.dropped, 0)
+        for p in range(4):
+            self.assertEqual([r['seq'] for r in rows if r['producer'] == p], list(range(500)))
+        self.assertFalse(writer.submit({'late': True}))
+
+    def test_drop_policies_count_losses(self):
+        # 'sample' admits every 5th overflowing entry (seq 14, 19, ..., 99), evicting the oldest
+        for policy, expected in (('drop_oldest', list(range(90, 100))),
+                                 ('sample', list(range(54, 100, 5)))):
+            sink = _SlowSink()
+            writer = AsyncLogWriter(sink, max_queue=10, batch_size=1000,
+                                    flush_interval=60, policy=policy, sample_every=5)
+            for i in range(100):
+                writer.submit({'seq': i})
+            sink.gate.set()
+            writer.close()
+            seqs = [r['seq'] for r in sink.rows]
+            self.assertEqual(writer.dropped + len(seqs), 100, policy)
+            self.assertEqual(seqs, expected, policy)
+
+    def test_flush_marker_waits_for_write(self):
+        sink = _SlowSink()
+        writer = AsyncLogWriter(sink, flush_interval=60)
+        writer.submit_many({'seq': i} for i in range(5))
+        self.assertFalse(writer.flush(timeout=0.05))
+        sink.gate.set()
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(len(sink.rows), 5)
+        writer.close()
+
+    def test_flush_after_close_returns_at_once(self):
+        writer = AsyncLogWriter(JsonlSink(os.path.join(self.path, "closed.jsonl")))
+        writer.submit_many({'seq': i} for i in range(5))
+        writer.close()
+        start = time.monotonic()
+        self.assertTrue(writer.flush())
+        self.assertTrue(writer.flush(timeout=2, fsync=True))
+        aggregator = LogAggregator(JsonlSink(os.path.join(self.path, "agg.jsonl")))
+        aggregator.close()
+        self.assertTrue(aggregator.flush())
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_sink_failures_never_strand_blocked_producers(self):
+        for dead_writer in (False, True):
+            sink = _FullDiskSink()
+            with redirect_stdout(io.StringIO()), \
+                    mock.patch.object(AsyncLogWriter, '_run', lambda w: None) if dead_writer else nullcontext():
+                writer = AsyncLogWriter(sink, max_queue=8, batch_size=4, flush_interval=0.01)
+                writer._thread.join(5 if dead_writer else 0)
+                producer = threading.Thread(target=lambda: [writer.submit({'seq': i}) for i in range(200)])
+                producer.start()
+                producer.join(10)
+                self.assertFalse(producer.is_alive(), dead_writer)
+                self.assertEqual(writer.flush(timeout=5), not dead_writer)
+                writer.close()
+            self.assertEqual(writer.dropped + len(sink.rows), 200)
+            self.assertGreater(writer.write_errors, 0)
+            if dead_writer:
+                self.assertEqual(writer.dropped, 192)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            AsyncLogWriter(_SlowSink(), policy='spill')
+
+
+class TestLaserAsyncFlush(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.path = tempfile.mkdtemp(prefix="laser_")
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _run(self, **config):
+        log_path = os.path.join(self.path, "universal.jsonl")
+        with redirect_stdout(io.StringIO()):
+            with LASERV30({'log_path': log_path, 'telemetry': False, 'max_buffer': 50,
+                           'min_buffer_for_log': 0, **config}) as laser_log:
+                for i in range(300):
+                    laser_log.log(random.random(), f"event {i}", seq=i)
+                processed = laser_log.metrics['logs_processed']
+        with open(log_path, encoding='utf-8') as fh:
+            rows = [json.loads(line) for line in fh if not line.startswith('#')]
+        return laser_log, processed, rows
+
+    def test_shutdown_writes_every_processed_entry(self):
+        laser_log, processed, rows = self._run()
+        self.assertGreater(processed, 0)
+        self.assertEqual(len(rows), processed)
+        self.assertEqual(laser_log.metrics_report()['writer']['dropped'], 0)
+        self.assertTrue(all('flush_metadata' in row for row in rows))
+        self.assertFalse(laser_log._writer._thread.is_alive())
+
+    def test_shutdown_races_concurrent_loggers(self):
+        log_path = os.path.join(self.path, "race.jsonl")
+        attempts = 4 * 1000
+        with redirect_stdout(io.StringIO()):
+            laser_log = LASERV30({'log_path': log_path, 'telemetry': False, 'min_buffer_for_log': 0})
+            started = threading.Barrier(5)
+
+            def produce(tid):
+                started.wait()
+                for i in range(1000):
+                    laser_log.log(random.random(), f"t{tid} event {i}", level=WARNING)
+
+            threads = [threading.Thread(target=produce, args=(t,)) for t in range(4)]
+            for t in threads:
+                t.start()
+            started.wait()
+            time.sleep(0.01)
+            laser_log.shutdown()
+            for t in threads:
+                t.join()
+        metrics = laser_log.metrics
+        with open(log_path, encoding='utf-8') as fh:
+            rows = [line for line in fh if not line.startswith('#')]
+        self.assertEqual(len(rows), metrics['logs_processed'])
+        self.assertFalse(laser_log.buffer)
+        self.assertGreater(metrics['logs_refused'], 0)
+        self.assertEqual(metrics['logs_processed'] + metrics['logs_filtered'] + metrics['logs_refused']
+                         + laser_log._gate.dropped, attempts)
+
+    def test_sync_fallback_matches_async_output(self):
+        _, processed, rows = self._run(async_flush=False)
+        self.assertEqual(len(rows), processed)
+        self.assertIn(rows[0]['flush_metadata']['type'], ('universal', 'quantum_emergency'))
+
+    def test_flushed_entries_are_detached_from_the_cache(self):
+        log_path = os.path.join(self.path, "detached.jsonl")
+        with redirect_stdout(io.StringIO()):
+            laser_log = LASERV30({'log_path': log_path, 'telemetry': False})
+        sink = _SlowSink()
+        laser_log._writer.close()
+        laser_log._writer = AsyncLogWriter(sink, flush_interval=60)
+        entry = laser_log.log(0.9, "detached entry", level=WARNING)
+        key = next(k for k, v in laser_log.cache.cache.items() if v is entry)
+        entry.setdefault('quantum_metadata', {})['entangled_with'] = ['before']
+        laser_log._universal_flush()
+        for _ in range(10):  # Cache refreshes keep mutating the cached original
+            laser_log.cache.get(key)
+        entry['quantum_metadata']['entangled_with'].append('after')
+        sink.gate.set()
+        laser_log._writer.flush(timeout=5)
+        self.assertIsNot(sink.rows[0], entry)
+        self.assertEqual(sink.rows[0]['quantum_metadata'], {'entangled_with': ['before']})
+        with redirect_stdout(io.StringIO()):
+            laser_log.shutdown()
+
+
+class TestStagedLog(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.path = tempfile.mkdtemp(prefix="laser_")
+        with redirect_stdout(io.StringIO()):
+            self.laser = LASERV30({'log_path': os.path.join(self.path, "universal.jsonl"),
+                                   'telemetry': False, 'min_level': INFO, 'rate_limit': 1000,
+                                   'rate_burst': 5})
+
+    def tearDown(self):
+        with redirect_stdout(io.StringIO()):
+            self.laser.shutdown()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_gate_levels_sampling_and_rate_limit(self):
+        gate = LogGate(min_level=INFO, sample_every=3)
+        self.assertFalse(gate.admit(DEBUG, "noise"))
+        self.assertFalse(gate.admit(DEBUG, "FAILURE in noise"))  # Keywords apply to unlabeled calls only
+        self.assertTrue(gate.admit(WARNING, "anything"))
+        self.assertEqual([gate.admit(None, "tick") for _ in range(6)],
+                         [False, False, True, False, False, True])
+        self.assertTrue(gate.admit(None, "disk failure"))
+
+        bucket = LogGate(rate_limit=1e-9, burst=2)
+        self.assertEqual([bucket.admit(INFO, "x") for _ in range(4)], [True, True, False, False])
+        self.assertEqual(bucket.dropped, 2)
+
+    def test_dropped_logs_skip_transform_and_hashing(self):
+        op = self.laser.quantum_op
+        with mock.patch.object(op, 'transform', wraps=op.transform) as transform:
+            for _ in range(50):
+                self.laser.log(0.5, "tick", level=DEBUG)
+            self.assertEqual(transform.call_count, 0)
+            self.assertEqual(self.laser.metrics_report()['performance']['logs_gated'], 50)
+
+            # Past the burst the rate limit drops unlabeled chatter, never warnings
+            kept = [self.laser.log(0.5, "tick") is not None for _ in range(20)]
+            self.assertLessEqual(sum(kept), 6)
+            self.assertIsNotNone(self.laser.log(0.5, "tick", level=WARNING))
+            self.assertEqual(transform.call_count, sum(kept) + 1)
+
+    def test_default_config_drops_debug_chatter_at_gate(self):
+        with redirect_stdout(io.StringIO()):
+            laser_log = LASERV30({'log_path': os.path.join(self.path, "default.jsonl"), 'telemetry': False})
+        try:
+            with mock.patch.object(laser_log, '_should_log', wraps=laser_log._should_log) as stage_two:
+                for i in range(100):
+                    self.assertIsNone(laser_log.log(0.5, f"Tensor created: shape=({i},)", level=DEBUG))
+                self.assertEqual(stage_two.call_count, 0)
+                self.assertEqual(laser_log.metrics_report()['performance']['logs_gated'], 100)
+                laser_log.log(0.5, "Tensor created: shape=(1,)")  # Unlevelled calls still reach stage two
+                self.assertEqual(stage_two.call_count, 1)
+        finally:
+            with redirect_stdout(io.StringIO()):
+                laser_log.shutdown()
+
+    def test_state_filter_skips_steady_values(self):
+        laser_log = self.laser
+        laser_log._gate = LogGate()
+        laser_log.log(0.5, "prime", level=WARNING)
+        op = laser_log.quantum_op
+        with mock.patch.object(op, 'transform', wraps=op.transform) as transform:
+            kept = sum(laser_log.log(0.5, "steady") is not None for _ in range(20))
+        self.assertEqual(transform.call_count, kept)
+        self.assertGreater(laser_log.metrics['logs_filtered'], 0)
+
+    def test_risk_estimate_tracks_transform(self):
+        op = self.laser.quantum_op
+        states = {'consciousness': 0.1, 'flumpy_coherence': 1.0, 'stability': 1.0, 'risk_bonus': 0.05}
+        for value in (0.0, 0.3, 0.9):
+            actual = op.transform(value, "probe", states)['risk']
+            self.assertAlmostEqual(op.estimate_risk(value, states), actual, delta=0.06)
+
+
+def _entries(n, start=1000.0):
+    kinds = ["Tensor created", "Quantum entanglement created", "Holographic compression applied"]
+    return [{'universal_time': start + i, 'message': f"{kinds[i % 3]} #{i}", 'value': i,
+             'meta': {'shape': [i]} if i % 5 == 0 else {}} for i in range(n)]
+
+
+class TestSegmentedLogStore(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix="laser_store_")
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_rolls_segments_and_pages_newest_first(self):
+        store = SegmentedLogStore(self.path, segment_bytes=2048)
+        for start in range(0, 300, 50):
+            store.write(_entries(300)[start:start + 50])
+        segments = store.segments()
+        self.assertGreater(len(segments), 5)
+        self.assertEqual(sum(seg['count'] for seg in segments), 300)
+        self.assertTrue(os.path.exists(os.path.join(self.path, 'manifest.json')))
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = store.query("ENTANGLEMENT cre", limit=7, cursor=cursor)
+            seen.extend(entry['value'] for entry in page)
+            if cursor is None:
+                break
+        self.assertEqual(seen, list(range(298, 0, -3)))
+
+        in_range, _ = store.query("tensor", temporal_range=(1100.0, 1130.0), limit=100)
+        self.assertEqual([e['value'] for e in in_range], list(range(129, 99, -3)))
+        keyed, _ = store.query("", context_keys=['shape'], limit=100, newest_first=False)
+        self.assertEqual([e['value'] for e in keyed], list(range(0, 300, 5)))
+        self.assertEqual(len(list(store.iter_entries())), 300)
+        store.close()
+
+    def test_context_keys_enforced_when_word_postings_are_smaller(self):
+        store = SegmentedLogStore(self.path)
+        store.write([{'universal_time': float(i),
+                      'message': f"foo event {i}" if i % 200 == 0 else f"other event {i}",
+                      'meta': {'bar': i} if i % 2 else {}} for i in range(1000)])
+        self.assertEqual(len(store.query("foo", limit=100)[0]), 5)
+        self.assertEqual(store.query("foo", context_keys=['bar'], limit=100)[0], [])
+        store.write([{'universal_time': 1000.0, 'message': "foo keyed", 'meta': {'bar': 1}}])
+        page, _ = store.query("foo", context_keys=['bar'], limit=100)
+        self.assertEqual([e['message'] for e in page], ["foo keyed"])
+        store.close()
+
+    def test_reopen_uses_sidecar_and_recovers_live_segment(self):
+        store = SegmentedLogStore(self.path, segment_bytes=2048)
+        store.write(_entries(120))
+        live_seq = store.segments()[-1]['seq']
+        store.close()
+        with open(os.path.join(self.path, f"seg-{live_seq:06d}.jsonl"), 'ab') as fh:
+            fh.write(b'{"universal_time": 9999, "mess')  # Torn final line
+
+        reopened = SegmentedLogStore(self.path, segment_bytes=2048)
+        self.assertEqual(len(reopened), 120)
+        reopened.write(_entries(1, start=5000.0))
+        page, _ = reopened.query("tensor", limit=2)
+        self.assertEqual([e['universal_time'] for e in page], [5000.0, 1117.0])
+        reopened.close()
+
+    def test_clean_close_persists_live_index(self):
+        store = SegmentedLogStore(self.path, segment_bytes=2048)
+        store.write(_entries(120))
+        store.close()
+        with mock.patch.object(SegmentedLogStore, '_scan', side_effect=AssertionError("rescanned")):
+            reopened = SegmentedLogStore(self.path, segment_bytes=2048)
+            self.assertEqual(len(reopened), 120)
+            reopened.write(_entries(30, start=5000.0))
+            page, _ = reopened.query("entanglement", limit=2)
+            self.assertEqual([e['universal_time'] for e in page], [5028.0, 5025.0])
+            reopened.close()
+        final = SegmentedLogStore(self.path, segment_bytes=2048)
+        self.assertEqual(len(final), 150)
+        final.close()
+
+
+class TestSegmentArchival(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix="laser_archive_")
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_closed_segments_archive_and_stay_readable(self):
+        for codec in ('zlib', 'lzma'):
+            directory = os.path.join(self.path, codec)
+            store = SegmentedLogStore(directory, segment_bytes=8192, archive_codec=codec,
+                                      archive_block_bytes=2048)
+            for start in range(0, 400, 40):
+                store.write(_entries(400)[start:start + 40])
+            self.assertTrue(store.wait_archived(timeout=30))
+            closed = store.segments()[:-1]
+            self.assertTrue(all(seg['codec'].endswith(codec) for seg in closed))
+            self.assertLess(sum(seg['stored_bytes'] for seg in closed), sum(seg['bytes'] for seg in closed))
+            self.assertFalse(os.path.exists(os.path.join(directory, 'seg-000001.jsonl')))
+            self.assertEqual(store.verify(), [])
+            self.assertEqual([e['value'] for e in store.iter_entries()], list(range(400)))
+            store.close()
+
+            reopened = SegmentedLogStore(directory, archive_codec=codec)
+            page, _ = reopened.query("holographic", limit=400, newest_first=False)
+            self.assertEqual([e['value'] for e in page], list(range(2, 400, 3)))
+            reopened.close()
+
+    def test_time_rotation(self):
+        store = SegmentedLogStore(self.path, segment_seconds=0.05)
+        store.write(_entries(5))
+        self.assertFalse(store.maybe_roll())
+        time.sleep(0.06)
+        store.write(_entries(5, start=2000.0))
+        self.assertEqual([seg['count'] for seg in store.segments()], [5, 5])
+        store.close()
+
+    def test_retention_drops_oldest_segments(self):
+        store = SegmentedLogStore(self.path, segment_bytes=4096, retention_bytes=12000)
+        for start in range(0, 400, 40):
+            store.write(_entries(400)[start:start + 40])
+        stats = store.stats()
+        self.assertGreater(stats['expired'], 0)
+        self.assertLessEqual(stats['stored_bytes'], 12000)
+        values = [e['value'] for e in store.iter_entries()]
+        self.assertEqual(values, list(range(400 - len(values), 400)))
+        self.assertFalse(os.path.exists(os.path.join(self.path, 'seg-000001.idx')))
+        store.close()
+
+
+class TestLaserIndexedQuery(unittest.TestCase):
+    def test_query_reads_from_store(self):
+        random.seed("LATERALUS_PHI")
+        path = tempfile.mkdtemp(prefix="laser_")
+        self.addCleanup(shutil.rmtree, path, True)
+        with redirect_stdout(io.StringIO()):
+            with LASERV30({'log_dir': path, 'telemetry': False, 'max_buffer': 40,
+                           'min_buffer_for_log': 0, 'segment_bytes': 1 << 16}) as laser_log:
+                for i in range(120):
+                    laser_log.log(random.random(), f"sweep step {i}", {'device': 'cpu'}, step=i)
+                laser_log._universal_flush()
+                laser_log._writer.flush(timeout=5)
+                hits = laser_log.query_universal_memory("sweep step 11")
+                page, cursor = laser_log.page_universal_memory("sweep", context_keys=['step'],
+                                                               page_size=10)
+        self.assertTrue(hits)
+        self.assertTrue(all("sweep step 11" in hit['message'] for hit in hits))
+        self.assertEqual(len(page), 10)
+        self.assertIsNotNone(cursor)
+        steps = [entry['meta']['step'] for entry in page]
+        self.assertEqual(steps, sorted(steps, reverse=True))
+        self.assertTrue(os.path.exists(os.path.join(path, 'header.jsonl')))
+
+
+class TestUniversalCache(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+
+    def test_lru_evicts_least_recent(self):
+        cache = UniversalCache(max_size=3)
+        for key in 'abc':
+            cache.set(key, {'v': key})
+        cache.get('a')
+        cache.set('d', {'v': 'd'})
+        self.assertEqual(list(cache.cache), ['c', 'a', 'd'])
+        self.assertIsNone(cache.get('b'))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']), (1, 1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_lfu_evicts_least_frequent_then_oldest(self):
+        cache = UniversalCache(max_size=3, policy='lfu')
+        for key in 'abc':
+            cache.set(key, {'v': key})
+        for key in 'aab':
+            cache.get(key)
+        cache.set('d', {'v': 'd'})  # c has no hits
+        cache.set('e', {'v': 'e'})  # d is the newest key but the only one at zero hits
+        self.assertEqual(set(cache.cache), {'a', 'b', 'e'})
+        cache.delete('e')
+        cache.set('f', {'v': 'f'})
+        cache.set('g', {'v': 'g'})  # f is at zero hits again
+        self.assertEqual(set(cache.cache), {'a', 'b', 'g'})
+        with self.assertRaises(ValueError):
+            UniversalCache(policy='mru')
+
+    def test_byte_budget_is_hard(self):
+        cache = UniversalCache(max_size=100, max_bytes=1000)
+        for i in range(10):
+            cache.set(f"k{i}", i, cost=300)
+            self.assertLessEqual(cache.bytes, 1000)
+        self.assertEqual(list(cache.cache), ['k7', 'k8', 'k9'])
+        cache.set('huge', 'x', cost=5000)
+        self.assertNotIn('huge', cache)
+        self.assertEqual(cache.metrics['rejections'], 1)
+        cache.delete('k9')
+        self.assertEqual(cache.bytes, 600)
+
+    def test_cold_entries_compress_losslessly(self):
+        cache = UniversalCache(pressure_interval=0.0, cold_after=0.0)
+        value = {'message': 'lateralus ' * 200, 'values': list(range(100))}
+        cache.set('cold', value)
+        cache.set('small', {'v': 1})
+        with mock.patch.object(cache, '_memory_pressure', return_value=0.1):
+            cache._tick()
+        self.assertIsInstance(cache.cache['cold'], laser._PackedValue)
+        self.assertIsInstance(cache.cache['small'], dict)  # Below compress_min_bytes
+        self.assertGreater(cache.metrics['size_reduction'], 0.5)
+        packed_bytes = cache.bytes
+        cache.cold_after = None
+        restored = cache.get('cold')
+        restored.pop('quantum_metadata', None)
+        self.assertEqual(restored, value)
+        self.assertGreater(cache.bytes, packed_bytes)
+        self.assertEqual(cache.metrics['decompressions'], 1)
+
+    def test_memory_pressure_is_sampled_on_a_timer(self):
+        cache = UniversalCache(max_size=1000, pressure_interval=60.0)
+        with mock.patch.object(cache, '_memory_pressure', return_value=0.95) as pressure:
+            for i in range(200):
+                cache.set(f"k{i}", i)
+            pressure.assert_not_called()
+            cache.last_cleanup -= 61.0
+            cache.set('trigger', 0)
+            pressure.assert_called_once()
+        self.assertEqual(len(cache), 201 - 201 // 5)
+        self.assertEqual(cache.memory_warnings, 1)
+
+
+class TestResourceSampler(unittest.TestCase):
+    def test_smoothed_cpu_deltas_and_memory(self):
+        readings = iter([
+            (10.0, 100.0, 1.0, 1000, 800, 1000),
+            (15.0, 110.0, 1.5, 2000, 600, 1000),  # 50% busy
+            (25.0, 120.0, 1.5, 2000, 600, 1000),  # 100% busy
+        ])
+        sampler = laser.ResourceSampler(alpha=0.5, use_psutil=False)
+        sampler._read = lambda: next(readings)
+        sampler.snapshot = laser.ResourceSnapshot()
+        sampler._last = None
+        sampler.sample()
+        self.assertEqual(sampler.snapshot.cpu_percent, 0.0)
+        self.assertAlmostEqual(sampler.snapshot.memory_percent, 20.0)
+        sampler.sample()
+        self.assertAlmostEqual(sampler.snapshot.cpu_percent, 50.0)
+        self.assertEqual(sampler.snapshot.rss_bytes, 1500)
+        sampler.sample()
+        self.assertAlmostEqual(sampler.snapshot.cpu_percent, 75.0)
+        self.assertEqual(sampler.snapshot.samples, 3)
+        sampler._read = mock.Mock(side_effect=OSError)
+        self.assertEqual(sampler.sample().samples, 3)  # A failed read keeps the last snapshot
+
+    @unittest.skipUnless(os.path.exists('/proc/self/stat'), "needs /proc")
+    def test_proc_fallback_matches_psutil(self):
+        proc = laser.ResourceSampler(use_psutil=False)
+        self.assertEqual(proc.source, 'proc')
+        self.assertGreater(proc.snapshot.rss_bytes, 0)
+        if laser.PSUTIL_AVAILABLE:
+            ps = laser.ResourceSampler(use_psutil=True)
+            self.assertEqual(proc.snapshot.total_bytes, ps.snapshot.total_bytes)
+            self.assertAlmostEqual(proc.snapshot.rss_bytes, ps.snapshot.rss_bytes, delta=64 << 20)
+
+    def test_consumers_read_the_snapshot(self):
+        sampler = laser.ResourceSampler(use_psutil=False)
+        sampler.snapshot = laser.ResourceSnapshot(memory_percent=95.0, cpu_percent=90.0, total_bytes=1)
+        cache = UniversalCache(max_size=100, pressure_interval=0.0, resources=sampler)
+        for i in range(50):
+            cache.set(f"k{i}", i)
+        self.assertGreater(cache.memory_warnings, 0)
+
+        path = tempfile.mkdtemp(prefix="laser_resources_")
+        try:
+            with redirect_stdout(io.StringIO()):
+                laser_log = LASERV30({'log_path': os.path.join(path, 'r.jsonl'), 'telemetry': False})
+                laser_log.resources = sampler
+                threshold = laser_log.config['emergency_flush_threshold']
+                start = time.perf_counter()
+                laser_log._monitor_system_health()
+                self.assertLess(time.perf_counter() - start, 0.1)
+                self.assertGreater(laser_log.config['emergency_flush_threshold'], threshold)
+                laser_log.shutdown()
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+        self.assertIs(laser.ResourceSampler.shared(), laser.ResourceSampler.shared(0.5))
+
+
+class TestLatencyHistograms(unittest.TestCase):
+    def test_sharded_recording_quantiles_and_merge(self):
+        histogram = laser.LogHistogram("test", lowest=1e-6, highest=10.0, per_octave=4)
+        values = [random.lognormvariate(-8, 1.5) for _ in range(4000)]
+
+        def record(chunk):
+            for v in chunk:
+                histogram.record(v)
+
+        threads = [threading.Thread(target=record, args=(values[i::4],)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 4000)
+        self.assertAlmostEqual(summary['sum'], sum(values))
+        self.assertEqual(summary['max'], max(values))
+        exact = sorted(values)[int(0.99 * 4000) - 1]
+        self.assertGreaterEqual(summary['p99'], exact)
+        self.assertLessEqual(summary['p99'], exact * 2 ** 0.25)  # Within one bucket
+        self.assertEqual(len(histogram._shards), 0)  # Finished threads are folded
+
+        other = laser.LogHistogram("other", lowest=1e-6, highest=10.0, per_octave=4)
+        other.record(100.0, count=3)  # Overflows into +Inf
+        histogram.merge(other)
+        self.assertEqual(histogram.summary()['count'], 4003)
+        self.assertEqual(histogram.quantile(1.0), 100.0)
+        with self.assertRaises(ValueError):
+            histogram.merge(laser.LogHistogram(per_octave=2))
+
+    def test_after_fork_starts_from_zero(self):
+        histogram = laser.LogHistogram("test")
+        histogram.record(0.5)
+        worker = threading.Thread(target=histogram.record, args=(0.25,))
+        worker.start()
+        worker.join()
+        self.assertEqual(histogram.summary()['count'], 2)
+        histogram.after_fork()  # The child must not re-export the parent's counts
+        self.assertEqual(histogram.summary(), laser.LogHistogram("test").summary())
+        histogram.record(0.125)
+        self.assertEqual((histogram.summary()['count'], histogram.summary()['max']), (1, 0.125))
+
+    def test_prometheus_text_is_cumulative(self):
+        histogram = laser.LogHistogram("Batch sizes", lowest=1, highest=64, per_octave=1)
+        for size in (1, 3, 3, 50, 500):
+            histogram.record(size)
+        text = laser.render_prometheus({'batch': histogram}, {'logs': (7, "Logs")}, {'depth': (0.5, "Depth")})
+        lines = text.splitlines()
+        self.assertIn("# TYPE laser_logs_total counter", lines)
+        self.assertIn("laser_logs_total 7", lines)
+        self.assertIn("laser_depth 0.5", lines)
+        buckets = [line for line in lines if line.startswith("laser_batch_bucket")]
+        self.assertEqual(buckets[0], 'laser_batch_bucket{le="1"} 1')
+        self.assertEqual(buckets[2], 'laser_batch_bucket{le="4"} 3')
+        self.assertEqual(buckets[-1], 'laser_batch_bucket{le="+Inf"} 5')
+        counts = [int(line.rsplit(' ', 1)[1]) for line in buckets]
+        self.assertEqual(counts, sorted(counts))
+        self.assertIn("laser_batch_count 5", lines)
+        self.assertIn("laser_batch_sum 557", lines)
+
+    def test_queue_stamps_are_not_entries(self):
+        sink = _SlowSink()
+        writer = AsyncLogWriter(sink, max_queue=10, batch_size=1000, flush_interval=60, policy='drop_oldest')
+        for block in range(5):
+            writer.submit_many([{'seq': block * 4 + i} for i in range(4)])
+        sink.gate.set()
+        writer.close()
+        self.assertEqual(writer.dropped + len(sink.rows), 20)
+        self.assertEqual([r['seq'] for r in sink.rows][-4:], [16, 17, 18, 19])
+        waited = writer.histograms['queue_wait_seconds'].summary()
+        self.assertGreater(waited['count'], 0)
+        self.assertLessEqual(waited['count'], len(sink.rows))  # An evicted stamp leaves its block unmeasured
+        self.assertEqual(writer.histograms['batch_size'].summary()['sum'], len(sink.rows))
+
+    def test_laser_serves_metrics_locally(self):
+        path = tempfile.mkdtemp(prefix="laser_metrics_")
+        try:
+            for endpoint in (0, os.path.join(path, 'metrics.sock')):
+                with redirect_stdout(io.StringIO()):
+                    laser_log = LASERV30({'log_path': os.path.join(path, 'm.jsonl'), 'telemetry': False,
+                                          'metrics_endpoint': endpoint})
+                    for i in range(20):
+                        laser_log.log(0.3 + i / 40, f"metric event {i}", level=WARNING)
+                    laser_log.log_many(np.linspace(0.1, 0.9, 50), "metric batch")
+                    laser_log._universal_flush()
+                    laser_log._writer.flush(timeout=5)
+                if endpoint == 0:
+                    host, port = laser_log.metrics_server.address
+                    with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=10) as response:
+                        self.assertTrue(response.headers['Content-Type'].startswith('text/plain; version=0.0.4'))
+                        text = response.read().decode('utf-8')
+                else:
+                    self.assertEqual(os.stat(endpoint).st_mode & 0o777, 0o600)
+                    conn = laser.socket.socket(laser.socket.AF_UNIX)
+                    conn.connect(endpoint)
+                    conn.sendall(b"GET /metrics HTTP/1.0\r\n\r\n")
+                    text = conn.makefile('rb').read().decode('utf-8')
+                    conn.close()
+                lines = text.splitlines()
+                self.assertIn("laser_log_seconds_count 20", lines)
+                self.assertIn("laser_log_many_seconds_count 1", lines)
+                processed = laser_log.metrics['logs_processed']
+                self.assertIn(f"laser_logs_processed_total {processed}", lines)
+                self.assertIn(f"laser_batch_size_sum {processed}", lines)
+                self.assertEqual(laser_log.latency_report()['queue_wait_seconds']['count'], processed)
+                with redirect_stdout(io.StringIO()):
+                    laser_log.shutdown()
+                self.assertIsNone(laser_log.metrics_server)
+            self.assertFalse(os.path.exists(os.path.join(path, 'metrics.sock')))
+            with self.assertRaises(ValueError):
+                laser.MetricsServer(str, '0.0.0.0:0')
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+class TestColumnarLog(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.path = tempfile.mkdtemp(prefix="laser_columnar_")
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_mixed_and_sparse_columns_round_trip(self):
+        rows = [
+            {'id': 'a3f09c11d2e4b5f6', 'timestamp': '2026-10-19T12:00:00.123456+00:00',
+             'universal_time': 1792411200.1234567, 'value': 0.5, 'n': 3, 'ok': True,
+             'message': 'spike', 'meta': {'cycle': 1, 'tags': ['x', 'y']}, 'empty': {}},
+            {'id': 'b3f09c11d2e4b5f7', 'timestamp': '2026-10-19T12:00:01+00:00',
+             'universal_time': 1792411201.0004, 'value': 2, 'n': -(1 << 40), 'ok': False,
+             'message': 'naïve \u2603', 'meta': {'cycle': None, 'extra': 1.5}, 'big': 1 << 70},
+            {'id': 'not-hex', 'timestamp': 'yesterday', 'value': float('inf')},
+        ]
+        sink = ColumnarSink(os.path.join(self.path, 'log.lcol'), block_records=2)
+        sink.write(rows)
+        sink.close()
+        self.assertEqual(list(ColumnarLogReader(sink.path)), rows)
+
+    def test_laser_columnar_output_matches_jsonl(self):
+        for fmt in ('jsonl', 'columnar'):
+            random.seed("LATERALUS_PHI")
+            path = os.path.join(self.path, f'log.{fmt}')
+            with redirect_stdout(io.StringIO()):
+                laser_log = LASERV30({'log_path': path, 'log_format': fmt, 'telemetry': False})
+                for i in range(120):
+                    laser_log.log(random.random(), f"cycle {i} consciousness", level=WARNING, cycle=i)
+                laser_log.shutdown()
+        jsonl = [json.loads(line) for line in open(os.path.join(self.path, 'log.jsonl'))
+                 if not line.startswith('#')]
+        columnar = list(ColumnarLogReader(os.path.join(self.path, 'log.columnar')))
+        self.assertEqual(len(columnar), 120)
+        self.assertEqual([e['message'] for e in columnar], [e['message'] for e in jsonl])
+        self.assertLess(os.path.getsize(os.path.join(self.path, 'log.columnar')),
+                        os.path.getsize(os.path.join(self.path, 'log.jsonl')) / 4)
+        self.assertTrue(os.path.exists(os.path.join(self.path, 'log.header.jsonl')))
+
+    def test_converter_and_column_selection(self):
+        src = os.path.join(self.path, 'src.jsonl')
+        rows = [{**entry, 'quantum': {'risk': i / 10, 'coherence': 0.9}}
+                for i, entry in enumerate(_entries(25))]
+        with open(src, 'w') as fh:
+            fh.write('#UNIVERSAL_INIT {}\n')
+            fh.writelines(json.dumps(row) + '\n' for row in rows)
+        dst = os.path.join(self.path, 'dst.lcol')
+        self.assertEqual(laser.jsonl_to_columnar(src, dst, block_records=10), 25)
+        self.assertEqual(list(ColumnarLogReader(dst)), rows)
+        self.assertEqual(list(ColumnarLogReader(dst).iter_entries(['quantum.risk'])),
+                         [{'quantum': {'risk': i / 10}} for i in range(25)])
+
+        back = os.path.join(self.path, 'back.jsonl')
+        with redirect_stdout(io.StringIO()):
+            laser.convert_log_main([dst, back])
+        self.assertEqual([json.loads(line) for line in open(back)], rows)
+
+    def test_torn_tail_block_is_ignored(self):
+        path = os.path.join(self.path, 'log.lcol')
+        sink = ColumnarSink(path, block_records=5)
+        sink.write(_entries(12))
+        sink.close()
+        with open(path, 'ab') as fh:
+            fh.write(laser.encode_columnar_block(_entries(3))[:-4])
+        reader = ColumnarLogReader(path)
+        self.assertEqual(len(list(reader)), 12)
+        self.assertGreater(reader.torn_bytes, 0)
+        with open(os.path.join(self.path, 'plain.jsonl'), 'w') as fh:
+            fh.write('{}\n')
+        with self.assertRaises(ValueError):
+            ColumnarSink(os.path.join(self.path, 'plain.jsonl'))
+
+
+class TestLogMany(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.path = tempfile.mkdtemp(prefix="laser_bulk_")
+        self.log_path = os.path.join(self.path, "bulk.jsonl")
+        with redirect_stdout(io.StringIO()):
+            self.laser = LASERV30({'log_path': self.log_path, 'telemetry': False, 'max_buffer': 300})
+
+    def tearDown(self):
+        with redirect_stdout(io.StringIO()):
+            self.laser.shutdown()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_batch_matches_sequential_temporal_state(self):
+        values = [random.random() for _ in range(60)]
+        reference = laser.FlumpyTemporalVector(size=15)
+        expected = [reference.update(v) for v in values]
+        entries = self.laser.log_many(values, [f"step {i}" for i in range(60)], level=WARNING, run=7)
+
+        self.assertEqual(len(entries), 60)
+        self.assertEqual(len({e['id'] for e in entries}), 60)
+        self.assertEqual([e['message'] for e in entries], [f"step {i}" for i in range(60)])
+        for entry, (delta, compressed, metrics) in zip(entries, expected):
+            self.assertAlmostEqual(entry['temporal']['delta'], delta, places=6)
+            self.assertAlmostEqual(entry['temporal']['compressed'], compressed, places=6)
+            self.assertAlmostEqual(entry['temporal']['metrics']['trend'], metrics['trend'], places=9)
+            self.assertEqual(entry['meta'], {'run': 7})
+            self.assertLessEqual(entry['quantum']['risk'], 1.0)
+        self.assertEqual(self.laser.temporal.data, reference.data)
+        self.assertEqual(self.laser.metrics['logs_processed'], 60)
+        with self.assertRaises(ValueError):
+            self.laser.log_many([0.1, 0.2], ["only one"])
+
+    def test_filters_apply_per_entry(self):
+        self.laser.config['min_buffer_for_log'] = 10 ** 6
+        self.laser.log(0.5, "prime", level=WARNING)
+        steady = self.laser.log_many([0.5] * 40, "steady")
+        self.assertLess(len(steady), 40)
+        self.assertEqual(self.laser.metrics['logs_filtered'], 40 - len(steady))
+        self.assertEqual(len(self.laser.log_many([0.5, 0.9, 0.5], "steady", level=WARNING)), 3)
+
+    def test_oversized_batch_is_flushed_as_one_block(self):
+        self.laser.log(0.5, "before", level=WARNING)
+        with mock.patch.object(self.laser, '_universal_flush', wraps=self.laser._universal_flush) as flush:
+            entries = self.laser.log_many(np.linspace(0, 1, 1000), level=WARNING)
+        self.assertEqual(flush.call_count, 1)
+        self.assertEqual(len(self.laser.buffer), 0)
+        self.assertLessEqual(len(self.laser.cache), self.laser.cache.max_size)
+        with redirect_stdout(io.StringIO()):
+            self.laser.shutdown()
+        written = [json.loads(line) for line in open(self.log_path) if not line.startswith('#')]
+        self.assertEqual([e['message'] for e in written], ["before"] + [''] * 1000)
+        self.assertEqual(written[-1]['id'], entries[-1]['id'])
+
+
+def _log_worker(config, count, tag):
+    with redirect_stdout(io.StringIO()):
+        laser_log = LASERV30({'telemetry': False, **config})
+        for i in range(count):
+            laser_log.log(0.5 + i / 1000, f"{tag} step {i}", level=WARNING)
+        laser_log.shutdown()
+
+
+class _Exploit:
+    """Pickle payload that creates a file when unpickled"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return (open, (self.path, 'w'))
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), "needs fork")
+class TestMultiProcessLogging(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.path = tempfile.mkdtemp(prefix="laser_mp_")
+        self.ctx = multiprocessing.get_context('fork')
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _run_workers(self, config, n=2, count=40):
+        workers = [self.ctx.Process(target=_log_worker, args=(config, count, f"w{i}")) for i in range(n)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+            self.assertEqual(worker.exitcode, 0)
+
+    def test_merge_orders_entries_across_sources(self):
+        a, b = os.path.join(self.path, 'log.jsonl'), os.path.join(self.path, 'log.p7-1.jsonl')
+        with open(a, 'w') as fh:
+            fh.write('#UNIVERSAL_INIT {}\n')
+            fh.writelines(json.dumps(e) + '\n' for e in _entries(10, start=0.0))
+            fh.write('{"universal_time": 99, "mess')  # Torn tail of a live writer
+        sink = ColumnarSink(b)
+        sink.write(_entries(10, start=0.5))
+        sink.close()
+        store = SegmentedLogStore(os.path.join(self.path, 'store'), segment_bytes=400)
+        store.write(_entries(10, start=0.25))
+        store.close()
+        self.assertEqual(laser.process_logs(a), [a, b])
+        merged = list(laser.merge_logs([a, b, store.directory]))
+        self.assertEqual(len(merged), 30)
+        times = [e['universal_time'] for e in merged]
+        self.assertEqual(times, sorted(times))
+
+    def test_forked_children_write_their_own_files(self):
+        base = os.path.join(self.path, 'shared.jsonl')
+        with redirect_stdout(io.StringIO()):
+            parent = LASERV30({'log_path': base, 'telemetry': False})
+            parent.log(0.5, "parent before fork", level=WARNING)
+            parent._universal_flush()
+            parent._writer.flush(timeout=5)
+
+            child = self.ctx.Process(target=_log_worker, args=({'log_path': base}, 25, "child"))
+            child.start()
+            child.join(30)
+            inherited = self.ctx.Process(target=parent.log, args=(0.9, "inherited instance"),
+                                         kwargs={'level': WARNING})
+            inherited.start()
+            inherited.join(30)
+            parent.log(0.6, "parent after fork", level=WARNING)
+            parent.shutdown()
+
+        own = [e['message'] for e in laser.iter_log_source(base)]
+        self.assertEqual(own, ["parent before fork", "parent after fork"])
+        self.assertEqual(len(laser.process_logs(base)), 3)
+        merged = [e['message'] for e in laser.merge_logs(base)]
+        self.assertEqual(len(merged), 28)  # Children drain at exit; the parent's buffer is not re-flushed
+        self.assertEqual(sum(m.startswith('child') for m in merged), 25)
+        self.assertIn("inherited instance", merged)
+
+    def test_child_exit_hook_does_not_pin_the_instance(self):
+        with redirect_stdout(io.StringIO()):
+            laser_log = LASERV30({'log_path': os.path.join(self.path, 'x.jsonl'), 'telemetry': False})
+            laser_log._drain_at_child_exit()
+            laser_log.shutdown()
+        ref = weakref.ref(laser_log)
+        del laser_log
+        deadline = time.time() + 5
+        while ref() is not None and time.time() < deadline:
+            gc.collect()
+            time.sleep(0.05)
+        self.assertIsNone(ref())
+
+    def test_aggregator_over_queue_and_socket(self):
+        for address in (None, os.path.join(self.path, 'agg.sock')):
+            out = os.path.join(self.path, f"agg-{bool(address)}.jsonl")
+            with LogAggregator(JsonlSink(out), address=address, context=self.ctx) as aggregator:
+                self._run_workers({'aggregator': aggregator.endpoint, 'log_path': out})
+            self.assertEqual(aggregator.stats()['received'], 80)
+            messages = [e['message'] for e in laser.iter_log_source(out)]
+            self.assertEqual(len(messages), 80)
+            for tag in ('w0', 'w1'):
+                mine = [m for m in messages if m.startswith(tag)]
+                self.assertEqual(mine, [f"{tag} step {i}" for i in range(40)])
+            self.assertEqual(laser.process_logs(out), [out])
+
+    def test_aggregator_socket_never_unpickles(self):
+        address = os.path.join(self.path, 'agg.sock')
+        out = os.path.join(self.path, 'agg.jsonl')
+        marker = os.path.join(self.path, 'pwned')
+        with LogAggregator(JsonlSink(out), address=address) as aggregator:
+            self.assertEqual(os.stat(address).st_mode & 0o777, 0o600)
+            payload = pickle.dumps(_Exploit(marker))
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.connect(address)
+                with redirect_stdout(io.StringIO()) as printed:
+                    conn.sendall(struct.pack('<I', len(payload)) + payload)
+                    conn.shutdown(socket.SHUT_WR)
+                    conn.recv(1)  # Served once the aggregator closes its side
+            sink = laser.AggregatorSink(address)
+            sink.write(_entries(3))
+            sink.close()
+        self.assertFalse(os.path.exists(marker))
+        self.assertIn("dropped a batch", printed.getvalue())
+        self.assertEqual(aggregator.stats()['received'], 3)
+
+
+class TestTelemetryRing(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.name = f"laser-test-{os.getpid()}-{self._testMethodName[5:12]}"
+
+    def test_seqlock_ring_wraps_and_skips_torn_rows(self):
+        with laser.TelemetryRing.create(self.name, slots=4, fields=('time', 'value')) as ring:
+            self.assertIsNone(ring.latest())
+            for i in range(10):
+                ring.publish((float(i), i * 10.0))
+            reader = laser.TelemetryRing.attach(self.name)
+            self.assertEqual((reader.fields, reader.slots, reader.pid), (('time', 'value'), 4, os.getpid()))
+            samples, cursor = reader.samples()
+            self.assertEqual(cursor, 10)
+            self.assertEqual([s['time'] for s in samples], [6.0, 7.0, 8.0, 9.0])
+            self.assertEqual(reader.latest(), {'time': 9.0, 'value': 90.0})
+
+            ring._seq[9 % 4] += 1  # Writer caught mid-row
+            self.assertIsNone(reader.latest())
+            self.assertEqual([s['time'] for s in reader.samples(7)[0]], [7.0, 8.0])
+            ring._seq[9 % 4] += 1
+            self.assertEqual(reader.samples(cursor), ([], 10))
+            reader.close()
+        with self.assertRaises(FileNotFoundError):
+            laser.TelemetryRing.attach(self.name)
+
+    def test_laser_publishes_to_external_reader(self):
+        path = tempfile.mkdtemp(prefix="laser_ring_")
+        with redirect_stdout(io.StringIO()):
+            laser_log = LASERV30({'log_path': os.path.join(path, 'ring.jsonl'), 'telemetry': False,
+                                  'telemetry_ring': self.name, 'telemetry_ring_interval': 0.05})
+        try:
+            with redirect_stdout(io.StringIO()):
+                laser_log.log_many(np.linspace(0.1, 0.9, 200), "ring batch")
+            deadline = time.monotonic() + 5
+            while laser_log.ring.published < 2 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            self.assertIn(self.name, laser.list_telemetry_rings())
+
+            watch = subprocess.run([sys.executable, laser.__file__, 'watch', self.name, '--count', '1', '--json'],
+                                   capture_output=True, text=True, timeout=60)
+            self.assertEqual(watch.returncode, 0, watch.stderr)
+            sample = json.loads(watch.stdout.strip().splitlines()[-1])
+            self.assertGreaterEqual(sample['logs_processed'], 1)
+            self.assertEqual(sample['logs_processed'], laser_log.metrics['logs_processed'])
+            self.assertAlmostEqual(sample['coherence'], laser_log.universal_state.coherence)
+        finally:
+            with redirect_stdout(io.StringIO()):
+                laser_log.shutdown()
+            shutil.rmtree(path, ignore_errors=True)
+        self.assertNotIn(self.name, laser.list_telemetry_rings())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+import os
+import unittest
+import random
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import BumpyArray, BUMPYCore
+
+
+def _population(seed, n=120, dim=6):
+    random.seed(seed)
+    centers = [[random.gauss(0, 1) for _ in range(dim)] for _ in range(n // 10)]
+    arrays = []
+    for i in range(n):
+        c = centers[i % len(centers)]
+        # Mixed lengths exercise the shared-prefix comparison of lambda_kernel
+        length = dim if i % 7 else dim - 2
+        arrays.append(BumpyArray([x + random.gauss(0, 0.4) for x in c[:length]],
+                                 coherence=random.uniform(0.7, 1.0)))
+    return arrays
+
+
+def _links(arrays):
+    index = {id(a): i for i, a in enumerate(arrays)}
+    return [sorted(index[id(o)] for o in a.entanglement_links) for a in arrays]
+
+
+@unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+class TestQualiaRitualIndex(unittest.TestCase):
+    def test_gram_mode_matches_exact_pass(self):
+        exact = _population("LATERALUS_PHI")
+        BUMPYCore().qualia_emergence_ritual(exact, mode='exact')
+        indexed = _population("LATERALUS_PHI")
+        core = BUMPYCore()
+        core.qualia_emergence_ritual(indexed, mode='gram')
+
+        self.assertEqual(_links(exact), _links(indexed))
+        for a, b in zip(exact, indexed):
+            self.assertAlmostEqual(a.coherence, b.coherence, places=12)
+        self.assertLess(core.last_ritual_stats['candidate_pairs'], 120 * 119 // 2)
+
+    def test_lsh_candidates_are_verified_subset(self):
+        arrays = _population("SOPHIA")
+        index = bumpy.EntanglementCandidateIndex()
+        gram = set(index.candidate_pairs(arrays, mode='gram'))
+        lsh = set(index.candidate_pairs(arrays, mode='lsh'))
+        self.assertTrue(lsh <= gram)
+        self.assertGreater(len(lsh & gram) / len(gram), 0.8)
+
+    def test_auto_mode_uses_exact_pass_for_small_batches(self):
+        core = BUMPYCore()
+        core.qualia_emergence_ritual(_population("TINY", n=10))
+        self.assertEqual(core.last_ritual_stats['mode'], 'exact')
+        self.assertEqual(core.last_ritual_stats['candidate_pairs'], 45)
+
+    def test_hashing_does_not_consume_global_rng(self):
+        arrays = _population("SOPHIA")
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        bumpy.EntanglementCandidateIndex().candidate_pairs(arrays, mode='lsh')
+        self.assertEqual(random.random(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
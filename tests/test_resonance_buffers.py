@@ -0,0 +1,75 @@
+import sys
+import os
+import gc
+import unittest
+import random
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import BumpyArray, RingBuffer, OracularEntropyOracle
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_capacity_bound_keeps_newest(self):
+        ring = RingBuffer(4, {'value': 'd', 'tag': 'O'})
+        for i in range(10):
+            ring.append(value=float(i), tag=f"t{i}")
+        self.assertEqual(len(ring), 4)
+        self.assertEqual(ring.total_appended, 10)
+        self.assertEqual([e['value'] for e in ring], [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(ring[-1]['tag'], "t9")
+        self.assertEqual(list(ring.column('value', window=2)), [8.0, 9.0])
+
+    def test_window_stats(self):
+        ring = RingBuffer(8, {'value': 'd'})
+        for v in [5.0, 1.0, 2.0, 3.0, 4.0, 5.0]:
+            ring.append(value=v)
+        stats = ring.window_stats('value', window=5)
+        self.assertEqual(stats['count'], 5)
+        self.assertAlmostEqual(stats['mean'], 3.0)
+        self.assertAlmostEqual(stats['variance'], 2.0)
+        self.assertAlmostEqual(stats['trend'], 1.0)
+
+    @unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+    def test_wrapped_stats_match_pure_python(self):
+        ring = RingBuffer(16, {'value': 'd'})
+        for _ in range(37):
+            ring.append(value=random.uniform(-1, 1))
+        vectorized = ring.window_stats('value', window=12)
+        with mock.patch.object(bumpy, 'NUMPY_AVAILABLE', False):
+            reference = ring.window_stats('value', window=12)
+        for key in ('mean', 'variance', 'trend'):
+            self.assertAlmostEqual(vectorized[key], reference[key], places=12)
+
+
+class TestResonanceHistories(unittest.TestCase):
+    def test_oracle_depth_and_selection(self):
+        oracle = OracularEntropyOracle(retrocausal_depth=3)
+        for c in [0.9, 0.2, 0.5, 0.7]:
+            oracle.record_future_state(1, c, [c])
+        self.assertEqual(len(oracle.future_states[1]), 3)
+        coherence, state, _ = oracle._select_optimal_future(1, 0.1)
+        self.assertEqual((coherence, state), (0.7, [0.7]))
+
+    def test_histories_released_with_arrays(self):
+        random.seed("LATERALUS_PHI")
+        field = bumpy.PanpsychicResonanceField()
+        oracle = OracularEntropyOracle()
+        arrays = [BumpyArray([random.uniform(-1, 1) for _ in range(8)]) for _ in range(5)]
+        for arr in arrays:
+            field.update_pilot_wave(id(arr), arr.data, arr.coherence, owner=arr)
+            oracle.record_future_state(id(arr), arr.coherence, arr.data, owner=arr)
+        self.assertEqual(len(oracle.future_states), 5)
+        self.assertEqual(len(field.implicate_order), 5)
+
+        del arrays, arr
+        gc.collect()
+        self.assertEqual(len(oracle.future_states), 0)
+        self.assertEqual(len(field.implicate_order), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
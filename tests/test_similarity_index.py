@@ -0,0 +1,55 @@
+import sys
+import os
+import unittest
+import random
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import similarity_index
+from similarity_index import SimHashLSH, cross_bucket_pairs, gram_pairs, unit_rows, within_bucket_pairs
+
+if similarity_index.NUMPY_AVAILABLE:
+    import numpy as np
+
+
+@unittest.skipUnless(similarity_index.NUMPY_AVAILABLE, "numpy not installed")
+class TestSimilarityIndex(unittest.TestCase):
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+        self.keys = np.array([random.randrange(6) for _ in range(40)], dtype=np.int64)
+
+    def test_bucket_pairs_match_brute_force(self):
+        li, ri = within_bucket_pairs(self.keys)
+        expected = {(a, b) for a in range(40) for b in range(a + 1, 40) if self.keys[a] == self.keys[b]}
+        self.assertEqual(set(zip(li.tolist(), ri.tolist())), expected)
+        self.assertEqual(len(li), len(expected))
+
+        other = self.keys[::-1][:15]
+        li, ri = cross_bucket_pairs(self.keys, other)
+        expected = {(a, b) for a in range(40) for b in range(15) if self.keys[a] == other[b]}
+        self.assertEqual(set(zip(li.tolist(), ri.tolist())), expected)
+
+    def test_gram_and_lsh_agree_on_near_duplicates(self):
+        base = np.array([[random.gauss(0, 1) for _ in range(8)] for _ in range(30)])
+        unit = unit_rows(np.vstack([base, base + 0.01, np.zeros((1, 8))]))
+        self.assertEqual(np.abs(unit[-1]).sum(), 0.0)
+        scores = lambda start, stop: unit[start:stop] @ unit.T
+        exact = set()
+        for li, ri, values in gram_pairs(len(unit), len(unit), scores, 0.999, True, block_rows=7):
+            self.assertTrue((values > 0.999).all())
+            exact.update(zip(li.tolist(), ri.tolist()))
+        self.assertTrue({(i, i + 30) for i in range(30)} <= exact)
+
+        lsh = SimHashLSH(tables=16, seed=1)
+        li, ri = lsh.pairs(unit, unit, True, lambda cl, cr: np.einsum('ij,ij->i', unit[cl], unit[cr]) > 0.999)
+        self.assertTrue(set(zip(li.tolist(), ri.tolist())) <= exact)
+        self.assertGreater(len(li), 25)
+
+        state = random.getstate()
+        SimHashLSH(tables=4, seed=2).bucket_keys(unit, 0, 8)
+        self.assertEqual(random.getstate(), state)  # Private generator only
+
+
+if __name__ == '__main__':
+    unittest.main()
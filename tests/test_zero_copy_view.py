@@ -0,0 +1,99 @@
+import sys
+import os
+import json
+import struct
+import unittest
+from array import array
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import BumpyArray, TrueZeroCopyView
+
+
+class TestTrueZeroCopyView(unittest.TestCase):
+    def setUp(self):
+        self.arr = BumpyArray([float(i) for i in range(12)])
+        self.view = self.arr.view()
+
+    def tearDown(self):
+        bumpy.set_backend('python')
+
+    def test_strided_and_nested_slices(self):
+        self.assertEqual(self.view[::3].tolist(), [0.0, 3.0, 6.0, 9.0])
+        self.assertEqual(self.view[::-2].tolist(), [11.0, 9.0, 7.0, 5.0, 3.0, 1.0])
+        self.assertEqual(self.view[10:1:-3][1:].tolist(), [7.0, 4.0])
+        self.assertIs(self.view[1::2]._base_ref, self.arr.data)
+
+    def test_reshape_and_write_through(self):
+        grid = self.view.reshape(3, -1)
+        self.assertEqual(grid.shape, (3, 4))
+        self.assertEqual(grid[:, 1].tolist(), [1.0, 5.0, 9.0])
+        grid[:, 1] += 100
+        grid[0, 0] = -1.0
+        self.assertEqual(self.arr.data[0], -1.0)
+        self.assertEqual([self.arr.data[i] for i in (1, 5, 9)], [101.0, 105.0, 109.0])
+        with self.assertRaises(ValueError):
+            self.view[::2].reshape(2, 3)
+
+    def test_buffer_export_without_copy(self):
+        window = self.view[4:8].as_memoryview()
+        self.assertEqual(struct.unpack_from('<4d', window), (4.0, 5.0, 6.0, 7.0))
+        window[0] = 42.0
+        self.assertEqual(self.arr.data[4], 42.0)
+        self.assertEqual(self.view[::-3].as_memoryview().tolist(), [11.0, 8.0, 5.0, 2.0])
+        self.assertEqual(self.arr.as_memoryview().nbytes, 12 * 8)
+
+    def test_copy_on_write_after_resize(self):
+        tail = self.view[8:]
+        self.arr.resize(4)
+        tail += 1
+        self.assertTrue(tail.detached)
+        self.assertEqual(tail.tolist(), [9.0, 10.0, 11.0, 12.0])
+        self.assertEqual(len(self.arr.data), 4)
+
+    def test_list_storage_returns_after_views_are_gone(self):
+        window = self.view[2:4].as_memoryview()
+        del self.view
+        self.assertIsInstance(self.arr.data, array)  # The export still shares it
+        window[0] = 20.0
+        del window
+        self.assertEqual(self.arr.data, [0.0, 1.0, 20.0] + [float(i) for i in range(3, 12)])
+        self.assertEqual(json.loads(json.dumps(self.arr.data))[2], 20.0)
+        self.arr.view()[0] = -1.0
+        self.assertEqual(self.arr.data[:2], [-1.0, 1.0])
+
+    def test_bounds_enforced_atomically(self):
+        drift = TrueZeroCopyView([0.5, 0.5, 0.5], 0.4, 0.6)
+        with self.assertRaises(ValueError):
+            drift += [0.0, 0.0, 0.5]
+        self.assertEqual(drift.tolist(), [0.5, 0.5, 0.5])
+        with self.assertRaises(BufferError):
+            drift.as_memoryview()
+
+    def test_windows_are_views(self):
+        windows = list(self.view.windows(4, step=4))
+        self.assertEqual([w.tolist()[0] for w in windows], [0.0, 4.0, 8.0])
+        windows[1] *= 0.5
+        self.assertEqual(self.arr.data[5], 2.5)
+
+    @unittest.skipUnless(bumpy.NUMPY_AVAILABLE, "numpy not installed")
+    def test_numpy_consumes_view_and_backend_writes_show(self):
+        import numpy as np
+        grid = np.asarray(self.view.reshape(3, 4)[:, ::-1])
+        grid[0, 0] = -7.0
+        self.assertEqual(self.arr.data[3], -7.0)
+
+        bumpy.set_backend('numpy')
+        arr = BumpyArray([0.0] * 6)
+        odd = arr.view()[1::2]
+        arr *= 0
+        arr.data[:] = 1.0
+        odd *= 3
+        self.assertFalse(odd.detached)
+        self.assertEqual(arr.data.tolist(), [1.0, 3.0, 1.0, 3.0, 1.0, 3.0])
+
+
+if __name__ == '__main__':
+    unittest.main()